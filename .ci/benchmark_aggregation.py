@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Command line interface to compare computing statistics of attributes in Python with aggregates in the database.
+
+.. warning:: this creates a large number of nodes in the database of the profile, only run it on a test profile.
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import time
+
+import click
+
+from aiida.cmdline.utils import decorators
+
+GROUP_KEY = 'benchmark_aggregation_formula'
+VALUE_KEY = 'benchmark_aggregation_energy'
+
+
+def create_nodes(number, groups):
+    """Create the given number of data nodes with a float attribute, distributed over the given number of groups."""
+    from aiida import orm
+    from aiida.manage.manager import get_manager
+
+    with get_manager().get_backend().transaction():
+        for index in range(number):
+            node = orm.Data()
+            node.set_attribute(GROUP_KEY, 'formula{}'.format(index % groups))
+            node.set_attribute(VALUE_KEY, float(index))
+            node.store()
+
+
+def aggregate_in_python():
+    """Compute the count and minimum of the value per group by retrieving all values.
+
+    :return: tuple of the number of retrieved rows and the time in seconds
+    """
+    from aiida import orm
+
+    start = time.time()
+    rows = 0
+    results = {}
+
+    builder = orm.QueryBuilder()
+    builder.append(orm.Data, filters={'attributes.{}'.format(GROUP_KEY): {'like': 'formula%'}},
+                   project=['attributes.{}'.format(GROUP_KEY), 'attributes.{}'.format(VALUE_KEY)])
+
+    for group, value in builder.iterall():
+        rows += 1
+        count, minimum = results.get(group, (0, value))
+        results[group] = (count + 1, min(minimum, value))
+
+    return rows, time.time() - start
+
+
+def aggregate_in_database():
+    """Compute the count and minimum of the value per group with aggregates in the database.
+
+    :return: tuple of the number of retrieved rows and the time in seconds
+    """
+    from aiida import orm
+
+    start = time.time()
+    group = 'attributes.{}'.format(GROUP_KEY)
+
+    builder = orm.QueryBuilder()
+    builder.append(orm.Data, filters={group: {'like': 'formula%'}}, tag='data', project=[
+        group, {'id': {'func': 'count'}}, {'attributes.{}'.format(VALUE_KEY): {'func': 'min', 'cast': 'f'}}])
+    builder.group_by({'data': [group]})
+    rows = len(builder.all())
+
+    return rows, time.time() - start
+
+
+@click.command()
+@click.option(
+    '-s',
+    '--step',
+    type=click.INT,
+    default=10000,
+    show_default=True,
+    help='The number of data nodes to add between two measurements.')
+@click.option('-n', '--steps', type=click.INT, default=5, show_default=True, help='The number of measurements.')
+@click.option('-g', '--groups', type=click.INT, default=10, show_default=True, help='The number of distinct groups.')
+@decorators.with_dbenv()
+def launch(step, steps, groups):
+    """Fill the database in steps and compare the aggregation of an attribute in Python and in the database."""
+    headers = ('nodes', 'python rows', 'python [s]', 'database rows', 'database [s]')
+    click.echo('{:>12} {:>12} {:>12} {:>14} {:>14}'.format(*headers))
+
+    for index in range(1, steps + 1):
+        create_nodes(step, groups)
+
+        python_rows, python_time = aggregate_in_python()
+        database_rows, database_time = aggregate_in_database()
+
+        click.echo('{:>12} {:>12} {:>12.4f} {:>14} {:>14.4f}'.format(index * step, python_rows, python_time,
+                                                                      database_rows, database_time))
+
+
+if __name__ == '__main__':
+    launch()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Command line interface to measure the serialization and deserialization of checkpoints that reference many nodes.
+
+.. warning:: this creates nodes in the database of the profile, only run it on a test profile.
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import time
+from functools import partial
+
+import click
+
+from aiida.cmdline.utils import decorators
+
+
+def create_context(number):
+    """Return a dictionary that resembles the context of a workchain referencing the given number of stored nodes."""
+    from aiida import orm
+    from aiida.common.extendeddicts import AttributeDict
+    from aiida.manage.manager import get_manager
+
+    nodes = []
+    with get_manager().get_backend().transaction():
+        for index in range(number):
+            node = orm.Int(index)
+            node.store()
+            nodes.append(node)
+
+    return AttributeDict({'iteration': number, 'children': nodes, 'last': nodes[-1], 'labels': {'label': 'value'}})
+
+
+def measure(function, repetitions):
+    """Call the function the given number of times and return the mean duration in milliseconds."""
+    start = time.time()
+    for _ in range(repetitions):
+        function()
+    return (time.time() - start) * 1000 / repetitions
+
+
+@click.command()
+@click.option(
+    '-n',
+    '--nodes',
+    type=click.INT,
+    multiple=True,
+    default=[10, 100, 1000],
+    show_default=True,
+    help='The number of nodes referenced by the checkpoint, can be specified multiple times.')
+@click.option('-r', '--repetitions', type=click.INT, default=10, show_default=True, help='The number of repetitions.')
+@decorators.with_dbenv()
+def launch(nodes, repetitions):
+    """Compare the size, serialization and deserialization of checkpoints in the yaml and the compact representation.
+
+    The yaml representation is deserialized both loading the nodes one by one and in bulk.
+    """
+    import yaml
+    from aiida.orm.utils import serialize
+
+    click.echo('LibYAML bindings: {}'.format('yes' if hasattr(yaml, 'CLoader') else 'no'))
+
+    headers = ('nodes', 'format', 'size [kB]', 'serialize [ms]', 'per node [ms]', 'bulk [ms]')
+    click.echo('{:>8} {:>8} {:>12} {:>16} {:>16} {:>16}'.format(*headers))
+
+    for number in nodes:
+        context = create_context(number)
+        serialized = serialize.serialize(context)
+        compact = serialize.serialize_compact(context)
+
+        # Without preloaded nodes the node constructor of the loader loads each node with a separate query
+        functions = (
+            partial(serialize.serialize, context),
+            partial(yaml.load, serialized, Loader=serialize.AiiDALoader),
+            partial(serialize.deserialize, serialized),
+        )
+        durations = [measure(function, repetitions) for function in functions]
+        click.echo('{:>8} {:>8} {:>12.1f} {:>16.2f} {:>16.2f} {:>16.2f}'.format(
+            number, 'yaml', len(serialized) / 1024, *durations))
+
+        functions = (partial(serialize.serialize_compact, context), partial(serialize.deserialize, compact))
+        durations = [measure(function, repetitions) for function in functions]
+        click.echo('{:>8} {:>8} {:>12.1f} {:>16.2f} {:>16} {:>16.2f}'.format(
+            number, 'compact', len(compact) / 1024, durations[0], '-', durations[1]))
+
+if __name__ == '__main__':
+    launch()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Command line interface to measure the rate at which nodes are loaded from the database by the `QueryBuilder`."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import time
+
+import click
+
+from aiida.cmdline.utils import decorators
+
+
+@click.command()
+@click.option(
+    '-n', '--number', type=click.INT, default=10000, show_default=True, help='The maximum number of nodes to load.')
+@decorators.with_dbenv()
+def launch(number):
+    """Load the most recent nodes with the `QueryBuilder` and print the number of nodes loaded per second.
+
+    The nodes are first loaded while the cache of the resolution of node classes and entry points is reset for every
+    node, which corresponds to the cost of resolving the class of each node without a cache, and then with the cache.
+    """
+    from aiida import orm
+    from aiida.orm.utils.node import load_node_class
+    from aiida.plugins.entry_point import reset_entry_point_cache
+
+    builder = orm.QueryBuilder().append(orm.Node, project=['node_type']).order_by({orm.Node: {'id': 'desc'}})
+    type_strings = [type_string for [type_string] in builder.limit(number).iterall()]
+
+    if not type_strings:
+        click.echo('the database does not contain any nodes')
+        return
+
+    start = time.time()
+    for type_string in type_strings:
+        reset_entry_point_cache()
+        load_node_class(type_string)
+    duration_uncached = time.time() - start
+
+    start = time.time()
+    for type_string in type_strings:
+        load_node_class(type_string)
+    duration_cached = time.time() - start
+
+    start = time.time()
+    orm.QueryBuilder().append(orm.Node).order_by({orm.Node: {'id': 'desc'}}).limit(number).all()
+    duration_query = time.time() - start
+
+    count = len(type_strings)
+    click.echo('class resolution without cache: {:12.2f} nodes per second'.format(count / max(duration_uncached, 1E-9)))
+    click.echo('class resolution with cache:    {:12.2f} nodes per second'.format(count / max(duration_cached, 1E-9)))
+    click.echo('query with cache:               {:12.2f} nodes per second'.format(count / max(duration_query, 1E-9)))
+
+
+if __name__ == '__main__':
+    launch()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Command line interface to measure the latency of the queries of `verdi process list` as a function of database size.
+
+.. warning:: this creates a large number of nodes in the database of the profile, only run it on a test profile.
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import time
+
+import click
+
+from aiida.cmdline.utils import decorators
+
+
+def create_nodes(number, data_per_process):
+    """Create the given number of terminated process nodes, each with a number of data nodes, and a few active ones."""
+    from aiida import orm
+    from aiida.manage.manager import get_manager
+
+    with get_manager().get_backend().transaction():
+        for index in range(number):
+            node = orm.WorkflowNode()
+            node.set_process_state('running' if index % 1000 == 0 else 'finished')
+            node.set_exit_status(index % 2)
+            node.set_attribute('process_label', 'BenchmarkWorkChain')
+            node.store()
+
+            for _ in range(data_per_process):
+                orm.Int(index).store()
+
+
+def time_query(**kwargs):
+    """Return the time in seconds to retrieve the result of the `verdi process list` query for the given filters."""
+    from aiida.cmdline.utils.query.calculation import CalculationQueryBuilder
+
+    builder = CalculationQueryBuilder()
+    filters = builder.get_filters(**kwargs)
+
+    start = time.time()
+    list(builder.get_query_set(filters=filters, limit=100))
+    return time.time() - start
+
+
+def time_summary():
+    """Return the time in seconds to count all processes per process state and label as `verdi process list -a -c`."""
+    from aiida.cmdline.utils.query.calculation import CalculationQueryBuilder
+
+    builder = CalculationQueryBuilder()
+
+    start = time.time()
+    builder.get_summary(filters=builder.get_filters(all_entries=True))
+    return time.time() - start
+
+
+@click.command()
+@click.option(
+    '-s',
+    '--step',
+    type=click.INT,
+    default=10000,
+    show_default=True,
+    help='The number of process nodes to add between two measurements.')
+@click.option('-n', '--steps', type=click.INT, default=5, show_default=True, help='The number of measurements.')
+@click.option(
+    '-d',
+    '--data-per-process',
+    type=click.INT,
+    default=4,
+    show_default=True,
+    help='The number of data nodes to create for each process node.')
+@decorators.with_dbenv()
+def launch(step, steps, data_per_process):
+    """Fill the database in steps and measure the latency of the queries of `verdi process list` after each step."""
+    from aiida import orm
+
+    headers = ('nodes', 'active [s]', 'failed [s]', 'all [s]', 'summary [s]')
+    click.echo('{:>12} {:>12} {:>12} {:>12} {:>12}'.format(*headers))
+
+    for _ in range(steps):
+        create_nodes(step, data_per_process)
+        count = orm.QueryBuilder().append(orm.Node).count()
+
+        active = time_query(process_state=('created', 'waiting', 'running'))
+        failed = time_query(failed=True)
+        everything = time_query(all_entries=True)
+        summary = time_summary()
+
+        click.echo('{:>12} {:>12.4f} {:>12.4f} {:>12.4f} {:>12.4f}'.format(count, active, failed, everything, summary))
+
+
+if __name__ == '__main__':
+    launch()  # pylint: disable=no-value-for-parameter
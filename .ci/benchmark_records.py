@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Command line interface to compare the time and memory needed to retrieve the attributes of nodes as entities,
+as projected columns and as plain records.
+
+.. warning:: this creates a large number of nodes in the database of the profile, only run it on a test profile.
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import time
+
+import click
+
+from aiida.cmdline.utils import decorators
+
+try:
+    import tracemalloc
+except ImportError:  # Python2
+    tracemalloc = None
+
+BENCHMARK_KEY = 'benchmark_records'
+
+
+def create_nodes(number, attributes):
+    """Create the given number of data nodes with the given number of attributes each."""
+    from aiida import orm
+    from aiida.manage.manager import get_manager
+
+    with get_manager().get_backend().transaction():
+        for index in range(number):
+            node = orm.Data()
+            node.set_attribute(BENCHMARK_KEY, index)
+            node.set_attribute_many({'key{}'.format(key): [key, float(key), 'value'] for key in range(attributes)})
+            node.store()
+
+
+def retrieve_entities():
+    """Retrieve the attributes by projecting the nodes."""
+    for node, in get_builder(['*']).iterall():
+        node.attributes  # pylint: disable=pointless-statement
+
+
+def retrieve_columns():
+    """Retrieve the attributes by projecting the column."""
+    for _ in get_builder(['id', 'attributes']).iterall():
+        pass
+
+
+def retrieve_records():
+    """Retrieve the attributes by projecting the column as plain records."""
+    for _ in get_builder(['id', 'attributes']).iterrecords():
+        pass
+
+
+def get_builder(project):
+    """Return a builder for the nodes created by this benchmark with the given projections."""
+    from aiida import orm
+
+    builder = orm.QueryBuilder()
+    builder.append(orm.Data, filters={'attributes': {'has_key': BENCHMARK_KEY}}, project=project)
+
+    return builder
+
+
+def measure(function):
+    """Call the function and measure its duration and the peak of the memory allocated while it is running.
+
+    :return: tuple of the time in seconds and the peak memory in MB, which is `None` if it cannot be measured
+    """
+    if tracemalloc is not None:
+        tracemalloc.start()
+
+    start = time.time()
+    function()
+    duration = time.time() - start
+
+    if tracemalloc is None:
+        return duration, None
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return duration, peak / 1024 / 1024
+
+
+@click.command()
+@click.option(
+    '-s',
+    '--step',
+    type=click.INT,
+    default=200000,
+    show_default=True,
+    help='The number of data nodes to add between two measurements.')
+@click.option('-n', '--steps', type=click.INT, default=5, show_default=True, help='The number of measurements.')
+@click.option(
+    '-a', '--attributes', type=click.INT, default=10, show_default=True, help='The number of attributes per node.')
+@decorators.with_dbenv()
+def launch(step, steps, attributes):
+    """Fill the database in steps and compare the retrieval of the attributes as entities, columns and records."""
+    methods = (('entities', retrieve_entities), ('columns', retrieve_columns), ('records', retrieve_records))
+
+    headers = ['nodes']
+    for name, _ in methods:
+        headers.extend(['{} [s]'.format(name), '{} [MB]'.format(name)])
+    click.echo(' '.join('{:>14}'.format(header) for header in headers))
+
+    for index in range(1, steps + 1):
+        create_nodes(step, attributes)
+
+        row = ['{:>14}'.format(index * step)]
+        for _, function in methods:
+            duration, memory = measure(function)
+            row.append('{:>14.4f}'.format(duration))
+            row.append('{:>14}'.format('n/a') if memory is None else '{:>14.1f}'.format(memory))
+        click.echo(' '.join(row))
+
+
+if __name__ == '__main__':
+    launch()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Command line interface to load test the REST API with the Flask test client, with and without the response cache.
+
+.. warning:: this creates a large number of nodes in the database of the profile, only run it on a test profile.
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import time
+
+import click
+
+from aiida.cmdline.utils import decorators
+
+PREFIX = '/api/v3'
+ENDPOINTS = (
+    '/nodes?limit=20&orderby=-id',
+    '/nodes/page/2?perpage=20',
+    '/data?limit=20&orderby=-ctime',
+    '/calculations?limit=20',
+    '/users',
+)
+
+
+def create_nodes(number):
+    """Create the given number of data nodes."""
+    from aiida import orm
+    from aiida.manage.manager import get_manager
+
+    with get_manager().get_backend().transaction():
+        for index in range(number):
+            node = orm.Data()
+            node.set_attribute('index', index)
+            node.store()
+
+
+def get_app(cache):
+    """Return a REST API application with the response cache enabled or disabled."""
+    from aiida.restapi.api import App, AiidaApi
+
+    app = App(__name__)
+    app.config['TESTING'] = True
+    AiidaApi(
+        app,
+        PREFIX=PREFIX,
+        PERPAGE_DEFAULT=20,
+        LIMIT_DEFAULT=400,
+        RESPONSE_CACHE_CONFIG={
+            'ENABLED': cache,
+            'MAXSIZE': 1000,
+            'TTL': 60
+        })
+
+    return app
+
+
+def load(app, requests, conditional=False):
+    """Send the given number of requests to each endpoint and return the mean time per request in milliseconds.
+
+    :param conditional: send the ETag of the first response in the `If-None-Match` header of the following requests
+    """
+    start = time.time()
+
+    with app.test_client() as client:
+        for endpoint in ENDPOINTS:
+            url = PREFIX + endpoint
+            headers = {}
+            for _ in range(requests):
+                response = client.get(url, headers=headers)
+                if response.status_code not in (200, 304):
+                    raise click.ClickException('request to {} failed: {}'.format(url, response.status_code))
+                if conditional and response.headers.get('ETag'):
+                    headers = {'If-None-Match': response.headers['ETag']}
+
+    return (time.time() - start) * 1000 / (requests * len(ENDPOINTS))
+
+
+@click.command()
+@click.option(
+    '-s',
+    '--step',
+    type=click.INT,
+    default=10000,
+    show_default=True,
+    help='The number of data nodes to add between two measurements.')
+@click.option('-n', '--steps', type=click.INT, default=5, show_default=True, help='The number of measurements.')
+@click.option(
+    '-r', '--requests', type=click.INT, default=50, show_default=True, help='The number of requests per endpoint.')
+@decorators.with_dbenv()
+def launch(step, steps, requests):
+    """Fill the database in steps and compare the mean response time of the REST API with and without cache."""
+    headers = ('nodes', 'no cache [ms]', 'cache [ms]', 'conditional [ms]')
+    click.echo('{:>12} {:>16} {:>16} {:>16}'.format(*headers))
+
+    for index in range(1, steps + 1):
+        create_nodes(step)
+
+        uncached = load(get_app(cache=False), requests)
+        cached = load(get_app(cache=True), requests)
+        conditional = load(get_app(cache=True), requests, conditional=True)
+
+        click.echo('{:>12} {:>16.2f} {:>16.2f} {:>16.2f}'.format(index * step, uncached, cached, conditional))
+
+
+if __name__ == '__main__':
+    launch()  # pylint: disable=no-value-for-parameter
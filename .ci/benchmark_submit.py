@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Command line interface to measure the rate at which calculations can be submitted one by one and in bulk."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import time
+
+import click
+
+from aiida.cmdline.params import options, types
+from aiida.cmdline.utils import decorators
+
+
+@click.command()
+@options.CODE(type=types.CodeParamType(entry_point='arithmetic.add'), required=True)
+@click.option(
+    '-n', '--number', type=click.INT, default=100, show_default=True, help='The number of calculations to submit.')
+@decorators.with_dbenv()
+def launch(code, number):
+    """Submit a number of `ArithmeticAddCalculation` processes with `submit` and with `submit_many`.
+
+    The calculations are only submitted, so the daemon does not have to be running, but its broker does. The rate of
+    both methods is printed in submissions per second.
+    """
+    from aiida import orm
+    from aiida.engine import submit, submit_many
+    from aiida.plugins import CalculationFactory
+
+    ArithmeticAddCalculation = CalculationFactory('arithmetic.add')  # pylint: disable=invalid-name
+
+    inputs = {
+        'code': code,
+        'x': orm.Int(1).store(),
+        'y': orm.Int(2).store(),
+        'metadata': {
+            'options': {
+                'resources': {
+                    'num_machines': 1
+                },
+            }
+        }
+    }
+
+    start = time.time()
+    for _ in range(number):
+        submit(ArithmeticAddCalculation, **inputs)
+    duration_submit = time.time() - start
+
+    start = time.time()
+    submit_many(ArithmeticAddCalculation, [inputs] * number)
+    duration_submit_many = time.time() - start
+
+    click.echo('submit:      {:8.2f} submissions per second'.format(number / duration_submit))
+    click.echo('submit_many: {:8.2f} submissions per second'.format(number / duration_submit_many))
+
+
+if __name__ == '__main__':
+    launch()  # pylint: disable=no-value-for-parameter
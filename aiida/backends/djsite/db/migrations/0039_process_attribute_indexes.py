@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=invalid-name,too-few-public-methods
+"""Add expression indexes on the JSONB values of the attributes of process nodes that are commonly filtered on.
+
+The indexes are partial and only contain the nodes that actually have the attribute, which are the process nodes, such
+that their size is independent of the number of data nodes. The expressions match the ones generated by the
+`QueryBuilder` for filters on these attributes. An additional partial index on the creation time of the processes that
+are not yet terminated serves the default query of `verdi process list`.
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+# Remove when https://github.com/PyCQA/pylint/issues/1931 is fixed
+# pylint: disable=no-name-in-module,import-error
+from django.db import migrations
+from aiida.backends.djsite.db.migrations import upgrade_schema_version
+
+REVISION = '1.0.39'
+DOWN_REVISION = '1.0.38'
+
+
+class Migration(migrations.Migration):
+    """Add expression indexes on the JSONB values of the attributes of process nodes."""
+
+    dependencies = [
+        ('db', '0038_data_migration_legacy_job_calculations'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=r"""
+                CREATE INDEX db_dbnode_attributes_process_state_idx ON db_dbnode ((attributes -> 'process_state'))
+                    WHERE (attributes -> 'process_state') IS NOT NULL;
+                CREATE INDEX db_dbnode_attributes_exit_status_idx ON db_dbnode ((attributes -> 'exit_status'))
+                    WHERE (attributes -> 'exit_status') IS NOT NULL;
+                CREATE INDEX db_dbnode_attributes_sealed_idx ON db_dbnode ((attributes -> 'sealed'))
+                    WHERE (attributes -> 'sealed') IS NOT NULL;
+                CREATE INDEX db_dbnode_attributes_scheduler_state_idx ON db_dbnode ((attributes -> 'scheduler_state'))
+                    WHERE (attributes -> 'scheduler_state') IS NOT NULL;
+                CREATE INDEX db_dbnode_attributes_process_label_idx ON db_dbnode ((attributes -> 'process_label'))
+                    WHERE (attributes -> 'process_label') IS NOT NULL;
+                CREATE INDEX db_dbnode_active_processes_ctime_idx ON db_dbnode (ctime)
+                    WHERE (attributes -> 'process_state') IN ('"created"', '"running"', '"waiting"');
+                """,
+            reverse_sql=r"""
+                DROP INDEX db_dbnode_attributes_process_state_idx;
+                DROP INDEX db_dbnode_attributes_exit_status_idx;
+                DROP INDEX db_dbnode_attributes_sealed_idx;
+                DROP INDEX db_dbnode_attributes_scheduler_state_idx;
+                DROP INDEX db_dbnode_attributes_process_label_idx;
+                DROP INDEX db_dbnode_active_processes_ctime_idx;
+                """),
+        upgrade_schema_version(REVISION, DOWN_REVISION)
+    ]
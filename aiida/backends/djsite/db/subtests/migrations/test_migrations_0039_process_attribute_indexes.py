@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=import-error,no-name-in-module,invalid-name
+"""
+Tests for the migration that adds expression indexes on the attributes of process nodes
+Migration 0039_process_attribute_indexes
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from aiida.backends.djsite.db.subtests.migrations.test_migrations_common import TestMigrations
+
+
+class TestProcessAttributeIndexesMigration(TestMigrations):
+    """Test the migration that adds expression indexes on the attributes of process nodes."""
+
+    migrate_from = '0038_data_migration_legacy_job_calculations'
+    migrate_to = '0039_process_attribute_indexes'
+
+    def setUpBeforeMigration(self):
+        node = self.DbNode(
+            node_type='process.workflow.workchain.WorkChainNode.',
+            user_id=self.default_user.id,
+            attributes={'process_state': 'finished', 'exit_status': 0, 'sealed': True})
+        node.save()
+        self.node_id = node.id
+
+    def test_indexes_created(self):
+        """Verify that the indexes exist and that the migrated node can still be queried."""
+        from django.db import connection
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT indexname FROM pg_indexes WHERE tablename = 'db_dbnode'")
+            indexes = [row[0] for row in cursor.fetchall()]
+
+        for key in ['process_state', 'exit_status', 'sealed', 'scheduler_state', 'process_label']:
+            self.assertIn('db_dbnode_attributes_{}_idx'.format(key), indexes)
+        self.assertIn('db_dbnode_active_processes_ctime_idx', indexes)
+
+        node = self.load_node(self.node_id)
+        self.assertEqual(node.attributes['process_state'], 'finished')
@@ -16,7 +16,7 @@ from __future__ import absolute_import
 import os
 import django
 
-from aiida.backends.utils import validate_attribute_key, SettingsManager, Setting
+from aiida.backends.utils import validate_attribute_key, SettingsManager, Setting, DELETE_NODES_CHUNK_SIZE
 from aiida.common import NotExistent
 
 SCHEMA_VERSION_DB_KEY = 'db|schemaversion'
@@ -192,18 +192,32 @@ def get_db_schema_version():
     return result[0][0]
 
 
-def delete_nodes_and_connections_django(pks_to_delete):  # pylint: disable=invalid-name
+def delete_nodes_and_connections_django(pks_to_delete, chunk_size=DELETE_NODES_CHUNK_SIZE):  # pylint: disable=invalid-name
     """
     Delete all nodes corresponding to pks in the input.
+
+    The nodes are deleted in chunks of `chunk_size` pks. Each chunk is deleted in its own transaction, together with
+    its group memberships, comments, logs and all links pointing to or from the nodes, using set-based statements.
+    This keeps the transactions bounded also when deleting millions of nodes. The chunks are committed one by one, in
+    the order of the given pks, so an interrupted deletion leaves the nodes of the chunks that were committed deleted
+    and the others in place. See `aiida.manage.database.delete.nodes.get_deletion_order` for an order of the pks in
+    which the remaining nodes can still be found from the nodes from which the deletion started.
+
     :param pks_to_delete: A list, tuple or set of pks that should be deleted.
+    :param chunk_size: the maximum number of nodes deleted per transaction
     """
-    from django.db import transaction
-    from django.db.models import Q
-    from aiida.backends.djsite.db import models
-    with transaction.atomic():
-        # This is fixed in pylint-django>=2, but this supports only py3
-        # pylint: disable=no-member
-        # Delete all links pointing to or from a given node
-        models.DbLink.objects.filter(Q(input__in=pks_to_delete) | Q(output__in=pks_to_delete)).delete()
-        # now delete nodes
-        models.DbNode.objects.filter(pk__in=pks_to_delete).delete()
+    from django.db import connection, transaction
+    from aiida.common.utils import grouper
+
+    statements = [
+        'DELETE FROM db_dbgroup_dbnodes WHERE dbnode_id = ANY(%(pks)s)',
+        'DELETE FROM db_dbcomment WHERE dbnode_id = ANY(%(pks)s)',
+        'DELETE FROM db_dblog WHERE dbnode_id = ANY(%(pks)s)',
+        'DELETE FROM db_dblink WHERE input_id = ANY(%(pks)s) OR output_id = ANY(%(pks)s)',
+        'DELETE FROM db_dbnode WHERE id = ANY(%(pks)s)',
+    ]
+
+    for chunk in grouper(chunk_size, pks_to_delete):
+        with transaction.atomic(), connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement, {'pks': list(chunk)})
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Add expression indexes on the JSONB values of the attributes of process nodes that are commonly filtered on.
+
+The indexes are partial and only contain the nodes that actually have the attribute, which are the process nodes, such
+that their size is independent of the number of data nodes. The expressions match the ones generated by the
+`QueryBuilder` for filters on these attributes. An additional partial index on the creation time of the processes that
+are not yet terminated serves the default query of `verdi process list`.
+
+Revision ID: 1de112340b16
+Revises: 26d561acd560
+Create Date: 2019-07-15 10:21:45.301826
+
+"""
+# pylint: disable=invalid-name,no-member,import-error,no-name-in-module
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+from alembic import op
+from sqlalchemy.sql import text
+
+# revision identifiers, used by Alembic.
+revision = '1de112340b16'
+down_revision = '26d561acd560'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Migrations for the upgrade."""
+    conn = op.get_bind()
+
+    statement = text("""
+        CREATE INDEX db_dbnode_attributes_process_state_idx ON db_dbnode ((attributes -> 'process_state'))
+            WHERE (attributes -> 'process_state') IS NOT NULL;
+        CREATE INDEX db_dbnode_attributes_exit_status_idx ON db_dbnode ((attributes -> 'exit_status'))
+            WHERE (attributes -> 'exit_status') IS NOT NULL;
+        CREATE INDEX db_dbnode_attributes_sealed_idx ON db_dbnode ((attributes -> 'sealed'))
+            WHERE (attributes -> 'sealed') IS NOT NULL;
+        CREATE INDEX db_dbnode_attributes_scheduler_state_idx ON db_dbnode ((attributes -> 'scheduler_state'))
+            WHERE (attributes -> 'scheduler_state') IS NOT NULL;
+        CREATE INDEX db_dbnode_attributes_process_label_idx ON db_dbnode ((attributes -> 'process_label'))
+            WHERE (attributes -> 'process_label') IS NOT NULL;
+        CREATE INDEX db_dbnode_active_processes_ctime_idx ON db_dbnode (ctime)
+            WHERE (attributes -> 'process_state') IN ('"created"', '"running"', '"waiting"');
+        """)
+    conn.execute(statement)
+
+
+def downgrade():
+    """Migrations for the downgrade."""
+    conn = op.get_bind()
+
+    statement = text("""
+        DROP INDEX db_dbnode_attributes_process_state_idx;
+        DROP INDEX db_dbnode_attributes_exit_status_idx;
+        DROP INDEX db_dbnode_attributes_sealed_idx;
+        DROP INDEX db_dbnode_attributes_scheduler_state_idx;
+        DROP INDEX db_dbnode_attributes_process_label_idx;
+        DROP INDEX db_dbnode_active_processes_ctime_idx;
+        """)
+    conn.execute(statement)
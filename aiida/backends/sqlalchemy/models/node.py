@@ -13,7 +13,8 @@ from __future__ import absolute_import
 
 from sqlalchemy import ForeignKey
 from sqlalchemy.orm import relationship, backref
-from sqlalchemy.schema import Column
+from sqlalchemy.schema import Column, Index
+from sqlalchemy.sql import text
 from sqlalchemy.types import Integer, String, DateTime, Text
 # Specific to PGSQL. If needed to be agnostic
 # http://docs.sqlalchemy.org/en/rel_0_9/core/custom_types.html?highlight=guid#backend-agnostic-guid-type
@@ -81,6 +82,22 @@ class DbNode(Base):
         passive_deletes=True
     )
 
+    # Partial indexes on the attributes of process nodes that are commonly filtered on, see migration `1de112340b16`
+    __table_args__ = (
+        Index('db_dbnode_attributes_process_state_idx', text("(attributes -> 'process_state')"),
+              postgresql_where=text("(attributes -> 'process_state') IS NOT NULL")),
+        Index('db_dbnode_attributes_exit_status_idx', text("(attributes -> 'exit_status')"),
+              postgresql_where=text("(attributes -> 'exit_status') IS NOT NULL")),
+        Index('db_dbnode_attributes_sealed_idx', text("(attributes -> 'sealed')"),
+              postgresql_where=text("(attributes -> 'sealed') IS NOT NULL")),
+        Index('db_dbnode_attributes_scheduler_state_idx', text("(attributes -> 'scheduler_state')"),
+              postgresql_where=text("(attributes -> 'scheduler_state') IS NOT NULL")),
+        Index('db_dbnode_attributes_process_label_idx', text("(attributes -> 'process_label')"),
+              postgresql_where=text("(attributes -> 'process_label') IS NOT NULL")),
+        Index('db_dbnode_active_processes_ctime_idx', 'ctime',
+              postgresql_where=text("""(attributes -> 'process_state') IN ('"created"', '"running"', '"waiting"')""")),
+    )
+
     def __init__(self, *args, **kwargs):
         super(DbNode, self).__init__(*args, **kwargs)
         # The behavior of an unstored Node instance should be that all its attributes should be initialized in
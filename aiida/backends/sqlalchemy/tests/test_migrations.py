@@ -1342,3 +1342,20 @@ class TestLegacyJobCalcStateDataMigration(TestMigrationsSQLA):
                         self.assertIsInstance(exit_status, six.integer_types)
             finally:
                 session.close()
+
+
+class TestProcessAttributeIndexesMigration(TestMigrationsSQLA):
+    """Test the migration that adds expression indexes on the attributes of process nodes."""
+
+    migrate_from = '26d561acd560'
+    migrate_to = '1de112340b16'
+
+    def test_indexes_created(self):
+        """Verify that the indexes exist."""
+        with sa.ENGINE.begin() as connection:
+            result = connection.execute("SELECT indexname FROM pg_indexes WHERE tablename = 'db_dbnode'")
+            indexes = [row[0] for row in result]
+
+        for key in ['process_state', 'exit_status', 'sealed', 'scheduler_state', 'process_label']:
+            self.assertIn('db_dbnode_attributes_{}_idx'.format(key), indexes)
+        self.assertIn('db_dbnode_active_processes_ctime_idx', indexes)
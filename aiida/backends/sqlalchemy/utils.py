@@ -20,7 +20,7 @@ from sqlalchemy.orm.exc import NoResultFound
 
 from aiida.backends import sqlalchemy as sa
 from aiida.backends.sqlalchemy import get_scoped_session
-from aiida.backends.utils import validate_attribute_key, SettingsManager, Setting
+from aiida.backends.utils import validate_attribute_key, SettingsManager, Setting, DELETE_NODES_CHUNK_SIZE
 from aiida.common import NotExistent
 
 
@@ -439,32 +439,41 @@ def get_alembic_conf():
     return alembic_cfg
 
 
-def delete_nodes_and_connections_sqla(pks_to_delete):
+def delete_nodes_and_connections_sqla(pks_to_delete, chunk_size=DELETE_NODES_CHUNK_SIZE):
     """
     Delete all nodes corresponding to pks in the input.
+
+    The nodes are deleted in chunks of `chunk_size` pks. Each chunk is deleted in its own transaction, together with
+    its group memberships, comments, logs and all links pointing to or from the nodes, using set-based statements.
+    This keeps the transactions bounded also when deleting millions of nodes. The chunks are committed one by one, in
+    the order of the given pks, so an interrupted deletion leaves the nodes of the chunks that were committed deleted
+    and the others in place. See `aiida.manage.database.delete.nodes.get_deletion_order` for an order of the pks in
+    which the remaining nodes can still be found from the nodes from which the deletion started.
+
     :param pks_to_delete: A list, tuple or set of pks that should be deleted.
+    :param chunk_size: the maximum number of nodes deleted per transaction
     """
+    from sqlalchemy import or_
     from aiida.backends import sqlalchemy as sa
-    from aiida.backends.sqlalchemy.models.node import DbNode, DbLink
+    from aiida.backends.sqlalchemy.models.comment import DbComment
     from aiida.backends.sqlalchemy.models.group import table_groups_nodes
+    from aiida.backends.sqlalchemy.models.log import DbLog
+    from aiida.backends.sqlalchemy.models.node import DbNode, DbLink
+    from aiida.common.utils import grouper
 
     session = sa.get_scoped_session()
     try:
-        # I am first making a statement to delete the membership of these nodes to groups.
-        # Since table_groups_nodes is a sqlalchemy.schema.Table, I am using expression language to compile
-        # a stmt to be executed by the session. It works, but it's not nice that two different ways are used!
-        # Can this be changed?
-        stmt = table_groups_nodes.delete().where(table_groups_nodes.c.dbnode_id.in_(list(pks_to_delete)))
-        session.execute(stmt)
-        # First delete links, then the Nodes, since we are not cascading deletions.
-        # Here I delete the links coming out of the nodes marked for deletion.
-        session.query(DbLink).filter(DbLink.input_id.in_(list(pks_to_delete))).delete(synchronize_session='fetch')
-        # Here I delete the links pointing to the nodes marked for deletion.
-        session.query(DbLink).filter(DbLink.output_id.in_(list(pks_to_delete))).delete(synchronize_session='fetch')
-        # Now I am deleting the nodes
-        session.query(DbNode).filter(DbNode.id.in_(list(pks_to_delete))).delete(synchronize_session='fetch')
-        # Here I commit this scoped session!
-        session.commit()
+        for chunk in grouper(chunk_size, pks_to_delete):
+            chunk = list(chunk)
+            # The group memberships table is a `sqlalchemy.schema.Table`, so the expression language has to be used
+            session.execute(table_groups_nodes.delete().where(table_groups_nodes.c.dbnode_id.in_(chunk)))
+            session.query(DbComment).filter(DbComment.dbnode_id.in_(chunk)).delete(synchronize_session=False)
+            session.query(DbLog).filter(DbLog.dbnode_id.in_(chunk)).delete(synchronize_session=False)
+            # First delete links, then the Nodes, since we are not cascading deletions.
+            session.query(DbLink).filter(or_(DbLink.input_id.in_(chunk),
+                                             DbLink.output_id.in_(chunk))).delete(synchronize_session=False)
+            session.query(DbNode).filter(DbNode.id.in_(chunk)).delete(synchronize_session=False)
+            session.commit()
     except Exception as e:
         # If there was any exception, I roll back the session.
         session.rollback()
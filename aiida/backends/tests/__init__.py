@@ -24,6 +24,7 @@ DB_TEST_LIST = {
             'aiida.backends.djsite.db.subtests.migrations.test_migrations_many',
             'aiida.backends.djsite.db.subtests.migrations.test_migrations_0037_attributes_extras_settings_json',
             'aiida.backends.djsite.db.subtests.migrations.test_migrations_0038_data_migration_legacy_job_calculations',
+            'aiida.backends.djsite.db.subtests.migrations.test_migrations_0039_process_attribute_indexes',
         ],
     },
     BACKEND_SQLA: {
@@ -53,6 +54,7 @@ DB_TEST_LIST = {
         'cmdline.commands.graph': ['aiida.backends.tests.cmdline.commands.test_graph'],
         'cmdline.commands.group': ['aiida.backends.tests.cmdline.commands.test_group'],
         'cmdline.commands.import': ['aiida.backends.tests.cmdline.commands.test_import'],
+        'cmdline.commands.node': ['aiida.backends.tests.cmdline.commands.test_node'],
         'cmdline.commands.process': ['aiida.backends.tests.cmdline.commands.test_process'],
         'cmdline.commands.profile': ['aiida.backends.tests.cmdline.commands.test_profile'],
         'cmdline.commands.rehash': ['aiida.backends.tests.cmdline.commands.test_rehash'],
@@ -73,6 +75,7 @@ DB_TEST_LIST = {
         'cmdline.params.types.plugin': ['aiida.backends.tests.cmdline.params.types.test_plugin'],
         'cmdline.utils.common': ['aiida.backends.tests.cmdline.utils.test_common'],
         'common.archive': ['aiida.backends.tests.common.test_archive'],
+        'common.datastructures': ['aiida.backends.tests.common.test_datastructures'],
         'common.extendeddicts': ['aiida.backends.tests.common.test_extendeddicts'],
         'common.folders': ['aiida.backends.tests.common.test_folders'],
         'common.hashing': ['aiida.backends.tests.common.test_hashing'],
@@ -85,6 +88,9 @@ DB_TEST_LIST = {
         'dataclasses': ['aiida.backends.tests.test_dataclasses'],
         'dbimporters': ['aiida.backends.tests.test_dbimporters'],
         'engine.daemon.client': ['aiida.backends.tests.engine.daemon.test_client'],
+        'engine.daemon.execmanager': ['aiida.backends.tests.engine.daemon.test_execmanager'],
+        'engine.daemon.load': ['aiida.backends.tests.engine.daemon.test_load'],
+        'engine.daemon.telemetry': ['aiida.backends.tests.engine.daemon.test_telemetry'],
         'engine.calc_job': ['aiida.backends.tests.engine.test_calc_job'],
         'engine.calcfunctions': ['aiida.backends.tests.engine.test_calcfunctions'],
         'engine.class_loader': ['aiida.backends.tests.engine.test_class_loader'],
@@ -93,6 +99,7 @@ DB_TEST_LIST = {
         'engine.launch': ['aiida.backends.tests.engine.test_launch'],
         'engine.manager': ['aiida.backends.tests.engine.test_manager'],
         'engine.persistence': ['aiida.backends.tests.engine.test_persistence'],
+        'engine.pool': ['aiida.backends.tests.engine.test_pool'],
         'engine.ports': ['aiida.backends.tests.engine.test_ports'],
         'engine.process': ['aiida.backends.tests.engine.test_process'],
         'engine.process_builder': ['aiida.backends.tests.engine.test_process_builder'],
@@ -138,6 +145,7 @@ DB_TEST_LIST = {
         'orm.mixins': ['aiida.backends.tests.orm.test_mixins'],
         'orm.node.calcjob': ['aiida.backends.tests.orm.node.test_calcjob'],
         'orm.node.node': ['aiida.backends.tests.orm.node.test_node'],
+        'orm.node.process': ['aiida.backends.tests.orm.node.test_process'],
         'orm.querybuilder': ['aiida.backends.tests.orm.test_querybuilder'],
         'orm.utils.calcjob': ['aiida.backends.tests.orm.utils.test_calcjob'],
         'orm.utils.node': ['aiida.backends.tests.orm.utils.test_node'],
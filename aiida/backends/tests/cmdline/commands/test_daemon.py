@@ -77,3 +77,9 @@ class TestVerdiDaemon(AiidaTestCase):
             self.assertIsNotNone(result.exception)
         finally:
             self.daemon_client.stop_daemon(wait=True)
+
+    def test_daemon_top_no_workers(self):
+        """Test `verdi daemon top` when no workers are reporting their load."""
+        result = self.cli_runner.invoke(cmd_daemon.top, ['--once'])
+        self.assertClickResultNoException(result)
+        self.assertIn('No daemon workers are reporting their load', result.output)
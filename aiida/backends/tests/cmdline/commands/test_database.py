@@ -149,3 +149,83 @@ class TestVerdiDatabasaIntegrity(AiidaTestCase):
         result = self.cli_runner.invoke(cmd_database.detect_invalid_nodes, [])
         self.assertNotEqual(result.exit_code, 0)
         self.assertIsNotNone(result.exception)
+
+
+class TestVerdiDatabaseRepository(AiidaTestCase):
+    """Tests for `verdi database repository`."""
+
+    def setUp(self):
+        self.cli_runner = CliRunner()
+
+    def test_iter_differences(self):
+        """Test the merge of the sorted streams of repository and database uuids."""
+        from aiida.manage.database.integrity.repository import iter_differences
+
+        repository = ['00', '02', '03', '05']
+        database = ['01', '02', '05', '06']
+        differences = list(iter_differences(repository, database))
+        self.assertEqual(differences, [('00', True), ('01', False), ('03', True), ('06', False)])
+
+        self.assertEqual(list(iter_differences([], database)), [(uuid, False) for uuid in database])
+        self.assertEqual(list(iter_differences(repository, [])), [(uuid, True) for uuid in repository])
+
+    def test_repository_gc(self):
+        """Test `verdi database repository gc` detects and removes orphaned folders only."""
+        import os
+        from aiida.common.folders import RepositoryFolder
+        from aiida.common.utils import get_new_uuid
+
+        node = Data().store()
+        node_folder = RepositoryFolder(section='node', uuid=node.uuid)
+
+        orphan_uuid = get_new_uuid()
+        orphan_folder = RepositoryFolder(section='node', uuid=orphan_uuid)
+        orphan_folder.create()
+        os.utime(orphan_folder.abspath, (0, 0))
+
+        recent_uuid = get_new_uuid()
+        recent_folder = RepositoryFolder(section='node', uuid=recent_uuid)
+        recent_folder.create()
+
+        try:
+            result = self.cli_runner.invoke(cmd_database.repository_gc, ['--verbose'])
+            self.assertClickResultNoException(result)
+            self.assertIn(orphan_uuid, result.output)
+            self.assertNotIn(recent_uuid, result.output)
+            self.assertNotIn(node.uuid, result.output)
+            self.assertTrue(orphan_folder.exists())
+
+            result = self.cli_runner.invoke(cmd_database.repository_gc, ['--apply'])
+            self.assertClickResultNoException(result)
+            self.assertFalse(orphan_folder.exists())
+            self.assertTrue(recent_folder.exists())
+            self.assertTrue(node_folder.exists())
+        finally:
+            orphan_folder.erase()
+            recent_folder.erase()
+
+    def test_remove_node_stored_during_scan(self):
+        """Test that the folder of a node stored after the scan but before the removal is not removed."""
+        import os
+        from aiida.common.folders import RepositoryFolder
+        from aiida.manage.database.integrity.repository import scan_repository, remove_repository_folders
+
+        # Simulate the folder of a node being moved into the repository, with its original modification time, before
+        # the database row of the node is committed
+        node = Data()
+        node_folder = RepositoryFolder(section='node', uuid=node.uuid)
+        node_folder.create()
+        os.utime(node_folder.abspath, (0, 0))
+
+        try:
+            result = scan_repository()
+            self.assertIn(node.uuid, result.orphaned)
+
+            node.store()
+
+            removed = remove_repository_folders(result.orphaned)
+            self.assertNotIn(node.uuid, removed)
+            self.assertTrue(node_folder.exists())
+        finally:
+            if not node.is_stored:
+                node_folder.erase()
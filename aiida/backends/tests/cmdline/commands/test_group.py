@@ -16,7 +16,8 @@ from aiida import orm
 from aiida.backends.testbase import AiidaTestCase
 from aiida.common import exceptions
 from aiida.cmdline.commands.cmd_group import (group_list, group_create, group_delete, group_relabel, group_description,
-                                              group_add_nodes, group_remove_nodes, group_show, group_copy)
+                                              group_add_nodes, group_remove_nodes, group_show, group_copy,
+                                              group_combine)
 
 
 class TestVerdiGroup(AiidaTestCase):
@@ -251,3 +252,22 @@ class TestVerdiGroup(AiidaTestCase):
         self.assertEqual(dest_group.count(), 2)
         nodes_dest_group = {str(node.uuid) for node in dest_group.nodes}
         self.assertSetEqual(nodes_source_group, nodes_dest_group)
+
+    def test_combine(self):
+        """Test `verdi group combine`."""
+        nodes = [orm.Data().store() for _ in range(3)]
+        group_a = orm.Group(label='combine_group_a').store()
+        group_b = orm.Group(label='combine_group_b').store()
+        group_a.add_nodes(nodes[:2])
+        group_b.add_nodes(nodes[1:])
+
+        options = ['intersection', 'combine_dest', 'combine_group_a', 'combine_group_b']
+        result = self.cli_runner.invoke(group_combine, options)
+        self.assertClickResultNoException(result)
+        self.assertIn('Added 1 nodes', result.output)
+        self.assertEqual(list(orm.load_group(label='combine_dest').iter_node_pks()), [nodes[1].pk])
+
+        options = ['union', 'combine_dest', 'combine_group_a', 'combine_group_b']
+        result = self.cli_runner.invoke(group_combine, options)
+        self.assertIsNotNone(result.exception, result.output)
+        self.assertIn('already exists and is not empty', result.output)
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for `verdi node`."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+from click.testing import CliRunner
+
+from aiida import orm
+from aiida.backends.testbase import AiidaTestCase
+from aiida.cmdline.commands import cmd_node
+from aiida.common import json
+
+
+class TestVerdiNodeAttributes(AiidaTestCase):
+    """Tests for `verdi node attributes`."""
+
+    def setUp(self):
+        super(TestVerdiNodeAttributes, self).setUp()
+        self.cli_runner = CliRunner()
+
+        self.attributes = {'integer': 1, 'string': 'value', 'nested': {'inner': [1, 2], 'other': 'value'}}
+        self.node = orm.Data()
+        for key, value in self.attributes.items():
+            self.node.set_attribute(key, value)
+        self.node.store()
+
+        self.other = orm.Data()
+        self.other.set_attribute('integer', 2)
+        self.other.store()
+
+    def invoke(self, options):
+        """Invoke the command with the given options and return the attributes printed for each pk.
+
+        :param options: the command line options
+        :return: list of tuples of the printed pk, or None if no pk is printed, and the printed attributes
+        """
+        result = self.cli_runner.invoke(cmd_node.node_attributes, options, catch_exceptions=False)
+        self.assertEqual(result.exit_code, 0, result.output)
+
+        if not result.output.startswith('PK: '):
+            return [(None, json.loads(result.output))]
+
+        printed = []
+        for block in result.output.split('PK: ')[1:]:
+            pk, _, dictionary = block.partition('\n')
+            printed.append((int(pk), json.loads(dictionary)))
+
+        return printed
+
+    def test_all_attributes(self):
+        """Test that all the attributes of each node are printed after its pk."""
+        printed = self.invoke([str(self.node.pk), str(self.other.pk)])
+
+        self.assertEqual(printed, [(self.node.pk, self.attributes), (self.other.pk, {'integer': 2})])
+
+    def test_keys(self):
+        """Test that only the given keys are printed, including nested keys and keys that do not exist."""
+        printed = self.invoke([str(self.node.pk), str(self.other.pk), '-k', 'integer', 'nested.inner', 'integer'])
+
+        self.assertEqual(printed, [
+            (self.node.pk, {'integer': 1, 'nested.inner': [1, 2]}),
+            (self.other.pk, {'integer': 2, 'nested.inner': None}),
+        ])
+
+    def test_raw(self):
+        """Test that the pk is not printed with the raw option."""
+        printed = self.invoke([str(self.node.pk), '--raw', '-k', 'nested.other'])
+
+        self.assertEqual(printed, [(None, {'nested.other': 'value'})])
@@ -245,6 +245,39 @@ class TestVerdiProcess(AiidaTestCase):
             self.assertEqual(len(get_result_lines(result)), 1)
             self.assertEqual(get_result_lines(result)[0], str(self.calcs[0].pk))
 
+    def test_list_pages(self):
+        """Test that the query set of the list command is complete and ordered regardless of the page size."""
+        from aiida.cmdline.utils.query.calculation import CalculationQueryBuilder
+
+        builder = CalculationQueryBuilder()
+        filters = builder.get_filters(all_entries=True)
+
+        for order_by in [{'ctime': 'asc'}, {'ctime': 'desc'}, {'id': 'asc'}, {'id': 'desc'}]:
+            expected = [entry['process']['id'] for entry in builder.get_query_set(filters=filters, order_by=order_by)]
+            self.assertEqual(sorted(expected), sorted([calc.pk for calc in self.calcs]))
+
+            for page_size in [1, 5]:
+                query_set = builder.get_query_set(filters=filters, order_by=order_by, page_size=page_size)
+                self.assertEqual([entry['process']['id'] for entry in query_set], expected)
+
+                query_set = builder.get_query_set(filters=filters, order_by=order_by, page_size=page_size, limit=7)
+                self.assertEqual([entry['process']['id'] for entry in query_set], expected[:7])
+
+    def test_list_count_only(self):
+        """Test the list command with the count only option."""
+        for flag in ['-c', '--count-only']:
+            result = self.cli_runner.invoke(cmd_process.process_list, ['-r', '-a', flag])
+            self.assertClickResultNoException(result)
+
+            # There is one entry for each process state, all of which have two processes without a process label
+            lines = get_result_lines(result)
+            self.assertEqual(len(lines), 6)
+            self.assertTrue(all([line.split()[-1] == '2' for line in lines]))
+
+        result = self.cli_runner.invoke(cmd_process.process_list, ['-c', '-S', 'finished'])
+        self.assertClickResultNoException(result)
+        self.assertIn('Total results: 2', result.output)
+
     def test_process_show(self):
         """Test verdi process show"""
         # We must choose a Node we can store
@@ -384,8 +417,8 @@ class TestVerdiProcessListWarning(AiidaTestCase):
         from aiida.engine import ProcessState
 
         # Get the number of allowed processes per worker:
-        from aiida.manage.external.rmq import _RMQ_TASK_PREFETCH_COUNT
-        limit = int(_RMQ_TASK_PREFETCH_COUNT * 0.9)
+        from aiida.manage.configuration import get_config_option
+        limit = int(get_config_option('daemon.worker_process_slots') * 0.9)
 
         # Create additional active nodes such that we have 90% of the active slot limit
         for _ in six.moves.range(limit):
@@ -67,3 +67,35 @@ if __name__ == '__main__':
             self.assertTrue(isinstance(node, WorkFunctionNode))
             self.assertEqual(node.function_name, 'wf')
             self.assertEqual(node.get_function_source_code(), script_content)
+
+    def test_autogroup(self):
+        """Check that all nodes stored by a script end up in the autogroup, including the still buffered ones."""
+        import tempfile
+        from aiida.orm import Group
+        from aiida.orm import autogroup
+
+        script_content = """
+from aiida.orm import Int
+from aiida.orm import autogroup
+
+autogroup.current_autogroup._flush_size = 2
+for value in range(5):
+    node = Int(value).store()
+print(node.pk)
+        """
+
+        with tempfile.NamedTemporaryFile(mode='w+') as fhandle:
+            fhandle.write(script_content)
+            fhandle.flush()
+
+            options = ['--group-name', 'test_autogroup', fhandle.name]
+            try:
+                result = self.cli_runner.invoke(cmd_run.run, options)
+            finally:
+                autogroup.current_autogroup = None
+            self.assertClickResultNoException(result)
+
+            pk = int(result.output)
+            group = Group.objects.get(label='test_autogroup', type_string=autogroup.VERDIAUTOGROUP_TYPE)
+            self.assertEqual(group.count(), 5)
+            self.assertIn(pk, [node.pk for node in group.nodes])
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the :py:mod:`~aiida.common.datastructures` module."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import time
+
+from aiida.backends.testbase import AiidaTestCase
+from aiida.common.datastructures import LRUCache
+
+
+class TestLRUCache(AiidaTestCase):
+    """Tests for the `LRUCache`."""
+
+    def test_eviction(self):
+        """Test that the least recently used entry is discarded when the cache is full."""
+        cache = LRUCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+
+        # Using `a` makes `b` the least recently used entry
+        self.assertEqual(cache.get('a'), 1)
+        cache.set('c', 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIn('a', cache)
+        self.assertIn('c', cache)
+        self.assertNotIn('b', cache)
+        self.assertEqual(cache.get('b', 'default'), 'default')
+
+        self.assertEqual(cache.pop('a'), 1)
+        self.assertNotIn('a', cache)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_ttl(self):
+        """Test that entries expire after the time to live."""
+        cache = LRUCache(maxsize=2, ttl=0.01)
+        cache.set('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+
+        time.sleep(0.02)
+        self.assertIsNone(cache.get('a'))
+
+    def test_invalid_maxsize(self):
+        """Test that the maximum size has to be positive."""
+        with self.assertRaises(ValueError):
+            LRUCache(maxsize=0)
@@ -12,6 +12,8 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
+import mock
+
 from aiida import orm
 from aiida.orm.utils import serialize
 from aiida.backends.testbase import AiidaTestCase
@@ -123,3 +125,83 @@ class TestSerialize(AiidaTestCase):
         deserialized = serialize.deserialize(serialized)
 
         self.assertEqual(attribute_dict, deserialized)
+
+    def test_deserialize_nodes_bulk(self):
+        """Test that all the nodes referenced in a serialized string are loaded with a single query."""
+        nodes = [orm.Data().store() for _ in range(3)]
+        data = {'nodes': nodes, 'same': nodes[0]}
+
+        serialized = serialize.serialize(data)
+        loaded = serialize._load_nodes(serialized)  # pylint: disable=protected-access
+        self.assertEqual(set(loaded.keys()), set(node.uuid for node in nodes))
+
+        deserialized = serialize.deserialize(serialized)
+        self.assertEqual([node.uuid for node in deserialized['nodes']], [node.uuid for node in nodes])
+        self.assertIs(deserialized['same'], deserialized['nodes'][0])
+
+
+class TestSerializeCompact(AiidaTestCase):
+    """Tests for the compact serializer and its deserialization."""
+
+    def test_round_trip(self):
+        """Test the round trip of nodes, groups, computers and of types that JSON cannot represent."""
+        from aiida.common.extendeddicts import AttributeDict
+
+        node = orm.Data().store()
+        group = orm.Group(label='test_compact_round_trip').store()
+
+        data = AttributeDict({
+            'node': node,
+            'group': group,
+            'computer': self.computer,
+            'tuple': (1, u'a', None),
+            'set': {1, 2},
+            'keys': {('Si',): node},
+            'tagged': {'!node': 1},
+            'nested': {'list': [1.5, True, {'a': node}]},
+        })
+
+        serialized = serialize.serialize_compact(data)
+        deserialized = serialize.deserialize(serialized)
+
+        self.assertIsInstance(deserialized, AttributeDict)
+        self.assertEqual(deserialized['node'].uuid, node.uuid)
+        self.assertEqual(deserialized['group'].uuid, group.uuid)
+        self.assertEqual(deserialized['computer'].uuid, self.computer.uuid)  # pylint: disable=no-member
+        self.assertEqual(deserialized['tuple'], (1, u'a', None))
+        self.assertEqual(deserialized['set'], {1, 2})
+        self.assertEqual(deserialized['keys'][('Si',)].uuid, node.uuid)
+        self.assertEqual(deserialized['tagged'], {'!node': 1})
+        self.assertEqual(deserialized['nested']['list'][:2], [1.5, True])
+        self.assertIs(deserialized['nested']['list'][2]['a'], deserialized['node'])
+
+    def test_nodes_by_pk(self):
+        """Test that nodes are referenced by pk and loaded with a single query for all the serialized strings."""
+        nodes = [orm.Data().store() for _ in range(3)]
+        serialized = [serialize.serialize_compact(nodes[:2]), serialize.serialize_compact({'node': nodes[2]})]
+
+        self.assertNotIn(nodes[0].uuid, serialized[0])
+
+        with mock.patch.object(orm, 'load_node') as load_node:
+            deserialized = serialize.deserialize_many(serialized)
+            load_node.assert_not_called()
+
+        self.assertEqual([node.uuid for node in deserialized[0]], [node.uuid for node in nodes[:2]])
+        self.assertEqual(deserialized[1]['node'].uuid, nodes[2].uuid)
+
+    def test_unstored(self):
+        """Test that unstored nodes, groups and computers cannot be serialized."""
+        for entity in [orm.Data(), orm.Group(label='test_compact_unstored'), orm.Computer('compact', 'localhost')]:
+            with self.assertRaises(ValueError):
+                serialize.serialize_compact([entity])
+
+    def test_version(self):
+        """Test that the version is checked and that yaml serialized strings are still deserialized."""
+        serialized = serialize.serialize_compact({'a': 1})
+        version = serialize.COMPACT_FORMAT_VERSION
+
+        self.assertEqual(serialize.deserialize(serialized), {'a': 1})
+        self.assertEqual(serialize.deserialize(serialize.serialize({'a': 1})), {'a': 1})
+
+        with self.assertRaises(ValueError):
+            serialize.deserialize(serialized.replace(str(version), str(version + 1), 1))
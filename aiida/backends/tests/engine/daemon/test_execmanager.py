@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the `aiida.engine.daemon.execmanager` module."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import io
+import shutil
+import tempfile
+import uuid
+
+import mock
+from tornado import ioloop
+
+from aiida import orm
+from aiida.backends.testbase import AiidaTestCase
+from aiida.common import LinkType, exceptions
+from aiida.common.datastructures import CalcInfo
+from aiida.engine.daemon import execmanager
+from aiida.engine.processes.calcjobs.tasks import task_parse_job
+from aiida.engine.utils import InterruptableFuture
+from aiida.plugins import CalculationFactory
+from aiida.transports.plugins.local import LocalTransport
+
+ArithmeticAddCalculation = CalculationFactory('arithmetic.add')  # pylint: disable=invalid-name
+
+
+class TestCaches(AiidaTestCase):
+    """Tests for the functions that cache the entities loaded by a daemon worker to upload calculation jobs."""
+
+    def setUp(self):
+        super(TestCaches, self).setUp()
+        self.user = orm.User.objects.get_default()
+        self.auth_info = orm.AuthInfo(self.computer, self.user).store()
+        for cache in (execmanager.NODE_CACHE, execmanager.AUTHINFO_CACHE, execmanager.REMOTE_USERNAME_CACHE):
+            cache.clear()
+
+    def tearDown(self):
+        super(TestCaches, self).tearDown()
+        orm.AuthInfo.objects.delete(self.auth_info.pk)
+
+    def test_load_stored_nodes(self):
+        """Test that the nodes are loaded once and that UUIDs without a node are left out."""
+        nodes = [orm.Int(1).store(), orm.Int(2).store()]
+        missing = str(uuid.uuid4())
+
+        loaded = execmanager.load_stored_nodes([nodes[0].uuid, missing])
+        self.assertEqual(set(loaded.keys()), {nodes[0].uuid})
+        self.assertEqual(loaded[nodes[0].uuid].pk, nodes[0].pk)
+
+        with mock.patch.object(orm.QueryBuilder, 'iterall', autospec=True) as iterall:
+            loaded = execmanager.load_stored_nodes([nodes[0].uuid])
+            iterall.assert_not_called()
+        self.assertEqual(set(loaded.keys()), {nodes[0].uuid})
+
+        loaded = execmanager.load_stored_nodes([node.uuid for node in nodes] + [missing])
+        self.assertEqual(set(loaded.keys()), {node.uuid for node in nodes})
+
+    def test_get_authinfo(self):
+        """Test that the authinfo is cached and that an unconfigured computer raises."""
+        authinfo = execmanager.get_authinfo(self.computer, self.user)
+        self.assertEqual(authinfo.pk, self.auth_info.pk)
+
+        with mock.patch.object(orm.Computer, 'get_authinfo', autospec=True) as get_authinfo:
+            self.assertIs(execmanager.get_authinfo(self.computer, self.user), authinfo)
+            get_authinfo.assert_not_called()
+
+        computer = orm.Computer(
+            name='unconfigured', hostname='localhost', transport_type='local', scheduler_type='direct').store()
+
+        with self.assertRaises(exceptions.NotExistent):
+            execmanager.get_authinfo(computer, self.user)
+
+    def test_get_remote_username(self):
+        """Test that the remote username is only requested through the transport once per computer and user."""
+        transport = mock.Mock()
+        transport.whoami.return_value = 'username'
+
+        self.assertEqual(execmanager.get_remote_username(transport, self.computer, self.user), 'username')
+        self.assertEqual(execmanager.get_remote_username(transport, self.computer, self.user), 'username')
+        self.assertEqual(transport.whoami.call_count, 1)
+
+
+class TestUploadCalculation(AiidaTestCase):
+    """Tests for the `upload_calculation` function."""
+
+    def setUp(self):
+        super(TestUploadCalculation, self).setUp()
+        self.workdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.workdir)
+        super(TestUploadCalculation, self).tearDown()
+
+    def test_local_copy_list_missing_node(self):
+        """Test that a node in the `local_copy_list` that does not exist raises instead of being skipped."""
+        node = orm.CalcJobNode(computer=self.computer, process_type=ArithmeticAddCalculation.build_process_type())
+        node.put_object_from_filelike(io.StringIO(u'content'), 'aiida.in')
+        node.store()
+
+        missing = str(uuid.uuid4())
+        calc_info = CalcInfo()
+        calc_info.uuid = node.uuid
+        calc_info.codes_info = []
+        calc_info.local_copy_list = [(missing, 'file.txt', 'file.txt')]
+
+        with LocalTransport() as transport:
+            transport.chdir(self.workdir)
+            with self.assertRaises(exceptions.NotExistent) as context:
+                execmanager.upload_calculation(node, transport, calc_info, 'aiida.in', dry_run=True)
+
+        self.assertIn(missing, str(context.exception))
+
+
+class TestParseCalculation(AiidaTestCase):
+    """Tests for running the parser of a calculation job outside of the process that attaches its outputs."""
+
+    def setUp(self):
+        super(TestParseCalculation, self).setUp()
+        self.parsed_folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.parsed_folder)
+        super(TestParseCalculation, self).tearDown()
+
+    def create_calculation(self, content):
+        """Return a stored `CalcJobNode` of the `ArithmeticAddCalculation` with an output file with the given content.
+
+        :param content: the content of the output file in the retrieved folder
+        """
+        output_filename = 'aiida.out'
+
+        node = orm.CalcJobNode(computer=self.computer, process_type=ArithmeticAddCalculation.build_process_type())
+        node.set_option('resources', {'num_machines': 1, 'num_mpiprocs_per_machine': 1})
+        node.set_option('max_wallclock_seconds', 1800)
+        node.set_option('output_filename', output_filename)
+        node.set_option('parser_name', 'arithmetic.add')
+        node.store()
+
+        retrieved = orm.FolderData()
+        retrieved.put_object_from_filelike(io.StringIO(content), output_filename)
+        retrieved.store()
+        retrieved.add_incoming(node, link_type=LinkType.CREATE, link_label='retrieved')
+
+        return node
+
+    def test_parse_calculation(self):
+        """Test that the exit code and the unstored outputs of the parser are written to and loaded from the folder."""
+        node = self.create_calculation(u'3')
+
+        execmanager.parse_calculation(node.pk, None, self.parsed_folder)
+        exit_code, outputs = execmanager._load_parsed_results(self.parsed_folder)  # pylint: disable=protected-access
+
+        self.assertEqual(exit_code.status, 0)
+        self.assertEqual(list(outputs.keys()), ['sum'])
+        self.assertIsInstance(outputs['sum'], orm.Int)
+        self.assertFalse(outputs['sum'].is_stored)
+        self.assertEqual(outputs['sum'].value, 3)
+
+    def test_parse_calculation_failed(self):
+        """Test that the exit code of a failed parser is written to and loaded from the folder."""
+        node = self.create_calculation(u'invalid')
+
+        execmanager.parse_calculation(node.pk, None, self.parsed_folder)
+        exit_code, outputs = execmanager._load_parsed_results(self.parsed_folder)  # pylint: disable=protected-access
+
+        self.assertEqual(exit_code.status, ArithmeticAddCalculation.exit_codes.ERROR_INVALID_OUTPUT.status)
+        self.assertEqual(exit_code.message, ArithmeticAddCalculation.exit_codes.ERROR_INVALID_OUTPUT.message)
+        self.assertEqual(outputs, {})
+
+    def test_task_parse_job(self):
+        """Test that `task_parse_job` runs the parser in a worker process of the pool."""
+        node = self.create_calculation(u'5')
+
+        loop = ioloop.IOLoop.current()
+        result = loop.run_sync(lambda: task_parse_job(node, None, self.parsed_folder, InterruptableFuture()))
+        exit_code, outputs = execmanager._load_parsed_results(self.parsed_folder)  # pylint: disable=protected-access
+
+        self.assertTrue(result)
+        self.assertEqual(exit_code.status, 0)
+        self.assertEqual(outputs['sum'].value, 5)
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the worker load monitor and the daemon autoscaler."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import os
+import shutil
+import tempfile
+import time
+
+import mock
+
+from aiida.backends.testbase import AiidaTestCase
+from aiida.engine.daemon.load import DaemonAutoscaler, WorkerLoad, WorkerLoadMonitor, read_worker_loads, \
+    write_worker_load
+
+
+class LocalBroker(object):  # pylint: disable=useless-object-inheritance
+    """Stand-in for RabbitMQ that distributes tasks over workers respecting their prefetch count."""
+
+    def __init__(self, slots):
+        self.slots = slots
+        self.pending = 0
+        self.workers = []
+
+    def add_worker(self):
+        self.workers.append(0)
+
+    def remove_worker(self):
+        """Remove the last worker, requeueing the tasks it had not yet completed."""
+        self.pending += self.workers.pop()
+
+    def set_tasks(self, number):
+        """Set the total number of tasks in the system and redistribute them over the workers."""
+        self.pending = number
+        self.workers = [0] * len(self.workers)
+        self.dispatch()
+
+    def dispatch(self):
+        for index, active in enumerate(self.workers):
+            taken = min(self.slots - active, self.pending)
+            self.workers[index] += taken
+            self.pending -= taken
+
+
+class SimulatedDaemonClient(object):  # pylint: disable=useless-object-inheritance
+    """Daemon client whose workers are simulated by the `LocalBroker` and report their load to a directory."""
+
+    def __init__(self, broker, directory, workers):
+        self.broker = broker
+        self.daemon_workers_directory = directory
+        for _ in range(workers):
+            self.broker.add_worker()
+        self.report()
+
+    def report(self):
+        """Let each simulated worker write a snapshot of its load."""
+        for filename in os.listdir(self.daemon_workers_directory):
+            os.remove(os.path.join(self.daemon_workers_directory, filename))
+
+        for pid, active in enumerate(self.broker.workers):
+            load = WorkerLoad(pid, time.time(), self.broker.slots, active, 0, 0.)
+            write_worker_load(os.path.join(self.daemon_workers_directory, '{}.json'.format(pid)), load)
+
+    def get_numprocesses(self):
+        return {'status': 'ok', 'numprocesses': len(self.broker.workers)}
+
+    def increase_workers(self, number):
+        for _ in range(number):
+            self.broker.add_worker()
+        self.broker.dispatch()
+        self.report()
+
+    def decrease_workers(self, number):
+        for _ in range(number):
+            self.broker.remove_worker()
+        self.broker.dispatch()
+        self.report()
+
+
+class TestWorkerLoad(AiidaTestCase):
+    """Tests for writing and reading the load snapshots of the workers."""
+
+    def setUp(self):
+        super(TestWorkerLoad, self).setUp()
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        super(TestWorkerLoad, self).tearDown()
+
+    def test_write_read(self):
+        """Test that written snapshots are read back."""
+        load = WorkerLoad(1, time.time(), 100, 25, 2, 0.1)
+        write_worker_load(os.path.join(self.directory, '1.json'), load)
+
+        self.assertEqual(read_worker_loads(self.directory), [load])
+        self.assertEqual(load.utilisation, 0.25)
+
+    def test_stale(self):
+        """Test that stale snapshots are ignored and removed."""
+        filepath = os.path.join(self.directory, '1.json')
+        write_worker_load(filepath, WorkerLoad(1, time.time() - 100, 100, 25, 2, 0.1))
+
+        self.assertEqual(read_worker_loads(self.directory, max_age=10), [])
+        self.assertFalse(os.path.exists(filepath))
+
+    def test_monitor(self):
+        """Test that the monitor takes snapshots from the task receiver and transport queue of the runner."""
+        runner = mock.Mock()
+        runner.loop.time.return_value = 0.
+        runner.task_receiver.active_process_count = 10
+        runner.transport.get_transport_count.return_value = 3
+
+        monitor = WorkerLoadMonitor(runner, os.path.join(self.directory, 'workers'), slots=50)
+        monitor.start()
+        load = monitor.get_load(loop_lag=0.5)
+
+        self.assertEqual(load.pid, os.getpid())
+        self.assertEqual((load.slots, load.active_processes, load.open_transports, load.loop_lag), (50, 10, 3, 0.5))
+
+        write_worker_load(monitor.filepath, load)
+        monitor.stop()
+        self.assertFalse(os.path.exists(monitor.filepath))
+
+
+class TestDaemonAutoscaler(AiidaTestCase):
+    """Tests for the `DaemonAutoscaler`, simulating the workers of a daemon."""
+
+    def setUp(self):
+        super(TestDaemonAutoscaler, self).setUp()
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        super(TestDaemonAutoscaler, self).tearDown()
+
+    @staticmethod
+    def converge(autoscaler, iterations=10):
+        """Let the autoscaler check the load until it no longer changes the number of workers."""
+        for _ in range(iterations):
+            if not autoscaler.check():
+                return
+        raise AssertionError('the autoscaler did not converge')
+
+    def test_invalid_bounds(self):
+        """Test that invalid bounds for the number of workers are rejected."""
+        with self.assertRaises(ValueError):
+            DaemonAutoscaler(None, min_workers=0, max_workers=2)
+
+        with self.assertRaises(ValueError):
+            DaemonAutoscaler(None, min_workers=3, max_workers=2)
+
+    def test_bounds(self):
+        """Test that the number of workers is brought within the bounds, regardless of the load."""
+        autoscaler = DaemonAutoscaler(None, min_workers=2, max_workers=4)
+        self.assertEqual(autoscaler.get_scaling([], 1), 1)
+        self.assertEqual(autoscaler.get_scaling([], 6), -2)
+        self.assertEqual(autoscaler.get_scaling([], 3), 0)
+
+    def test_loop_lag(self):
+        """Test that a worker is added if the event loop of a worker lags, even if slots are available."""
+        autoscaler = DaemonAutoscaler(None, min_workers=1, max_workers=4)
+        loads = [WorkerLoad(1, time.time(), 100, 10, 0, 0.), WorkerLoad(2, time.time(), 100, 10, 0, 5.)]
+        self.assertEqual(autoscaler.get_scaling(loads, 2), 1)
+
+    def test_simulation(self):
+        """Simulate a varying number of tasks and verify that the number of workers follows the load."""
+        broker = LocalBroker(slots=100)
+        client = SimulatedDaemonClient(broker, self.directory, workers=1)
+        autoscaler = DaemonAutoscaler(client, min_workers=1, max_workers=4, cooldown=0)
+
+        # More tasks than the maximum number of workers can handle: scale up to the maximum
+        broker.set_tasks(450)
+        client.report()
+        self.converge(autoscaler)
+        self.assertEqual(len(broker.workers), 4)
+        self.assertEqual(broker.pending, 50)
+
+        # Load drops: scale down to the minimum without losing any of the tasks
+        broker.set_tasks(50)
+        client.report()
+        self.converge(autoscaler)
+        self.assertEqual(broker.workers, [50])
+
+        # Moderate load: scale up until the utilisation is below the threshold
+        broker.set_tasks(150)
+        client.report()
+        self.converge(autoscaler)
+        self.assertEqual(broker.workers, [100, 50])
+
+    def test_cooldown(self):
+        """Test that the number of workers is not changed again within the cooldown period."""
+        broker = LocalBroker(slots=100)
+        client = SimulatedDaemonClient(broker, self.directory, workers=1)
+        autoscaler = DaemonAutoscaler(client, min_workers=1, max_workers=4, cooldown=3600)
+
+        broker.set_tasks(400)
+        client.report()
+        self.assertEqual(autoscaler.check(), 1)
+        self.assertEqual(autoscaler.check(), 0)
+        self.assertEqual(len(broker.workers), 2)
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the telemetry registry of the daemon workers."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import os
+import shutil
+import tempfile
+import time
+
+from tornado import gen, ioloop
+
+from aiida.backends.testbase import AiidaTestCase
+from aiida.cmdline.utils.daemon import format_daemon_top
+from aiida.engine.daemon import telemetry
+from aiida.engine.daemon.load import WorkerLoad
+
+
+class TestRegistry(AiidaTestCase):
+    """Tests for the `Registry` and the functions to write, read and merge its snapshots."""
+
+    def setUp(self):
+        super(TestRegistry, self).setUp()
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        super(TestRegistry, self).tearDown()
+
+    def test_disabled(self):
+        """Test that nothing is recorded by a disabled registry."""
+        registry = telemetry.Registry()
+        registry.increment('counter')
+        registry.observe('histogram', 1.)
+        with registry.timer('timer'):
+            pass
+
+        snapshot = registry.snapshot()
+        self.assertEqual(snapshot['counters'], {})
+        self.assertEqual(snapshot['histograms'], {})
+
+    def test_record(self):
+        """Test recording counters and histograms."""
+        registry = telemetry.Registry()
+        registry.enable()
+
+        registry.increment('counter')
+        registry.increment('counter', 2)
+        for value in [0.002, 0.002, 0.002, 2.]:
+            registry.observe('histogram', value)
+        with registry.timer('timer'):
+            pass
+
+        snapshot = registry.snapshot()
+        histogram = snapshot['histograms']['histogram']
+        self.assertEqual(snapshot['counters'], {'counter': 3})
+        self.assertEqual(histogram['count'], 4)
+        self.assertAlmostEqual(histogram['sum'], 2.006)
+        self.assertEqual(histogram['max'], 2.)
+        self.assertEqual(telemetry.get_histogram_quantile(histogram, 0.5), 0.005)
+        self.assertEqual(telemetry.get_histogram_quantile(histogram, 1.), 2.)
+        self.assertEqual(snapshot['histograms']['timer']['count'], 1)
+
+        registry.reset()
+        self.assertEqual(registry.snapshot()['counters'], {})
+
+    def test_timed_coroutine(self):
+        """Test that the duration of a decorated coroutine is recorded once its future resolves."""
+
+        @telemetry.timed_coroutine('coroutine')
+        @gen.coroutine
+        def coroutine():
+            yield gen.sleep(0.01)
+            raise gen.Return(True)
+
+        registry = telemetry.get_registry()
+        registry.enable()
+        try:
+            self.assertTrue(ioloop.IOLoop().run_sync(coroutine))
+            histogram = registry.snapshot()['histograms']['coroutine']
+        finally:
+            registry.disable()
+            registry.reset()
+
+        self.assertEqual(histogram['count'], 1)
+        self.assertGreaterEqual(histogram['max'], 0.01)
+
+    def test_write_read_merge(self):
+        """Test that the snapshots of multiple workers are read back and merged."""
+        for pid, value in [(1, 0.5), (2, 2.)]:
+            registry = telemetry.Registry()
+            registry.enable()
+            registry.increment('counter', pid)
+            registry.observe('histogram', value)
+            filepath = os.path.join(self.directory, '{}{}'.format(pid, telemetry.METRICS_FILE_EXTENSION))
+            telemetry.write_worker_metrics(filepath, registry)
+
+        snapshots = telemetry.read_worker_metrics(self.directory, max_age=60)
+        self.assertEqual(sorted(snapshots.keys()), [1, 2])
+
+        merged = telemetry.merge_metrics(snapshots.values())
+        self.assertEqual(merged['counters'], {'counter': 3})
+        self.assertEqual(merged['histograms']['histogram']['count'], 2)
+        self.assertEqual(merged['histograms']['histogram']['max'], 2.)
+
+        time.sleep(0.01)
+        self.assertEqual(telemetry.read_worker_metrics(self.directory, max_age=0), {})
+
+    def test_format_daemon_top(self):
+        """Test the formatting of the load and metrics of the workers as shown by `verdi daemon top`."""
+        previous = {'timestamp': 0., 'counters': {'counter': 10}, 'histograms': {}}
+        metrics = {
+            'timestamp': 10.,
+            'counters': {
+                'counter': 30
+            },
+            'histograms': {
+                'histogram': {
+                    'count': 2,
+                    'sum': 0.004,
+                    'max': 0.003,
+                    'buckets': [0, 2] + [0] * 10
+                }
+            }
+        }
+        loads = [WorkerLoad(1234, time.time(), 100, 50, 2, 0.)]
+
+        output = format_daemon_top(loads, metrics, previous)
+        self.assertIn('1234', output)
+        self.assertIn('histogram', output)
+        self.assertIn('2.00', output)
+
+        self.assertIn('No daemon workers', format_daemon_top([], metrics))
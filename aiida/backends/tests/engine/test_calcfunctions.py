@@ -12,12 +12,54 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
+import plumpy
+
 from aiida.backends.testbase import AiidaTestCase
 from aiida.common import exceptions
 from aiida.common.links import LinkType
-from aiida.engine import calcfunction, Process
+from aiida.engine import calcfunction, launch, Process, ToContext, WorkChain
 from aiida.manage.caching import enable_caching
-from aiida.orm import Int, CalcFunctionNode
+from aiida.orm import Int, CalcFunctionNode, load_node
+
+
+@calcfunction(executor='process')
+def add_multiply_in_pool(left, right):
+    """Calcfunction that is run in a worker process of the pool."""
+    return {'sum': Int(left.value + right.value), 'product': Int(left.value * right.value)}
+
+
+class SubmitInPoolWorkChain(WorkChain):
+    """Work chain that submits calcfunctions that run in the pool of worker processes."""
+
+    @classmethod
+    def define(cls, spec):
+        super(SubmitInPoolWorkChain, cls).define(spec)
+        spec.outline(cls.submit_functions, cls.collect)
+        spec.output('sum', valid_type=Int)
+
+    def submit_functions(self):
+        return ToContext(first=self.submit(add_multiply_in_pool, Int(1), Int(2)),
+                         second=self.submit(add_multiply_in_pool, Int(3), Int(4)))
+
+    def collect(self):
+        self.out('sum', Int(self.ctx.first.outputs.sum.value + self.ctx.second.outputs.sum.value).store())
+
+
+class SubmitInlineWorkChain(WorkChain):
+    """Work chain that submits a calcfunction that runs inline, which is not supported."""
+
+    @classmethod
+    def define(cls, spec):
+        super(SubmitInlineWorkChain, cls).define(spec)
+        spec.outline(cls.submit_function)
+
+    def submit_function(self):
+        self.submit(add_inline, Int(1))
+
+
+@calcfunction
+def add_inline(data):
+    return Int(data.value + 1)
 
 
 class TestCalcFunction(AiidaTestCase):
@@ -130,3 +172,57 @@ class TestCalcFunction(AiidaTestCase):
         # The node of the outermost `calcfunction` should have a single `CREATE` link and no `CALL_CALC` links
         self.assertEqual(len(node.get_outgoing(link_type=LinkType.CREATE).all()), 1)
         self.assertEqual(len(node.get_outgoing(link_type=LinkType.CALL_CALC).all()), 0)
+
+    def test_calcfunction_invalid_executor(self):
+        """Verify that an unknown executor is rejected."""
+        with self.assertRaises(ValueError):
+
+            @calcfunction(executor='thread')
+            def test_calcfunction(data):
+                return data
+
+    def test_calcfunction_process_executor(self):
+        """Verify that a calcfunction run in a worker process stores the same provenance as when run inline."""
+        left = Int(2)
+        result, node = add_multiply_in_pool.run_get_node(left, Int(3))
+
+        self.assertTrue(node.is_finished_ok)
+        self.assertEqual(result['sum'].value, 5)
+        self.assertEqual(result['product'].value, 6)
+        self.assertTrue(result['sum'].is_stored)
+        self.assertEqual(node.get_incoming().get_node_by_label('left').uuid, left.uuid)
+        self.assertEqual(sorted(node.get_outgoing(link_type=LinkType.CREATE).all_link_labels()), ['product', 'sum'])
+
+    def test_calcfunction_process_executor_submit(self):
+        """Verify that a calcfunction with the process executor can be submitted and awaited from a work chain."""
+        result, node = launch.run_get_node(SubmitInPoolWorkChain)
+
+        self.assertTrue(node.is_finished_ok)
+        self.assertEqual(result['sum'].value, 10)
+        self.assertEqual(len(node.get_outgoing(link_type=LinkType.CALL_CALC).all()), 2)
+
+    def test_calcfunction_process_executor_lost(self):
+        """Verify that a submitted calcfunction that was lost with the runner of its caller is set to excepted.
+
+        The caller is loaded from its checkpoint as a daemon worker would after the one that ran it was restarted.
+        """
+        workchain = SubmitInPoolWorkChain()
+
+        lost = CalcFunctionNode()
+        lost.set_process_state(plumpy.ProcessState.WAITING)
+        lost.add_incoming(workchain.node, link_type=LinkType.CALL_CALC, link_label='CALL')
+        lost.store()
+
+        bundle = plumpy.Bundle(workchain)
+        workchain.close()
+        bundle.unbundle()
+
+        lost = load_node(lost.pk)
+        self.assertTrue(lost.is_excepted)
+        self.assertTrue(lost.is_sealed)
+        self.assertIn('lost', lost.exception)
+
+    def test_calcfunction_inline_executor_submit(self):
+        """Verify that a calcfunction with the inline executor cannot be submitted."""
+        with self.assertRaises(AssertionError):
+            launch.run(SubmitInlineWorkChain)
@@ -105,6 +105,22 @@ class TestLaunchers(AiidaTestCase):
         with self.assertRaises(exceptions.InvalidOperation):
             launch.submit(AddWorkChain, a=self.a, b=self.b, metadata={'store_provenance': False})
 
+    def test_submit_many_store_provenance_false(self):
+        """Verify that submitting in bulk with `store_provenance=False` raises before any process node is stored."""
+        inputs_list = [{'a': self.a, 'b': self.b}, {'a': self.a, 'b': self.b, 'metadata': {'store_provenance': False}}]
+        count = orm.QueryBuilder().append(orm.ProcessNode).count()
+        with self.assertRaises(exceptions.InvalidOperation):
+            launch.submit_many(AddWorkChain, inputs_list)
+        self.assertEqual(orm.QueryBuilder().append(orm.ProcessNode).count(), count)
+
+    def test_submit_many_invalid_inputs(self):
+        """Verify that submitting in bulk with invalid inputs raises before any process node is stored."""
+        inputs_list = [{'a': self.a, 'b': self.b}, {'a': self.a}]
+        count = orm.QueryBuilder().append(orm.ProcessNode).count()
+        with self.assertRaises(ValueError):
+            launch.submit_many(AddWorkChain, inputs_list)
+        self.assertEqual(orm.QueryBuilder().append(orm.ProcessNode).count(), count)
+
 
 class TestLaunchersDryRun(AiidaTestCase):
     """Test the launchers when performing a dry-run."""
@@ -12,13 +12,15 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
+import contextlib
 import time
 
+import mock
 import tornado
 
 from aiida.orm import AuthInfo, User
 from aiida.backends.testbase import AiidaTestCase
-from aiida.engine.processes.calcjobs.manager import JobManager, JobsList
+from aiida.engine.processes.calcjobs.manager import JobManager, JobsList, JobSubmitter
 from aiida.engine.transports import TransportQueue
 
 
@@ -50,6 +52,116 @@ class TestJobManager(AiidaTestCase):
         with self.manager.request_job_info_update(self.auth_info, job_id=1) as request:
             self.assertIsInstance(request, tornado.concurrent.Future)
 
+    def test_get_job_submitter(self):
+        """Test the `JobManager.get_job_submitter` method."""
+        job_submitter = self.manager.get_job_submitter(self.auth_info)
+        self.assertIsInstance(job_submitter, JobSubmitter)
+
+        # Calling the method again, should return the exact same instance of `JobSubmitter`
+        self.assertEqual(self.manager.get_job_submitter(self.auth_info), job_submitter)
+
+    def test_request_job_submission(self):
+        """Test the `JobManager.request_job_submission` method."""
+        with self.manager.request_job_submission(self.auth_info, '/scratch/job', 'aiida.sh') as request:
+            self.assertIsInstance(request, tornado.concurrent.Future)
+
+
+class TestJobSubmitter(AiidaTestCase):
+    """Test the `aiida.engine.processes.calcjobs.manager.JobSubmitter` class."""
+
+    def setUp(self):
+        super(TestJobSubmitter, self).setUp()
+        self.loop = tornado.ioloop.IOLoop()
+        self.transport_queue = TransportQueue(self.loop)
+        self.user = User.objects.get_default()
+        self.auth_info = AuthInfo(self.computer, self.user).store()
+
+    def tearDown(self):
+        super(TestJobSubmitter, self).tearDown()
+        AuthInfo.objects.delete(self.auth_info.pk)
+
+    def test_submit_batch(self):
+        """Test that requests within the batch window are submitted with a single call and resolve separately."""
+        from aiida.schedulers import Scheduler, SchedulerError
+
+        job_submitter = JobSubmitter(self.auth_info, self.transport_queue, batch_window=0.)
+        job_ids = ['1001', SchedulerError('submission failed'), '1003']
+
+        @tornado.gen.coroutine
+        def submit():
+            requests = [job_submitter.request_job_submission('/scratch/job_{}'.format(i), 'aiida.sh') for i in range(3)]
+            results = []
+            for request in requests:
+                try:
+                    result = yield request
+                except SchedulerError as exception:
+                    result = exception
+                results.append(result)
+            raise tornado.gen.Return(results)
+
+        with mock.patch.object(Scheduler, 'submit_from_scripts', return_value=job_ids) as submit_from_scripts:
+            results = self.loop.run_sync(submit)
+
+        self.assertEqual(submit_from_scripts.call_count, 1)
+        self.assertEqual([submission[0] for submission in submit_from_scripts.call_args[0][0]],
+                         ['/scratch/job_0', '/scratch/job_1', '/scratch/job_2'])
+        self.assertEqual(results, job_ids)
+
+    def test_submit_batch_size(self):
+        """Test that the requests are split in batches of the maximum batch size."""
+        from aiida.schedulers import Scheduler
+
+        job_submitter = JobSubmitter(self.auth_info, self.transport_queue, batch_window=0., batch_size=2)
+
+        @tornado.gen.coroutine
+        def submit():
+            requests = [job_submitter.request_job_submission('/scratch/job_{}'.format(i), 'aiida.sh') for i in range(3)]
+            results = yield requests
+            raise tornado.gen.Return(results)
+
+        def submit_from_scripts(submissions):
+            return [directory.split('_')[-1] for directory, _ in submissions]
+
+        with mock.patch.object(Scheduler, 'submit_from_scripts', side_effect=submit_from_scripts) as mocked:
+            results = self.loop.run_sync(submit)
+
+        self.assertEqual(mocked.call_count, 2)
+        self.assertEqual(results, ['0', '1', '2'])
+
+    def test_submit_cancelled_while_waiting_for_transport(self):
+        """Test that requests cancelled while the batch waits for a transport are not submitted."""
+        from aiida.schedulers import Scheduler
+
+        job_submitter = JobSubmitter(self.auth_info, self.transport_queue, batch_window=0.)
+        transport_request = tornado.concurrent.Future()
+
+        @contextlib.contextmanager
+        def request_transport(authinfo):  # pylint: disable=unused-argument
+            yield transport_request
+
+        @tornado.gen.coroutine
+        def submit():
+            requests = [job_submitter.request_job_submission('/scratch/job_{}'.format(i), 'aiida.sh') for i in range(3)]
+
+            # Let the batch start waiting for the transport, then cancel a request before the transport is available
+            yield tornado.gen.sleep(0.1)
+            job_submitter.cancel_job_submission(requests[1])
+            transport_request.set_result(mock.Mock())
+
+            results = yield [requests[0], requests[2]]
+            raise tornado.gen.Return(results)
+
+        def submit_from_scripts(submissions):
+            return [directory.split('_')[-1] for directory, _ in submissions]
+
+        with mock.patch.object(self.transport_queue, 'request_transport', request_transport), \
+                mock.patch.object(Scheduler, 'submit_from_scripts', side_effect=submit_from_scripts) as mocked:
+            results = self.loop.run_sync(submit)
+
+        self.assertEqual(mocked.call_count, 1)
+        self.assertEqual([submission[0] for submission in mocked.call_args[0][0]], ['/scratch/job_0', '/scratch/job_2'])
+        self.assertEqual(results, ['0', '2'])
+
 
 class TestJobsList(AiidaTestCase):
     """Test the `aiida.engine.processes.calcjobs.manager.JobsList` class."""
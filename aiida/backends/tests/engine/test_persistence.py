@@ -11,13 +11,29 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
+import mock
 import six
 import plumpy
 
+from aiida import orm
 from aiida.backends.testbase import AiidaTestCase
 from aiida.backends.tests.utils.processes import DummyProcess
+from aiida.common import AttributeDict
 from aiida.engine.persistence import AiiDAPersister
-from aiida.engine import Process, run
+from aiida.engine import Process, WorkChain, run
+from aiida.orm.utils import serialize
+
+
+class ContextWorkChain(WorkChain):
+    """Work chain with a single step, used to test the persistence of its context."""
+
+    @classmethod
+    def define(cls, spec):
+        super(ContextWorkChain, cls).define(spec)
+        spec.outline(cls.step)
+
+    def step(self):
+        pass
 
 
 class TestProcess(AiidaTestCase):
@@ -65,3 +81,52 @@ class TestAiiDAPersister(AiidaTestCase):
 
         self.persister.delete_checkpoint(process.pid)
         self.assertEquals(process.node.checkpoint, None)
+
+    def test_load_yaml_checkpoint(self):
+        """Test that a checkpoint that was serialized to yaml can still be loaded."""
+        process = DummyProcess()
+        bundle_saved = self.persister.save_checkpoint(process)
+        process.node.set_checkpoint(serialize.serialize(bundle_saved))
+
+        bundle_loaded = self.persister.load_checkpoint(process.node.pk)
+        self.assertDictEqual(bundle_saved, bundle_loaded)
+
+    def test_save_load_context(self):
+        """Test that the entries of the context are stored separately from the bundle and restored on loading."""
+        nodes = [orm.Int(index).store() for index in range(3)]
+
+        process = ContextWorkChain()
+        process.ctx.nodes = nodes
+        process.ctx.iteration = 3
+        self.persister.save_checkpoint(process)
+
+        self.assertNotIn(AiiDAPersister.CONTEXT_KEY, serialize.deserialize(process.node.checkpoint))
+        self.assertIn('nodes', process.node.checkpoint_context)
+        self.assertIn('iteration', process.node.checkpoint_context)
+
+        bundle_loaded = self.persister.load_checkpoint(process.node.pk)
+        context = bundle_loaded[AiiDAPersister.CONTEXT_KEY]
+
+        self.assertIsInstance(context, AttributeDict)
+        self.assertEqual([node.pk for node in context.nodes], [node.pk for node in nodes])
+        self.assertEqual(context.iteration, 3)
+
+        self.persister.delete_checkpoint(process.pid)
+        self.assertIsNone(process.node.checkpoint_context)
+
+    def test_context_written_when_changed(self):
+        """Test that the context entries are only written when one of them has changed."""
+        process = ContextWorkChain()
+        process.ctx.iteration = 1
+        self.persister.save_checkpoint(process)
+
+        with mock.patch.object(process.node, 'set_checkpoint', wraps=process.node.set_checkpoint) as set_checkpoint:
+            self.persister.save_checkpoint(process)
+            self.assertIsNone(set_checkpoint.call_args[0][1])
+
+            process.ctx.iteration = 2
+            self.persister.save_checkpoint(process)
+            self.assertIsNotNone(set_checkpoint.call_args[0][1])
+
+        context = self.persister.load_checkpoint(process.node.pk)[AiiDAPersister.CONTEXT_KEY]
+        self.assertEqual(context.iteration, 2)
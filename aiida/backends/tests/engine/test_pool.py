@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the utilities to pass nodes between the runner and the processes of a pool."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import io
+import os
+import shutil
+import tempfile
+
+from aiida import orm
+from aiida.backends.testbase import AiidaTestCase
+from aiida.engine.pool import pack_nodes, unpack_nodes
+
+
+class TestPackNodes(AiidaTestCase):
+    """Tests for `pack_nodes` and `unpack_nodes`."""
+
+    def setUp(self):
+        super(TestPackNodes, self).setUp()
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+        super(TestPackNodes, self).tearDown()
+
+    def test_roundtrip(self):
+        """Test that unstored nodes are recreated unstored with the same content and stored nodes are loaded."""
+        content_folder = tempfile.mkdtemp()
+        try:
+            with io.open(os.path.join(content_folder, 'file.txt'), 'w', encoding='utf8') as handle:
+                handle.write(u'content')
+            folder_data = orm.FolderData()
+            folder_data.put_object_from_tree(content_folder)
+        finally:
+            shutil.rmtree(content_folder)
+
+        stored = orm.Int(2).store()
+        dictionary = orm.Dict(dict={'a': 1, 'b': [1, 2]})
+        dictionary.set_extra('extra', 'value')
+
+        pack_nodes({'stored': stored, 'integer': orm.Int(1), 'dict': dictionary, 'folder': folder_data}, self.folder)
+        nodes = unpack_nodes(self.folder)
+
+        self.assertEqual(nodes['stored'].uuid, stored.uuid)
+
+        for key in ['integer', 'dict', 'folder']:
+            self.assertFalse(nodes[key].is_stored)
+
+        self.assertIsInstance(nodes['integer'], orm.Int)
+        self.assertEqual(nodes['integer'].value, 1)
+        self.assertEqual(nodes['dict'].get_dict(), {'a': 1, 'b': [1, 2]})
+        self.assertEqual(nodes['dict'].get_extra('extra'), 'value')
+        self.assertEqual(nodes['folder'].get_object_content('file.txt'), 'content')
+
+        for node in nodes.values():
+            node.store()
+
+    def test_roundtrip_properties(self):
+        """Test that the label, description and computer of unstored nodes are recreated."""
+        with_computer = orm.RemoteData(computer=self.computer, remote_path='/tmp')
+        with_computer.label = 'label'
+        with_computer.description = 'description'
+
+        pack_nodes({'with_computer': with_computer, 'without_computer': orm.Int(1)}, self.folder)
+        nodes = unpack_nodes(self.folder)
+
+        self.assertEqual(nodes['with_computer'].label, 'label')
+        self.assertEqual(nodes['with_computer'].description, 'description')
+        self.assertEqual(nodes['with_computer'].computer.uuid, self.computer.uuid)
+        self.assertEqual(nodes['with_computer'].get_remote_path(), '/tmp')
+        self.assertIsNone(nodes['without_computer'].computer)
+        self.assertEqual(nodes['without_computer'].label, '')
+
+    def test_roundtrip_numpy(self):
+        """Test that attributes and extras with numpy values are written as the python values they are stored as."""
+        import numpy
+
+        dictionary = orm.Dict(dict={'integer': numpy.int64(1), 'float': numpy.float64(0.5)})
+        dictionary.set_attribute('array', numpy.array([1., 2.]))
+        dictionary.set_extra('extra', numpy.int32(3))
+
+        pack_nodes({'dict': dictionary}, self.folder)
+        nodes = unpack_nodes(self.folder)
+
+        self.assertEqual(nodes['dict'].get_dict(), {'integer': 1, 'float': 0.5, 'array': [1., 2.]})
+        self.assertEqual(nodes['dict'].get_extra('extra'), 3)
+        nodes['dict'].store()
@@ -11,11 +11,12 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
+import mock
 from six.moves import range
-from tornado.gen import coroutine, Return
+from tornado.gen import coroutine, Return, sleep
 
 from aiida.backends.testbase import AiidaTestCase
-from aiida.engine.transports import TransportQueue
+from aiida.engine.transports import CircuitBreaker, TransportQueue
 from aiida import orm
 
 
@@ -143,3 +144,88 @@ class TestTransportQueue(AiidaTestCase):
 
         finally:
             transport_class._DEFAULT_SAFE_OPEN_INTERVAL = original_interval
+
+    def test_circuit_breaker_parks_requests(self):
+        """Test that requests are parked while the circuit of the authinfo is open and released once it recovers."""
+        queue = TransportQueue()
+        loop = queue.loop()
+        transport_class = self.authinfo.get_transport().__class__
+        original = transport_class.open
+        attempts = []
+
+        def broken_open(trans):
+            attempts.append(trans)
+            raise RuntimeError("Could not open transport")
+
+        @coroutine
+        def test():
+            with queue.request_transport(self.authinfo) as request:
+                trans = yield request
+                raise Return(trans.is_open)
+
+        with mock.patch.multiple(CircuitBreaker, FAILURE_THRESHOLD=1, RESET_INTERVAL=0.1):
+            try:
+                transport_class.open = broken_open
+                with self.assertRaises(RuntimeError):
+                    loop.run_sync(test)
+
+                breaker = queue.get_circuit_breaker(self.authinfo)
+                self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+                futures = [test() for _ in range(3)]
+                self.assertEqual(breaker.parked_count, 3)
+            finally:
+                transport_class.open = original
+
+            # Only the first request and the failed probes have tried to open a connection
+            self.assertEqual(len(attempts), 1)
+            self.assertEqual(loop.run_sync(lambda: futures), [True] * 3)
+            self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+
+class TestCircuitBreaker(AiidaTestCase):
+    """Tests for the circuit breaker that tracks the health of the connection of an authinfo."""
+
+    def test_state_transitions(self):
+        """Test tripping the breaker, the probing with an increasing interval and the release of parked requests."""
+        healthy = [False]
+        probes = []
+
+        def probe():
+            probes.append(healthy[0])
+            if not healthy[0]:
+                raise RuntimeError("Could not open transport")
+
+        loop = TransportQueue().loop()
+        options = dict(FAILURE_THRESHOLD=2, RESET_INTERVAL=0.01, RELEASE_BATCH_SIZE=2, RELEASE_INTERVAL=0.1)
+
+        with mock.patch.multiple(CircuitBreaker, **options):
+            breaker = CircuitBreaker(loop, probe)
+            self.assertTrue(breaker.wait().done())
+
+            breaker.record_failure()
+            self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+            breaker.record_failure()
+            self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+            parked = [breaker.wait() for _ in range(5)]
+            breaker.discard(parked.pop())
+            self.assertEqual(breaker.parked_count, 4)
+            self.assertFalse(any(future.done() for future in parked))
+
+            @coroutine
+            def recover():
+                yield sleep(0.05)
+                healthy[0] = True
+                yield parked[0]
+                # Only the first batch is released immediately
+                self.assertTrue(parked[1].done())
+                self.assertFalse(parked[2].done())
+                yield parked
+
+            loop.run_sync(recover, timeout=5)
+
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(breaker.parked_count, 0)
+        self.assertEqual(probes[-1], True)
+        self.assertGreater(len(probes), 1)
@@ -763,6 +763,40 @@ class TestWorkchain(AiidaTestCase):
 
         run_and_check_success(Workchain)
 
+    def test_to_context_submit_many(self):
+        """Test that the nodes of processes submitted in bulk are appended to a list in the context."""
+        test_case = self
+
+        class SimpleWc(WorkChain):
+
+            @classmethod
+            def define(cls, spec):
+                super(SimpleWc, cls).define(spec)
+                spec.input('value', valid_type=Int)
+                spec.outline(cls.result)
+                spec.outputs.dynamic = True
+
+            def result(self):
+                self.out('result', self.inputs.value)
+
+        class Workchain(WorkChain):
+
+            @classmethod
+            def define(cls, spec):
+                super(Workchain, cls).define(spec)
+                spec.outline(cls.begin, cls.result)
+
+            def begin(self):
+                nodes = self.submit_many(SimpleWc, [{'value': Int(value)} for value in range(3)])
+                test_case.assertEqual([node.inputs.value.value for node in nodes], [0, 1, 2])
+                return ToContext(results=nodes)
+
+            def result(self):
+                values = sorted(node.outputs.result.value for node in self.ctx.results)
+                test_case.assertEqual(values, [0, 1, 2])
+
+        run_and_check_success(Workchain)
+
     def test_persisting(self):
         persister = plumpy.test_utils.TestPersister()
         runner = get_manager().get_runner()
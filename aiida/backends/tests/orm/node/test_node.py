@@ -17,7 +17,7 @@ import os
 
 from aiida.backends.testbase import AiidaTestCase
 from aiida.common import exceptions, LinkType
-from aiida.orm import Data, Node, User, CalculationNode, WorkflowNode, load_node
+from aiida.orm import Data, Node, User, CalculationNode, WorkflowNode, QueryBuilder, load_node
 from aiida.orm.utils.links import LinkTriple
 
 
@@ -365,6 +365,31 @@ class TestNodeAttributesExtras(AiidaTestCase):
         self.assertEqual(set(self.node.extras_keys()), set(extras))
 
 
+    def test_deferred_attributes_extras(self):
+        """Test that the attributes and extras of a queried node are deferred and can still be retrieved."""
+        attributes = {'key': {'nested': [1, 2]}, 'none': None}
+        self.node.set_attribute_many(attributes)
+        self.node.set_extra('extra', 'value')
+        self.node.store()
+
+        for project in ['*', {'*': {'defer': []}}, {'*': {'defer': ['attributes']}}]:
+            builder = QueryBuilder().append(Data, filters={'id': self.node.pk}, project=project)
+            node = builder.one()[0]
+            self.assertEqual(node.get_attribute('key'), attributes['key'])
+            self.assertIsNone(node.get_attribute('none'))
+            self.assertEqual(node.get_extra('extra'), 'value')
+            self.assertEqual(node.attributes, attributes)
+
+            with self.assertRaises(AttributeError):
+                node.get_attribute('not_existing')
+
+            with self.assertRaises(AttributeError):
+                node.get_extra('not_existing')
+
+        for project in [{'*': {'defer': ['not_existing']}}, {'id': {'defer': ['attributes']}}]:
+            with self.assertRaises(exceptions.InputValidationError):
+                QueryBuilder().append(Data, filters={'id': self.node.pk}, project=project).all()
+
 class TestNodeLinks(AiidaTestCase):
     """Test for linking from and to Node."""
 
@@ -394,6 +419,50 @@ class TestNodeLinks(AiidaTestCase):
         self.assertEqual(link_triple.link_type, LinkType.INPUT_CALC)
         self.assertEqual(link_triple.link_label, 'input')
 
+    def test_prefetch_links(self):
+        """Test that prefetched links answer `get_outgoing` until a link is added through the same node instance."""
+        calculation = CalculationNode().store()
+        output_a = Data()
+        output_a.add_incoming(calculation, LinkType.CREATE, 'output_a')
+        output_a.store()
+
+        calculation.prefetch_links('outgoing', LinkType.CREATE)
+        self.assertEqual(calculation.outputs.output_a.uuid, output_a.uuid)
+
+        # A link added through another instance of the calculation is not reflected in the prefetched links
+        output_b = Data()
+        output_b.add_incoming(load_node(calculation.pk), LinkType.CREATE, 'output_b')
+        output_b.store()
+        self.assertEqual(calculation.get_outgoing(link_type=LinkType.CREATE).all_link_labels(), ['output_a'])
+
+        # Links of types that were not prefetched are still queried
+        self.assertEqual(sorted(calculation.get_outgoing().all_link_labels()), ['output_a', 'output_b'])
+
+        output_c = Data()
+        output_c.add_incoming(calculation, LinkType.CREATE, 'output_c')
+        output_c.store()
+        labels = sorted(calculation.get_outgoing(link_type=LinkType.CREATE).all_link_labels())
+        self.assertEqual(labels, ['output_a', 'output_b', 'output_c'])
+
+    def test_identity_map(self):
+        """Test that within an identity map the same stored node is always represented by the same instance."""
+        from aiida.orm.utils.identity import identity_map
+
+        data = Data().store()
+        calculation = CalculationNode()
+        calculation.add_incoming(data, LinkType.INPUT_CALC, 'input')
+        calculation.store()
+
+        with identity_map():
+            node = load_node(data.pk)
+            self.assertIs(load_node(data.uuid), node)
+            self.assertIs(load_node(calculation.pk).inputs.input, node)
+
+            stored = Data().store()
+            self.assertIs(load_node(stored.pk), stored)
+
+        self.assertIsNot(load_node(data.pk), load_node(data.pk))
+
     def test_validate_incoming_ipsum(self):
         """Test the `validate_incoming` method with respect to linking ourselves."""
         with self.assertRaises(ValueError):
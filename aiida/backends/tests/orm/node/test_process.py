@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the `ProcessNode` node sub class."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import contextlib
+
+import mock
+from plumpy import ProcessState
+
+from aiida.backends.testbase import AiidaTestCase
+from aiida.common import exceptions
+from aiida.orm import CalcJobNode, WorkflowNode, load_node
+from aiida.schedulers.datastructures import JobState
+
+# Methods of the backend node that each write the attributes to the database with a single statement once stored
+WRITE_METHODS = ('set_attribute', 'set_attribute_many', 'delete_attribute', 'delete_attribute_many')
+
+
+@contextlib.contextmanager
+def count_attribute_writes(node):
+    """Count the number of statements with which the attributes of the given stored node are written.
+
+    :param node: a stored node
+    :return: a list that will contain the names of the backend methods that were called to write attributes
+    """
+    writes = []
+    backend_entity = node.backend_entity
+
+    def wrap(name):
+        method = getattr(backend_entity, name)
+
+        def wrapped(*args, **kwargs):
+            writes.append(name)
+            return method(*args, **kwargs)
+
+        return wrapped
+
+    patches = [mock.patch.object(backend_entity, name, wrap(name)) for name in WRITE_METHODS]
+
+    for patch in patches:
+        patch.start()
+
+    try:
+        yield writes
+    finally:
+        for patch in patches:
+            patch.stop()
+
+
+class TestProcessNodeAttributeBuffer(AiidaTestCase):
+    """Tests for the attribute buffer of the `ProcessNode`."""
+
+    def test_unstored(self):
+        """The attribute buffer can only be enabled for stored nodes."""
+        with self.assertRaises(exceptions.ModificationNotAllowed):
+            WorkflowNode().enable_attribute_buffer()
+
+    def test_buffered_updates(self):
+        """Updates of the bufferable attributes are only written when the buffer is flushed."""
+        node = WorkflowNode().store()
+        node.enable_attribute_buffer()
+
+        with count_attribute_writes(node) as writes:
+            node.set_process_state(ProcessState.RUNNING)
+            node.set_process_status('first')
+            node.set_process_status('second')
+
+            # The buffered values are visible on the node itself but not yet in the database
+            self.assertEqual(node.process_state, ProcessState.RUNNING)
+            self.assertEqual(node.process_status, 'second')
+            self.assertIsNone(load_node(node.pk).process_status)
+            self.assertTrue(node.is_attribute_buffer_pending)
+            self.assertEqual(writes, [])
+
+            node.flush_attribute_buffer()
+
+        self.assertEqual(len(writes), 1)
+        self.assertFalse(node.is_attribute_buffer_pending)
+        self.assertEqual(load_node(node.pk).process_state, ProcessState.RUNNING)
+        self.assertEqual(load_node(node.pk).process_status, 'second')
+
+    def test_buffered_deletion(self):
+        """Deleting a bufferable attribute is held back as well and raises if the attribute does not exist."""
+        node = WorkflowNode().store()
+        node.set_process_status('status')
+        node.enable_attribute_buffer()
+
+        node.set_process_status(None)
+        self.assertIsNone(node.process_status)
+        self.assertEqual(load_node(node.pk).process_status, 'status')
+
+        with self.assertRaises(AttributeError):
+            node.delete_attribute(node.PROCESS_STATUS_KEY)
+
+        node.flush_attribute_buffer()
+        self.assertIsNone(load_node(node.pk).process_status)
+
+    def test_immediate_update_carries_buffer(self):
+        """An update of an attribute that is not bufferable writes all pending updates in the same statement."""
+        node = WorkflowNode().store()
+        node.enable_attribute_buffer()
+
+        with count_attribute_writes(node) as writes:
+            node.set_process_state(ProcessState.WAITING)
+            node.set_process_status('waiting')
+            node.set_checkpoint('checkpoint')
+
+        self.assertEqual(len(writes), 1)
+        self.assertFalse(node.is_attribute_buffer_pending)
+
+        loaded = load_node(node.pk)
+        self.assertEqual(loaded.process_state, ProcessState.WAITING)
+        self.assertEqual(loaded.process_status, 'waiting')
+        self.assertEqual(loaded.checkpoint, 'checkpoint')
+
+    def test_callback_and_seal(self):
+        """The callback is called when the buffer becomes dirty and sealing the node flushes the buffer."""
+        calls = []
+        node = WorkflowNode().store()
+        node.enable_attribute_buffer(callback=lambda: calls.append(True))
+
+        node.set_process_state(ProcessState.FINISHED)
+        node.set_process_status('done')
+        self.assertEqual(len(calls), 1)
+
+        node.seal()
+        self.assertTrue(load_node(node.pk).is_sealed)
+        self.assertEqual(load_node(node.pk).process_state, ProcessState.FINISHED)
+
+        with self.assertRaises(exceptions.ModificationNotAllowed):
+            node.set_process_status('after sealing')
+
+    def test_calcjob_scheduler_updates(self):
+        """Repeated scheduler updates of a calculation job are coalesced into a single statement."""
+        node = CalcJobNode(computer=self.computer)
+        node.set_option('resources', {'num_machines': 1, 'num_mpiprocs_per_machine': 1})
+        node.store()
+        node.enable_attribute_buffer()
+
+        with count_attribute_writes(node) as writes:
+            for _ in range(10):
+                node.set_process_status('Waiting for transport task: update')
+                node.set_scheduler_state(JobState.RUNNING)
+                node.set_process_status(None)
+            node.flush_attribute_buffer()
+
+        # The process status was never written, so its pending deletion does not require a statement
+        self.assertEqual(len(writes), 1)
+        self.assertEqual(load_node(node.pk).get_scheduler_state(), JobState.RUNNING)
+        self.assertIsNone(load_node(node.pk).process_status)
@@ -165,6 +165,54 @@ class TestGroups(AiidaTestCase):
         group.remove_nodes([node_01, node_02])
         self.assertEqual(set(_.pk for _ in nodes), set(_.pk for _ in group.nodes))
 
+    def test_nodes_by_pks(self):
+        """Test the bulk membership operations based on node pks."""
+        nodes = [orm.Data().store() for _ in range(4)]
+        pks = [node.pk for node in nodes]
+        group = orm.Group(label='test_nodes_by_pks').store()
+
+        # Duplicate pks and pks of nodes that are already in the group should be ignored
+        group.add_nodes_by_pks(pks[:2] + pks[:1])
+        group.add_nodes_by_pks(iter(pks))
+        self.assertEqual(list(group.iter_node_pks()), sorted(pks))
+
+        # Removing pks that are not in the group should not raise
+        group.remove_nodes_by_pks([pks[0], pks[2], max(pks) + 1000])
+        self.assertEqual(list(group.iter_node_pks()), sorted([pks[1], pks[3]]))
+
+        with self.assertRaises(exceptions.ModificationNotAllowed):
+            orm.Group(label='test_nodes_by_pks_unstored').add_nodes_by_pks(pks)
+
+    def test_set_operations(self):
+        """Test the set operations between the node sets of groups."""
+        nodes = [orm.Data().store() for _ in range(4)]
+        pks = [node.pk for node in nodes]
+
+        group_a = orm.Group(label='test_set_operations_a').store()
+        group_b = orm.Group(label='test_set_operations_b').store()
+        group_c = orm.Group(label='test_set_operations_c').store()
+        group_a.add_nodes_by_pks(pks[:3])
+        group_b.add_nodes_by_pks(pks[1:])
+        group_c.add_nodes_by_pks(pks[2:3])
+
+        iter_node_pks = orm.Group.objects.iter_node_pks
+        self.assertEqual(list(iter_node_pks([group_a, group_b], 'union')), sorted(pks))
+        self.assertEqual(list(iter_node_pks([group_a, group_b], 'intersection')), sorted(pks[1:3]))
+        self.assertEqual(list(iter_node_pks([group_a, group_b], 'difference')), pks[:1])
+        self.assertEqual(list(iter_node_pks([group_b, group_a, group_c], 'difference')), pks[3:])
+        self.assertEqual(list(iter_node_pks([group_c])), pks[2:3])
+
+        with self.assertRaises(ValueError):
+            list(iter_node_pks([group_a, group_b], 'symmetric_difference'))
+
+        destination = orm.Group(label='test_set_operations_destination').store()
+        destination.add_nodes_from_groups([group_a, group_b], 'intersection')
+        self.assertEqual(list(destination.iter_node_pks()), sorted(pks[1:3]))
+
+        # Adding nodes that are already contained should be ignored
+        destination.add_nodes_from_groups([group_a])
+        self.assertEqual(list(destination.iter_node_pks()), sorted(pks[:3]))
+
     def test_clear(self):
         """Test the `clear` method to remove all nodes."""
         node_01 = orm.Data().store()
@@ -211,3 +211,19 @@ class TestOrmUtils(AiidaTestCase):
 
         with self.assertRaises(NotExistent):
             load_group('non-existent-uuid')
+
+    def test_load_node_partial_uuid(self):
+        """Test that partial UUIDs are resolved regardless of their dashes and case."""
+        node = Data().store()
+
+        for identifier in [node.uuid[:9], node.uuid[:13].replace('-', ''), node.uuid[:11].upper(), node.uuid[:-1]]:
+            loaded_node = load_node(uuid=identifier)
+            self.assertEqual(loaded_node.uuid, node.uuid)
+
+        # A partial UUID whose range does not include the node, because the character following the prefix differs
+        other_character = 'f' if node.uuid[9] != 'f' else '0'
+        with self.assertRaises(NotExistent):
+            load_node(uuid='{}-{}'.format(node.uuid[:8], other_character * 4))
+
+        with self.assertRaises(NotExistent):
+            load_node(uuid='non-hexadecimal')
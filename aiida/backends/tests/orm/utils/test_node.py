@@ -24,3 +24,17 @@ class TestLoadNodeClass(AiidaTestCase):
         """Verify that `load_node_class` will fall back to `Data` class if entry point cannot be loaded."""
         loaded_class = load_node_class('data.some.non.existing.plugin.')
         self.assertEqual(loaded_class, Data)
+
+    def test_load_node_class_cache(self):
+        """Verify that `load_node_class` caches the resolved classes until the entry point cache is reset."""
+        from aiida.orm import Int
+        from aiida.orm.utils.node import NODE_CLASS_CACHE
+        from aiida.plugins.entry_point import reset_entry_point_cache
+
+        type_string = Int().node_type
+        self.assertEqual(load_node_class(type_string), Int)
+        self.assertIs(NODE_CLASS_CACHE[type_string], Int)
+
+        reset_entry_point_cache()
+        self.assertNotIn(type_string, NODE_CLASS_CACHE)
+        self.assertEqual(load_node_class(type_string), Int)
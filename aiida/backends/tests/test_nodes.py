@@ -1852,3 +1852,114 @@ class TestNodeDeletion(AiidaTestCase):
             delete_nodes([called.pk], verbosity=2, force=True, follow_returns=True)
 
         self._check_existence(uuids_check_existence, uuids_check_deleted)
+
+    def test_deletion_dry_run(self):
+        """Check that a dry run reports the number of nodes per type but does not delete anything."""
+        in1, in2, wf, slave1, outp1, outp2, slave2, outp3, outp4 = self._create_calls_n_returns_graph()
+        nodes = (in1, in2, wf, slave1, outp1, outp2, slave2, outp3, outp4)
+
+        with Capturing() as output:
+            delete_nodes([wf.pk], verbosity=1, dry_run=True, follow_calls=True)
+
+        self._check_existence([node.uuid for node in nodes], [])
+        self.assertIn('would delete 4 nodes', '\n'.join(output))
+        self.assertTrue(any(line.split() == ['2', wf.node_type] for line in output))
+
+    def test_deletion_chunked(self):
+        """Check that the deletion gives the same result if the traversal and deletion are split in many chunks."""
+        from aiida.manage.database.delete import nodes as delete_module
+
+        in1, in2, wf, slave1, outp1, outp2, slave2, outp3, outp4 = self._create_calls_n_returns_graph()
+        uuids_check_existence = (in1.uuid, in2.uuid)
+        uuids_check_deleted = [n.uuid for n in (wf, slave1, outp1, outp2, outp3, slave2, outp4)]
+
+        group = orm.Group(label='test_deletion_chunked').store()
+        group.add_nodes([in1, outp1])
+
+        query_chunk_size = delete_module.QUERY_CHUNK_SIZE
+        delete_module.QUERY_CHUNK_SIZE = 1
+        try:
+            with Capturing():
+                delete_nodes([wf.pk], verbosity=2, force=True, follow_calls=True, follow_returns=True)
+        finally:
+            delete_module.QUERY_CHUNK_SIZE = query_chunk_size
+
+        self._check_existence(uuids_check_existence, uuids_check_deleted)
+        self.assertEqual([node.pk for node in group.nodes], [in1.pk])
+
+    def test_delete_nodes_and_connections_chunked(self):
+        """Check that deleting nodes in chunks of a single node also removes their group memberships and comments."""
+        from aiida.backends.utils import delete_nodes_and_connections
+
+        in1, in2, wf, slave1, outp1, outp2, slave2, outp3, outp4 = self._create_calls_n_returns_graph()
+        uuids_check_existence = (in1.uuid, in2.uuid)
+        uuids_check_deleted = [n.uuid for n in (wf, slave1, outp1, outp2, outp3, slave2, outp4)]
+
+        group = orm.Group(label='test_delete_nodes_and_connections_chunked').store()
+        group.add_nodes([in1, outp1])
+        comment = outp1.add_comment('comment')
+
+        delete_nodes_and_connections([orm.load_node(uuid).pk for uuid in uuids_check_deleted], chunk_size=1)
+
+        self._check_existence(uuids_check_existence, uuids_check_deleted)
+        self.assertEqual([node.pk for node in group.nodes], [in1.pk])
+        self.assertEqual(orm.Comment.objects.find(filters={'id': comment.pk}), [])
+
+    def test_deletion_interrupted(self):
+        """Check that rerunning a deletion that was interrupted after any number of chunks deletes the remaining nodes.
+
+        The nodes are deleted in chunks of a single node and the deletion is interrupted after each possible number of
+        chunks. The repository folders of the committed chunks should be erased right away and the rerun should find
+        all the remaining nodes from the start node, such that no node is left behind.
+        """
+        import mock
+        from aiida.backends import utils as backend_utils
+        from aiida.manage.database.delete import nodes as delete_module
+
+        delete_nodes_and_connections = backend_utils.delete_nodes_and_connections
+
+        for interrupt_after in range(1, 7):
+            in1, in2, wf, slave1, outp1, outp2, slave2, outp3, outp4 = self._create_calls_n_returns_graph()
+            uuids_check_existence = (in1.uuid, in2.uuid)
+            nodes_check_deleted = (wf, slave1, outp1, outp2, outp3, slave2, outp4)
+            uuids_check_deleted = [node.uuid for node in nodes_check_deleted]
+            uuids = {node.pk: node.uuid for node in nodes_check_deleted}
+            deleted_chunks = []
+
+            def delete_chunk(pks, *args, **kwargs):
+                if len(deleted_chunks) == interrupt_after:  # pylint: disable=cell-var-from-loop
+                    raise KeyboardInterrupt
+                delete_nodes_and_connections(pks, *args, **kwargs)
+                deleted_chunks.append(list(pks))  # pylint: disable=cell-var-from-loop
+
+            with mock.patch.object(backend_utils, 'DELETE_NODES_CHUNK_SIZE', 1):
+                with mock.patch.object(backend_utils, 'delete_nodes_and_connections', side_effect=delete_chunk):
+                    with mock.patch.object(delete_module, 'erase_repository_folders') as erase_repository_folders:
+                        with self.assertRaises(KeyboardInterrupt), Capturing():
+                            delete_nodes([wf.pk], force=True, follow_calls=True, follow_returns=True)
+
+            # The start node is deleted last and the folders of every committed chunk are erased right after it
+            self.assertNotIn([wf.pk], deleted_chunks)
+            erased = [call[0][0] for call in erase_repository_folders.call_args_list]
+            self.assertEqual(erased, [[uuids[pk]] for [pk] in deleted_chunks])
+
+            with Capturing():
+                delete_nodes([wf.pk], force=True, follow_calls=True, follow_returns=True)
+
+            self._check_existence(uuids_check_existence, uuids_check_deleted)
+
+    def test_deletion_repository(self):
+        """Check that the repository folders of the deleted nodes are removed."""
+        import io
+        import os
+
+        node = orm.Data()
+        node.put_object_from_filelike(io.StringIO(u'content'), 'file.txt')
+        node.store()
+        path = node._repository._repo_folder.abspath  # pylint: disable=protected-access
+        self.assertTrue(os.path.isdir(path))
+
+        with Capturing():
+            delete_nodes([node.pk], force=True)
+
+        self.assertFalse(os.path.exists(path))
@@ -16,7 +16,7 @@ from aiida.engine import CalcJob, WorkChain
 from aiida.orm import Data
 from aiida.parsers import Parser
 from aiida.plugins import factories
-from aiida.plugins.entry_point import get_entry_points
+from aiida.plugins.entry_point import get_entry_points, get_entry_point_group_index, load_entry_point
 from aiida.schedulers import Scheduler
 from aiida.transports import Transport
 from aiida.tools.dbimporters import DbImporter
@@ -102,3 +102,13 @@ class TestExistingPlugins(AiidaTestCase):
             cls = factories.DbImporterFactory(entry_point.name)
             self.assertTrue(issubclass(cls, DbImporter),
                 'DbImporter plugin class {} is not subclass of {}'.format(cls, DbImporter))
+
+    def test_entry_point_group_index(self):
+        """Test that the index of an entry point group contains its entry points and that loading is cached."""
+        index = get_entry_point_group_index('aiida.transports')
+        self.assertEqual(list(index.keys()), [entry_point.name for entry_point in get_entry_points('aiida.transports')])
+        self.assertIn('local', index)
+
+        loaded = load_entry_point('aiida.transports', 'local')
+        self.assertTrue(issubclass(loaded, Transport))
+        self.assertIs(load_entry_point('aiida.transports', 'local'), loaded)
@@ -15,10 +15,12 @@ from __future__ import print_function
 
 import warnings
 
+import six
 from six.moves import range, zip
 
 from aiida import orm
 from aiida.backends.testbase import AiidaTestCase
+from aiida.common.exceptions import InputValidationError
 from aiida.common.links import LinkType
 from aiida.manage import configuration
 
@@ -703,6 +705,118 @@ class TestAttributes(AiidaTestCase):
             res = [str(_) for _, in qb.all()]
             self.assertEqual(set(res), set((n_arr.uuid,)))
 
+    def test_attribute_negation(self):
+        """Test that negated filters on attributes match nodes with a value of another type or without the attribute."""
+        key = 'value_test_attr_negation'
+        n_str, n_int, n_bool, n_none = [orm.Data() for _ in range(4)]
+        n_str.set_attribute(key, 'running')
+        n_int.set_attribute(key, 1)
+        n_bool.set_attribute(key, True)
+
+        for node in (n_str, n_int, n_bool, n_none):
+            node.store()
+
+        uuids = {node.uuid for node in (n_str, n_int, n_bool, n_none)}
+
+        def get_uuids(filters):
+            builder = orm.QueryBuilder().append(orm.Data, filters=filters, project='uuid')
+            return {str(uuid) for uuid, in builder.all() if str(uuid) in uuids}
+
+        attribute = 'attributes.{}'.format(key)
+        self.assertEqual(get_uuids({attribute: {'in': ['running', 'waiting']}}), {n_str.uuid})
+        self.assertEqual(get_uuids({attribute: {'!in': ['running']}}), {n_int.uuid, n_bool.uuid, n_none.uuid})
+        self.assertEqual(get_uuids({attribute: {'!==': 1}}), {n_str.uuid, n_bool.uuid, n_none.uuid})
+        self.assertEqual(get_uuids({attribute: {'!>': 0}}), {n_str.uuid, n_bool.uuid, n_none.uuid})
+        self.assertEqual(get_uuids({attribute: {'!==': True}}), {n_str.uuid, n_int.uuid, n_none.uuid})
+
+
+class TestAggregation(AiidaTestCase):
+    """Tests for grouping and aggregate functions in projections."""
+
+    def setUp(self):
+        super(TestAggregation, self).setUp()
+        self.key_group = 'aggregation_group'
+        self.key_value = 'aggregation_value'
+        for group, value in [('a', 1), ('a', 2), ('a', 6), ('b', 1.5)]:
+            node = orm.Data()
+            node.set_attribute(self.key_group, group)
+            node.set_attribute(self.key_value, value)
+            node.store()
+
+    def get_builder(self, project, group_by):
+        """Return a builder for the nodes created by `setUp`, grouped by the group attribute."""
+        builder = orm.QueryBuilder()
+        filters = {'attributes.{}'.format(self.key_group): {'in': ['a', 'b']}}
+        builder.append(orm.Data, filters=filters, project=project, tag='data')
+        builder.group_by({'data': group_by})
+        return builder
+
+    def test_aggregate_functions(self):
+        """Test the aggregate functions on a casted attribute per value of another attribute."""
+        group = 'attributes.{}'.format(self.key_group)
+        value = 'attributes.{}'.format(self.key_value)
+
+        project = [
+            {group: {'cast': 't'}},
+            {'id': {'func': 'count'}},
+            {value: {'func': 'sum', 'cast': 'f'}},
+            {'label': {'func': 'array_agg'}},
+        ]
+        results = {entry[0]: entry[1:] for entry in self.get_builder(project, [{group: {'cast': 't'}}]).all()}
+        self.assertEqual(sorted(results.keys()), ['a', 'b'])
+        self.assertEqual(results['a'][:2], [3, 9.])
+        self.assertEqual(len(results['a'][2]), 3)
+        self.assertEqual(results['b'][:2], [1, 1.5])
+
+        for func, expected in [('min', 1.), ('max', 6.), ('avg', 3.)]:
+            project = [group, {value: {'func': func, 'cast': 'f'}}]
+            results = dict(self.get_builder(project, [group]).all())
+            self.assertAlmostEqual(results['a'], expected)
+
+    def test_group_by_queryhelp(self):
+        """Test that the grouping is part of the queryhelp and that the count is the number of groups."""
+        group = 'attributes.{}'.format(self.key_group)
+        builder = self.get_builder([group, {'id': {'func': 'count'}}], [group])
+        self.assertEqual(builder.count(), 2)
+
+        queryhelp = builder.get_json_compatible_queryhelp()
+        self.assertEqual(queryhelp['group_by'], [{'data': [{group: {}}]}])
+        self.assertEqual(sorted(orm.QueryBuilder(**queryhelp).all()), [['a', 3], ['b', 1]])
+
+        with self.assertRaises(InputValidationError):
+            builder.group_by({'data': [{group: {'order': 'asc'}}]})
+
+
+class TestRecords(AiidaTestCase):
+    """Tests for the projection of plain records."""
+
+    def test_records(self):
+        """Test that the records are tuples of the projected values, which are equal to those returned by `all`."""
+        node = orm.Data()
+        node.set_attribute('record', {'nested': [1, 2]})
+        node.set_extra('extra', 'value')
+        node.store()
+
+        builder = orm.QueryBuilder()
+        builder.append(orm.Data, filters={'id': {'==': node.pk}}, project=['id', 'uuid', 'attributes', 'extras'])
+        records = builder.records()
+
+        self.assertEqual(records, [(node.pk, node.uuid, node.attributes, node.extras)])
+        self.assertEqual([list(record) for record in records], builder.all())
+        self.assertIsInstance(records[0][1], six.string_types)
+
+        builder = orm.QueryBuilder()
+        builder.append(orm.Data, filters={'id': {'==': node.pk}}, project=['attributes.record.nested', 'extras.extra'])
+        self.assertEqual(list(builder.iterrecords()), [([1, 2], 'value')])
+
+    def test_records_entities(self):
+        """Test that records cannot be returned when projecting entire entities."""
+        builder = orm.QueryBuilder()
+        builder.append(orm.Data, project=['id', '*'])
+
+        with self.assertRaises(InputValidationError):
+            builder.records()
+
 
 class QueryBuilderLimitOffsetsTest(AiidaTestCase):
 
@@ -678,6 +678,63 @@ class RESTApiTestSuite(RESTApiTestCase):
         RESTApiTestCase.node_exception(self, "/computers?aa=bb&id=2", InputValidationError)
         """
 
+    ############### grouping and aggregates #######################
+    def get_grouped_data(self, url):
+        """
+        Return the data of the response of a grouped query
+
+        :param url: web url
+        """
+        with self.app.test_client() as client:
+            response = json.loads(client.get(self._url_prefix + url).data)
+
+        self.assertNotIn('message', response)
+        return response['data']
+
+    def test_computers_groupby(self):
+        """
+        Group the computers by transport type, count them and get the largest id of each group
+        """
+        expected = {}
+        for transport_type, pk in orm.QueryBuilder().append(orm.Computer, project=['transport_type', 'id']).all():
+            count, max_id = expected.get(transport_type, (0, pk))
+            expected[transport_type] = (count + 1, max(pk, max_id))
+
+        data = self.get_grouped_data('/computers?groupby=transport_type&aggregate=count,max_id&orderby=transport_type')
+
+        self.assertEqual([group['transport_type'] for group in data['computers']], sorted(expected))
+        for group in data['computers']:
+            self.assertEqual((group['count'], group['max_id']), expected[group['transport_type']])
+
+    def test_nodes_groupby(self):
+        """
+        Group the nodes by node type, and check that the number of nodes is counted if no aggregate is given
+        """
+        expected = {}
+        for node_type, pk in orm.QueryBuilder().append(orm.Node, project=['node_type', 'id']).all():
+            count, min_pk = expected.get(node_type, (0, pk))
+            expected[node_type] = (count + 1, min(pk, min_pk))
+
+        data = self.get_grouped_data('/nodes?groupby=node_type')
+        self.assertEqual({group['node_type']: group['count'] for group in data['nodes']},
+                         {node_type: count for node_type, (count, _) in expected.items()})
+
+        data = self.get_grouped_data('/nodes?groupby=node_type&aggregate=min_pk')
+        self.assertEqual({group['node_type']: group['min_pk'] for group in data['nodes']},
+                         {node_type: min_pk for node_type, (_, min_pk) in expected.items()})
+
+    def test_groupby_invalid_aggregate(self):
+        """
+        Check that an unknown aggregate function and an aggregate of a specific node are refused
+        """
+        node_uuid = self.get_dummy_data()["calculations"][0]["uuid"]
+
+        for url in ['/computers?groupby=transport_type&aggregate=median_id',
+                    '/nodes/{}?groupby=node_type'.format(node_uuid)]:
+            with self.app.test_client() as client:
+                response = json.loads(client.get(self._url_prefix + url).data)
+            self.assertIn('message', response)
+
     ############### single calculation ########################
     def test_calculations_details(self):
         """
@@ -966,3 +1023,183 @@ class RESTApiTestSuite(RESTApiTestCase):
                 available_properties = response["data"]["fields"].keys()
                 for prop in response["data"]["ordering"]:
                     self.assertIn(prop, available_properties)
+
+
+class RESTApiCacheTestSuite(AiidaTestCase):
+    """
+    Tests of the cache of the responses of the RESTful-api
+    """
+    _url_prefix = "/api/v3"
+
+    def setUp(self):
+        super(RESTApiCacheTestSuite, self).setUp()
+        kwargs = dict(
+            PREFIX=self._url_prefix,
+            PERPAGE_DEFAULT=20,
+            LIMIT_DEFAULT=400,
+            RESPONSE_CACHE_CONFIG={
+                'ENABLED': True,
+                'MAXSIZE': 10,
+                'TTL': 60
+            })
+
+        self.app = App(__name__)
+        self.app.config['TESTING'] = True
+        AiidaApi(self.app, **kwargs)
+
+        self.node = orm.Data().store()
+
+    def test_conditional_request(self):
+        """
+        Test that a cached response carries an ETag and that a matching If-None-Match header returns a 304
+        """
+        url = self._url_prefix + '/nodes/' + self.node.uuid
+
+        with self.app.test_client() as client:
+            response = client.get(url)
+            self.assertEqual(response.status_code, 200)
+            etag = response.headers.get('ETag')
+            self.assertIsNotNone(etag)
+
+            cached = client.get(url)
+            self.assertEqual(cached.status_code, 200)
+            self.assertEqual(cached.data, response.data)
+            self.assertEqual(cached.headers.get('ETag'), etag)
+
+            not_modified = client.get(url, headers={'If-None-Match': etag})
+            self.assertEqual(not_modified.status_code, 304)
+            self.assertEqual(not_modified.data, b'')
+
+    def test_normalized_query_string(self):
+        """
+        Test that requests that only differ in the order of the parameters share their cached response
+        """
+        url = self._url_prefix + '/nodes'
+
+        with self.app.test_client() as client:
+            first = client.get(url + '?limit=5&orderby=-id')
+            second = client.get(url + '?orderby=-id&limit=5')
+
+        self.assertEqual(first.headers.get('ETag'), second.headers.get('ETag'))
+        self.assertEqual(first.data, second.data)
+
+    def test_invalidation(self):
+        """
+        Test that storing a node invalidates the cached responses and counts
+        """
+        url = self._url_prefix + '/nodes?orderby=-id&limit=1'
+
+        with self.app.test_client() as client:
+            response = client.get(url)
+            self.assertEqual(json.loads(response.data)['data']['nodes'][0]['uuid'], self.node.uuid)
+
+            node = orm.Data().store()
+
+            response = client.get(url)
+            self.assertEqual(json.loads(response.data)['data']['nodes'][0]['uuid'], node.uuid)
+
+
+class RESTApiTreeTestSuite(AiidaTestCase):
+    """
+    Tests of the tree endpoint of the RESTful-api for a node with many links
+    """
+    _url_prefix = "/api/v3"
+    _LIMIT_DEFAULT = 10
+    _number_of_outgoings = 25
+
+    @classmethod
+    def setUpClass(cls, *args, **kwargs):
+        super(RESTApiTreeTestSuite, cls).setUpClass()
+        kwargs = dict(PREFIX=cls._url_prefix, PERPAGE_DEFAULT=20, LIMIT_DEFAULT=cls._LIMIT_DEFAULT)
+
+        cls.app = App(__name__)
+        cls.app.config['TESTING'] = True
+        AiidaApi(cls.app, **kwargs)
+
+        creator = orm.CalculationNode().store()
+        cls.node = orm.Data()
+        cls.node.add_incoming(creator, link_type=LinkType.CREATE, link_label='result')
+        cls.node.store()
+
+        for index in range(cls._number_of_outgoings):
+            calc = orm.CalculationNode()
+            calc.add_incoming(cls.node, link_type=LinkType.INPUT_CALC, link_label='even' if index % 2 else 'odd')
+            calc.store()
+
+    def get_tree(self, query_string=''):
+        """
+        Return the data of the response of the tree endpoint of the node with many links
+        """
+        url = self._url_prefix + '/nodes/' + self.node.uuid + '/io/tree' + query_string
+
+        with self.app.test_client() as client:
+            response = json.loads(client.get(url).data)
+
+        self.assertNotIn('message', response)
+        return response['data']
+
+    def test_default_limit(self):
+        """
+        Test that the number of returned links is bounded by the default limit, while the totals count all links
+        """
+        data = self.get_tree()
+
+        self.assertEqual(data['sent_no_of_incomings'], 1)
+        self.assertEqual(data['sent_no_of_outgoings'], self._LIMIT_DEFAULT)
+        self.assertEqual(data['total_no_of_incomings'], 1)
+        self.assertEqual(data['total_no_of_outgoings'], self._number_of_outgoings)
+        self.assertEqual(len(data['nodes']), 1 + 1 + self._LIMIT_DEFAULT)
+        self.assertEqual(len(data['edges']), 1 + self._LIMIT_DEFAULT)
+        self.assertIsNone(data['next_in_cursor'])
+        self.assertIsNotNone(data['next_out_cursor'])
+
+    def test_link_counts(self):
+        """
+        Test the number of links per link type and label
+        """
+        data = self.get_tree('?in_limit=1&out_limit=1')
+
+        self.assertEqual(data['incoming_link_counts'], [{
+            'linktype': LinkType.CREATE.value,
+            'linklabel': 'result',
+            'count': 1
+        }])
+        self.assertEqual(data['outgoing_link_counts'], [{
+            'linktype': LinkType.INPUT_CALC.value,
+            'linklabel': 'even',
+            'count': self._number_of_outgoings // 2
+        }, {
+            'linktype': LinkType.INPUT_CALC.value,
+            'linklabel': 'odd',
+            'count': self._number_of_outgoings - self._number_of_outgoings // 2
+        }])
+
+    def test_cursor_pagination(self):
+        """
+        Test that following the cursors returns every outgoing link exactly once
+        """
+        uuids = []
+        cursor = None
+
+        while True:
+            query_string = '?out_limit=7' if cursor is None else '?out_limit=7&out_cursor={}'.format(cursor)
+            data = self.get_tree(query_string)
+            uuids.extend(node['nodeuuid'] for node in data['nodes'] if node['group'] == 'outputs')
+            cursor = data['next_out_cursor']
+            if cursor is None:
+                break
+
+        expected = [node.uuid for node in self.node.get_outgoing().all_nodes()]
+        self.assertEqual(len(uuids), self._number_of_outgoings)
+        self.assertEqual(sorted(uuids), sorted(expected))
+
+    def test_limit_too_large(self):
+        """
+        Test that a limit larger than the default limit is refused
+        """
+        url = self._url_prefix + '/nodes/' + self.node.uuid + '/io/tree?out_limit={}'.format(self._LIMIT_DEFAULT + 1)
+
+        with self.app.test_client() as client:
+            response = json.loads(client.get(url).data)
+
+        self.assertIn('message', response)
@@ -21,6 +21,9 @@ from aiida.manage import configuration
 
 AIIDA_ATTRIBUTE_SEP = '.'
 
+# Maximum number of nodes that are deleted within a single transaction by `delete_nodes_and_connections`
+DELETE_NODES_CHUNK_SIZE = 5000
+
 
 Setting = collections.namedtuple('Setting', ['key', 'value', 'description', 'time'])
 
@@ -116,7 +119,12 @@ def _load_dbenv_noschemacheck(profile=None, *args, **kwargs):
     return to_return
 
 
-def delete_nodes_and_connections(pks):
+def delete_nodes_and_connections(pks, chunk_size=DELETE_NODES_CHUNK_SIZE):
+    """Delete the nodes with the given pks together with their links, comments, logs and group memberships.
+
+    :param pks: an iterable of node pks
+    :param chunk_size: the maximum number of nodes deleted per transaction
+    """
     if configuration.PROFILE.database_backend == BACKEND_DJANGO:
         from aiida.backends.djsite.utils import delete_nodes_and_connections_django as delete_nodes_backend
     elif configuration.PROFILE.database_backend == BACKEND_SQLA:
@@ -124,4 +132,4 @@ def delete_nodes_and_connections(pks):
     else:
         raise Exception("unknown backend {}".format(configuration.PROFILE.database_backend))
 
-    delete_nodes_backend(pks)
+    delete_nodes_backend(pks, chunk_size)
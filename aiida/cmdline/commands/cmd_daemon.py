@@ -22,9 +22,9 @@ from click_spinner import spinner
 from aiida.cmdline.commands.cmd_verdi import verdi
 from aiida.cmdline.utils import decorators, echo
 from aiida.cmdline.utils.common import get_env_with_venv_bin
-from aiida.cmdline.utils.daemon import get_daemon_status, \
+from aiida.cmdline.utils.daemon import get_daemon_status, format_daemon_top, \
     print_client_response_status, delete_stale_pid_file, _START_CIRCUS_COMMAND
-from aiida.manage.configuration import get_config
+from aiida.manage.configuration import get_config, get_config_option
 
 
 def validate_positive_non_zero_integer(ctx, param, value):  # pylint: disable=unused-argument,invalid-name
@@ -121,6 +121,43 @@ def decr(number):
     print_client_response_status(response)
 
 
+@verdi_daemon.command()
+@click.option(
+    '-i', '--interval', type=click.FLOAT, default=5., show_default=True, help='Refresh interval in seconds.')
+@click.option('--once', is_flag=True, help='Print the current state once and exit.')
+def top(interval, once):
+    """Show the load and performance metrics of the daemon workers, press CTRL+C to quit."""
+    from aiida.engine.daemon.client import get_daemon_client
+    from aiida.engine.daemon.load import read_worker_loads, WORKER_LOAD_MAX_AGE
+    from aiida.engine.daemon.telemetry import read_worker_metrics, merge_metrics
+
+    client = get_daemon_client()
+    directory = client.daemon_workers_directory
+
+    # The workers write their metrics periodically, so the rates are computed between the last two distinct snapshots
+    current = None
+    previous = None
+
+    try:
+        while True:
+            metrics = merge_metrics(read_worker_metrics(directory, WORKER_LOAD_MAX_AGE).values())
+
+            if current is None or metrics['timestamp'] != current['timestamp']:
+                previous, current = current, metrics
+
+            output = format_daemon_top(read_worker_loads(directory), current, previous)
+
+            if once:
+                echo.echo(output)
+                return
+
+            click.clear()
+            echo.echo(output)
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+
+
 @verdi_daemon.command()
 def logshow():
     """Show the log of the daemon, press CTRL+C to quit."""
@@ -233,6 +270,7 @@ def start_circus(foreground, number):
     from circus.util import check_future_exception_and_log, configure_logger
 
     from aiida.engine.daemon.client import get_daemon_client
+    from aiida.engine.daemon.load import DaemonAutoscaler
 
     if foreground and number > 1:
         raise click.ClickException('can only run a single worker when running in the foreground')
@@ -284,6 +322,14 @@ def start_circus(foreground, number):
     loggerconfig = loggerconfig or arbiter.loggerconfig or None
     configure_logger(circus_logger, loglevel, logoutput, loggerconfig)
 
+    autoscaler = None
+
+    if get_config_option('daemon.autoscale'):
+        min_workers = get_config_option('daemon.autoscale.min_workers')
+        max_workers = get_config_option('daemon.autoscale.max_workers')
+        autoscaler = DaemonAutoscaler(client, min_workers, max_workers)
+        autoscaler.start()
+
     # Main loop
     should_restart = True
 
@@ -304,3 +350,6 @@ def start_circus(foreground, number):
             arbiter = None
             if pidfile is not None:
                 pidfile.unlink()
+
+    if autoscaler is not None:
+        autoscaler.stop()
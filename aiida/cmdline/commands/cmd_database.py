@@ -18,6 +18,7 @@ from aiida.cmdline.commands.cmd_verdi import verdi
 from aiida.cmdline.params import options
 from aiida.cmdline.utils import decorators, echo
 from aiida.manage.database.integrity.duplicate_uuid import TABLES_UUID_DEDUPLICATION
+from aiida.manage.database.integrity.repository import MIN_AGE_ORPHANED, SCAN_THREADS
 
 
 @verdi.group('database')
@@ -197,3 +198,66 @@ def detect_invalid_nodes():
         echo.echo_success('no integrity violations detected')
     else:
         echo.echo_critical('one or more integrity violations detected')
+
+
+@verdi_database.group('repository')
+def verdi_database_repository():
+    """Inspect and clean the file repository of the nodes."""
+
+
+@verdi_database_repository.command('gc')
+@click.option(
+    '-a', '--apply', 'apply_removal', is_flag=True, help='Remove the orphaned folders instead of performing a dry run.')
+@click.option(
+    '-m',
+    '--min-age',
+    type=click.INT,
+    default=MIN_AGE_ORPHANED,
+    show_default=True,
+    help='Only consider unreferenced folders that were last modified at least this many seconds ago as orphaned.')
+@click.option(
+    '-t',
+    '--threads',
+    type=click.INT,
+    default=SCAN_THREADS,
+    show_default=True,
+    help='Number of threads scanning the repository.')
+@options.VERBOSE(help='Print the UUIDs of the orphaned and missing folders.')
+@decorators.with_dbenv()
+def repository_gc(apply_removal, min_age, threads, verbose):
+    """Detect and remove node repository folders that do not correspond to any node in the database.
+
+    Orphaned folders can be left behind by failures while storing, deleting or importing nodes. The command also reports
+    nodes whose repository folder is missing. Folders that were recently modified are skipped, since they might belong
+    to nodes that are being stored at this very moment.
+    """
+    from aiida.manage.database.integrity.repository import scan_repository, remove_repository_folders
+
+    result = scan_repository(min_age=min_age, threads=threads)
+
+    echo.echo_info('scanned {} repository folders'.format(result.scanned))
+
+    if result.recent:
+        echo.echo_info('skipped {} unreferenced folders modified in the last {} seconds'.format(result.recent, min_age))
+
+    if result.missing:
+        echo.echo_warning('{} nodes do not have a repository folder'.format(len(result.missing)))
+        if verbose:
+            echo.echo('\n'.join(result.missing))
+
+    if not result.orphaned:
+        echo.echo_success('no orphaned repository folders detected')
+        return
+
+    echo.echo_warning('{} orphaned repository folders detected'.format(len(result.orphaned)))
+    if verbose:
+        echo.echo('\n'.join(result.orphaned))
+
+    if apply_removal:
+        removed = remove_repository_folders(result.orphaned, threads=threads)
+        if len(removed) < len(result.orphaned):
+            echo.echo_info('kept {} folders of nodes that were stored during the scan'.format(
+                len(result.orphaned) - len(removed)))
+        echo.echo_success('removed {} orphaned repository folders'.format(len(removed)))
+    else:
+        echo.echo_info('this was a dry run, pass `--apply` to remove the orphaned folders')
@@ -36,7 +36,7 @@ def group_add_nodes(group, force, nodes):
     if not force:
         click.confirm('Do you really want to add {} nodes to Group<{}>?'.format(len(nodes), group.label), abort=True)
 
-    group.add_nodes(nodes)
+    group.add_nodes_by_pks([node.pk for node in nodes])
 
 
 @verdi_group.command('remove-nodes')
@@ -58,7 +58,7 @@ def group_remove_nodes(group, nodes, clear, force):
     if clear:
         group.clear()
     else:
-        group.remove_nodes(nodes)
+        group.remove_nodes_by_pks([node.pk for node in nodes])
 
 
 @verdi_group.command('delete')
@@ -143,7 +143,7 @@ def group_show(group, raw, uuid):
         if uuid:
             echo.echo(' '.join(str(_.uuid) for _ in group.nodes))
         else:
-            echo.echo(' '.join(str(_.pk) for _ in group.nodes))
+            echo.echo(' '.join(str(pk) for pk in group.iter_node_pks()))
     else:
         type_string = group.type_string
         desc = group.description
@@ -340,5 +340,32 @@ def group_copy(source_group, destination_group):
         click.confirm('Do you wish to continue anyway?', abort=True)
 
     # Copy nodes
-    dest_group.add_nodes(list(source_group.nodes))
+    dest_group.add_nodes_from_groups([source_group])
     echo.echo_success('Nodes copied from group<{}> to group<{}>'.format(source_group.label, dest_group.label))
+
+
+@verdi_group.command('combine')
+@click.argument('operation', type=click.Choice(['union', 'intersection', 'difference']))
+@click.argument('destination_group', nargs=1, type=click.STRING)
+@arguments.GROUPS('source_groups', required=True)
+@with_dbenv()
+def group_combine(operation, destination_group, source_groups):
+    """Add the union, intersection or difference of the nodes of SOURCE_GROUPS to DESTINATION_GROUP.
+
+    The destination group is created if it does not exist yet. For the difference, the nodes of the first source group
+    that are not contained in any of the other source groups are added. The set operation is performed directly in the
+    database, so it is fast also for groups with millions of nodes.
+    """
+    from aiida import orm
+    from aiida.orm import GroupTypeString
+
+    dest_group, created = orm.Group.objects.get_or_create(
+        label=destination_group, type_string=GroupTypeString.USER.value)
+
+    if not created and not dest_group.is_empty:
+        echo.echo_warning('Destination group<{}> already exists and is not empty.'.format(dest_group.label))
+        click.confirm('Do you wish to continue anyway?', abort=True)
+
+    count = dest_group.count()
+    dest_group.add_nodes_from_groups(list(source_groups), operation)
+    echo.echo_success('Added {} nodes to group<{}>'.format(dest_group.count() - count, dest_group.label))
@@ -162,6 +162,43 @@ def show(nodes, print_groups):
                     echo.echo(gr_specs)
 
 
+@verdi_node.command('attributes')
+@arguments.NODES()
+@click.option(
+    '-k',
+    '--keys',
+    type=click.STRING,
+    cls=options.MultipleValueOption,
+    help='Only show the attributes with these keys, nested keys are separated by a dot.')
+@options.RAW(help='Display only the attributes, without the pk of the node.')
+@with_dbenv()
+def node_attributes(nodes, keys, raw):
+    """Show the attributes of one or more nodes."""
+    from collections import OrderedDict
+    from aiida.orm import Node, QueryBuilder
+
+    # Remove duplicate keys while preserving the order, because the same key cannot be projected twice
+    keys = list(OrderedDict.fromkeys(keys or ()))
+
+    if keys:
+        projections = ['id'] + ['attributes.{}'.format(key) for key in keys]
+    else:
+        projections = ['id', 'attributes']
+
+    # The attributes are projected as records, which avoids copying the attributes of each of the loaded nodes
+    builder = QueryBuilder()
+    builder.append(Node, filters={'id': {'in': [node.pk for node in nodes]}}, project=projections)
+
+    attributes = {}
+    for record in builder.iterrecords():
+        attributes[record[0]] = dict(zip(keys, record[1:])) if keys else record[1]
+
+    for node in nodes:
+        if not raw:
+            echo.echo('PK: {}'.format(node.pk), bold=True)
+        echo.echo_dictionary(attributes[node.pk])
+
+
 @verdi_node.command()
 @arguments.NODES()
 @click.option('-d', '--depth', 'depth', default=1, help="Show children of nodes up to given depth")
@@ -236,7 +273,13 @@ class NodeTreePrinter(object):  # pylint: disable=useless-object-inheritance
 @click.option('--force', is_flag=True, default=False, help='Do not ask for confirmation.')
 @with_dbenv()
 def node_delete(nodes, follow_calls, dry_run, verbose, force):
-    """Delete nodes and everything that originates from them."""
+    """Delete nodes and everything that originates from them.
+
+    Large deletions are committed in chunks, deleting the nodes that originate from others first and the given nodes
+    last. If the command is interrupted, the nodes of the chunks that were already committed are deleted while the
+    others are not, which leaves a partially deleted provenance graph. Run the command again with the same nodes to
+    complete the deletion.
+    """
     from aiida.manage.database.delete.nodes import delete_nodes
 
     verbosity = 1
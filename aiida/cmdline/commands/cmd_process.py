@@ -43,13 +43,20 @@ def verdi_process():
 @options.PAST_DAYS()
 @options.LIMIT()
 @options.RAW()
+@click.option(
+    '-c',
+    '--count-only',
+    is_flag=True,
+    default=False,
+    help='Only show the number of matching entries per process state and process label.')
 @decorators.with_dbenv()
 def process_list(all_entries, group, process_state, exit_status, failed, past_days, limit, project, raw, order_by,
-                 order_dir):
+                 order_dir, count_only):
     """Show a list of processes that are still running."""
     # pylint: disable=too-many-locals
     from tabulate import tabulate
     from aiida.cmdline.utils.common import print_last_process_state_change, check_worker_load
+    from aiida.cmdline.utils.query.formatting import format_table_pages
 
     relationships = {}
 
@@ -58,28 +65,45 @@ def process_list(all_entries, group, process_state, exit_status, failed, past_da
 
     builder = CalculationQueryBuilder()
     filters = builder.get_filters(all_entries, process_state, exit_status, failed)
+
+    if count_only:
+        summary = builder.get_summary(relationships=relationships, filters=filters, past_days=past_days)
+        if raw:
+            echo.echo(tabulate(summary, tablefmt='plain'))
+        else:
+            echo.echo(tabulate(summary, headers=['Process state', 'Process label', 'Count']))
+            echo.echo('\nTotal results: {}\n'.format(sum(entry[2] for entry in summary)))
+        return
+
     query_set = builder.get_query_set(
-        relationships=relationships, filters=filters, order_by={order_by: order_dir}, past_days=past_days, limit=limit)
-    projected = builder.get_projected(query_set, projections=project)
+        relationships=relationships,
+        filters=filters,
+        order_by={order_by: order_dir},
+        past_days=past_days,
+        limit=limit,
+        projections=project)
+
+    counter = {'rows': 0}
+
+    def count_rows(rows):
+        for row in rows:
+            counter['rows'] += 1
+            yield row
 
-    headers = projected.pop(0)
+    projected = count_rows(builder.iterate_projected(query_set, projections=project))
 
     if raw:
-        tabulated = tabulate(projected, tablefmt='plain')
-        echo.echo(tabulated)
+        for page in format_table_pages(projected, tablefmt='plain'):
+            if page:
+                echo.echo(page)
     else:
-        tabulated = tabulate(projected, headers=headers)
-        echo.echo(tabulated)
-        echo.echo('\nTotal results: {}\n'.format(len(projected)))
+        for page in format_table_pages(projected, headers=builder.get_headers(project)):
+            echo.echo(page)
+        echo.echo('\nTotal results: {}\n'.format(counter['rows']))
         print_last_process_state_change()
-        # Second query to get active process count
-        # Currently this is slow but will be fixed wiith issue #2770
-        # We place it at the end so that the user can Ctrl+C after getting the process table.
-        builder = CalculationQueryBuilder()
+        # We place the count of active processes at the end so that the user can Ctrl+C after getting the process table
         filters = builder.get_filters(process_state=('created', 'waiting', 'running'))
-        query_set = builder.get_query_set(filters=filters)
-        projected = builder.get_projected(query_set, projections=['pk'])
-        worker_slot_use = len(projected) - 1
+        worker_slot_use = builder.get_count(filters=filters)
         check_worker_load(worker_slot_use)
 
 
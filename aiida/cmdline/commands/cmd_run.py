@@ -115,5 +115,9 @@ def run(scriptname, varargs, group, group_name, exclude, excludesubclasses, incl
             # Re-raise the exception to have the error code properly returned at the end
             raise
     finally:
+        # Write the autogroup memberships that are still buffered
+        if autogroup.current_autogroup is not None:
+            autogroup.current_autogroup.flush()
+
         if handle:
             handle.close()
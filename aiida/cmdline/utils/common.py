@@ -466,11 +466,11 @@ def check_worker_load(active_slots):
     """
     from aiida.common.exceptions import CircusCallError
     from aiida.cmdline.utils import echo
-    from aiida.manage.external.rmq import _RMQ_TASK_PREFETCH_COUNT
+    from aiida.manage.configuration import get_config_option
 
     warning_threshold = 0.9  # 90%
 
-    slots_per_worker = _RMQ_TASK_PREFETCH_COUNT
+    slots_per_worker = get_config_option('daemon.worker_process_slots')
 
     try:
         active_workers = get_num_workers()
@@ -95,6 +95,69 @@ def get_daemon_status(client):
     return template.format(**info)
 
 
+def format_daemon_top(loads, metrics, previous=None):
+    """
+    Format the load and performance metrics of the daemon workers as shown by `verdi daemon top`
+
+    :param loads: list of `WorkerLoad` snapshots of the workers
+    :param metrics: the merged metrics snapshot of the workers
+    :param previous: an earlier merged metrics snapshot, used to compute the rates of the counters and histograms
+    :return: the formatted string
+    """
+    from aiida.engine.daemon.telemetry import get_histogram_quantile
+
+    if not loads:
+        return '--> No daemon workers are reporting their load. Is the daemon running?'
+
+    interval = metrics['timestamp'] - previous['timestamp'] if previous else 0.
+
+    def get_rate(current, before):
+        if interval <= 0:
+            return '-'
+        return '{:.2f}'.format(max(current - before, 0) / interval)
+
+    def to_milliseconds(value):
+        return '-' if value is None else '{:.1f}'.format(value * 1000)
+
+    workers = [['PID', 'processes', 'slots', 'load %', 'transports', 'loop lag [ms]']]
+    for load in sorted(loads, key=lambda load: load.pid):
+        workers.append([
+            load.pid, load.active_processes, load.slots, '{:.0f}'.format(load.utilisation * 100), load.open_transports,
+            to_milliseconds(load.loop_lag)
+        ])
+
+    counters = [['counter', 'total', 'rate [1/s]']]
+    for name, value in sorted(metrics['counters'].items()):
+        before = previous['counters'].get(name, 0) if previous else 0
+        counters.append([name, value, get_rate(value, before)])
+
+    histograms = [['metric', 'count', 'rate [1/s]', 'mean [ms]', 'p50 [ms]', 'p95 [ms]', 'max [ms]']]
+    for name, histogram in sorted(metrics['histograms'].items()):
+        before = previous['histograms'].get(name, {'count': 0})['count'] if previous else 0
+        mean = histogram['sum'] / histogram['count'] if histogram['count'] else None
+        histograms.append([
+            name, histogram['count'],
+            get_rate(histogram['count'], before),
+            to_milliseconds(mean),
+            to_milliseconds(get_histogram_quantile(histogram, 0.5)),
+            to_milliseconds(get_histogram_quantile(histogram, 0.95)),
+            to_milliseconds(histogram['max'])
+        ])
+
+    sections = [
+        'Workers [{}]:'.format(len(loads)),
+        tabulate(workers, headers='firstrow', tablefmt='simple'),
+    ]
+
+    if len(histograms) > 1:
+        sections.extend(['', tabulate(histograms, headers='firstrow', tablefmt='simple')])
+
+    if len(counters) > 1:
+        sections.extend(['', tabulate(counters, headers='firstrow', tablefmt='simple')])
+
+    return '\n'.join(sections)
+
+
 def delete_stale_pid_file(client):
     """Delete a potentially state daemon PID file.
 
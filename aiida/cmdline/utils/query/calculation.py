@@ -18,14 +18,17 @@ from aiida.cmdline.utils.query.mapping import CalculationProjectionMapper
 class CalculationQueryBuilder(object):  # pylint: disable=useless-object-inheritance
     """Utility class to construct a QueryBuilder instance for Calculation nodes and project the query set."""
 
-    # This tuple serves to mark compound projections that cannot explicitly be projected in the QueryBuilder, but will
-    # have to be manually projected from composing its individual projection constituents
-    _compound_projections = ('state',)
+    # This mapping serves to mark compound projections that cannot explicitly be projected in the QueryBuilder, but will
+    # have to be manually projected from composing the individual projection constituents to which they are mapped
+    _projection_dependencies = {'state': ('process_state', 'paused', 'exit_status')}
     _default_projections = ('pk', 'ctime', 'process_label', 'state', 'process_status')
     _valid_projections = ('pk', 'uuid', 'ctime', 'mtime', 'state', 'process_state', 'process_status', 'exit_status',
                           'sealed', 'process_label', 'label', 'description', 'node_type', 'paused', 'process_type',
                           'job_state', 'scheduler_state')
 
+    # The number of entries retrieved per query of the query set
+    _page_size = 1000
+
     def __init__(self, mapper=None):
         if mapper is None:
             self._mapper = CalculationProjectionMapper(self._valid_projections)
@@ -80,36 +83,142 @@ class CalculationQueryBuilder(object):  # pylint: disable=useless-object-inherit
 
         return filters
 
-    def get_query_set(self, relationships=None, filters=None, order_by=None, past_days=None, limit=None):
+    def get_query_set(self,
+                      relationships=None,
+                      filters=None,
+                      order_by=None,
+                      past_days=None,
+                      limit=None,
+                      projections=None,
+                      page_size=None):
         """
         Return the query set of calculations for the given filters and query parameters
 
+        The query set is retrieved in pages using keyset pagination: each page is a separate query that continues after
+        the `ctime` and `id` of the last entry of the previous page, such that the database can seek to the start of the
+        page through the index instead of counting past all preceding rows, and the entries can be formatted as soon as
+        their page arrives instead of after the entire query set has been retrieved.
+
         :param relationships: a mapping of relationships to join on, e.g. {'with_node': Group} to join on a Group. The
             keys in this dictionary should be the keyword used in the `append` method of the `QueryBuilder` to join the
             entity on that is defined as the value.
         :param filters: rules to filter query results with
-        :param order_by: order the query set by this criterion
+        :param order_by: order the query set by this criterion, either on `ctime` or on `id`
         :param past_days: only include entries from the last past days
         :param limit: limit the query set to this number of entries
-        :return: the query set, a list of dictionaries
+        :param projections: only retrieve the attributes needed for these projections, by default all valid ones
+        :param page_size: the number of entries to retrieve per query
+        :return: the query set, an iterator of dictionaries
         """
-        import datetime
+        if projections is None:
+            projections = self._valid_projections
 
-        from aiida import orm
-        from aiida.common import timezone
+        if order_by is None:
+            order_by = {'ctime': 'asc'}
 
-        # Define the list of projections for the QueryBuilder, which are all valid minus the compound projections
-        projected_attributes = [
-            self.mapper.get_attribute(projection)
-            for projection in self._valid_projections
-            if projection not in self._compound_projections
-        ]
+        ((order_key, order_direction),) = order_by.items()
 
-        if filters is None:
-            filters = {}
+        # Order on the `id` as well to have a total order for entries with the same `ctime`, on which the pages can seek
+        keys = [order_key] if order_key == 'id' else [order_key, 'id']
+        projected_attributes = self._get_projected_attributes(projections)
+        projected_attributes.extend([key for key in keys if key not in projected_attributes])
+        filters = self._get_past_days_filters(filters, past_days)
 
-        if past_days is not None:
-            filters['ctime'] = {'>': timezone.now() - datetime.timedelta(days=past_days)}
+        return self._iterate_pages(relationships, filters, projected_attributes, keys, order_direction, limit,
+                                   page_size or self._page_size)
+
+    def _iterate_pages(self, relationships, filters, projected_attributes, keys, order_direction, limit, page_size):
+        """
+        Yield the entries of the query set page by page, where each page continues after the last entry of the previous.
+
+        :param relationships: a mapping of relationships to join on
+        :param filters: rules to filter query results with
+        :param projected_attributes: the attributes to project
+        :param keys: the columns to order on, which together have to uniquely identify an entry
+        :param order_direction: `asc` or `desc`
+        :param limit: the maximum number of entries to yield in total
+        :param page_size: the number of entries to retrieve per query
+        """
+        # pylint: disable=too-many-arguments
+        operator = '>' if order_direction == 'asc' else '<'
+        remaining = limit
+        last_entry = None
+
+        while remaining is None or remaining > 0:
+
+            if last_entry is None:
+                page_filters = filters
+            else:
+                # Seek past the last entry: the first key is beyond its value, or equal and the next key is beyond etc.
+                keyset = {'or': []}
+                for index, key in enumerate(keys):
+                    condition = {previous: {'==': last_entry[previous]} for previous in keys[:index]}
+                    condition[key] = {operator: last_entry[key]}
+                    keyset['or'].append(condition)
+                page_filters = {'and': [filters, keyset]} if filters else keyset
+
+            size = page_size if remaining is None else min(page_size, remaining)
+
+            builder = self._get_builder(relationships, page_filters, projected_attributes)
+            builder.order_by({'process': [{key: order_direction} for key in keys]})
+            builder.limit(size)
+
+            page = builder.dict()
+
+            for entry in page:
+                yield entry
+
+            if len(page) < size:
+                return
+
+            if remaining is not None:
+                remaining -= len(page)
+
+            last_entry = page[-1]['process']
+
+    def get_count(self, relationships=None, filters=None, past_days=None):
+        """
+        Return the number of calculations for the given filters, counted by the database
+
+        :param relationships: a mapping of relationships to join on
+        :param filters: rules to filter query results with
+        :param past_days: only include entries from the last past days
+        :return: the number of matching calculations
+        """
+        filters = self._get_past_days_filters(filters, past_days)
+        return self._get_builder(relationships, filters, ['id']).count()
+
+    def get_summary(self, relationships=None, filters=None, past_days=None):
+        """
+        Return the number of calculations per process state and process label for the given filters
+
+        The entries are counted by the database with a `GROUP BY` on the process state and label, such that the
+        calculations themselves never have to be retrieved.
+
+        :param relationships: a mapping of relationships to join on
+        :param filters: rules to filter query results with
+        :param past_days: only include entries from the last past days
+        :return: list of tuples of process state, process label and count, sorted by process state and label
+        """
+        process_state = self.mapper.get_attribute('process_state')
+        process_label = self.mapper.get_attribute('process_label')
+
+        filters = self._get_past_days_filters(filters, past_days)
+        builder = self._get_builder(relationships, filters, [process_state, process_label, {'id': {'func': 'count'}}])
+        builder.group_by({'process': [process_state, process_label]})
+
+        return sorted((tuple(entry) for entry in builder.iterall()), key=lambda entry: (entry[0] or '', entry[1] or ''))
+
+    def _get_builder(self, relationships, filters, projected_attributes):
+        """
+        Return a QueryBuilder for the calculations with the given relationships, filters and projections
+
+        :param relationships: a mapping of relationships to join on
+        :param filters: rules to filter query results with
+        :param projected_attributes: the attributes to project
+        :return: the `QueryBuilder` instance, where the calculations have the tag `process`
+        """
+        from aiida import orm
 
         builder = orm.QueryBuilder()
         builder.append(cls=orm.ProcessNode, filters=filters, project=projected_attributes, tag='process')
@@ -118,25 +227,60 @@ class CalculationQueryBuilder(object):  # pylint: disable=useless-object-inherit
             for tag, entity in relationships.items():
                 builder.append(cls=type(entity), filters={'id': entity.id}, **{tag: 'process'})
 
-        if order_by is not None:
-            builder.order_by({'process': order_by})
-        else:
-            builder.order_by({'process': {'ctime': 'asc'}})
+        return builder
+
+    def _get_projected_attributes(self, projections):
+        """
+        Return the attributes that need to be projected by the QueryBuilder to format the given projections
 
-        if limit is not None:
-            builder.limit(limit)
+        :param projections: the projections
+        :return: list of attributes without duplicates
+        """
+        projected_attributes = []
 
-        return builder.iterdict()
+        for projection in projections:
+            for dependency in self._projection_dependencies.get(projection, (projection,)):
+                attribute = self.mapper.get_attribute(dependency)
+                if attribute not in projected_attributes:
+                    projected_attributes.append(attribute)
 
-    def get_projected(self, query_set, projections):
+        return projected_attributes
+
+    @staticmethod
+    def _get_past_days_filters(filters, past_days):
         """
-        Project the query set for the given set of projections
+        Return a copy of the filters that includes a filter on the creation time if `past_days` is specified
+
+        :param filters: rules to filter query results with
+        :param past_days: only include entries from the last past days
+        :return: dictionary of filters
         """
-        header = [self.mapper.get_label(projection) for projection in projections]
-        result = [header]
+        import datetime
 
+        from aiida.common import timezone
+
+        filters = dict(filters or {})
+
+        if past_days is not None:
+            filters['ctime'] = {'>': timezone.now() - datetime.timedelta(days=past_days)}
+
+        return filters
+
+    def get_headers(self, projections):
+        """
+        Return the labels of the given projections
+        """
+        return [self.mapper.get_label(projection) for projection in projections]
+
+    def iterate_projected(self, query_set, projections):
+        """
+        Yield the formatted values of the given projections for each entry of the query set as it is retrieved
+        """
         for query_result in query_set:
-            result_row = [self.mapper.format(projection, query_result['process']) for projection in projections]
-            result.append(result_row)
+            yield [self.mapper.format(projection, query_result['process']) for projection in projections]
 
-        return result
+    def get_projected(self, query_set, projections):
+        """
+        Project the query set for the given set of projections
+        """
+        return [self.get_headers(projections)] + list(self.iterate_projected(query_set, projections))
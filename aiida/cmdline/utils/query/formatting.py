@@ -76,3 +76,38 @@ def format_sealed(sealed):
     :return: string representation of seal status
     """
     return 'True' if sealed == 1 else 'False'
+
+
+def format_table_pages(rows, headers=(), tablefmt='simple', page_size=1000):
+    """
+    Yield a table of the given rows formatted page by page, such that rows are shown as soon as their page is complete
+
+    The column widths are determined per page and the headers are only included in the first page.
+
+    :param rows: an iterable of rows, which are lists of values
+    :param headers: the column headers
+    :param tablefmt: the table format as accepted by `tabulate`
+    :param page_size: the number of rows per page
+    :return: generator of strings, one for each page
+    """
+    from tabulate import tabulate
+
+    def format_page(page, first_page):
+        table = tabulate(page, headers=headers, tablefmt=tablefmt)
+        if first_page or not headers:
+            return table
+        # The headers are included in the formatting such that the columns are at least as wide as in the first page
+        return table.split('\n', 2)[-1]
+
+    page = []
+    first_page = True
+
+    for row in rows:
+        page.append(row)
+        if len(page) >= page_size:
+            yield format_page(page, first_page)
+            page = []
+            first_page = False
+
+    if page or first_page:
+        yield format_page(page, first_page)
@@ -12,6 +12,10 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
+import collections
+import threading
+import time
+
 from enum import Enum, IntEnum
 
 from .extendeddicts import DefaultFieldsAttributeDict
@@ -206,3 +210,83 @@ class LazyStore(object):
         :return: the object that was popped
         """
         return self._store.pop(key)
+
+
+class LRUCache(object):  # pylint: disable=useless-object-inheritance
+    """
+    A thread safe mapping with a maximum number of entries, that discards the least recently used entry when full
+
+    Optionally, entries expire a given number of seconds after they were set, after which they are treated as absent.
+    """
+
+    def __init__(self, maxsize, ttl=None):
+        """
+        :param maxsize: the maximum number of entries
+        :param ttl: optional number of seconds after which an entry expires
+        """
+        if maxsize < 1:
+            raise ValueError('the maximum size should be a positive integer')
+
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return self.get(key, self) is not self
+
+    def get(self, key, default=None):
+        """
+        Get the value of the given key and mark it as the most recently used entry
+
+        :param key: the key of the entry
+        :param default: the value to return if there is no entry for the key or if it expired
+        :return: the value
+        """
+        with self._lock:
+            try:
+                value, timestamp = self._entries.pop(key)
+            except KeyError:
+                return default
+
+            if self._ttl is not None and time.time() - timestamp > self._ttl:
+                return default
+
+            self._entries[key] = (value, timestamp)
+            return value
+
+    def set(self, key, value):
+        """
+        Set the value of the given key, discarding the least recently used entry if the cache is full
+
+        :param key: the key of the entry
+        :param value: the value
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (value, time.time())
+
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key, default=None):
+        """
+        Remove the entry of the given key
+
+        :param key: the key of the entry
+        :param default: the value to return if there is no entry for the key
+        :return: the value of the removed entry
+        """
+        with self._lock:
+            try:
+                return self._entries.pop(key)[0]
+            except KeyError:
+                return default
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
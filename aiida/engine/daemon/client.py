@@ -142,6 +142,10 @@ class DaemonClient(object):  # pylint: disable=too-many-public-methods,useless-o
     def daemon_pid_file(self):
         return self.profile.filepaths['daemon']['pid']
 
+    @property
+    def daemon_workers_directory(self):
+        return self.profile.filepaths['daemon']['workers']
+
     def get_circus_port(self):
         """
         Retrieve the port for the circus controller, which should be written to the circus port file. If the
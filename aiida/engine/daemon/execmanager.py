@@ -16,13 +16,14 @@ plugin-specific operations.
 from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
+import io
 import os
 
 import warnings
 from six.moves import zip
 
 from aiida.common import AIIDA_LOGGER, exceptions
-from aiida.common.datastructures import CalcJobState
+from aiida.common.datastructures import CalcJobState, LRUCache
 from aiida.common.folders import SandboxFolder
 from aiida.common.links import LinkType
 from aiida.common.warnings import AiidaDeprecationWarning
@@ -33,8 +34,81 @@ from aiida.schedulers.datastructures import JobState
 
 REMOTE_WORK_DIRECTORY_LOST_FOUND = 'lost+found'
 
+# Name of the file in which `parse_calculation` writes the exit code returned by the parser
+PARSED_EXIT_CODE_FILENAME = 'exit_code.json'
+
 execlogger = AIIDA_LOGGER.getChild('execmanager')
 
+# Caches of the entities that a daemon worker loads for every calculation job that it uploads. Since stored nodes are
+# immutable, they can be cached indefinitely. Authorization information and remote usernames expire, such that changes
+# to the configuration of a computer are picked up without having to restart the worker.
+NODE_CACHE = LRUCache(maxsize=1024)
+AUTHINFO_CACHE = LRUCache(maxsize=256, ttl=60.)
+REMOTE_USERNAME_CACHE = LRUCache(maxsize=256, ttl=600.)
+
+
+def load_stored_nodes(uuids):
+    """Return the stored nodes with the given UUIDs, loading those that are not yet cached with a single query.
+
+    :param uuids: iterable of node UUIDs
+    :return: dictionary of the nodes by UUID, which does not contain the UUIDs for which no node exists
+    """
+    from aiida.orm import Node, QueryBuilder
+
+    nodes = {}
+    missing = set()
+
+    for uuid in uuids:
+        node = NODE_CACHE.get(uuid)
+        if node is None:
+            missing.add(uuid)
+        else:
+            nodes[uuid] = node
+
+    if missing:
+        builder = QueryBuilder().append(Node, filters={'uuid': {'in': list(missing)}})
+        for [node] in builder.iterall():
+            NODE_CACHE.set(node.uuid, node)
+            nodes[node.uuid] = node
+
+    return nodes
+
+
+def get_authinfo(computer, user):
+    """Return the authorization information of the given user on the given computer.
+
+    :param computer: the computer
+    :param user: the user
+    :return: the `AuthInfo`
+    :raise aiida.common.NotExistent: if the computer is not configured for the given user
+    """
+    key = (computer.pk, user.pk)
+    authinfo = AUTHINFO_CACHE.get(key)
+
+    if authinfo is None:
+        authinfo = computer.get_authinfo(user)
+        AUTHINFO_CACHE.set(key, authinfo)
+
+    return authinfo
+
+
+def get_remote_username(transport, computer, user):
+    """Return the name of the user on the remote computer, as returned by `whoami` through the given transport.
+
+    :param transport: an open transport to the computer
+    :param computer: the computer
+    :param user: the user for whom the transport was opened
+    :return: the remote username
+    """
+    key = (computer.pk, user.pk)
+    username = REMOTE_USERNAME_CACHE.get(key)
+
+    if username is None:
+        username = transport.whoami()
+        REMOTE_USERNAME_CACHE.set(key, username)
+
+    return username
+
 
 def upload_calculation(node, transport, calc_info, script_filename, dry_run=False):
     """Upload a `CalcJob` instance
@@ -43,15 +117,25 @@ def upload_calculation(node, transport, calc_info, script_filename, dry_run=Fals
     :param transport: an already opened transport to use to submit the calculation.
     :param calc_info: the calculation info datastructure returned by `CalcJobNode.presubmit`
     :param script_filename: the job launch script returned by `CalcJobNode.presubmit`
+    :raise aiida.common.NotExistent: if a code or a node of the local copy list does not exist
     """
     from logging import LoggerAdapter
-    from tempfile import NamedTemporaryFile
-    from aiida.orm import load_node, Code, RemoteData
+    from aiida.orm import Code, RemoteData
 
     computer = node.computer
 
     codes_info = calc_info.codes_info
-    input_codes = [load_node(_.code_uuid, sub_classes=(Code,)) for _ in codes_info]
+    local_copy_list = calc_info.local_copy_list or []
+
+    # Load the codes and the nodes of the local copy list at once, most of which will already be cached by the worker
+    stored_nodes = load_stored_nodes([info.code_uuid for info in codes_info] + [uuid for uuid, _, _ in local_copy_list])
+
+    input_codes = []
+    for info in codes_info:
+        code = stored_nodes.get(info.code_uuid, None)
+        if not isinstance(code, Code):
+            raise exceptions.NotExistent('no Code found with UUID<{}>'.format(info.code_uuid))
+        input_codes.append(code)
 
     logger_extra = get_dblogger_extra(node)
     transport.set_logger_extra(logger_extra)
@@ -67,7 +151,7 @@ def upload_calculation(node, transport, calc_info, script_filename, dry_run=Fals
     if dry_run:
         workdir = transport.getcwd()
     else:
-        remote_user = transport.whoami()
+        remote_user = get_remote_username(transport, computer, node.user)
         # TODO Doc: {username} field
         # TODO: if something is changed here, fix also 'verdi computer test'
         remote_working_directory = computer.get_workdir().format(username=remote_user)
@@ -149,7 +233,6 @@ def upload_calculation(node, transport, calc_info, script_filename, dry_run=Fals
 
     # local_copy_list is a list of tuples, each with (uuid, dest_rel_path)
     # NOTE: validation of these lists are done inside calculation.presubmit()
-    local_copy_list = calc_info.local_copy_list or []
     remote_copy_list = calc_info.remote_copy_list or []
     remote_symlink_list = calc_info.remote_symlink_list or []
 
@@ -157,17 +240,12 @@ def upload_calculation(node, transport, calc_info, script_filename, dry_run=Fals
         logger.debug("[submission of calculation {}] copying local file/folder to {}".format(node.pk, target))
 
         try:
-            data_node = load_node(uuid=uuid)
-        except exceptions.NotExistent:
-            logger.warning('failed to load Node<{}> specified in the `local_copy_list`'.format(uuid))
-
-        # Note, once #2579 is implemented, use the `node.open` method instead of the named temporary file in
-        # combination with the new `Transport.put_object_from_filelike`
-        # Since the content of the node could potentially be binary, we read the raw bytes and pass them on
-        with NamedTemporaryFile(mode='wb+') as handle:
-            handle.write(data_node.get_object_content(filename, mode='rb'))
-            handle.flush()
-            handle.seek(0)
+            data_node = stored_nodes[uuid]
+        except KeyError:
+            raise exceptions.NotExistent('failed to load Node<{}> specified in the `local_copy_list`'.format(uuid))
+
+        # The object of a stored node is a file in the repository, so it is put directly instead of copying its content
+        with data_node.open(filename, mode='rb') as handle:
             transport.put(handle.name, target)
 
     if dry_run:
@@ -222,25 +300,6 @@ def upload_calculation(node, transport, calc_info, script_filename, dry_run=Fals
     return calc_info, script_filename
 
 
-def submit_calculation(calculation, transport, calc_info, script_filename):
-    """
-    Submit a calculation
-
-    :param calculation: the instance of CalcJobNode to submit.
-    :param transport: an already opened transport to use to submit the calculation.
-    :param calc_info: the calculation info datastructure returned by `CalcJobNode._presubmit`
-    :param script_filename: the job launch script returned by `CalcJobNode._presubmit`
-    :return: the job id as returned by the scheduler `submit_from_script` call
-    """
-    scheduler = calculation.computer.get_scheduler()
-    scheduler.set_transport(transport)
-
-    workdir = calculation.get_remote_workdir()
-    job_id = scheduler.submit_from_script(workdir, script_filename)
-    calculation.set_job_id(job_id)
-    return job_id
-
-
 def retrieve_calculation(calculation, transport, retrieved_temporary_folder):
     """
     Retrieve all the files of a completed job calculation using the given transport.
@@ -277,10 +336,9 @@ def retrieve_calculation(calculation, transport, retrieved_temporary_folder):
         retrieve_temporary_list = calculation.get_retrieve_temporary_list()
         retrieve_singlefile_list = calculation.get_retrieve_singlefile_list()
 
-        with SandboxFolder() as folder:
-            retrieve_files_from_list(calculation, transport, folder.abspath, retrieve_list)
-            # Here I retrieved everything; now I store them inside the calculation
-            retrieved_files.put_object_from_tree(folder.abspath)
+        # Retrieve the files directly into the repository sandbox of the unstored node, avoiding an intermediate copy
+        repository_folder = retrieved_files._repository._get_base_folder()  # pylint: disable=protected-access
+        retrieve_files_from_list(calculation, transport, repository_folder.abspath, retrieve_list)
 
         # Second, retrieve the singlefiles, if any files were specified in the 'retrieve_temporary_list' key
         if retrieve_singlefile_list:
@@ -338,10 +396,14 @@ def kill_calculation(calculation, transport):
     return True
 
 
-def parse_results(process, retrieved_temporary_folder=None):
+def parse_results(process, retrieved_temporary_folder=None, parsed_folder=None):
     """
     Parse the results for a given CalcJobNode (job)
 
+    :param process: the `CalcJob` process whose node to parse
+    :param retrieved_temporary_folder: the absolute path of the folder with the retrieved temporary files, if any
+    :param parsed_folder: the absolute path of a folder to which `parse_calculation` wrote the results of the parser,
+        when the parser was run in a separate process. In this case the parser is not run again.
     :returns: integer exit code, where 0 indicates success and non-zero failure
     """
     from aiida.engine import ExitCode
@@ -371,23 +433,17 @@ def parse_results(process, retrieved_temporary_folder=None):
     if parser_class is not None:
 
         parser = parser_class(process.node)
-        parse_kwargs = parser.get_outputs_for_parsing()
-
-        if retrieved_temporary_folder:
-            parse_kwargs['retrieved_temporary_folder'] = retrieved_temporary_folder
-
-        exit_code = parser.parse(**parse_kwargs)
 
-        if exit_code is None:
-            exit_code = ExitCode(0)
-
-        if not isinstance(exit_code, ExitCode):
-            raise ValueError('parse should return an `ExitCode` or None, and not {}'.format(type(exit_code)))
+        if parsed_folder is not None:
+            exit_code, outputs = _load_parsed_results(parsed_folder)
+        else:
+            exit_code = _run_parser(parser, retrieved_temporary_folder)
+            outputs = parser.outputs
 
         if exit_code.status:
             parser.logger.error('parser returned exit code<{}>: {}'.format(exit_code.status, exit_code.message))
 
-        for link_label, node in parser.outputs.items():
+        for link_label, node in outputs.items():
             try:
                 process.out(link_label, node)
             except ValueError as exception:
@@ -398,6 +454,75 @@ def parse_results(process, retrieved_temporary_folder=None):
     return exit_code
 
 
+def parse_calculation(pk, retrieved_temporary_folder, parsed_folder):
+    """
+    Run the parser of a calculation job and write the exit code and outputs to a folder
+
+    This function is meant to be called in a separate process, see `aiida.engine.pool`, after which `parse_results`
+    attaches the outputs to the process in the runner.
+
+    :param pk: the pk of the `CalcJobNode`
+    :param retrieved_temporary_folder: the absolute path of the folder with the retrieved temporary files, if any
+    :param parsed_folder: the absolute path of an existing, empty folder to which to write the results
+    """
+    from aiida.common import json
+    from aiida.engine.pool import pack_nodes
+    from aiida.orm import load_node
+
+    node = load_node(pk)
+    parser = node.get_parser_class()(node)
+    exit_code = _run_parser(parser, retrieved_temporary_folder)
+
+    pack_nodes(parser.outputs, parsed_folder)
+
+    with io.open(os.path.join(parsed_folder, PARSED_EXIT_CODE_FILENAME), 'wb') as handle:
+        json.dump({'status': exit_code.status, 'message': exit_code.message}, handle)
+
+
+def _run_parser(parser, retrieved_temporary_folder):
+    """
+    Call the parse method of a parser
+
+    :param parser: the `Parser` instance
+    :param retrieved_temporary_folder: the absolute path of the folder with the retrieved temporary files, if any
+    :return: the `ExitCode` returned by the parser
+    :raises ValueError: if the parser returns something else than an `ExitCode` or None
+    """
+    from aiida.engine import ExitCode
+
+    parse_kwargs = parser.get_outputs_for_parsing()
+
+    if retrieved_temporary_folder:
+        parse_kwargs['retrieved_temporary_folder'] = retrieved_temporary_folder
+
+    exit_code = parser.parse(**parse_kwargs)
+
+    if exit_code is None:
+        exit_code = ExitCode(0)
+
+    if not isinstance(exit_code, ExitCode):
+        raise ValueError('parse should return an `ExitCode` or None, and not {}'.format(type(exit_code)))
+
+    return exit_code
+
+
+def _load_parsed_results(parsed_folder):
+    """
+    Load the exit code and outputs written by `parse_calculation`
+
+    :param parsed_folder: the absolute path of the folder
+    :return: tuple of the `ExitCode` and the dictionary of output nodes
+    """
+    from aiida.common import json
+    from aiida.engine import ExitCode
+    from aiida.engine.pool import unpack_nodes
+
+    with io.open(os.path.join(parsed_folder, PARSED_EXIT_CODE_FILENAME), 'r', encoding='utf8') as handle:
+        exit_code = json.load(handle)
+
+    return ExitCode(exit_code['status'], exit_code['message']), unpack_nodes(parsed_folder)
+
+
 def _retrieve_singlefiles(job, transport, folder, retrieve_file_list, logger_extra=None):
     singlefile_list = []
     for (linkname, subclassname, filename) in retrieve_file_list:
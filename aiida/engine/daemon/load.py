@@ -0,0 +1,344 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Components to measure the load of the daemon workers and to scale the number of workers accordingly.
+
+Each daemon worker runs a `WorkerLoadMonitor` that periodically writes a snapshot of its load to a file in the workers
+directory of the daemon of the profile. The `DaemonAutoscaler`, which runs in the circus arbiter process when the
+`daemon.autoscale` option is enabled, aggregates these snapshots and adds or removes workers through the daemon client,
+within the bounds defined by the `daemon.autoscale.min_workers` and `daemon.autoscale.max_workers` options.
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import collections
+import io
+import logging
+import os
+import threading
+import time
+
+from aiida.common import json
+from aiida.engine.daemon import telemetry
+
+__all__ = ('WorkerLoad', 'WorkerLoadMonitor', 'DaemonAutoscaler', 'read_worker_loads', 'write_worker_load')
+
+LOGGER = logging.getLogger(__name__)
+
+# Interval in seconds between two consecutive load snapshots of a worker
+WORKER_LOAD_INTERVAL = 5.
+
+# Snapshots older than this many seconds belong to workers that are no longer alive
+WORKER_LOAD_MAX_AGE = 3 * WORKER_LOAD_INTERVAL
+
+# Interval in seconds between two consecutive checks of the autoscaler
+AUTOSCALE_INTERVAL = 10.
+
+# Minimum number of seconds between two changes of the number of workers, such that new workers have a chance to
+# report their load and to take over tasks from the others, before the load is evaluated again
+AUTOSCALE_COOLDOWN = 60.
+
+
+class WorkerLoad(
+        collections.namedtuple('WorkerLoad', 'pid timestamp slots active_processes open_transports loop_lag')):
+    """Snapshot of the load of a daemon worker.
+
+    :param pid: the system process id of the worker
+    :param timestamp: the time at which the snapshot was taken
+    :param slots: the maximum number of processes the worker can run concurrently
+    :param active_processes: the number of processes that the worker is currently running
+    :param open_transports: the number of transports that are currently open or being opened by the worker
+    :param loop_lag: the delay in seconds with which the event loop of the worker executed the last scheduled callback
+    """
+
+    __slots__ = ()
+
+    @property
+    def utilisation(self):
+        """Return the fraction of the process slots of the worker that is occupied.
+
+        :return: float between zero and one
+        """
+        if not self.slots:
+            return 1.
+        return min(self.active_processes / self.slots, 1.)
+
+
+def write_worker_load(filepath, load):
+    """Write a worker load snapshot to the given file.
+
+    The snapshot is first written to a temporary file that is then moved in place, such that readers never see a
+    partially written file.
+
+    :param filepath: the absolute path of the file
+    :param load: the `WorkerLoad` to write
+    """
+    filepath_temp = '{}.tmp'.format(filepath)
+
+    with io.open(filepath_temp, 'wb') as handle:
+        json.dump(dict(load._asdict()), handle)
+
+    os.rename(filepath_temp, filepath)
+
+
+def read_worker_loads(directory, max_age=WORKER_LOAD_MAX_AGE):
+    """Return the most recent load snapshots of all the workers that report their load in the given directory.
+
+    Snapshots that are older than `max_age` seconds were left behind by workers that were not shut down cleanly and
+    are removed, together with the metrics snapshot of the same worker.
+
+    :param directory: the absolute path of the directory with the worker load files
+    :param max_age: the maximum age in seconds of a snapshot
+    :return: list of `WorkerLoad` instances
+    """
+    loads = []
+    now = time.time()
+
+    try:
+        filenames = os.listdir(directory)
+    except OSError:
+        return loads
+
+    for filename in filenames:
+
+        if not filename.endswith('.json'):
+            continue
+
+        filepath = os.path.join(directory, filename)
+
+        try:
+            with io.open(filepath, 'r', encoding='utf8') as handle:
+                load = WorkerLoad(**json.load(handle))
+        except (IOError, OSError, TypeError, ValueError):
+            # The file disappeared in the meantime or is not a valid snapshot
+            continue
+
+        if now - load.timestamp > max_age:
+            for stale_filepath in [filepath, '{}{}'.format(filepath[:-5], telemetry.METRICS_FILE_EXTENSION)]:
+                try:
+                    os.remove(stale_filepath)
+                except OSError:
+                    pass
+            continue
+
+        loads.append(load)
+
+    return loads
+
+
+class WorkerLoadMonitor(object):  # pylint: disable=useless-object-inheritance
+    """Periodically measure the load of a daemon worker and write it to a file in the workers directory.
+
+    Alongside the load, a snapshot of the metrics of the telemetry registry of the worker is written, such that both
+    can be inspected with `verdi daemon top`.
+
+    The event loop lag is measured as the delay with which the loop executes the callback that takes the snapshot with
+    respect to the time for which it was scheduled. A loop that is blocked by long running synchronous operations will
+    be unable to respond to its processes in time, even if not all of its process slots are occupied.
+    """
+
+    def __init__(self, runner, directory, slots, interval=WORKER_LOAD_INTERVAL):
+        """Construct a new monitor.
+
+        :param runner: the daemon runner of the worker
+        :type runner: :class:`aiida.engine.runners.Runner`
+        :param directory: the absolute path of the directory where to write the load file
+        :param slots: the maximum number of processes the worker can run concurrently
+        :param interval: the interval in seconds between two snapshots
+        """
+        self._runner = runner
+        self._directory = directory
+        self._slots = slots
+        self._interval = interval
+        self._scheduled_time = None
+        self._handle = None
+
+    @property
+    def filepath(self):
+        """Return the absolute path of the file to which the load of this worker is written."""
+        return os.path.join(self._directory, '{}.json'.format(os.getpid()))
+
+    @property
+    def metrics_filepath(self):
+        """Return the absolute path of the file to which the metrics of this worker are written."""
+        return os.path.join(self._directory, '{}{}'.format(os.getpid(), telemetry.METRICS_FILE_EXTENSION))
+
+    def start(self):
+        """Start taking snapshots of the load of the worker."""
+        try:
+            os.makedirs(self._directory)
+        except OSError:
+            if not os.path.isdir(self._directory):
+                raise
+
+        self._schedule()
+
+    def stop(self):
+        """Stop taking snapshots and remove the load and metrics files of the worker."""
+        if self._handle is not None:
+            self._runner.loop.remove_timeout(self._handle)
+            self._handle = None
+
+        for filepath in [self.filepath, self.metrics_filepath]:
+            try:
+                os.remove(filepath)
+            except OSError:
+                pass
+
+    def get_load(self, loop_lag=0.):
+        """Return a snapshot of the current load of the worker.
+
+        :param loop_lag: the current lag in seconds of the event loop
+        :return: a `WorkerLoad` instance
+        """
+        task_receiver = self._runner.task_receiver
+        active_processes = task_receiver.active_process_count if task_receiver is not None else 0
+        open_transports = self._runner.transport.get_transport_count()
+
+        return WorkerLoad(os.getpid(), time.time(), self._slots, active_processes, open_transports, loop_lag)
+
+    def _schedule(self):
+        """Schedule the next snapshot."""
+        self._scheduled_time = self._runner.loop.time() + self._interval
+        self._handle = self._runner.loop.call_at(self._scheduled_time, self._take_snapshot)
+
+    def _take_snapshot(self):
+        """Take a snapshot of the load, write it to the load file and schedule the next snapshot."""
+        loop_lag = max(self._runner.loop.time() - self._scheduled_time, 0.)
+        telemetry.REGISTRY.observe('loop.lag', loop_lag)
+
+        try:
+            write_worker_load(self.filepath, self.get_load(loop_lag))
+            if telemetry.REGISTRY.enabled:
+                telemetry.write_worker_metrics(self.metrics_filepath)
+        except (IOError, OSError):
+            LOGGER.exception('failed to write the load and metrics of the daemon worker')
+
+        self._schedule()
+
+
+class DaemonAutoscaler(object):  # pylint: disable=useless-object-inheritance
+    """Add or remove daemon workers based on the load reported by the workers.
+
+    A worker is added when the fraction of occupied process slots of all workers exceeds `SCALE_UP_UTILISATION` or
+    when the event loop of any of the workers lags more than `MAX_LOOP_LAG` seconds. A worker is removed when the
+    utilisation drops below `SCALE_DOWN_UTILISATION` and the remaining workers could take over the load without
+    exceeding the scale up threshold. The processes of a removed worker are not lost: their tasks are requeued by
+    RabbitMQ and continued by the remaining workers from their last checkpoint.
+    """
+
+    SCALE_UP_UTILISATION = 0.8
+    SCALE_DOWN_UTILISATION = 0.3
+    MAX_LOOP_LAG = 1.
+
+    def __init__(self, client, min_workers, max_workers, interval=AUTOSCALE_INTERVAL, cooldown=AUTOSCALE_COOLDOWN):
+        """Construct a new autoscaler.
+
+        :param client: the daemon client
+        :type client: :class:`aiida.engine.daemon.client.DaemonClient`
+        :param min_workers: the minimum number of workers
+        :param max_workers: the maximum number of workers
+        :param interval: the interval in seconds between two checks of the load
+        :param cooldown: the minimum number of seconds between two changes of the number of workers
+        """
+        # pylint: disable=too-many-arguments
+        if min_workers < 1 or max_workers < min_workers:
+            raise ValueError('invalid bounds for the number of workers: [{}, {}]'.format(min_workers, max_workers))
+
+        self._client = client
+        self._min_workers = min_workers
+        self._max_workers = max_workers
+        self._interval = interval
+        self._cooldown = cooldown
+        self._last_change = None
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def get_scaling(self, loads, workers):
+        """Return the change in the number of workers that is warranted by the given loads.
+
+        :param loads: list of `WorkerLoad` instances of the workers that reported their load
+        :param workers: the current number of workers
+        :return: the number of workers to add, which is negative if workers should be removed
+        """
+        if workers < self._min_workers:
+            return self._min_workers - workers
+
+        if workers > self._max_workers:
+            return self._max_workers - workers
+
+        if not loads:
+            return 0
+
+        slots = sum(load.slots for load in loads)
+        active_processes = sum(load.active_processes for load in loads)
+        utilisation = active_processes / slots if slots else 1.
+        loop_lag = max(load.loop_lag for load in loads)
+
+        if workers < self._max_workers and (utilisation >= self.SCALE_UP_UTILISATION or loop_lag >= self.MAX_LOOP_LAG):
+            return 1
+
+        if workers > self._min_workers and utilisation <= self.SCALE_DOWN_UTILISATION and loop_lag < self.MAX_LOOP_LAG:
+            remaining_slots = slots / len(loads) * (workers - 1)
+            if active_processes < self.SCALE_UP_UTILISATION * remaining_slots:
+                return -1
+
+        return 0
+
+    def check(self):
+        """Evaluate the load of the workers and add or remove workers if necessary.
+
+        :return: the number of workers that were added, which is negative if workers were removed
+        """
+        if self._last_change is not None and time.time() - self._last_change < self._cooldown:
+            return 0
+
+        response = self._client.get_numprocesses()
+
+        if response.get('status') != 'ok':
+            LOGGER.warning('could not retrieve the number of daemon workers: %s', response.get('status'))
+            return 0
+
+        workers = response['numprocesses']
+        scaling = self.get_scaling(read_worker_loads(self._client.daemon_workers_directory), workers)
+
+        if scaling > 0:
+            LOGGER.info('increasing the number of daemon workers from %d to %d', workers, workers + scaling)
+            self._client.increase_workers(scaling)
+        elif scaling < 0:
+            LOGGER.info('decreasing the number of daemon workers from %d to %d', workers, workers + scaling)
+            self._client.decrease_workers(-scaling)
+
+        if scaling:
+            self._last_change = time.time()
+
+        return scaling
+
+    def start(self):
+        """Start checking the load periodically in a background thread."""
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name='aiida-daemon-autoscaler')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """Stop checking the load and wait for the background thread to finish."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        """Check the load every interval until stopped."""
+        while not self._stopped.wait(self._interval):
+            try:
+                self.check()
+            except Exception:  # pylint: disable=broad-except
+                LOGGER.exception('the daemon autoscaler failed to check the load of the workers')
@@ -17,6 +17,9 @@ import signal
 
 from aiida.common.log import configure_logging
 from aiida.engine.daemon.client import get_daemon_client
+from aiida.engine.daemon import telemetry
+from aiida.engine.daemon.load import WorkerLoadMonitor
+from aiida.manage.configuration import get_config_option
 from aiida.manage.manager import get_manager
 
 LOGGER = logging.getLogger(__name__)
@@ -37,6 +40,13 @@ def start_daemon():
         LOGGER.exception('daemon runner failed to start')
         raise
 
+    telemetry.get_registry().enable()
+    telemetry.instrument_database()
+
+    slots = get_config_option('daemon.worker_process_slots')
+    load_monitor = WorkerLoadMonitor(runner, daemon_client.daemon_workers_directory, slots)
+    load_monitor.start()
+
     def shutdown_daemon(_num, _frame):
         LOGGER.info('Received signal to shut down the daemon runner')
         runner.close()
@@ -51,5 +61,7 @@ def start_daemon():
     except SystemError as exception:
         LOGGER.info('Received a SystemError: %s', exception)
         runner.close()
+    finally:
+        load_monitor.stop()
 
     LOGGER.info('Daemon runner stopped')
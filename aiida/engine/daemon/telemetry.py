@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""In-process registry of performance metrics of the hot paths of a daemon worker.
+
+The registry is disabled by default, in which case recording a metric is a no-op, and is enabled by the daemon runner.
+The worker load monitor periodically writes a snapshot of the registry of each worker to the workers directory of the
+profile daemon, from where `verdi daemon top` reads and aggregates them.
+
+Two types of metrics are supported: counters, that are simply incremented, and histograms, that keep the number, sum
+and maximum of the observed values, as well as the number of values that fall within each of a fixed set of buckets.
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import bisect
+import contextlib
+import functools
+import io
+import os
+import threading
+import time
+
+from aiida.common import json
+
+__all__ = ('Registry', 'get_registry', 'timed_coroutine', 'read_worker_metrics', 'merge_metrics')
+
+# Upper bounds in seconds of the buckets of the histograms, the last bucket is unbounded
+HISTOGRAM_BOUNDS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1., 5., 10., 60., 300.)
+
+METRICS_FILE_EXTENSION = '.metrics'
+
+
+class Histogram(object):  # pylint: disable=useless-object-inheritance
+    """Distribution of observed values over a fixed set of buckets."""
+
+    __slots__ = ('count', 'total', 'maximum', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.
+        self.maximum = 0.
+        self.buckets = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+
+    def observe(self, value):
+        self.count += 1
+        self.total += value
+        self.maximum = max(self.maximum, value)
+        self.buckets[bisect.bisect_left(HISTOGRAM_BOUNDS, value)] += 1
+
+    def as_dict(self):
+        return {'count': self.count, 'sum': self.total, 'max': self.maximum, 'buckets': list(self.buckets)}
+
+
+class Registry(object):  # pylint: disable=useless-object-inheritance
+    """Registry of counters and histograms."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+        self.enabled = False
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        """Remove all recorded metrics."""
+        with self._lock:
+            self._counters = {}
+            self._histograms = {}
+
+    def increment(self, name, value=1):
+        """Increment a counter.
+
+        :param name: the name of the counter
+        :param value: the value to add to the counter
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name, value):
+        """Record a value in a histogram.
+
+        :param name: the name of the histogram
+        :param value: the observed value, which for durations should be expressed in seconds
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            try:
+                histogram = self._histograms[name]
+            except KeyError:
+                histogram = self._histograms[name] = Histogram()
+            histogram.observe(value)
+
+    @contextlib.contextmanager
+    def timer(self, name):
+        """Context manager that records the duration of its body in a histogram.
+
+        :param name: the name of the histogram
+        """
+        if not self.enabled:
+            yield
+            return
+
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.observe(name, time.time() - start)
+
+    def snapshot(self):
+        """Return a snapshot of all the metrics in the registry.
+
+        :return: dictionary with the counters and histograms, which can be serialized to JSON
+        """
+        with self._lock:
+            return {
+                'timestamp': time.time(),
+                'counters': dict(self._counters),
+                'histograms': {name: histogram.as_dict() for name, histogram in self._histograms.items()},
+            }
+
+
+REGISTRY = Registry()
+
+
+def get_registry():
+    """Return the metrics registry of this interpreter.
+
+    :return: the `Registry` instance
+    """
+    return REGISTRY
+
+
+def timed_coroutine(name):
+    """Decorate a tornado coroutine function to record the time until the future it returns resolves.
+
+    :param name: the name of the histogram in which to record the duration
+    """
+
+    def decorator(function):
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not REGISTRY.enabled:
+                return function(*args, **kwargs)
+
+            start = time.time()
+            future = function(*args, **kwargs)
+            future.add_done_callback(lambda _: REGISTRY.observe(name, time.time() - start))
+            return future
+
+        return wrapper
+
+    return decorator
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # pylint: disable=unused-argument,too-many-arguments
+    conn.info['aiida_query_start'] = time.time()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # pylint: disable=unused-argument,too-many-arguments
+    start = conn.info.pop('aiida_query_start', None)
+    if start is not None:
+        REGISTRY.observe('database.query', time.time() - start)
+
+
+def instrument_database():
+    """Record the number and duration of the queries executed through SQLAlchemy in the `database.query` histogram.
+
+    The listeners are registered on the `Engine` class, which means that they apply to the queries of the query builder
+    for both database backends. The queries that go directly through the Django ORM are not recorded.
+    """
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+
+
+def write_worker_metrics(filepath, registry=REGISTRY):
+    """Write a snapshot of the registry to the given file, moving it in place atomically.
+
+    :param filepath: the absolute path of the file
+    :param registry: the registry
+    """
+    filepath_temp = '{}.tmp'.format(filepath)
+
+    with io.open(filepath_temp, 'wb') as handle:
+        json.dump(registry.snapshot(), handle)
+
+    os.rename(filepath_temp, filepath)
+
+
+def read_worker_metrics(directory, max_age):
+    """Return the most recent metrics snapshots of all the workers that write them to the given directory.
+
+    :param directory: the absolute path of the directory with the worker metrics files
+    :param max_age: snapshots older than this many seconds were left behind by dead workers and are ignored
+    :return: dictionary of worker pid to metrics snapshot
+    """
+    snapshots = {}
+    now = time.time()
+
+    try:
+        filenames = os.listdir(directory)
+    except OSError:
+        return snapshots
+
+    for filename in filenames:
+
+        if not filename.endswith(METRICS_FILE_EXTENSION):
+            continue
+
+        try:
+            with io.open(os.path.join(directory, filename), 'r', encoding='utf8') as handle:
+                snapshot = json.load(handle)
+        except (IOError, OSError, ValueError):
+            continue
+
+        if now - snapshot['timestamp'] <= max_age:
+            snapshots[int(filename[:-len(METRICS_FILE_EXTENSION)])] = snapshot
+
+    return snapshots
+
+
+def merge_metrics(snapshots):
+    """Merge the metrics snapshots of multiple workers into a single snapshot.
+
+    :param snapshots: iterable of metrics snapshots
+    :return: the merged snapshot
+    """
+    counters = {}
+    histograms = {}
+    timestamp = 0.
+
+    for snapshot in snapshots:
+        timestamp = max(timestamp, snapshot['timestamp'])
+
+        for name, value in snapshot['counters'].items():
+            counters[name] = counters.get(name, 0) + value
+
+        for name, histogram in snapshot['histograms'].items():
+            merged = histograms.setdefault(name, {
+                'count': 0,
+                'sum': 0.,
+                'max': 0.,
+                'buckets': [0] * len(histogram['buckets'])
+            })
+            merged['count'] += histogram['count']
+            merged['sum'] += histogram['sum']
+            merged['max'] = max(merged['max'], histogram['max'])
+            merged['buckets'] = [left + right for left, right in zip(merged['buckets'], histogram['buckets'])]
+
+    return {'timestamp': timestamp, 'counters': counters, 'histograms': histograms}
+
+
+def get_histogram_quantile(histogram, quantile):
+    """Return an estimate of a quantile of a histogram, which is the upper bound of the bucket that contains it.
+
+    :param histogram: the histogram as returned in a snapshot
+    :param quantile: the quantile between zero and one
+    :return: the estimate or None if the histogram is empty
+    """
+    if not histogram['count']:
+        return None
+
+    threshold = quantile * histogram['count']
+    cumulative = 0
+
+    for bound, count in zip(HISTOGRAM_BOUNDS, histogram['buckets']):
+        cumulative += count
+        if cumulative >= threshold:
+            return min(bound, histogram['max'])
+
+    return histogram['max']
@@ -16,9 +16,10 @@ from aiida.common import InvalidOperation
 from aiida.manage import manager
 from .processes.functions import FunctionProcess
 from .processes.process import Process
-from .utils import is_process_function, is_process_scoped, instantiate_process
+from .utils import is_process_function, is_process_scoped, instantiate_process, instantiate_processes, \
+    send_continue_tasks
 
-__all__ = ('run', 'run_get_pk', 'run_get_node', 'submit')
+__all__ = ('run', 'run_get_pk', 'run_get_node', 'submit', 'submit_many')
 
 
 def run(process, *args, **inputs):
@@ -129,6 +130,42 @@ def submit(process, **inputs):
     return process.node
 
 
+def submit_many(process, inputs_list):
+    """Submit a process for each of the given sets of inputs to the daemon, immediately returning control.
+
+    This is equivalent to calling `submit` for each set of inputs, but much faster for large numbers of processes:
+    the database records and checkpoints of all processes are created in a single transaction, after which their
+    tasks are sent to the daemon together.
+
+    .. warning: this should not be used within another process. Instead, there one should use the `submit_many`
+        method of the wrapping process itself, i.e. use `self.submit_many`.
+
+    .. warning: submission of processes requires `store_provenance=True` and does not support `dry_run=True`
+
+    :param process: the process class or process builder to submit
+    :type process: :class:`aiida.engine.Process`
+
+    :param inputs_list: list of dictionaries with the inputs of each process
+    :type inputs_list: list
+
+    :return: list of the nodes of the processes, in the same order as the inputs
+    :rtype: list
+    """
+    assert not is_process_function(process), 'Cannot submit a process function'
+
+    if is_process_scoped() and not isinstance(Process.current(), FunctionProcess):
+        raise InvalidOperation('Cannot use top-level `submit_many` from within another process, use '
+                               '`self.submit_many` instead')
+
+    runner = manager.get_manager().get_runner()
+    controller = manager.get_manager().get_process_controller()
+
+    processes = instantiate_processes(runner, process, inputs_list, persister=runner.persister)
+    send_continue_tasks(controller, [instance.pid for instance in processes])
+
+    return [instance.node for instance in processes]
+
+
 # Allow one to also use run.get_node and run.get_pk as a shortcut, without having to import the functions themselves
 run.get_node = run_get_node
 run.get_pk = run_get_pk
@@ -16,7 +16,9 @@ import logging
 import traceback
 
 import plumpy
+import six
 
+from aiida.common import AttributeDict
 from aiida.orm.utils import serialize
 
 __all__ = ('AiiDAPersister', 'ObjectLoader', 'get_object_loader')
@@ -44,8 +46,15 @@ class AiiDAPersister(plumpy.Persister):
     """
     This node is responsible to taking saved process instance states and
     persisting them to the database.
+
+    Checkpoints are written in the compact representation of :mod:`aiida.orm.utils.serialize`. The context of a work
+    chain is not part of the serialized bundle: each of its entries is serialized separately and stored in the
+    `checkpoint_context` attribute of the process node, which is only written when an entry has changed.
     """
 
+    # The key of the context in the bundle of a work chain
+    CONTEXT_KEY = 'CONTEXT'
+
     def save_checkpoint(self, process, tag=None):
         """
         Persist a Process instance
@@ -67,7 +76,8 @@ class AiiDAPersister(plumpy.Persister):
                 process, traceback.format_exc()))
 
         try:
-            process.node.set_checkpoint(serialize.serialize(bundle))
+            checkpoint, context = self._serialize_bundle(bundle, process.node.checkpoint_context)
+            process.node.set_checkpoint(checkpoint, context)
         except Exception:
             raise plumpy.PersistenceError("Failed to store a checkpoint for '{}': {}".format(
                 process, traceback.format_exc()))
@@ -102,13 +112,56 @@ class AiiDAPersister(plumpy.Persister):
             raise plumpy.PersistenceError('Calculation<{}> does not have a saved checkpoint'.format(calculation.pk))
 
         try:
-            bundle = serialize.deserialize(checkpoint)
+            bundle = self._deserialize_bundle(checkpoint, calculation.checkpoint_context)
         except Exception:
             raise plumpy.PersistenceError("Failed to load the checkpoint for process<{}>: {}".format(
                 pid, traceback.format_exc()))
 
         return bundle
 
+    def _serialize_bundle(self, bundle, stored_context=None):
+        """
+        Serialize a bundle, with the entries of its context serialized separately
+
+        :param bundle: the bundle to serialize
+        :param stored_context: the serialized context entries that are currently stored, if any
+        :return: tuple of the serialized bundle and the dictionary of serialized context entries, where the latter is
+            None if it does not differ from the stored entries
+        """
+        context = bundle.get(self.CONTEXT_KEY, None)
+
+        if not isinstance(context, AttributeDict) or not all(isinstance(key, six.string_types) for key in context):
+            return serialize.serialize_compact(bundle), None
+
+        stripped = plumpy.Bundle.__new__(plumpy.Bundle)
+        stripped.update((key, value) for key, value in bundle.items() if key != self.CONTEXT_KEY)
+
+        entries = {key: serialize.serialize_compact(value) for key, value in context.items()}
+
+        if entries == stored_context:
+            entries = None
+
+        return serialize.serialize_compact(stripped), entries
+
+    def _deserialize_bundle(self, checkpoint, stored_context=None):
+        """
+        Deserialize a bundle, restoring its context from the separately serialized entries if it does not contain one
+
+        The nodes referenced by the bundle and by all the context entries are loaded with a single query.
+
+        :param checkpoint: the serialized bundle
+        :param stored_context: the serialized context entries that are stored, if any
+        :return: the bundle
+        """
+        keys = list(stored_context.keys()) if stored_context else []
+        deserialized = serialize.deserialize_many([checkpoint] + [stored_context[key] for key in keys])
+        bundle = deserialized[0]
+
+        if stored_context is not None and self.CONTEXT_KEY not in bundle:
+            bundle[self.CONTEXT_KEY] = AttributeDict(dict(zip(keys, deserialized[1:])))
+
+        return bundle
+
     def get_checkpoints(self):
         """
         Return a list of all the current persisted process checkpoints
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Pools of interpreter processes to run CPU intensive work outside of the event loop of a runner.
+
+Work is submitted as a module level function with picklable arguments, which is called in a worker process that has
+loaded the same profile as the submitting interpreter. Stored nodes are best passed to the function by their pk. Since
+unstored nodes cannot be pickled, nodes created by the function are passed back by writing them to a folder with
+`pack_nodes`, such that the submitting interpreter can recreate them with `unpack_nodes` and store them itself.
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import io
+import os
+import shutil
+
+from aiida.common import json
+
+__all__ = ('submit_to_pool', 'pack_nodes', 'unpack_nodes')
+
+PACKED_NODES_FILENAME = 'nodes.json'
+
+POOLS = {}
+
+
+def submit_to_pool(name, max_workers, function, *args):
+    """Call a function in the named process pool, creating the pool if it does not yet exist.
+
+    This should be called from the thread of the event loop of the caller, which will resolve the returned future.
+
+    :param name: the name of the pool, pools with different names do not share their worker processes
+    :param max_workers: the number of worker processes of the pool if it has to be created
+    :param function: a module level function
+    :param args: the picklable positional arguments for the function
+    :return: a :class:`tornado.concurrent.Future` that resolves to the return value of the function
+    """
+    from tornado import concurrent
+    from aiida.manage.configuration import get_profile
+
+    try:
+        pool = POOLS[name]
+    except KeyError:
+        pool = POOLS[name] = _create_pool(max_workers)
+
+    # Chaining makes sure that the callbacks of the future are called on the event loop instead of a thread of the pool
+    future = concurrent.Future()
+    concurrent.chain_future(pool.submit(_call_in_profile, get_profile().name, function, args), future)
+
+    return future
+
+
+def _create_pool(max_workers):
+    """Create a process pool whose workers do not share the database connections of this interpreter.
+
+    Where supported, the worker processes are started as fresh interpreters. Otherwise they are forked, in which case
+    the database connections of this interpreter are closed first, because they would otherwise be shared with the
+    workers, which are forked when the first function is submitted. SQLAlchemy engines are recreated after a fork.
+
+    :param max_workers: the number of worker processes
+    :return: a :class:`concurrent.futures.ProcessPoolExecutor`
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    try:
+        return ProcessPoolExecutor(max_workers, mp_context=multiprocessing.get_context('spawn'))
+    except (AttributeError, TypeError):
+        _close_database_connections()
+        return ProcessPoolExecutor(max_workers)
+
+
+def _close_database_connections():
+    """Close the Django database connections of the current thread, they will be reopened when next needed."""
+    from aiida.backends import BACKEND_DJANGO
+    from aiida.manage.configuration import get_profile
+
+    if get_profile().database_backend == BACKEND_DJANGO:
+        from django.db import connections
+        connections.close_all()
+
+
+def _call_in_profile(profile_name, function, args):
+    """Load the given profile and its backend, if not already loaded, and call the function.
+
+    :param profile_name: the name of the profile
+    :param function: the function to call
+    :param args: the positional arguments for the function
+    :return: the return value of the function
+    """
+    from aiida.manage.configuration import load_profile
+    from aiida.manage.manager import get_manager
+
+    load_profile(profile_name)
+    get_manager().get_backend()
+
+    return function(*args)
+
+
+def pack_nodes(nodes, folder):
+    """Write nodes to a folder such that they can be recreated in another interpreter with `unpack_nodes`.
+
+    Stored nodes are written as a reference to their UUID. For unstored nodes, the type, label, description, computer,
+    attributes and extras are written, as well as a copy of the contents of their repository. The computer, which has
+    to be stored, is written as a reference to its pk. The attributes and extras are cleaned as they would be when the
+    node is stored, such that values like numpy scalars and arrays can be written as JSON.
+
+    :param nodes: a dictionary of nodes
+    :param folder: the absolute path of an existing, empty folder
+    :raises aiida.common.exceptions.ValidationError: if an attribute or extra cannot be stored
+    """
+    from aiida.orm.utils.node import clean_value
+
+    packed = {}
+
+    for index, (key, node) in enumerate(nodes.items()):
+
+        if node.is_stored:
+            packed[key] = {'uuid': node.uuid}
+            continue
+
+        subfolder = os.path.join(folder, str(index))
+        repository_folder = node._repository._get_base_folder().abspath  # pylint: disable=protected-access
+
+        if os.path.isdir(repository_folder):
+            shutil.copytree(repository_folder, subfolder)
+        else:
+            os.mkdir(subfolder)
+
+        packed[key] = {
+            'node_type': node.node_type,
+            'label': node.label,
+            'description': node.description,
+            'computer': node.computer.pk if node.computer else None,
+            'attributes': clean_value(node.attributes),
+            'extras': clean_value(node.extras),
+            'folder': str(index),
+        }
+
+    with io.open(os.path.join(folder, PACKED_NODES_FILENAME), 'wb') as handle:
+        json.dump(packed, handle)
+
+
+def unpack_nodes(folder):
+    """Recreate the nodes that were written to a folder with `pack_nodes`.
+
+    :param folder: the absolute path of the folder
+    :return: a dictionary of nodes, where the nodes that were unstored when packed are unstored again
+    """
+    from aiida.orm import Node, load_computer, load_node
+    from aiida.orm.utils.node import load_node_class
+
+    with io.open(os.path.join(folder, PACKED_NODES_FILENAME), 'r', encoding='utf8') as handle:
+        packed = json.load(handle)
+
+    nodes = {}
+
+    for key, entry in packed.items():
+
+        if 'uuid' in entry:
+            nodes[key] = load_node(uuid=entry['uuid'])
+            continue
+
+        # The constructors of sub classes may require arguments, but the attributes already define the complete state
+        node_class = load_node_class(entry['node_type'])
+        computer = load_computer(pk=entry['computer']) if entry['computer'] is not None else None
+        node = node_class.__new__(node_class)
+        Node.__init__(node, computer=computer, label=entry['label'], description=entry['description'])
+        node.set_attribute_many(entry['attributes'])
+        node.set_extra_many(entry['extras'])
+        node.put_object_from_tree(os.path.join(folder, entry['folder']))
+        nodes[key] = node
+
+    return nodes
@@ -199,24 +199,35 @@ class CalcJob(Process):
         """Prepare files for submission of calculation."""
         raise NotImplementedError
 
-    def parse(self, retrieved_temporary_folder=None):
+    def parse(self, retrieved_temporary_folder=None, parsed_folder=None):
         """
         Parse a retrieved job calculation.
 
         This is called once it's finished waiting for the calculation to be finished and the data has been retrieved.
+
+        :param retrieved_temporary_folder: the absolute path of the folder with the retrieved temporary files
+        :param parsed_folder: the absolute path of the folder with the results of the parser, if it was already run in
+            a separate process, in which case only its outputs are attached
         """
         import shutil
-        from aiida.engine.daemon import execmanager
+        from aiida.engine.daemon import execmanager, telemetry
 
         try:
-            exit_code = execmanager.parse_results(self, retrieved_temporary_folder)
+            if parsed_folder is None:
+                with telemetry.REGISTRY.timer('calcjob.parse'):
+                    exit_code = execmanager.parse_results(self, retrieved_temporary_folder)
+            else:
+                exit_code = execmanager.parse_results(self, retrieved_temporary_folder, parsed_folder)
         finally:
-            # Delete the temporary folder
-            try:
-                shutil.rmtree(retrieved_temporary_folder)
-            except OSError as exception:
-                if exception.errno != 2:
-                    raise
+            # Delete the temporary folders
+            for folder in [retrieved_temporary_folder, parsed_folder]:
+                if folder is None:
+                    continue
+                try:
+                    shutil.rmtree(folder)
+                except OSError as exception:
+                    if exception.errno != 2:
+                        raise
 
         # Finally link up the outputs and we're done
         for entry in self.node.get_outgoing():
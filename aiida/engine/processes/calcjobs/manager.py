@@ -22,7 +22,13 @@ from aiida import schedulers
 from aiida.common import exceptions, lang
 from aiida.common.log import AIIDA_LOGGER
 
-__all__ = ('JobsList', 'JobManager')
+__all__ = ('JobsList', 'JobSubmitter', 'JobManager')
+
+# Time in seconds during which submission requests for the same authinfo are gathered before being submitted together
+SUBMIT_BATCH_WINDOW = 1.
+
+# Maximum number of jobs that are submitted with a single remote command
+SUBMIT_BATCH_SIZE = 100
 
 
 class JobsList(object):  # pylint: disable=useless-object-inheritance
@@ -102,11 +108,16 @@ class JobsList(object):  # pylint: disable=useless-object-inheritance
             scheduler = self._authinfo.computer.get_scheduler()
             scheduler.set_transport(transport)
 
+            jobs_with_scheduler = self._get_jobs_with_scheduler()
+
+            # When querying by user, the output also contains the jobs of the user that are not tracked by this list,
+            # which are skipped, in particular since retrieving detailed job information costs a command per job
             kwargs = {'as_dict': True}
             if scheduler.get_feature('can_query_by_user'):
                 kwargs['user'] = "$USER"
+                kwargs['filter_jobs'] = jobs_with_scheduler
             else:
-                kwargs['jobs'] = self._get_jobs_with_scheduler()
+                kwargs['jobs'] = jobs_with_scheduler
 
             scheduler_response = scheduler.get_jobs(**kwargs)
 
@@ -236,12 +247,155 @@ class JobsList(object):  # pylint: disable=useless-object-inheritance
         return any(not request.done() for request in itervalues(self._job_update_requests))
 
     def _get_jobs_with_scheduler(self):
-        """Get all the jobs that are currently with scheduler.
+        """Get all the jobs that are currently with scheduler and have a pending update request.
 
         :return: the list of jobs with the scheduler
         :rtype: list
         """
-        return [str(job_id) for job_id, _ in self._job_update_requests.items()]
+        return [str(job_id) for job_id, request in self._job_update_requests.items() if not request.done()]
+
+
+class JobSubmitter(object):  # pylint: disable=useless-object-inheritance
+    """Coalescer of the submissions of calculation jobs with a specific ``AuthInfo``.
+
+    Submitting each job separately costs a remote command per job and schedulers tend to throttle users that submit
+    many jobs in a short time. Instead, submission requests are gathered for a short window, after which all of them are
+    submitted through a single remote command with :py:meth:`~aiida.schedulers.Scheduler.submit_from_scripts`. The
+    future of each request resolves to the job id of its job, or to the exception if its submission failed, such that
+    a failed submission does not affect the other jobs of the batch.
+    """
+
+    def __init__(self, authinfo, transport_queue, batch_window=SUBMIT_BATCH_WINDOW, batch_size=SUBMIT_BATCH_SIZE):
+        """Construct an instance for the given authinfo and transport queue.
+
+        :param authinfo: The authinfo used to submit the jobs
+        :type authinfo: :class:`aiida.orm.AuthInfo`
+        :param transport_queue: A transport queue
+        :type: :class:`aiida.engine.transports.TransportQueue`
+        :param batch_window: the time in seconds during which submission requests are gathered
+        :param batch_size: the maximum number of jobs to submit with a single remote command
+        """
+        self._authinfo = authinfo
+        self._transport_queue = transport_queue
+        self._loop = transport_queue.loop()
+        self._logger = AIIDA_LOGGER.getChild('calcjobs')
+        self._batch_window = batch_window
+        self._batch_size = batch_size
+
+        self._submission_requests = []  # List of tuples: (working_directory, submit_script, Future)
+        self._cancelled_requests = set()
+        self._submit_handle = None
+
+    @property
+    def logger(self):
+        """Return the logger configured for this instance.
+
+        :return: the logger
+        """
+        return self._logger
+
+    def request_job_submission(self, working_directory, submit_script):
+        """Request the submission of a job script.
+
+        :param working_directory: the remote working directory of the job
+        :param submit_script: the path of the submit script relative to the working directory
+        :return: future that will resolve to the job id once the job has been submitted
+        :rtype: :class:`tornado.concurrent.Future`
+        """
+        request = concurrent.Future()
+        self._submission_requests.append((working_directory, submit_script, request))
+
+        if len(self._submission_requests) >= self._batch_size:
+            self._schedule_submission(0.)
+        elif self._submit_handle is None:
+            self._schedule_submission(self._batch_window)
+
+        return request
+
+    def cancel_job_submission(self, request):
+        """Cancel a request, such that its job is not submitted unless the remote command was already issued.
+
+        Futures of tornado cannot be cancelled, so the request is also recorded to be skipped when its batch is
+        submitted.
+
+        :param request: a future returned by `request_job_submission`
+        """
+        request.cancel()
+        if not request.done():
+            self._cancelled_requests.add(request)
+
+    def _is_pending(self, request):
+        """Return whether the request still needs to be submitted.
+
+        :param request: a future returned by `request_job_submission`
+        """
+        return not request.done() and request not in self._cancelled_requests
+
+    def _schedule_submission(self, delay):
+        """Schedule the submission of the outstanding requests after the given delay.
+
+        :param delay: the delay in seconds
+        """
+        if self._submit_handle is not None:
+            self._loop.remove_timeout(self._submit_handle)
+
+        self._submit_handle = self._loop.call_later(delay, self._submit_jobs)
+
+    @gen.coroutine
+    def _submit_jobs(self):
+        """Submit the outstanding requests in batches, setting the result or exception on each request."""
+        self._submit_handle = None
+
+        requests = self._submission_requests
+        self._submission_requests = []
+
+        for batch in [requests[i:i + self._batch_size] for i in range(0, len(requests), self._batch_size)]:
+            yield self._submit_batch(batch)
+
+    @gen.coroutine
+    def _submit_batch(self, batch):
+        """Submit a batch of jobs with a single remote command, setting the result or exception on each request.
+
+        Waiting for the transport can take a while, during which the processes of the requests can be killed or paused,
+        which cancels their request. The cancelled requests are therefore only dropped once the transport is available,
+        right before the remote command, because a job that is submitted after its request was cancelled would not be
+        tracked by anyone.
+
+        :param batch: a list of tuples `(working_directory, submit_script, future)`
+        """
+        pending = []
+        job_ids = []
+
+        try:
+            with self._transport_queue.request_transport(self._authinfo) as request:
+                transport = yield request
+
+                pending = [submission for submission in batch if self._is_pending(submission[2])]
+
+                if pending:
+                    scheduler = self._authinfo.computer.get_scheduler()
+                    scheduler.set_transport(transport)
+
+                    job_ids = scheduler.submit_from_scripts([(directory, script) for directory, script, _ in pending])
+                    self.logger.info('AuthInfo<{}>: submitted a batch of {} jobs'.format(
+                        self._authinfo.pk, len(pending)))
+        except Exception as exception:  # pylint: disable=broad-except
+            for _, _, future in batch:
+                if self._is_pending(future):
+                    future.set_exception(exception)
+        else:
+            for (_, _, future), job_id in zip(pending, job_ids):
+                if not self._is_pending(future):
+                    # The request was cancelled while the remote command was running, so the job cannot be stopped
+                    self.logger.warning('AuthInfo<{}>: request for job<{}> was cancelled after its submission'.format(
+                        self._authinfo.pk, job_id))
+                elif isinstance(job_id, Exception):
+                    future.set_exception(job_id)
+                else:
+                    future.set_result(job_id)
+        finally:
+            for _, _, future in batch:
+                self._cancelled_requests.discard(future)
 
 
 class JobManager(object):
@@ -264,6 +418,7 @@ class JobManager(object):
     def __init__(self, transport_queue):
         self._transport_queue = transport_queue
         self._job_lists = {}
+        self._job_submitters = {}
 
     def get_jobs_list(self, authinfo):
         """Get or create a new `JobLists` instance for the given authinfo.
@@ -276,6 +431,38 @@ class JobManager(object):
 
         return self._job_lists[authinfo.id]
 
+    def get_job_submitter(self, authinfo):
+        """Get or create a new `JobSubmitter` instance for the given authinfo.
+
+        :param authinfo: the `AuthInfo`
+        :return: a `JobSubmitter` instance
+        """
+        if authinfo.id not in self._job_submitters:
+            self._job_submitters[authinfo.id] = JobSubmitter(authinfo, self._transport_queue)
+
+        return self._job_submitters[authinfo.id]
+
+    @contextlib.contextmanager
+    def request_job_submission(self, authinfo, working_directory, submit_script):
+        """Get a future that will resolve to the job id of the submitted job.
+
+        Submissions with the same authinfo are gathered and submitted in batches. This is a context manager so that if
+        the user leaves the context the request is automatically cancelled.
+
+        :param authinfo: the `AuthInfo` with which to submit the job
+        :param working_directory: the remote working directory of the job
+        :param submit_script: the path of the submit script relative to the working directory
+        :return: future that resolves to the job id
+        :rtype: :class:`tornado.concurrent.Future`
+        """
+        job_submitter = self.get_job_submitter(authinfo)
+        request = job_submitter.request_job_submission(working_directory, submit_script)
+        try:
+            yield request
+        finally:
+            if not request.done():
+                job_submitter.cancel_job_submission(request)
+
     @contextlib.contextmanager
     def request_job_info_update(self, authinfo, job_id):
         """Get a future that will resolve to information about a given job.
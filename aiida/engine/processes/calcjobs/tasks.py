@@ -13,6 +13,7 @@ from __future__ import absolute_import
 
 import functools
 import logging
+import shutil
 import sys
 import tempfile
 
@@ -23,7 +24,7 @@ import plumpy
 
 from aiida.common.datastructures import CalcJobState
 from aiida.common.exceptions import TransportTaskException
-from aiida.engine.daemon import execmanager
+from aiida.engine.daemon import execmanager, telemetry
 from aiida.engine.utils import exponential_backoff_retry, interruptable_task
 from aiida.schedulers.datastructures import JobState
 
@@ -33,6 +34,7 @@ UPLOAD_COMMAND = 'upload'
 SUBMIT_COMMAND = 'submit'
 UPDATE_COMMAND = 'update'
 RETRIEVE_COMMAND = 'retrieve'
+PARSE_COMMAND = 'parse'
 KILL_COMMAND = 'kill'
 
 TRANSPORT_TASK_RETRY_INITIAL_INTERVAL = 20
@@ -41,6 +43,7 @@ TRANSPORT_TASK_MAXIMUM_ATTEMTPS = 5
 logger = logging.getLogger(__name__)
 
 
+@telemetry.timed_coroutine('calcjob.upload')
 @coroutine
 def task_upload_job(node, transport_queue, calc_info, script_filename, cancellable):
     """
@@ -67,7 +70,7 @@ def task_upload_job(node, transport_queue, calc_info, script_filename, cancellab
     initial_interval = TRANSPORT_TASK_RETRY_INITIAL_INTERVAL
     max_attempts = TRANSPORT_TASK_MAXIMUM_ATTEMTPS
 
-    authinfo = node.computer.get_authinfo(node.user)
+    authinfo = execmanager.get_authinfo(node.computer, node.user)
 
     @coroutine
     def do_upload():
@@ -90,19 +93,21 @@ def task_upload_job(node, transport_queue, calc_info, script_filename, cancellab
         raise Return(result)
 
 
+@telemetry.timed_coroutine('calcjob.submit')
 @coroutine
-def task_submit_job(node, transport_queue, calc_info, script_filename, cancellable):
+def task_submit_job(node, job_manager, script_filename, cancellable):
     """
     Transport task that will attempt to submit a job calculation
 
-    The task will first request a transport from the queue. Once the transport is yielded, the relevant execmanager
-    function is called, wrapped in the exponential_backoff_retry coroutine, which, in case of a caught exception, will
-    retry after an interval that increases exponentially with the number of retries, for a maximum number of retries.
-    If all retries fail, the task will raise a TransportTaskException
+    The submission is requested from the job manager, which gathers the submissions of all jobs with the same authinfo
+    and submits them in batches with a single remote command. The request is wrapped in the exponential_backoff_retry
+    coroutine, which, in case of a caught exception, will retry after an interval that increases exponentially with the
+    number of retries, for a maximum number of retries. If all retries fail, the task will raise a
+    TransportTaskException
 
     :param node: the node that represents the job calculation
-    :param transport_queue: the TransportQueue from which to request a Transport
-    :param calc_info: the calculation info datastructure returned by `CalcJobNode._presubmit`
+    :param job_manager: The job manager
+    :type job_manager: :class:`aiida.engine.processes.calcjobs.manager.JobManager`
     :param script_filename: the job launch script returned by `CalcJobNode._presubmit`
     :param cancellable: the cancelled flag that will be queried to determine whether the task was cancelled
     :type cancellable: :class:`aiida.engine.utils.InterruptableFuture`
@@ -117,13 +122,15 @@ def task_submit_job(node, transport_queue, calc_info, script_filename, cancellab
     initial_interval = TRANSPORT_TASK_RETRY_INITIAL_INTERVAL
     max_attempts = TRANSPORT_TASK_MAXIMUM_ATTEMTPS
 
-    authinfo = node.computer.get_authinfo(node.user)
+    authinfo = execmanager.get_authinfo(node.computer, node.user)
+    workdir = node.get_remote_workdir()
 
     @coroutine
     def do_submit():
-        with transport_queue.request_transport(authinfo) as request:
-            transport = yield cancellable.with_interrupt(request)
-            raise Return(execmanager.submit_calculation(node, transport, calc_info, script_filename))
+        with job_manager.request_job_submission(authinfo, workdir, script_filename) as request:
+            job_id = yield cancellable.with_interrupt(request)
+            node.set_job_id(job_id)
+            raise Return(job_id)
 
     try:
         logger.info('submitting CalcJob<{}>'.format(node.pk))
@@ -133,13 +140,14 @@ def task_submit_job(node, transport_queue, calc_info, script_filename, cancellab
         pass
     except Exception:
         logger.warning('submitting CalcJob<{}> failed'.format(node.pk))
-        raise TransportTaskException('submit_calculation failed {} times consecutively'.format(max_attempts))
+        raise TransportTaskException('submit_job failed {} times consecutively'.format(max_attempts))
     else:
         logger.info('submitting CalcJob<{}> successful'.format(node.pk))
         node.set_state(CalcJobState.WITHSCHEDULER)
         raise Return(result)
 
 
+@telemetry.timed_coroutine('calcjob.update')
 @coroutine
 def task_update_job(node, job_manager, cancellable):
     """
@@ -165,7 +173,7 @@ def task_update_job(node, job_manager, cancellable):
     initial_interval = TRANSPORT_TASK_RETRY_INITIAL_INTERVAL
     max_attempts = TRANSPORT_TASK_MAXIMUM_ATTEMTPS
 
-    authinfo = node.computer.get_authinfo(node.user)
+    authinfo = execmanager.get_authinfo(node.computer, node.user)
     job_id = node.get_job_id()
 
     @coroutine
@@ -202,6 +210,7 @@ def task_update_job(node, job_manager, cancellable):
         raise Return(job_done)
 
 
+@telemetry.timed_coroutine('calcjob.retrieve')
 @coroutine
 def task_retrieve_job(node, transport_queue, retrieved_temporary_folder, cancellable):
     """
@@ -226,7 +235,7 @@ def task_retrieve_job(node, transport_queue, retrieved_temporary_folder, cancell
     initial_interval = TRANSPORT_TASK_RETRY_INITIAL_INTERVAL
     max_attempts = TRANSPORT_TASK_MAXIMUM_ATTEMTPS
 
-    authinfo = node.computer.get_authinfo(node.user)
+    authinfo = execmanager.get_authinfo(node.computer, node.user)
 
     @coroutine
     def do_retrieve():
@@ -249,6 +258,37 @@ def task_retrieve_job(node, transport_queue, retrieved_temporary_folder, cancell
         raise Return(result)
 
 
+@telemetry.timed_coroutine('calcjob.parse')
+@coroutine
+def task_parse_job(node, retrieved_temporary_folder, parsed_folder, cancellable):
+    """
+    Task that runs the parser of a job calculation in a separate process
+
+    The parser is run through `execmanager.parse_calculation`, in a pool of processes whose size, configured through
+    the `runner.parse.max_concurrent` option, limits the number of parsers that run concurrently. The exit code and
+    outputs of the parser are written to the `parsed_folder`, from which they are attached to the process afterwards.
+
+    :param node: the node that represents the job calculation
+    :param retrieved_temporary_folder: the absolute path of the folder with the retrieved temporary files
+    :param parsed_folder: the absolute path of an existing, empty folder to which the results of the parser are written
+    :param cancellable: the cancelled flag that will be queried to determine whether the task was cancelled
+    :type cancellable: :class:`aiida.engine.utils.InterruptableFuture`
+    :raises: Return if the tasks was successfully completed
+    """
+    from aiida.engine.pool import submit_to_pool
+    from aiida.manage.configuration import get_config_option
+
+    max_concurrent = get_config_option('runner.parse.max_concurrent')
+
+    logger.info('parsing calculation<{}>'.format(node.pk))
+    future = submit_to_pool('parse', max_concurrent, execmanager.parse_calculation, node.pk,
+                            retrieved_temporary_folder, parsed_folder)
+    yield cancellable.with_interrupt(future)
+    logger.info('parsing calculation<{}> successful'.format(node.pk))
+    raise Return(True)
+
+
+@telemetry.timed_coroutine('calcjob.kill')
 @coroutine
 def task_kill_job(node, transport_queue, cancellable):
     """
@@ -273,7 +313,7 @@ def task_kill_job(node, transport_queue, cancellable):
         logger.warning('CalcJob<{}> killed, it was in the {} state'.format(node.pk, node.get_state()))
         raise Return(True)
 
-    authinfo = node.computer.get_authinfo(node.user)
+    authinfo = execmanager.get_authinfo(node.computer, node.user)
 
     @coroutine
     def do_kill():
@@ -329,7 +369,9 @@ class Waiting(plumpy.Waiting):
                 raise Return(self.submit(calc_info, script_filename))
 
             elif command == SUBMIT_COMMAND:
-                yield self._launch_task(task_submit_job, node, transport_queue, *args)
+                # The calculation info is kept in the state data for compatibility with existing checkpoints
+                _, script_filename = args
+                yield self._launch_task(task_submit_job, node, self.process.runner.job_manager, script_filename)
                 raise Return(self.update())
 
             elif self.data == UPDATE_COMMAND:
@@ -346,6 +388,17 @@ class Waiting(plumpy.Waiting):
                 yield self._launch_task(task_retrieve_job, node, transport_queue, temp_folder)
                 raise Return(self.parse(temp_folder))
 
+            elif command == PARSE_COMMAND:
+                # Create a temporary folder for the results of the parser that is deleted by `CalcJob.parse`
+                parsed_folder = tempfile.mkdtemp()
+                try:
+                    yield self._launch_task(task_parse_job, node, args[0], parsed_folder)
+                except Exception:
+                    # The parse command creates a new folder when it is run again, for example after a pause
+                    shutil.rmtree(parsed_folder, ignore_errors=True)
+                    raise
+                raise Return(self.create_state(ProcessState.RUNNING, self.process.parse, args[0], parsed_folder))
+
             else:
                 raise RuntimeError('Unknown waiting command')
 
@@ -403,10 +456,19 @@ class Waiting(plumpy.Waiting):
         return self.create_state(ProcessState.WAITING, None, msg='Waiting to retrieve', data=RETRIEVE_COMMAND)
 
     def parse(self, retrieved_temporary_folder):
-        """Return the `Running` state that will `parse` the `CalcJob`.
+        """Return the state that will `parse` the `CalcJob`.
+
+        If the `runner.parse.executor` option is set to `process`, this is a `Waiting` state that runs the parser in a
+        separate process, otherwise it is the `Running` state that runs the parser directly.
 
         :param retrieved_temporary_folder: temporary folder used in retrieving that can be used during parsing.
         """
+        from aiida.manage.configuration import get_config_option
+
+        if get_config_option('runner.parse.executor') == 'process':
+            return self.create_state(
+                ProcessState.WAITING, None, msg='Waiting for parsing', data=(PARSE_COMMAND, retrieved_temporary_folder))
+
         return self.create_state(ProcessState.RUNNING, self.process.parse, retrieved_temporary_folder)
 
     def interrupt(self, reason):
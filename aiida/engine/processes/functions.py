@@ -13,13 +13,19 @@ from __future__ import print_function
 from __future__ import absolute_import
 
 import functools
+import importlib
 import logging
+import os
+import shutil
 import signal
 import inspect
+import tempfile
 
 from six.moves import zip  # pylint: disable=unused-import
 from six import PY2
 
+import plumpy
+
 if PY2:
     import collections
 else:
@@ -28,14 +34,18 @@ else:
 from aiida.common.lang import override  # pylint: disable=wrong-import-position
 from aiida.manage.manager import get_manager  # pylint: disable=wrong-import-position
 
+from .exit_code import ExitCode  # pylint: disable=wrong-import-position
 from .process import Process  # pylint: disable=wrong-import-position
 
 __all__ = ('calcfunction', 'workfunction', 'FunctionProcess')
 
 LOGGER = logging.getLogger(__name__)
 
+EXECUTOR_INLINE = 'inline'
+EXECUTOR_PROCESS = 'process'
+
 
-def calcfunction(function):
+def calcfunction(function=None, executor=EXECUTOR_INLINE):
     """
     A decorator to turn a standard python function into a calcfunction.
     Example usage:
@@ -56,14 +66,25 @@ def calcfunction(function):
     >>> r.get_incoming().get_node_by_label('result').get_incoming().all_nodes()
     [4, 5]
 
+    By default the function is executed in the interpreter that calls it. CPU intensive functions can instead be run in
+    a pool of worker processes, by decorating them with ``@calcfunction(executor='process')``. The inputs are passed
+    to the worker process and the outputs are passed back, such that the provenance is still stored by the caller.
+    Since the worker has to import the function, it has to be defined at the top level of an importable module.
+
     :param function: The function to decorate.
     :type function: callable
+    :param executor: where to execute the function, either 'inline' or 'process'
 
     :return: The decorated function.
     :rtype: callable
     """
     from aiida.orm import CalcFunctionNode
-    return process_function(node_class=CalcFunctionNode)(function)
+    decorator = process_function(node_class=CalcFunctionNode, executor=executor)
+
+    if function is None:
+        return decorator
+
+    return decorator(function)
 
 
 def workfunction(function):
@@ -97,13 +118,17 @@ def workfunction(function):
     return process_function(node_class=WorkFunctionNode)(function)
 
 
-def process_function(node_class):
+def process_function(node_class, executor=EXECUTOR_INLINE):
     """
     The base function decorator to create a FunctionProcess out of a normal python function.
 
     :param node_class: the ORM class to be used as the Node record for the FunctionProcess
     :type node_class: :class:`aiida.orm.ProcessNode`
+    :param executor: where to execute the function, either 'inline' or 'process'
     """
+    if executor not in (EXECUTOR_INLINE, EXECUTOR_PROCESS):
+        raise ValueError('invalid executor `{}`, choose from `{}` and `{}`'.format(
+            executor, EXECUTOR_INLINE, EXECUTOR_PROCESS))
 
     @staticmethod
     @property
@@ -117,7 +142,11 @@ def process_function(node_class):
         :param callable function: the actual decorated function that the FunctionProcess represents
         :return callable: The decorated function.
         """
-        process_class = FunctionProcess.build(function, node_class=node_class)
+        if executor == EXECUTOR_PROCESS and '<locals>' in getattr(function, '__qualname__', ''):
+            raise ValueError('function `{}` cannot be run by the process executor because it is not defined at the '
+                             'top level of a module'.format(function.__name__))
+
+        process_class = FunctionProcess.build(function, node_class=node_class, executor=executor)
 
         def run_get_node(*args, **kwargs):
             """
@@ -201,6 +230,8 @@ def process_function(node_class):
         decorated_function.run_get_pk = run_get_pk
         decorated_function.run_get_node = run_get_node
         decorated_function.is_process_function = is_process_function
+        decorated_function.process_class = process_class
+        decorated_function.executor = executor
 
         return decorated_function
 
@@ -211,6 +242,7 @@ class FunctionProcess(Process):
     """Function process class used for turning functions into a Process"""
 
     _func_args = None
+    _executor = EXECUTOR_INLINE
 
     @staticmethod
     def _func(*_args, **_kwargs):
@@ -221,7 +253,7 @@ class FunctionProcess(Process):
         return {}
 
     @staticmethod
-    def build(func, node_class):
+    def build(func, node_class, executor=EXECUTOR_INLINE):
         """
         Build a Process from the given function.
 
@@ -235,6 +267,8 @@ class FunctionProcess(Process):
             be a sub class of `ProcessNode` and the mixin :class:`~aiida.orm.utils.mixins.FunctionCalculationMixin`.
         :type node_class: :class:`aiida.orm.nodes.process.process.ProcessNode`
 
+        :param executor: where to execute the function, either 'inline' or 'process'
+
         :return: A Process class that represents the function
         :rtype: :class:`FunctionProcess`
         """
@@ -298,7 +332,8 @@ class FunctionProcess(Process):
                 '_func': staticmethod(func),
                 Process.define.__name__: classmethod(_define),
                 '_func_args': args,
-                '_node_class': node_class
+                '_node_class': node_class,
+                '_executor': executor
             })
 
     @classmethod
@@ -357,6 +392,11 @@ class FunctionProcess(Process):
             raise RuntimeError('Cannot persist a function process')
         super(FunctionProcess, self).__init__(enable_persistence=False, *args, **kwargs)
 
+    @property
+    def executor(self):
+        """Return where the function is executed, either 'inline' or 'process'."""
+        return self._executor
+
     @property
     def process_class(self):
         """
@@ -393,9 +433,6 @@ class FunctionProcess(Process):
 
         :rtype: :class:`aiida.engine.ExitCode`
         """
-        from aiida.orm import Data
-        from .exit_code import ExitCode
-
         # Split the inputs into positional and keyword arguments
         args = [None] * len(self._func_args)
         kwargs = {}
@@ -414,18 +451,124 @@ class FunctionProcess(Process):
             except ValueError:
                 kwargs[name] = value
 
+        if self._executor == EXECUTOR_PROCESS:
+            return self._submit_to_pool(args, kwargs)
+
         result = self._func(*args, **kwargs)
 
         if result is None or isinstance(result, ExitCode):
             return result
 
-        if isinstance(result, Data):
-            self.out(self.SINGLE_OUTPUT_LINKNAME, result)
-        elif isinstance(result, collections.Mapping):
-            for name, value in result.items():
-                self.out(name, value)
-        else:
-            raise TypeError("Function process returned an output with unsupported type '{}'\n"
-                            "Must be a Data type or a mapping of {{string: Data}}".format(result.__class__))
+        for name, value in _get_outputs(result).items():
+            self.out(name, value)
 
         return ExitCode()
+
+    def _submit_to_pool(self, args, kwargs):
+        """Submit the function to the pool of worker processes and wait for it to finish.
+
+        The inputs are written to a temporary folder with `pack_nodes`, from which the worker reads them and to which
+        it writes the outputs. Once the worker has finished, the process is resumed with `_collect_from_pool`.
+
+        :param args: the positional arguments of the function
+        :param kwargs: the keyword arguments of the function
+        :return: the `Wait` command
+        """
+        from aiida.engine.pool import pack_nodes, submit_to_pool
+        from aiida.manage.configuration import get_config_option
+
+        inputs = dict(kwargs)
+        inputs.update({name: value for name, value in zip(self._func_args, args) if value is not None})
+
+        folder = tempfile.mkdtemp()
+        os.mkdir(os.path.join(folder, 'inputs'))
+        os.mkdir(os.path.join(folder, 'outputs'))
+        pack_nodes(inputs, os.path.join(folder, 'inputs'))
+
+        max_concurrent = get_config_option('runner.function.max_concurrent')
+        future = submit_to_pool('function', max_concurrent, _call_function, self._func.__module__,
+                                self._func.__name__, list(self._func_args), folder)
+        self.loop().add_future(future, functools.partial(self._on_pool_done, folder))
+
+        return plumpy.Wait(self._collect_from_pool, msg='Waiting for the function to finish in a worker process')
+
+    def _on_pool_done(self, folder, future):
+        """Resume the process once the worker has finished, or clean up if the process was killed in the meantime."""
+        if self.state == plumpy.ProcessState.WAITING:
+            self.resume((folder, future))
+        else:
+            shutil.rmtree(folder, ignore_errors=True)
+
+    def _collect_from_pool(self, outcome):
+        """Attach the outputs that were written by the worker and return the exit code of the function.
+
+        :param outcome: tuple of the temporary folder and the future of the worker
+        :rtype: :class:`aiida.engine.ExitCode`
+        """
+        from aiida.engine.pool import unpack_nodes
+
+        folder, future = outcome
+
+        try:
+            exit_code = future.result()
+            outputs = unpack_nodes(os.path.join(folder, 'outputs'))
+        finally:
+            shutil.rmtree(folder, ignore_errors=True)
+
+        for name, value in outputs.items():
+            self.out(name, value)
+
+        if exit_code is None and not outputs:
+            return None
+
+        return exit_code or ExitCode()
+
+
+def _get_outputs(result):
+    """Return the outputs of a process function from the value returned by the wrapped function.
+
+    :param result: the value returned by the function
+    :return: a mapping of output link labels to nodes
+    :raises TypeError: if the value is not a `Data` node or a mapping of nodes
+    """
+    from aiida.orm import Data
+
+    if isinstance(result, Data):
+        return {FunctionProcess.SINGLE_OUTPUT_LINKNAME: result}
+
+    if isinstance(result, collections.Mapping):
+        return result
+
+    raise TypeError("Function process returned an output with unsupported type '{}'\n"
+                    "Must be a Data type or a mapping of {{string: Data}}".format(result.__class__))
+
+
+def _call_function(module_name, function_name, positional, folder):
+    """Call a process function in a worker process of the pool, see `FunctionProcess._submit_to_pool`.
+
+    :param module_name: the name of the module in which the function is defined
+    :param function_name: the name of the decorated function in the module
+    :param positional: the names of the positional arguments of the function
+    :param folder: the temporary folder with the packed inputs, to which the outputs are packed
+    :return: the `ExitCode` returned by the function, or None
+    """
+    from aiida.engine.pool import pack_nodes, unpack_nodes
+
+    decorated_function = getattr(importlib.import_module(module_name), function_name)
+    function = decorated_function.process_class._func  # pylint: disable=protected-access
+
+    kwargs = unpack_nodes(os.path.join(folder, 'inputs'))
+    args = [kwargs.pop(name, None) for name in positional]
+
+    result = function(*args, **kwargs)
+
+    if result is None or isinstance(result, ExitCode):
+        pack_nodes({}, os.path.join(folder, 'outputs'))
+        return result
+
+    outputs = _get_outputs(result)
+
+    if any(isinstance(value, collections.Mapping) for value in outputs.values()):
+        raise TypeError('functions run by the process executor cannot return nested output namespaces')
+
+    pack_nodes(outputs, os.path.join(folder, 'outputs'))
@@ -41,6 +41,9 @@ from .process_spec import ProcessSpec
 
 __all__ = ('Process', 'ProcessState')
 
+# Maximum time in seconds that buffered updates of the process node attributes are held back before being written
+NODE_ATTRIBUTE_FLUSH_INTERVAL = 5.
+
 
 @plumpy.auto_persist('_parent_pid', '_enable_persistence')
 @six.add_metaclass(abc.ABCMeta)
@@ -124,6 +127,7 @@ class Process(plumpy.Process):
             communicator=self.runner.communicator)
 
         self._node = None
+        self._node_attribute_flush_handle = None
         self._parent_pid = parent_pid
         self._enable_persistence = enable_persistence
         if self._enable_persistence and self.runner.persister is None:
@@ -240,11 +244,28 @@ class Process(plumpy.Process):
         if self.SaveKeys.CALC_ID.value in saved_state:
             self._node = orm.load_node(saved_state[self.SaveKeys.CALC_ID.value])
             self._pid = self.node.pk
+            self._enable_node_attribute_buffer()
+            self._except_lost_function_children()
         else:
             self._pid = self._create_and_setup_db_record()
 
         self.node.logger.info('Loaded process<{}> from saved state'.format(self.node.pk))
 
+    def _except_lost_function_children(self):
+        """Set the process functions called by this process that did not terminate to the excepted state.
+
+        Process functions cannot be persisted, so the ones that are submitted are run by the runner of their caller.
+        When the caller is loaded from a checkpoint, that runner has stopped and any process function that had not yet
+        terminated was lost with it. Setting them to the excepted state ensures that the caller does not wait forever.
+        """
+        for child in self.node.called:
+            if isinstance(child, (orm.CalcFunctionNode, orm.WorkFunctionNode)) and not child.is_terminated:
+                child.set_process_state(ProcessState.EXCEPTED)
+                child.set_exception('the process function was lost when the runner of its caller<{}> stopped'.format(
+                    self.node.pk))
+                child.seal()
+                self.logger.warning('set lost process function<{}> to the excepted state'.format(child.pk))
+
     def kill(self, msg=None):
         """
         Kill the process and all the children calculations it called
@@ -332,6 +353,8 @@ class Process(plumpy.Process):
         from aiida.engine.utils import set_process_state_change_timestamp
         self.update_node_state(self._state)
         self._save_checkpoint()
+        # Write the buffered node attributes, if the checkpoint did not already do so, once per state transition
+        self.node.flush_attribute_buffer()
         # Update the latest process state change timestamp
         set_process_state_change_timestamp(self)
         super(Process, self).on_entered(from_state)
@@ -445,6 +468,18 @@ class Process(plumpy.Process):
         """
         return self.runner.submit(process, *args, **kwargs)
 
+    def submit_many(self, process, inputs_list):
+        """Submit a process for each of the given sets of inputs in bulk.
+
+        The returned list of nodes can be passed to `ToContext` of a `WorkChain`, to wait for all of them to finish.
+
+        :param process: process
+        :type process: :class:`aiida.engine.Process`
+        :param inputs_list: list of dictionaries with the inputs of each process
+        :return: list of the nodes of the submitted processes
+        """
+        return self.runner.submit_many(process, inputs_list)
+
     @property
     def runner(self):
         """Get process runner.
@@ -539,11 +574,36 @@ class Process(plumpy.Process):
             # Cannot persist the process if were not storing provenance because that would require a stored node
             self._enable_persistence = False
 
+        self._enable_node_attribute_buffer()
+
         if self.node.pk is not None:
             return self.node.pk
 
         return uuid.UUID(self.node.uuid)
 
+    def _enable_node_attribute_buffer(self):
+        """Buffer the frequent updates of the process node attributes, such as the process state and status.
+
+        The buffered updates are written at the latest once per state transition, or after the maximum interval
+        `NODE_ATTRIBUTE_FLUSH_INTERVAL`, whichever comes first.
+        """
+        if not self.node.is_stored or self.node.is_sealed:
+            return
+
+        self._node_attribute_flush_handle = None
+        self.node.enable_attribute_buffer(callback=self._schedule_node_attribute_flush)
+
+    def _schedule_node_attribute_flush(self):
+        """Schedule the flush of the buffered process node attributes after the maximum interval."""
+        if self._node_attribute_flush_handle is None:
+            self._node_attribute_flush_handle = self.runner.loop.call_later(NODE_ATTRIBUTE_FLUSH_INTERVAL,
+                                                                            self._flush_node_attributes)
+
+    def _flush_node_attributes(self):
+        """Write the buffered process node attributes."""
+        self._node_attribute_flush_handle = None
+        self.node.flush_attribute_buffer()
+
     @override
     def encode_input_args(self, inputs):
         """
@@ -145,11 +145,26 @@ class WorkChain(Process):
 
         This is a convenience method that provides syntactic sugar, for a user to add multiple intersteps that will
         assign a certain value to the corresponding key in the context of the work chain.
+
+        A value can also be a list of nodes, as returned by `submit_many`, in which case each node is appended to the
+        list in the context once it is finished. Note that the nodes are therefore appended in the order in which they
+        finish, which is not necessarily the order in which they were submitted.
         """
         for key, value in kwargs.items():
-            awaitable = construct_awaitable(value)
-            awaitable.key = key
-            self.insert_awaitable(awaitable)
+
+            if not isinstance(value, (list, tuple)):
+                awaitable = construct_awaitable(value)
+                awaitable.key = key
+                self.insert_awaitable(awaitable)
+                continue
+
+            self.ctx.setdefault(key, [])
+
+            for target in value:
+                awaitable = construct_awaitable(target)
+                awaitable.key = key
+                awaitable.action = AwaitableAction.APPEND
+                self.insert_awaitable(awaitable)
 
     def _update_process_status(self):
         """Set the process status with a message accounting the current sub processes that we are waiting for."""
@@ -14,6 +14,7 @@ from __future__ import print_function
 from __future__ import absolute_import
 
 import collections
+import functools
 import logging
 import signal
 import tornado.ioloop
@@ -22,7 +23,9 @@ import plumpy
 
 from aiida.common import exceptions
 from aiida.orm import load_node
+from .daemon import telemetry
 from .processes import futures
+from .processes.functions import EXECUTOR_PROCESS, FunctionProcess
 from .processes.calcjobs import manager
 from .utils import instantiate_process
 from . import transports
@@ -42,6 +45,7 @@ class Runner(object):  # pylint: disable=useless-object-inheritance
     _persister = None
     _communicator = None
     _controller = None
+    _task_receiver = None
     _closed = False
 
     def __init__(self, poll_interval=0, loop=None, communicator=None, rmq_submit=False, persister=None):
@@ -116,6 +120,31 @@ class Runner(object):  # pylint: disable=useless-object-inheritance
     def controller(self):
         return self._controller
 
+    @property
+    def task_receiver(self):
+        """
+        Get the task receiver that launches and continues the tasks this runner receives from the communicator
+
+        :return: the task receiver or None if this runner does not subscribe to tasks
+        :rtype: :class:`aiida.manage.external.rmq.ProcessLauncher`
+        """
+        return self._task_receiver
+
+    def set_task_receiver(self, task_receiver):
+        """
+        Set the task receiver and subscribe it to the tasks of the communicator of this runner
+
+        :param task_receiver: the task receiver
+        :type task_receiver: :class:`aiida.manage.external.rmq.ProcessLauncher`
+        """
+
+        def callback(*args, **kwargs):
+            telemetry.REGISTRY.increment('rmq.tasks.received')
+            return plumpy.create_task(functools.partial(task_receiver, *args, **kwargs), loop=self._loop)
+
+        self._task_receiver = task_receiver
+        self._communicator.add_task_subscriber(callback)
+
     @property
     def is_daemon_runner(self):
         """Return whether the runner is a daemon runner, which means it submits processes over RabbitMQ.
@@ -152,14 +181,24 @@ class Runner(object):  # pylint: disable=useless-object-inheritance
         Submit the process with the supplied inputs to this runner immediately returning control to
         the interpreter. The return value will be the calculation node of the submitted process
 
+        A process function can only be submitted if it runs in a pool of worker processes, i.e. if it was decorated
+        with `executor='process'`. Since process functions cannot be persisted, it is then run by this runner itself,
+        whose event loop remains free while the function runs in the pool. If this runner stops before the function
+        terminates, the function is lost and it is set to the excepted state when its caller is loaded from its
+        checkpoint, after which the caller can resume.
+
         :param process: the process class to submit
         :param inputs: the inputs to be passed to the process
         :return: the calculation node of the process
         """
-        assert not utils.is_process_function(process), 'Cannot submit a process function'
         assert not self._closed
 
-        process = instantiate_process(self, process, *args, **inputs)
+        if utils.is_process_function(process):
+            assert process.executor == EXECUTOR_PROCESS, 'Cannot submit a process function with the inline executor'
+            process_class = process.process_class
+            process = process_class(runner=self, inputs=process_class.create_inputs(*args, **inputs))
+        else:
+            process = instantiate_process(self, process, *args, **inputs)
 
         if not process.metadata.store_provenance:
             raise exceptions.InvalidOperation('cannot submit a process with `store_provenance=False`')
@@ -167,15 +206,43 @@ class Runner(object):  # pylint: disable=useless-object-inheritance
         if process.metadata.get('dry_run', False):
             raise exceptions.InvalidOperation('cannot submit a process from within another with `dry_run=True`')
 
-        if self._rmq_submit:
+        if isinstance(process, FunctionProcess):
+            self.loop.add_callback(process.step_until_terminated)
+        elif self._rmq_submit:
             self.persister.save_checkpoint(process)
             process.close()
             self.controller.continue_process(process.pid, nowait=False, no_reply=True)
+            telemetry.REGISTRY.increment('rmq.tasks.sent')
         else:
             self.loop.add_callback(process.step_until_terminated)
 
         return process.node
 
+    def submit_many(self, process, inputs_list):
+        """
+        Submit a process for each of the given sets of inputs to this runner, immediately returning control to the
+        interpreter. The return value will be the list of the nodes of the submitted processes, in the same order.
+
+        Contrary to calling `submit` for each set of inputs, the database records and checkpoints of all processes are
+        created in a single transaction, after which their tasks are sent to the daemon together.
+
+        :param process: the process class or process builder to submit
+        :param inputs_list: list of dictionaries with the inputs of each process
+        :return: list of the calculation nodes of the processes
+        """
+        assert not utils.is_process_function(process), 'Cannot submit a process function in bulk'
+        assert not self._closed
+
+        if self._rmq_submit:
+            processes = utils.instantiate_processes(self, process, inputs_list, persister=self.persister)
+            utils.send_continue_tasks(self.controller, [instance.pid for instance in processes])
+        else:
+            processes = utils.instantiate_processes(self, process, inputs_list)
+            for instance in processes:
+                self.loop.add_callback(instance.step_until_terminated)
+
+        return [instance.node for instance in processes]
+
     def schedule(self, process, *args, **inputs):
         """
         Schedule a process to be executed by this runner
@@ -11,12 +11,16 @@
 from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
-from collections import namedtuple
+from collections import deque, namedtuple
 import contextlib
+import functools
 import logging
+import time
 import traceback
 from tornado import concurrent, gen, ioloop
 
+from aiida.engine.daemon import telemetry
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -28,6 +32,154 @@ class TransportRequest(object):
         super(TransportRequest, self).__init__()
         self.future = concurrent.Future()
         self.count = 0
+        self.open_callback_handle = None
+
+
+class CircuitBreaker(object):  # pylint: disable=useless-object-inheritance
+    """
+    Health model of the connection to the computer of an authinfo, shared by all tasks that request its transport.
+
+    The breaker starts out `CLOSED`, in which case transport requests are served as usual. When opening the transport
+    fails `FAILURE_THRESHOLD` times in a row, the breaker trips and goes `OPEN`: new requests are parked without
+    opening any connection. After the reset interval, the breaker goes `HALF_OPEN` and opens a single probe connection.
+    If the probe fails, the breaker opens again and the reset interval is doubled, up to `MAXIMUM_RESET_INTERVAL`. If
+    the probe succeeds, the breaker closes and the parked requests are released in batches of `RELEASE_BATCH_SIZE`
+    every `RELEASE_INTERVAL` seconds, such that the waiting tasks do not all hit the computer at the same time.
+
+    Each time the breaker trips, the `transport.circuit.opened` counter is incremented and once it closes again, the
+    duration of the open period is recorded in the `transport.circuit.open` histogram of the telemetry registry.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    FAILURE_THRESHOLD = 2
+    RESET_INTERVAL = 30.
+    MAXIMUM_RESET_INTERVAL = 600.
+    RELEASE_BATCH_SIZE = 50
+    RELEASE_INTERVAL = 1.
+
+    def __init__(self, loop, probe, name=None):
+        """
+        :param loop: the event loop on which to schedule the probes and the release of parked requests
+        :type loop: :class:`tornado.ioloop.IOLoop`
+        :param probe: a callable that opens and closes a connection, raising an exception if it fails to do so
+        :param name: the name with which to refer to the breaker in log messages
+        """
+        self._loop = loop
+        self._probe = probe
+        self._name = name
+        self._state = self.CLOSED
+        self._failures = 0
+        self._reset_interval = self.RESET_INTERVAL
+        self._opened = None
+        self._parked = deque()
+        self._callback_handle = None
+
+    @property
+    def state(self):
+        """Return the current state of the breaker, one of `CLOSED`, `OPEN` or `HALF_OPEN`."""
+        return self._state
+
+    @property
+    def parked_count(self):
+        """Return the number of requests that are currently parked."""
+        return len(self._parked)
+
+    def wait(self):
+        """
+        Return a future that resolves once a transport may be requested.
+
+        The future is already resolved if the breaker is closed and no requests are parked. Otherwise the request is
+        parked behind the requests that are already waiting.
+
+        :return: a :class:`tornado.concurrent.Future`
+        """
+        future = concurrent.Future()
+
+        if self._state == self.CLOSED and not self._parked:
+            future.set_result(True)
+        else:
+            self._parked.append(future)
+            telemetry.REGISTRY.increment('transport.circuit.parked')
+
+        return future
+
+    def discard(self, future):
+        """
+        Remove a parked request, for example because the task that made it was cancelled.
+
+        :param future: the future returned by `wait`
+        """
+        try:
+            self._parked.remove(future)
+        except ValueError:
+            pass
+
+    def record_success(self):
+        """Record that a connection was opened successfully, which closes the breaker if it was not already."""
+        self._failures = 0
+
+        if self._state != self.CLOSED:
+            duration = time.time() - self._opened
+            _LOGGER.warning('connection for %s restored after %d seconds, releasing %d parked transport requests',
+                            self._name, duration, len(self._parked))
+            telemetry.REGISTRY.observe('transport.circuit.open', duration)
+            self._state = self.CLOSED
+            self._opened = None
+            self._reset_interval = self.RESET_INTERVAL
+            self._release()
+
+    def record_failure(self):
+        """Record that a connection failed to open, which trips the breaker if the failure threshold is reached."""
+        self._failures += 1
+
+        if self._state == self.HALF_OPEN:
+            self._reset_interval = min(2 * self._reset_interval, self.MAXIMUM_RESET_INTERVAL)
+            self._open()
+        elif self._state == self.CLOSED and self._failures >= self.FAILURE_THRESHOLD:
+            telemetry.REGISTRY.increment('transport.circuit.opened')
+            self._opened = time.time()
+            self._open()
+
+    def _open(self):
+        """Open the breaker and schedule the next probe."""
+        _LOGGER.warning('connection for %s failed %d times in a row, parking transport requests for %d seconds',
+                        self._name, self._failures, self._reset_interval)
+        self._state = self.OPEN
+
+        if self._callback_handle is not None:
+            self._loop.remove_timeout(self._callback_handle)
+
+        self._callback_handle = self._loop.call_later(self._reset_interval, self._do_probe)
+
+    def _do_probe(self):
+        """Open a single probe connection to determine whether the breaker can be closed."""
+        self._callback_handle = None
+        self._state = self.HALF_OPEN
+        telemetry.REGISTRY.increment('transport.circuit.probes')
+
+        try:
+            self._probe()
+        except Exception as exception:  # pylint: disable=broad-except
+            _LOGGER.warning('probe connection for %s failed: %s', self._name, exception)
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def _release(self):
+        """Release the next batch of parked requests and schedule the release of the following batch if necessary."""
+        self._callback_handle = None
+
+        if self._state != self.CLOSED:
+            return
+
+        for _ in range(min(self.RELEASE_BATCH_SIZE, len(self._parked))):
+            self._parked.popleft().set_result(True)
+
+        if self._parked:
+            self._callback_handle = self._loop.call_later(self.RELEASE_INTERVAL, self._release)
 
 
 class TransportQueue(object):  # pylint: disable=useless-object-inheritance
@@ -40,6 +192,9 @@ class TransportQueue(object):  # pylint: disable=useless-object-inheritance
     it will open the transport and give it to all the clients that asked for it
     up to that point.  This way opening of transports (a costly operation) can
     be minimised.
+
+    The health of the connection of each authinfo is tracked by a `CircuitBreaker`, such that when a computer becomes
+    unreachable, the requests for its transport are parked instead of each of them trying to open a connection.
     """
     AuthInfoEntry = namedtuple('AuthInfoEntry', ['authinfo', 'transport', 'callbacks', 'callback_handle'])
 
@@ -50,11 +205,39 @@ class TransportQueue(object):  # pylint: disable=useless-object-inheritance
         """
         self._loop = loop if loop is not None else ioloop.IOLoop.current()
         self._transport_requests = {}
+        self._circuit_breakers = {}
 
     def loop(self):
         """ Get the loop being used by this transport queue """
         return self._loop
 
+    def get_transport_count(self):
+        """Return the number of transports that are currently requested, i.e. that are either open or being opened.
+
+        :return: the number of requested transports
+        """
+        return len(self._transport_requests)
+
+    def get_circuit_breaker(self, authinfo):
+        """Return the circuit breaker that tracks the health of the connection of the given authinfo.
+
+        :param authinfo: the authinfo
+        :return: the :class:`CircuitBreaker`
+        """
+        try:
+            return self._circuit_breakers[authinfo.id]
+        except KeyError:
+            breaker = CircuitBreaker(self._loop, functools.partial(self._probe, authinfo), name=str(authinfo))
+            self._circuit_breakers[authinfo.id] = breaker
+            return breaker
+
+    @staticmethod
+    def _probe(authinfo):
+        """Open and close a new transport of the given authinfo."""
+        transport = authinfo.get_transport()
+        transport.open()
+        transport.close()
+
     @contextlib.contextmanager
     def request_transport(self, authinfo):
         """
@@ -68,10 +251,54 @@ class TransportQueue(object):  # pylint: disable=useless-object-inheritance
                     transport = yield request
                     # Do some work with the transport
 
+        If the circuit breaker of the authinfo is not closed, the request is parked until the breaker releases it.
+
         :param authinfo: The authinfo to be used to get transport
         :return: A future that can be yielded to give the transport
         """
-        open_callback_handle = None
+        breaker = self.get_circuit_breaker(authinfo)
+        released = breaker.wait()
+        joined = []
+
+        if released.done():
+            joined.append(self._join_request(authinfo, breaker))
+            future = joined[0].future
+        else:
+            _LOGGER.debug('Transport request for %s parked, the circuit is %s', authinfo, breaker.state)
+            future = concurrent.Future()
+
+            def on_released(_):
+                joined.append(self._join_request(authinfo, breaker))
+                concurrent.chain_future(joined[0].future, future)
+
+            released.add_done_callback(on_released)
+
+        if telemetry.REGISTRY.enabled and not future.done():
+            requested = time.time()
+            future.add_done_callback(lambda _: telemetry.REGISTRY.observe('transport.wait', time.time() - requested))
+
+        try:
+            yield future
+        except gen.Return:
+            # Have to have this special case so tornado returns are propagated up to the loop
+            raise
+        except Exception:
+            _LOGGER.error("Exception whilst using transport:\n%s", traceback.format_exc())
+            raise
+        finally:
+            if joined:
+                self._leave_request(authinfo, joined[0])
+            else:
+                breaker.discard(released)
+
+    def _join_request(self, authinfo, breaker):
+        """
+        Join the pending request for the transport of the authinfo, creating it if there is none.
+
+        :param authinfo: the authinfo
+        :param breaker: the circuit breaker of the authinfo, to which the outcome of opening the transport is reported
+        :return: the :class:`TransportRequest`
+        """
         transport_request = self._transport_requests.get(authinfo.id, None)
 
         if transport_request is None:
@@ -91,34 +318,44 @@ class TransportQueue(object):  # pylint: disable=useless-object-inheritance
                         transport.open()
                     except Exception as exception:  # pylint: disable=broad-except
                         _LOGGER.error('exception occurred while trying to open transport:\n %s', exception)
+                        breaker.record_failure()
                         transport_request.future.set_exception(exception)
 
                         # Cleanup of the stale TransportRequest with the excepted transport future
-                        self._transport_requests.pop(authinfo.id, None)
+                        self._discard_request(authinfo, transport_request)
                     else:
+                        breaker.record_success()
                         transport_request.future.set_result(transport)
 
             # Save the handle so that we can cancel the callback if the user no longer wants it
-            open_callback_handle = self._loop.call_later(safe_open_interval, do_open)
+            transport_request.open_callback_handle = self._loop.call_later(safe_open_interval, do_open)
 
-        try:
-            transport_request.count += 1
-            yield transport_request.future
-        except gen.Return:
-            # Have to have this special case so tornado returns are propagated up to the loop
-            raise
-        except Exception:
-            _LOGGER.error("Exception whilst using transport:\n%s", traceback.format_exc())
-            raise
-        finally:
-            transport_request.count -= 1
-            assert transport_request.count >= 0, "Transport request count dropped below 0!"
-            # Check if there are no longer any users that want the transport
-            if transport_request.count == 0:
-                if transport_request.future.done():
+        transport_request.count += 1
+
+        return transport_request
+
+    def _leave_request(self, authinfo, transport_request):
+        """
+        Leave a request for the transport of the authinfo, closing the transport if nobody else needs it anymore.
+
+        :param authinfo: the authinfo
+        :param transport_request: the :class:`TransportRequest` returned by `_join_request`
+        """
+        transport_request.count -= 1
+        assert transport_request.count >= 0, "Transport request count dropped below 0!"
+
+        # Check if there are no longer any users that want the transport
+        if transport_request.count == 0:
+            if transport_request.future.done():
+                if transport_request.future.exception() is None:
                     _LOGGER.debug('Transport request closing transport for %s', authinfo)
                     transport_request.future.result().close()
-                elif open_callback_handle is not None:
-                    self._loop.remove_timeout(open_callback_handle)
+            else:
+                self._loop.remove_timeout(transport_request.open_callback_handle)
+
+            self._discard_request(authinfo, transport_request)
 
-                self._transport_requests.pop(authinfo.id, None)
+    def _discard_request(self, authinfo, transport_request):
+        """Remove the request for the transport of the authinfo, unless it was already replaced by a new request."""
+        if self._transport_requests.get(authinfo.id, None) is transport_request:
+            self._transport_requests.pop(authinfo.id)
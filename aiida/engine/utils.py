@@ -26,6 +26,15 @@ LOGGER = logging.getLogger(__name__)
 PROCESS_STATE_CHANGE_KEY = 'process|state_change|{}'
 PROCESS_STATE_CHANGE_DESCRIPTION = 'The last time a process of type {}, changed state'
 
+# Minimum interval in seconds between two updates of the process state change setting by the same interpreter
+PROCESS_STATE_CHANGE_INTERVAL = 5.
+
+# Mapping: {process_type: time.time() of the last update of the setting by this interpreter}
+_PROCESS_STATE_CHANGE_LAST_UPDATED = {}
+
+# Maximum number of continue tasks that are being published concurrently when submitting processes in bulk
+CONTINUE_TASKS_MAX_CONCURRENT = 32
+
 
 def instantiate_process(runner, process, *args, **inputs):
     """
@@ -63,6 +72,112 @@ def instantiate_process(runner, process, *args, **inputs):
     return process
 
 
+def instantiate_processes(runner, process, inputs_list, persister=None):
+    """
+    Return instances of the process for each of the given sets of inputs, created in a single database transaction
+
+    This is used to submit processes in bulk: the processes and their database records are all created before any of
+    them is sent to the daemon. If a persister is passed, a checkpoint of each process is saved in the same
+    transaction, after which the process is closed. Since the transaction is committed before this function returns,
+    the continue tasks of the processes can be sent right after it. All sets of inputs are validated before the first
+    process is instantiated, such that nothing is stored if any of them is invalid.
+
+    :param runner: the runner of the processes
+    :param process: Process class or ProcessBuilder instance, in the latter case the inputs are added to its inputs
+    :param inputs_list: list of dictionaries with the inputs of each process
+    :param persister: optional persister with which to save a checkpoint of each process
+    :return: list of process instances
+    :raises ValueError: if any of the sets of inputs is invalid
+    :raises aiida.common.InvalidOperation: if any of the processes is a dry run or does not store provenance
+    """
+    from aiida.manage.manager import get_manager
+
+    for inputs in inputs_list:
+        _validate_submission_inputs(process, inputs)
+
+    processes = []
+
+    with get_manager().get_backend().transaction():
+        for inputs in inputs_list:
+            instance = instantiate_process(runner, process, **inputs)
+
+            if persister is not None:
+                persister.save_checkpoint(instance)
+                instance.close()
+
+            processes.append(instance)
+
+    return processes
+
+
+def _validate_submission_inputs(process, inputs):
+    """
+    Validate the inputs with which a process is to be submitted, without instantiating the process
+
+    :param process: Process class or ProcessBuilder instance, in the latter case the inputs are added to its inputs
+    :param inputs: the inputs for the process
+    :raises ValueError: if the process is not a Process class or ProcessBuilder or if the inputs are invalid
+    :raises aiida.common.InvalidOperation: if the process would be a dry run or would not store provenance
+    """
+    from aiida.common import InvalidOperation
+    from .processes import Process, ProcessBuilder
+
+    inputs = dict(inputs)
+
+    if isinstance(process, ProcessBuilder):
+        process_class = process.process_class
+        inputs.update(**process)
+    elif isinstance(process, type) and issubclass(process, Process):
+        process_class = process
+    else:
+        raise ValueError('invalid process {}, needs to be Process or ProcessBuilder'.format(type(process)))
+
+    # This mirrors how the inputs are serialized by the constructor of the process and validated when it is created
+    port_namespace = process_class.spec().inputs
+    parsed_inputs = port_namespace.pre_process(port_namespace.serialize(inputs))
+    validation_error = port_namespace.validate(parsed_inputs)
+
+    if validation_error is not None:
+        raise ValueError(validation_error)
+
+    metadata = parsed_inputs.get('metadata', {})
+
+    if not metadata.get('store_provenance', True):
+        raise InvalidOperation('cannot submit a process with `store_provenance=False`')
+
+    if metadata.get('dry_run', False):
+        raise InvalidOperation('cannot submit processes in bulk with `dry_run=True`')
+
+
+def send_continue_tasks(controller, pids):
+    """
+    Send the continue tasks for the given processes, waiting for the broker to confirm all of them
+
+    The thread communicator of the controller blocks until the broker confirms each task, so sending them one by one
+    costs a round trip per task. Instead, they are sent from a pool of threads, such that the tasks are published
+    concurrently by the event loop of the communicator and their confirmations are awaited together.
+
+    :param controller: the process controller
+    :type controller: :class:`plumpy.RemoteProcessThreadController`
+    :param pids: list of the pids of the processes to continue
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from aiida.engine.daemon import telemetry
+
+    if not pids:
+        return
+
+    def continue_process(pid):
+        # Do not wait for the reply of the worker, only for the broker to confirm that it received the task
+        controller.continue_process(pid, nowait=False, no_reply=True)
+
+    with ThreadPoolExecutor(max_workers=min(len(pids), CONTINUE_TASKS_MAX_CONCURRENT)) as executor:
+        # Consume the results such that an exception raised by any of the calls is re-raised
+        list(executor.map(continue_process, pids))
+
+    telemetry.REGISTRY.increment('rmq.tasks.sent', len(pids))
+
+
 class InterruptableFuture(concurrent.Future):
     """A future that can be interrupted by calling `interrupt`."""
 
@@ -240,8 +355,13 @@ def set_process_state_change_timestamp(process):
     of the given process, to the current timestamp. The process type will be determined based on
     the class of the calculation node it has as its database container.
 
+    The setting is a single row in the database that is updated by all the daemon workers, so to limit the contention
+    each interpreter updates it at most once every `PROCESS_STATE_CHANGE_INTERVAL` seconds. The stored timestamp can
+    therefore lag behind the actual last state change by at most that interval.
+
     :param process: the Process instance that changed its state
     """
+    import time
     from aiida.backends.utils import get_settings_manager
     from aiida.common import timezone
     from aiida.common.exceptions import UniquenessError
@@ -257,6 +377,14 @@ def set_process_state_change_timestamp(process):
     else:
         raise ValueError('unsupported calculation node type {}'.format(type(process.node)))
 
+    now = time.time()
+    last_updated = _PROCESS_STATE_CHANGE_LAST_UPDATED.get(process_type, None)
+
+    if last_updated is not None and now - last_updated < PROCESS_STATE_CHANGE_INTERVAL:
+        return
+
+    _PROCESS_STATE_CHANGE_LAST_UPDATED[process_type] = now
+
     key = PROCESS_STATE_CHANGE_KEY.format(process_type)
     description = PROCESS_STATE_CHANGE_DESCRIPTION.format(process_type)
     value = timezone.datetime_to_isoformat(timezone.now())
@@ -19,6 +19,7 @@ __all__ = ('get_option', 'get_option_names', 'parse_option')
 
 NO_DEFAULT = ()
 DEFAULT_DAEMON_TIMEOUT = 20  # Default timeout in seconds for circus client calls
+DEFAULT_DAEMON_WORKER_PROCESS_SLOTS = 100  # Default number of processes a single daemon worker can run concurrently
 VALID_LOG_LEVELS = ['CRITICAL', 'ERROR', 'WARNING', 'REPORT', 'INFO', 'DEBUG']
 
 Option = collections.namedtuple('Option',
@@ -94,6 +95,30 @@ CONFIG_OPTIONS = {
         'description': 'The polling interval in seconds to be used by process runners',
         'global_only': False,
     },
+    'runner.parse.executor': {
+        'key': 'runner_parse_executor',
+        'valid_type': 'string',
+        'valid_values': ['inline', 'process'],
+        'default': 'inline',
+        'description': 'Whether the parser of a calculation job runs inline in the runner or in a separate process',
+        'global_only': False,
+    },
+    'runner.parse.max_concurrent': {
+        'key': 'runner_parse_max_concurrent',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 4,
+        'description': 'The maximum number of parsers that a runner runs concurrently with the `process` executor',
+        'global_only': False,
+    },
+    'runner.function.max_concurrent': {
+        'key': 'runner_function_max_concurrent',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 4,
+        'description': 'The maximum number of calcfunctions with the `process` executor that a runner runs concurrently',
+        'global_only': False,
+    },
     'daemon.timeout': {
         'key': 'daemon_timeout',
         'valid_type': 'int',
@@ -102,6 +127,38 @@ CONFIG_OPTIONS = {
         'description': 'The timeout in seconds for calls to the circus client',
         'global_only': False,
     },
+    'daemon.worker_process_slots': {
+        'key': 'daemon_worker_process_slots',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': DEFAULT_DAEMON_WORKER_PROCESS_SLOTS,
+        'description': 'The maximum number of concurrent process tasks that each daemon worker can handle',
+        'global_only': False,
+    },
+    'daemon.autoscale': {
+        'key': 'daemon_autoscale',
+        'valid_type': 'bool',
+        'valid_values': None,
+        'default': False,
+        'description': 'Whether the daemon adapts the number of workers to their load between the configured bounds',
+        'global_only': False,
+    },
+    'daemon.autoscale.min_workers': {
+        'key': 'daemon_autoscale_min_workers',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 1,
+        'description': 'The minimum number of daemon workers that is maintained when autoscaling is enabled',
+        'global_only': False,
+    },
+    'daemon.autoscale.max_workers': {
+        'key': 'daemon_autoscale_max_workers',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 4,
+        'description': 'The maximum number of daemon workers that is started when autoscaling is enabled',
+        'global_only': False,
+    },
     'verdi.shell.auto_import': {
         'key': 'verdi_shell_auto_import',
         'valid_type': 'string',
@@ -12,11 +12,18 @@ from __future__ import division
 from __future__ import absolute_import
 from __future__ import print_function
 
-from six.moves import zip
+import collections
 
 import click
 
 from aiida.cmdline.utils import echo
+from aiida.common.utils import grouper
+
+# Maximum number of pks that are passed in a single `IN` clause by the queries of the deletion
+QUERY_CHUNK_SIZE = 10000
+
+# Number of threads used to remove the repository folders of the deleted nodes
+REPOSITORY_ERASE_THREADS = 8
 
 
 def delete_nodes(pks,
@@ -31,6 +38,12 @@ def delete_nodes(pks,
 
     :note: The script will also delete all children calculations generated from the specified nodes.
 
+    :note: The nodes are deleted in chunks that are each committed in their own transaction, after which the
+        repository folders of the nodes of the chunk are erased. The nodes are ordered such that every node is deleted
+        before the nodes from which it can be reached, with the given nodes last. An interrupted deletion therefore
+        leaves a partially deleted provenance graph in which all the remaining nodes can still be reached from the
+        given nodes, such that running the same deletion again completes it.
+
     :param pks: a list of the PKs of the nodes to delete
     :param bool follow_calls: Follow calls
     :param bool follow_returns:
@@ -43,35 +56,27 @@ def delete_nodes(pks,
         If checks are disabled, also logging is disabled.
     :param bool force: Do not ask for confirmation to delete nodes.
     :param int verbosity:
-        The verbosity levels, 0 prints nothing, 1 prints just sums and total, 2 prints individual nodes.
+        The verbosity levels, 0 prints nothing, 1 prints sums, totals and the number of nodes per type,
+        2 prints individual nodes.
     """
     # pylint: disable=too-many-arguments,too-many-branches,too-many-locals,too-many-statements
-    from aiida.backends.utils import delete_nodes_and_connections
-    from aiida.common import exceptions
+    from aiida.backends.utils import DELETE_NODES_CHUNK_SIZE, delete_nodes_and_connections
     from aiida.common.links import LinkType
-    from aiida.orm import User, Node, ProcessNode, Data, QueryBuilder, load_node
+    from aiida.orm import User, load_node
 
     user_email = User.objects.get_default().email
 
-    starting_pks = []
+    existing_pks = get_existing_pks(pks)
     for pk in pks:
-        try:
-            load_node(pk)
-        except exceptions.NotExistent:
+        if pk not in existing_pks:
             echo.echo_warning('warning: node with pk<{}> does not exist, skipping'.format(pk))
-        else:
-            starting_pks.append(pk)
 
-    if not starting_pks:
+    if not existing_pks:
         # I prefer checking explicitly, an empty set might be problematic for the queries done below.
         if verbosity:
             echo.echo("Nothing to delete")
         return
 
-    # The following code is just for the querying of downwards provenance.
-    # Ideally, there should be a module to interface with, but this is the solution for now.
-    # By only dealing with ids, and keeping track of what has been already
-    # visited in the query, there's good performance and no infinite loops.
     link_types_to_follow = [LinkType.CREATE.value, LinkType.INPUT_CALC.value, LinkType.INPUT_WORK.value]
     if follow_calls:
         link_types_to_follow.append(LinkType.CALL_CALC.value)
@@ -79,35 +84,26 @@ def delete_nodes(pks,
     if follow_returns:
         link_types_to_follow.append(LinkType.RETURN.value)
 
-    edge_filters = {'type': {'in': link_types_to_follow}}
-
-    # Operational set always includes the recently (in the last iteration added) nodes.
-    operational_set = set().union(set(starting_pks))  # Union to copy the set!
-    pks_set_to_delete = set().union(set(starting_pks))
-    while operational_set:
-        # new_pks_set are the the pks of all nodes that are connected to the operational node set
-        # with the links specified.
-        new_pks_set = set(i for i, in QueryBuilder().append(Node, filters={
-            'id': {
-                'in': operational_set
-            }
-        }).append(Node, project='id', edge_filters=edge_filters).iterall())
-        # The operational set is only those pks that haven't been yet put into the pks_set_to_delete.
-        operational_set = new_pks_set.difference(pks_set_to_delete)
-
-        # I add these pks in the pks_set_to_delete with a union
-        pks_set_to_delete = pks_set_to_delete.union(new_pks_set)
+    pks_set_to_delete, links = get_outgoing_closure(existing_pks, link_types_to_follow, return_links=True)
+
+    # Get the uuids, needed to erase the repository folders later, and the types of all the nodes in a single pass
+    uuids = {}
+    type_counter = collections.Counter()
+    nodes_listing = []
+    for uuid, pk, type_string, label in _iter_projections(pks_set_to_delete, ('uuid', 'id', 'node_type', 'label')):
+        uuids[pk] = uuid
+        type_counter[type_string] += 1
+        if verbosity > 1:
+            nodes_listing.append((uuid, pk, type_string, label))
 
     if verbosity > 0:
         echo.echo("I {} delete {} node{}".format('would' if dry_run else 'will', len(pks_set_to_delete),
                                                  's' if len(pks_set_to_delete) > 1 else ''))
+        for type_string, count in sorted(type_counter.items()):
+            echo.echo("   {:>8} {}".format(count, type_string))
         if verbosity > 1:
-            builder = QueryBuilder().append(
-                Node, filters={'id': {
-                    'in': pks_set_to_delete
-                }}, project=('uuid', 'id', 'node_type', 'label'))
             echo.echo("The nodes I {} delete:".format('would' if dry_run else 'will'))
-            for uuid, pk, type_string, label in builder.iterall():
+            for uuid, pk, type_string, label in nodes_listing:
                 try:
                     short_type_string = type_string.split('.')[-2]
                 except IndexError:
@@ -119,23 +115,11 @@ def delete_nodes(pks,
     # A calculation instance that was called, without also deleting the caller.
 
     if not disable_checks:
-        link_types_to_follow = [LinkType.CALL_CALC.value, LinkType.CALL_WORK.value]
-        called_qb = QueryBuilder()
-        called_qb.append(ProcessNode, filters={'id': {'!in': pks_set_to_delete}}, project='id')
-        called_qb.append(
-            ProcessNode,
-            project='node_type',
-            edge_project='label',
-            filters={'id': {
-                'in': pks_set_to_delete
-            }},
-            edge_filters={'type': {
-                'in': link_types_to_follow
-            }})
-        caller_to_called2delete = called_qb.all()
+        caller_to_called2delete = _get_incoming_links_from_outside(
+            pks_set_to_delete, [LinkType.CALL_CALC.value, LinkType.CALL_WORK.value])
 
         if verbosity > 0 and caller_to_called2delete:
-            calculation_pks_losing_called = set(next(zip(*caller_to_called2delete)))
+            calculation_pks_losing_called = set(caller_pk for caller_pk, _, _ in caller_to_called2delete)
             echo.echo("\n{} calculation{} {} lose at least one called instance".format(
                 len(calculation_pks_losing_called), 's' if len(calculation_pks_losing_called) > 1 else '',
                 'would' if dry_run else 'will'))
@@ -145,22 +129,10 @@ def delete_nodes(pks,
                 for calc_losing_called_pk in calculation_pks_losing_called:
                     echo.echo('  ', load_node(calc_losing_called_pk))
 
-        created_qb = QueryBuilder()
-        created_qb.append(ProcessNode, filters={'id': {'!in': pks_set_to_delete}}, project='id')
-        created_qb.append(
-            Data,
-            project='node_type',
-            edge_project='label',
-            filters={'id': {
-                'in': pks_set_to_delete
-            }},
-            edge_filters={'type': {
-                '==': LinkType.CREATE.value
-            }})
+        creator_to_created2delete = _get_incoming_links_from_outside(pks_set_to_delete, [LinkType.CREATE.value])
 
-        creator_to_created2delete = created_qb.all()
         if verbosity > 0 and creator_to_created2delete:
-            calculation_pks_losing_created = set(next(zip(*creator_to_created2delete)))
+            calculation_pks_losing_created = set(creator_pk for creator_pk, _, _ in creator_to_created2delete)
             echo.echo("\n{} calculation{} {} lose at least one created data-instance".format(
                 len(calculation_pks_losing_created), 's' if len(calculation_pks_losing_created) > 1 else '',
                 'would' if dry_run else 'will'))
@@ -184,11 +156,11 @@ def delete_nodes(pks,
             echo.echo("Exiting without deleting")
             return
 
-    # Recover the list of folders to delete before actually deleting the nodes. I will delete the folders only later,
-    # so that if there is a problem during the deletion of the nodes in the DB, I don't delete the folders
-    repositories = [load_node(pk)._repository for pk in pks_set_to_delete]  # pylint: disable=protected-access
-
-    delete_nodes_and_connections(pks_set_to_delete)
+    # The repository folders of the nodes of a chunk are only erased once the chunk has been committed, such that they
+    # are kept if there is a problem during the deletion of the nodes in the DB
+    for chunk in grouper(DELETE_NODES_CHUNK_SIZE, get_deletion_order(existing_pks, pks_set_to_delete, links)):
+        delete_nodes_and_connections(chunk)
+        erase_repository_folders([uuids[pk] for pk in chunk])
 
     if not disable_checks:
         # I pass now to the log the information for calculations losing created data or called instances
@@ -206,7 +178,164 @@ def delete_nodes(pks,
                                 "created with the label {} "
                                 "by this calculation".format(user_email, data_type_string, link_label))
 
-    # If we are here, we managed to delete the entries from the DB.
-    # I can now delete the folders
-    for repository in repositories:
-        repository.erase(force=True)
+
+def get_existing_pks(pks):
+    """Return the subset of the given pks that correspond to existing nodes, using a single query per chunk of pks.
+
+    :param pks: an iterable of node pks
+    :return: set of the pks of the existing nodes
+    """
+    return set(pk for pk, in _iter_projections(set(pks), ('id',)))
+
+
+def get_outgoing_closure(pks, link_types, return_links=False):
+    """Return the pks of the given nodes and all the nodes reachable from them by following outgoing links.
+
+    The graph is traversed by breadth-first expansion of the frontier, i.e. the nodes discovered in the previous
+    iteration. Each iteration queries the outgoing neighbours of the frontier in chunks, so that the `IN` clauses of
+    the queries stay bounded, independent of the total number of nodes in the closure.
+
+    :param pks: an iterable of node pks from which to start the traversal
+    :param link_types: list of link type values of the links to follow
+    :param return_links: if True, also return the links that were followed
+    :return: set of node pks or, if `return_links` is True, tuple of the set of node pks and the set of followed links
+        as tuples of the pks of their source and target
+    """
+    from aiida.orm import Node, QueryBuilder
+
+    edge_filters = {'type': {'in': link_types}}
+
+    closure = set(pks)
+    frontier = set(closure)
+    links = set()
+
+    while frontier:
+        discovered = set()
+        for chunk in grouper(QUERY_CHUNK_SIZE, frontier):
+            builder = QueryBuilder().append(Node, filters={'id': {'in': chunk}}, project='id', tag='source')
+            builder.append(Node, with_incoming='source', project='id', edge_filters=edge_filters)
+            for source, target in builder.iterall():
+                discovered.add(target)
+                links.add((source, target))
+
+        # Only the nodes that have not yet been visited need to be expanded in the next iteration
+        frontier = discovered.difference(closure)
+        closure.update(frontier)
+
+    if return_links:
+        return closure, links
+
+    return closure
+
+
+def get_deletion_order(pks, closure, links):
+    """Return the pks of the closure of the given nodes in the order in which they should be deleted.
+
+    Every node comes before the nodes from which it can be reached through the links, i.e. the nodes are ordered by
+    decreasing length of the longest path that leads to them, and the given nodes come last. When the deletion is
+    interrupted after any number of nodes, every remaining node can therefore still be reached from the remaining
+    given nodes, such that the same closure is found when the deletion is run again.
+
+    :param pks: the pks of the nodes from which the closure was computed
+    :param closure: the set of pks of the closure, as returned by `get_outgoing_closure`
+    :param links: the set of links followed to compute the closure, as tuples of the pks of their source and target
+    :return: list of node pks
+    """
+    targets = collections.defaultdict(list)
+    in_degree = collections.Counter()
+
+    for source, target in links:
+        targets[source].append(target)
+        in_degree[target] += 1
+
+    depth = dict.fromkeys(closure, 0)
+    queue = collections.deque(pk for pk in closure if not in_degree[pk])
+
+    # Kahn's algorithm visits the nodes in topological order, in which the depth of each node is final once visited
+    while queue:
+        source = queue.popleft()
+        for target in targets[source]:
+            depth[target] = max(depth[target], depth[source] + 1)
+            in_degree[target] -= 1
+            if not in_degree[target]:
+                queue.append(target)
+
+    # Links form a directed acyclic graph, but should there be a cycle, its nodes are deleted before all others
+    unvisited_depth = len(closure)
+    for pk, count in in_degree.items():
+        if count:
+            depth[pk] = unvisited_depth
+
+    pks = set(pks)
+
+    return sorted(closure, key=lambda pk: (pk in pks, -depth[pk], pk))
+
+
+def erase_repository_folders(uuids, threads=REPOSITORY_ERASE_THREADS):
+    """Remove the repository folders of the nodes with the given uuids, using a pool of threads.
+
+    Removing the folders is dominated by file system operations, so they can be run in parallel. Folders that do not
+    exist are silently skipped.
+
+    :param uuids: an iterable of node uuids
+    :param threads: the number of threads to use
+    """
+    from multiprocessing.pool import ThreadPool
+    from aiida.common.folders import RepositoryFolder
+    from aiida.orm.utils.repository import Repository
+
+    def erase(uuid):
+        # pylint: disable=protected-access
+        RepositoryFolder(section=Repository._section_name, uuid=uuid).erase()
+
+    pool = ThreadPool(threads)
+    try:
+        # Consume the iterator to propagate any exception that occurred in the threads
+        for _ in pool.imap_unordered(erase, uuids, chunksize=100):
+            pass
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _iter_projections(pks, projections):
+    """Yield the given projections of the nodes with the given pks, querying in chunks of `QUERY_CHUNK_SIZE` pks.
+
+    :param pks: a collection of node pks
+    :param projections: a tuple of node properties to project
+    """
+    from aiida.orm import Node, QueryBuilder
+
+    for chunk in grouper(QUERY_CHUNK_SIZE, pks):
+        builder = QueryBuilder().append(Node, filters={'id': {'in': chunk}}, project=projections)
+        for row in builder.iterall():
+            yield row
+
+
+def _get_incoming_links_from_outside(pks, link_types):
+    """Return the links of the given types pointing to the given nodes from process nodes not in the set.
+
+    :param pks: a set of node pks
+    :param link_types: list of link type values
+    :return: list of tuples with the pk of the source node, the type string of the target node and the link label
+    """
+    from aiida.orm import Node, ProcessNode, QueryBuilder
+
+    links = []
+
+    for chunk in grouper(QUERY_CHUNK_SIZE, pks):
+        builder = QueryBuilder().append(ProcessNode, project='id', tag='source')
+        builder.append(
+            Node,
+            with_incoming='source',
+            filters={'id': {
+                'in': chunk
+            }},
+            project='node_type',
+            edge_project='label',
+            edge_filters={'type': {
+                'in': link_types
+            }})
+        links.extend(link for link in builder.iterall() if link[0] not in pks)
+
+    return links
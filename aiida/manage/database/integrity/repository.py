@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Functions to detect and remove node repository folders that are not referenced by the database and vice versa.
+
+The node repository is sharded on the first two pairs of characters of the node UUID, i.e. the folder of the node with
+UUID `0a1b2c3d-...` lives in `repository/node/0a/1b/2c3d-...`. Listing each shard and sorting its entries therefore
+yields the UUIDs of all the folders in lexicographical order, which coincides with the order of the `uuid` column in
+the database. Both streams are compared with a single merge pass, such that neither of them ever has to be held in
+memory in its entirety, which keeps the memory footprint constant independent of the size of the repository.
+
+Since a scan of a large repository takes a while, nodes can be stored while it runs. Their folder is moved into the
+repository with its original modification time before their database row is committed, such that the scan can report
+it as orphaned if the database stream already passed its uuid. The orphaned folders are therefore checked against the
+database once more right before they are removed.
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import collections
+import os
+import re
+import time
+
+from aiida.common.utils import get_repository_folder
+
+__all__ = ('scan_repository', 'remove_repository_folders', 'RepositoryScanResult')
+
+# Number of threads that list the shards of the repository in parallel
+SCAN_THREADS = 8
+
+# Number of uuids that are fetched from the database at a time
+DATABASE_BATCH_SIZE = 10000
+
+# Folders that were modified less than this many seconds ago are never considered orphaned, because a node that is
+# being stored has its repository folder moved in place before its database row is committed
+MIN_AGE_ORPHANED = 3600
+
+REGEX_SHARD = re.compile(r'^[0-9a-f]{2}$')
+REGEX_UUID_REMAINDER = re.compile(r'^[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$')
+
+
+class RepositoryScanResult(collections.namedtuple('RepositoryScanResult', 'scanned orphaned missing recent')):
+    """Result of a repository scan.
+
+    :param scanned: the number of folders that were found in the repository
+    :param orphaned: list of the uuids of the folders that do not correspond to any node in the database
+    :param missing: list of the uuids of the nodes in the database that do not have a repository folder
+    :param recent: the number of unreferenced folders that were skipped because they are younger than the minimum age
+    """
+
+    __slots__ = ()
+
+
+def get_node_repository_path():
+    """Return the absolute path of the node section of the repository.
+
+    :return: absolute path
+    """
+    # pylint: disable=protected-access
+    from aiida.orm.utils.repository import Repository
+    return os.path.join(get_repository_folder('repository'), Repository._section_name)
+
+
+def _list_shard(shard_path):
+    """Return the sorted list of uuids of all the node folders within the given top level shard.
+
+    Entries whose name does not follow the sharding scheme are ignored.
+
+    :param shard_path: absolute path of a top level shard of the node repository
+    :return: sorted list of uuid strings
+    """
+    uuids = []
+    shard = os.path.basename(shard_path)
+
+    for subshard in os.listdir(shard_path):
+        if not REGEX_SHARD.match(subshard):
+            continue
+
+        subshard_path = os.path.join(shard_path, subshard)
+
+        if not os.path.isdir(subshard_path):
+            continue
+
+        for remainder in os.listdir(subshard_path):
+            if REGEX_UUID_REMAINDER.match(remainder):
+                uuids.append(shard + subshard + remainder)
+
+    uuids.sort()
+    return uuids
+
+
+def iter_repository_uuids(threads=SCAN_THREADS):
+    """Yield the uuids of all the folders in the node repository in lexicographical order.
+
+    The top level shards are listed in parallel by a pool of threads, but are yielded in order.
+
+    :param threads: the number of threads used to list the shards
+    :return: generator of uuid strings
+    """
+    from multiprocessing.pool import ThreadPool
+
+    base_path = get_node_repository_path()
+
+    if not os.path.isdir(base_path):
+        return
+
+    shards = sorted(
+        os.path.join(base_path, shard)
+        for shard in os.listdir(base_path)
+        if REGEX_SHARD.match(shard) and os.path.isdir(os.path.join(base_path, shard)))
+
+    pool = ThreadPool(threads)
+    try:
+        for uuids in pool.imap(_list_shard, shards):
+            for uuid in uuids:
+                yield uuid
+    finally:
+        pool.close()
+        pool.join()
+
+
+def iter_database_uuids(batch_size=DATABASE_BATCH_SIZE):
+    """Yield the uuids of all the nodes in the database in lexicographical order.
+
+    :param batch_size: the number of uuids fetched from the database at a time
+    :return: generator of uuid strings
+    """
+    from aiida.orm import Node, QueryBuilder
+
+    builder = QueryBuilder().append(Node, project='uuid').order_by({Node: {'uuid': 'asc'}})
+
+    for uuid, in builder.iterall(batch_size=batch_size):
+        yield str(uuid)
+
+
+def iter_differences(repository_uuids, database_uuids):
+    """Merge two sorted streams of uuids and yield the uuids that only appear in one of them.
+
+    :param repository_uuids: sorted iterable of the uuids of the repository folders
+    :param database_uuids: sorted iterable of the uuids of the nodes in the database
+    :return: generator of tuples `(uuid, in_repository)` where `in_repository` is True if the uuid only appears in the
+        repository and False if it only appears in the database
+    """
+    sentinel = object()
+    repository_uuids = iter(repository_uuids)
+    database_uuids = iter(database_uuids)
+
+    repository_uuid = next(repository_uuids, sentinel)
+    database_uuid = next(database_uuids, sentinel)
+
+    while repository_uuid is not sentinel or database_uuid is not sentinel:
+        if database_uuid is sentinel or (repository_uuid is not sentinel and repository_uuid < database_uuid):
+            yield repository_uuid, True
+            repository_uuid = next(repository_uuids, sentinel)
+        elif repository_uuid is sentinel or database_uuid < repository_uuid:
+            yield database_uuid, False
+            database_uuid = next(database_uuids, sentinel)
+        else:
+            repository_uuid = next(repository_uuids, sentinel)
+            database_uuid = next(database_uuids, sentinel)
+
+
+def scan_repository(min_age=MIN_AGE_ORPHANED, threads=SCAN_THREADS, batch_size=DATABASE_BATCH_SIZE):
+    """Compare the node repository with the database and return the orphaned and missing repository folders.
+
+    :param min_age: folders that were modified less than this many seconds ago are not reported as orphaned
+    :param threads: the number of threads used to list the repository shards
+    :param batch_size: the number of uuids fetched from the database at a time
+    :return: a `RepositoryScanResult`
+    """
+    from aiida.common.folders import RepositoryFolder
+    from aiida.orm.utils.repository import Repository
+
+    counter = collections.Counter()
+    orphaned = []
+    missing = []
+    threshold = time.time() - min_age
+
+    def count(uuids):
+        for uuid in uuids:
+            counter['scanned'] += 1
+            yield uuid
+
+    repository_uuids = count(iter_repository_uuids(threads))
+
+    for uuid, in_repository in iter_differences(repository_uuids, iter_database_uuids(batch_size)):
+        if not in_repository:
+            missing.append(uuid)
+            continue
+
+        # pylint: disable=protected-access
+        path = RepositoryFolder(section=Repository._section_name, uuid=uuid).abspath
+
+        try:
+            modified = os.path.getmtime(path)
+        except OSError:
+            # The folder disappeared in the meantime
+            continue
+
+        if modified > threshold:
+            counter['recent'] += 1
+        else:
+            orphaned.append(uuid)
+
+    return RepositoryScanResult(counter['scanned'], orphaned, missing, counter['recent'])
+
+
+def get_unreferenced_uuids(uuids, batch_size=DATABASE_BATCH_SIZE):
+    """Return the uuids that do not correspond to any node in the database.
+
+    :param uuids: a list of node uuids
+    :param batch_size: the number of uuids checked per query
+    :return: list of the uuids without a node, in the order of the given list
+    """
+    from aiida.common.utils import grouper
+    from aiida.orm import Node, QueryBuilder
+
+    referenced = set()
+
+    for chunk in grouper(batch_size, uuids):
+        builder = QueryBuilder().append(Node, filters={'uuid': {'in': list(chunk)}}, project='uuid')
+        referenced.update(str(uuid) for uuid, in builder.iterall(batch_size=batch_size))
+
+    return [uuid for uuid in uuids if uuid not in referenced]
+
+
+def remove_repository_folders(uuids, threads=SCAN_THREADS, batch_size=DATABASE_BATCH_SIZE):
+    """Remove the repository folders of the given uuids in parallel.
+
+    The uuids are checked against the database first and the folders of the uuids that now correspond to a node, for
+    example because the node was stored after the repository was scanned, are left untouched.
+
+    :param uuids: a list of node uuids
+    :param threads: the number of threads used to remove the folders
+    :param batch_size: the number of uuids checked against the database per query
+    :return: list of the uuids whose folders were removed
+    """
+    from aiida.manage.database.delete.nodes import erase_repository_folders
+
+    uuids = get_unreferenced_uuids(uuids, batch_size=batch_size)
+    erase_repository_folders(uuids, threads=threads)
+
+    return uuids
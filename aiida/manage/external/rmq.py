@@ -19,6 +19,8 @@ from tornado import gen
 import plumpy
 from kiwipy import communications, Future
 
+from aiida.manage.configuration.options import DEFAULT_DAEMON_WORKER_PROCESS_SLOTS
+
 __all__ = ('RemoteException', 'CommunicationTimeout', 'DeliveryFailed', 'ProcessLauncher')
 
 LOGGER = logging.getLogger(__name__)
@@ -34,7 +36,8 @@ CommunicationTimeout = communications.TimeoutError  # pylint: disable=invalid-na
 # know how to avoid warnings. For more info see
 # https://github.com/aiidateam/aiida_core/issues/1142
 _RMQ_URL = 'amqp://127.0.0.1'
-_RMQ_TASK_PREFETCH_COUNT = 100  # This value should become configurable per profile at some point
+# The task prefetch count of daemon workers is configurable per profile through the `daemon.worker_process_slots` option
+_RMQ_TASK_PREFETCH_COUNT = DEFAULT_DAEMON_WORKER_PROCESS_SLOTS
 _RMQ_HEARTBEAT_TIMEOUT = 600  # Maximum that can be set by client, with default RabbitMQ server configuration
 _LAUNCH_QUEUE = 'process.queue'
 _MESSAGE_EXCHANGE = 'messages'
@@ -122,6 +125,19 @@ class ProcessLauncher(plumpy.ProcessLauncher):
     that if it is already marked as terminated, it is not continued but the future is reconstructed and returned
     """
 
+    _active_process_count = 0
+
+    @property
+    def active_process_count(self):
+        """Return the number of processes that were continued by this launcher and are still running.
+
+        Since the daemon continues processes with `nowait=False`, each process occupies one of the task slots of the
+        communicator until it terminates, so this number is a measure for the load of the worker.
+
+        :return: the number of running processes
+        """
+        return self._active_process_count
+
     @gen.coroutine
     def _continue(self, communicator, pid, nowait, tag=None):
         """
@@ -168,7 +184,12 @@ class ProcessLauncher(plumpy.ProcessLauncher):
 
             raise gen.Return(future.result())
 
-        result = yield super(ProcessLauncher, self)._continue(communicator, pid, nowait, tag)
+        self._active_process_count += 1
+
+        try:
+            result = yield super(ProcessLauncher, self)._continue(communicator, pid, nowait, tag)
+        finally:
+            self._active_process_count -= 1
 
         # Ensure that the result is serialized such that communication thread won't have to do database operations
         try:
@@ -164,10 +164,11 @@ class Manager(object):  # pylint: disable=useless-object-inheritance
         """
         from aiida.manage.external import rmq
         import kiwipy.rmq
+        from .configuration import get_config_option
         profile = self.get_profile()
 
         if task_prefetch_count is None:
-            task_prefetch_count = rmq._RMQ_TASK_PREFETCH_COUNT  # pylint: disable=protected-access
+            task_prefetch_count = get_config_option('daemon.worker_process_slots')
 
         url = rmq.get_rmq_url()
         prefix = profile.rmq_prefix
@@ -304,10 +305,7 @@ class Manager(object):  # pylint: disable=useless-object-inheritance
             load_context=plumpy.LoadSaveContext(runner=runner),
             loader=persistence.get_object_loader())
 
-        def callback(*args, **kwargs):
-            return plumpy.create_task(functools.partial(task_receiver, *args, **kwargs), loop=runner_loop)
-
-        runner.communicator.add_task_subscriber(callback)
+        runner.set_task_receiver(task_receiver)
 
         return runner
 
@@ -11,6 +11,8 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
+import time
+
 import six
 
 from aiida.common import exceptions, timezone
@@ -21,6 +23,10 @@ current_autogroup = None
 
 VERDIAUTOGROUP_TYPE = GroupTypeString.VERDIAUTOGROUP_TYPE.value
 
+# Number of buffered nodes and number of seconds after which the pending memberships are flushed to the database
+AUTOGROUP_FLUSH_SIZE = 1000
+AUTOGROUP_FLUSH_INTERVAL = 10.
+
 # TODO: make the Autogroup usable to the user, and not only to the verdi run
 
 class Autogroup(object):
@@ -34,8 +40,24 @@ class Autogroup(object):
     The exclude/include lists, can have values 'all' if you want to include/exclude all classes.
     Otherwise, they are lists of strings like: calculation.quantumespresso.pw, data.array.kpoints, ...
     i.e.: a string identifying the base class, than the path to the class as in Calculation/Data -Factories
+
+    The group itself is resolved only once, when the first node has to be added to it, and the group memberships are
+    buffered: they are written to the database in bulk as soon as `flush_size` nodes are pending or `flush_interval`
+    seconds have passed since the last flush. Whoever activates the autogroup is responsible for calling `flush` when
+    done, such that the remaining pending memberships are written as well.
     """
 
+    def __init__(self, flush_size=AUTOGROUP_FLUSH_SIZE, flush_interval=AUTOGROUP_FLUSH_INTERVAL):
+        """
+        :param flush_size: the number of pending nodes that will trigger a flush
+        :param flush_interval: the number of seconds since the last flush after which pending nodes are flushed
+        """
+        self._flush_size = flush_size
+        self._flush_interval = flush_interval
+        self._group = None
+        self._pending = []
+        self._last_flush = time.time()
+
     def _validate(self, param, is_exact=True):
         """
         Used internally to verify the sanity of exclude, include lists
@@ -157,6 +179,56 @@ class Autogroup(object):
         if not isinstance(gname, six.string_types):
             raise exceptions.ValidationError("group name must be a string")
         self.group_name = gname
+        self._group = None
+
+    def get_group(self):
+        """Return the group of this autogroup, creating it if it does not yet exist.
+
+        The group is looked up in the database only once and then cached on the instance.
+
+        :return: the autogroup
+        :rtype: :class:`aiida.orm.Group`
+        """
+        from aiida.orm import Group
+
+        if self._group is None:
+            self._group = Group.objects.get_or_create(label=self.get_group_name(), type_string=VERDIAUTOGROUP_TYPE)[0]
+
+        return self._group
+
+    @property
+    def pending(self):
+        """Return the number of stored nodes that still have to be added to the group.
+
+        :return: the number of pending nodes
+        :rtype: int
+        """
+        return len(self._pending)
+
+    def add_node(self, node):
+        """Schedule a stored node to be added to the group.
+
+        The node is buffered and the membership is only written to the database when the buffer is flushed, which
+        happens automatically when either the size or the time threshold is exceeded.
+
+        :param node: a stored node
+        :type node: :class:`aiida.orm.Node`
+        """
+        self._pending.append(node.backend_entity)
+
+        if len(self._pending) >= self._flush_size or time.time() - self._last_flush >= self._flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Add all the pending nodes to the group with a single bulk insert."""
+        self._last_flush = time.time()
+
+        if not self._pending:
+            return
+
+        pending = self._pending
+        self._pending = []
+        self.get_group().backend_entity.add_nodes(pending, skip_orm=True)
 
     def is_to_be_grouped(self, the_class):
         """
@@ -78,9 +78,23 @@ def _(backend_entity):
 
 @get_orm_entity.register(BackendNode)
 def _(backend_entity):
+    from .utils.identity import get_identity_map
     from .utils.node import load_node_class
+
+    identity_map = get_identity_map()
+
+    if identity_map is not None and backend_entity.is_stored:
+        node = identity_map.get(backend_entity.id)
+        if node is not None:
+            return node
+
     node_class = load_node_class(backend_entity.node_type)
-    return node_class.from_backend_entity(backend_entity)
+    node = node_class.from_backend_entity(backend_entity)
+
+    if identity_map is not None and node.is_stored:
+        identity_map.add(node)
+
+    return node
 
 
 class ConvertIterator(Iterator, Sized):
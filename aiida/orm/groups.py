@@ -91,6 +91,23 @@ class Group(entities.Entity):
 
             return res[0], False
 
+        def iter_node_pks(self, groups, operation='union', batch_size=None):
+            """Return an iterator over the pks of the nodes resulting from a set operation between the given groups.
+
+            The set operation is computed by the database, so no node is ever loaded.
+
+            :param groups: a list of groups
+            :type groups: list of :class:`aiida.orm.Group`
+            :param operation: one of 'union', 'intersection' or 'difference'. For 'difference', the nodes of the first
+                group that are not contained in any of the other groups are returned.
+            :param batch_size: the number of rows fetched from the database at a time
+            :return: an iterator of node pks, ordered by pk
+            """
+            for group in groups:
+                type_check(group, Group)
+
+            return self._backend.groups.iter_node_pks([group.pk for group in groups], operation, batch_size)
+
         def delete(self, id):  # pylint: disable=invalid-name, redefined-builtin
             """
             Delete a group
@@ -355,6 +372,55 @@ class Group(entities.Entity):
 
         self._backend_entity.remove_nodes([node.backend_entity for node in nodes])
 
+    def add_nodes_by_pks(self, pks):
+        """Add the nodes with the given pks to the group, without loading them.
+
+        This is the method of choice to add large numbers of nodes, as it only issues a set-based statement for each
+        chunk of pks. Pks of nodes that are already in the group or that do not exist are ignored.
+
+        :param pks: an iterable of node pks
+        """
+        if not self.is_stored:
+            raise exceptions.ModificationNotAllowed('cannot add nodes to an unstored group')
+
+        self._backend_entity.add_nodes_by_pks(pks)
+
+    def remove_nodes_by_pks(self, pks):
+        """Remove the nodes with the given pks from the group, without loading them.
+
+        :param pks: an iterable of node pks
+        """
+        if not self.is_stored:
+            raise exceptions.ModificationNotAllowed('cannot remove nodes from an unstored group')
+
+        self._backend_entity.remove_nodes_by_pks(pks)
+
+    def iter_node_pks(self, batch_size=None):
+        """Return an iterator over the pks of the nodes in this group, without loading the nodes.
+
+        :param batch_size: the number of rows fetched from the database at a time
+        :return: an iterator of node pks, ordered by pk
+        """
+        return self._backend_entity.iter_node_pks(batch_size)
+
+    def add_nodes_from_groups(self, groups, operation='union'):
+        """Add the nodes resulting from a set operation between the given groups to this group.
+
+        Both the set operation and the insertion are performed by the database, so no node is ever loaded.
+
+        :param groups: a list of groups
+        :type groups: list of :class:`aiida.orm.Group`
+        :param operation: one of 'union', 'intersection' or 'difference'. For 'difference', the nodes of the first
+            group that are not contained in any of the other groups are added.
+        """
+        if not self.is_stored:
+            raise exceptions.ModificationNotAllowed('cannot add nodes to an unstored group')
+
+        for group in groups:
+            type_check(group, Group)
+
+        self._backend_entity.add_nodes_from_groups([group.pk for group in groups], operation)
+
     @classmethod
     def get(cls, **kwargs):
         """
@@ -155,7 +155,13 @@ def _(dbmodel, backend):
     """
     get_backend_entity for DummyModel DbNode.
     DummyModel instances are created when QueryBuilder queries the Django backend.
+    The columns that were deferred by the query are also deferred on the Django model, such that they are only loaded
+    when they are first accessed.
     """
+    from django.db.models.base import DEFERRED
+    from sqlalchemy import inspect
+
+    unloaded = inspect(dbmodel).unloaded
     djnode_instance = djmodels.DbNode(
         id=dbmodel.id,
         node_type=dbmodel.node_type,
@@ -167,8 +173,8 @@ def _(dbmodel, backend):
         description=dbmodel.description,
         dbcomputer_id=dbmodel.dbcomputer_id,
         user_id=dbmodel.user_id,
-        attributes=dbmodel.attributes,
-        extras=dbmodel.extras)
+        attributes=DEFERRED if 'attributes' in unloaded else dbmodel.attributes,
+        extras=DEFERRED if 'extras' in unloaded else dbmodel.extras)
 
     from . import nodes
     return nodes.DjangoNode.from_dbmodel(djnode_instance, backend)
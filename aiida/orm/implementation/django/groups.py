@@ -22,11 +22,13 @@ except ImportError:
 import six
 
 # pylint: disable=no-name-in-module, import-error
-from django.db import transaction
+from django.db import connection, transaction
 from django.db.models import Q
 
 from aiida.orm.implementation.groups import BackendGroup, BackendGroupCollection
+from aiida.orm.implementation.groups import GROUP_NODES_CHUNK_SIZE, validate_set_operation
 from aiida.common.lang import type_check
+from aiida.common.utils import grouper
 from aiida.backends.djsite.db import models
 
 from . import entities
@@ -199,6 +201,86 @@ class DjangoGroup(entities.DjangoModelEntity[models.DbGroup], BackendGroup):  #
 
         self._dbmodel.dbnodes.remove(*node_pks)
 
+    def add_nodes_by_pks(self, pks):
+        """Add the nodes with the given pks to the group with set-based statements, without loading the nodes.
+
+        Pks of nodes that are already in the group are ignored, as are pks that do not correspond to existing nodes.
+
+        :note: the group itself has to be stored.
+
+        :param pks: an iterable of node pks
+        """
+        if not self.is_stored:
+            raise ValueError('group has to be stored before nodes can be added')
+
+        statement = """
+            INSERT INTO {table} (dbgroup_id, dbnode_id)
+            SELECT %s, id FROM db_dbnode WHERE id = ANY(%s)
+            ON CONFLICT DO NOTHING
+            """.format(table=_GROUP_NODES_TABLE)
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            for chunk in grouper(GROUP_NODES_CHUNK_SIZE, pks):
+                cursor.execute(statement, [self.pk, list(chunk)])
+
+    def remove_nodes_by_pks(self, pks):
+        """Remove the nodes with the given pks from the group with set-based statements, without loading the nodes.
+
+        :note: the group itself has to be stored.
+
+        :param pks: an iterable of node pks
+        """
+        if not self.is_stored:
+            raise ValueError('group has to be stored before nodes can be removed')
+
+        statement = 'DELETE FROM {table} WHERE dbgroup_id = %s AND dbnode_id = ANY(%s)'.format(
+            table=_GROUP_NODES_TABLE)
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            for chunk in grouper(GROUP_NODES_CHUNK_SIZE, pks):
+                cursor.execute(statement, [self.pk, list(chunk)])
+
+    def iter_node_pks(self, batch_size=None):  # pylint: disable=unused-argument
+        """Return an iterator over the pks of the nodes in the group, ordered by pk, without loading the nodes.
+
+        :param batch_size: the number of rows fetched from the database at a time
+        :return: an iterator of integers
+        """
+        # The batch size is determined by Django's server side cursor that is used by `iterator`
+        queryset = models.DbGroup.dbnodes.through.objects.filter(dbgroup_id=self.pk)
+        return queryset.order_by('dbnode_id').values_list('dbnode_id', flat=True).iterator()
+
+    def add_nodes_from_groups(self, group_pks, operation='union'):
+        """Add the nodes resulting from a set operation between the node sets of the given groups to this group.
+
+        The set operation and the insertion are performed by the database with a single `INSERT ... SELECT`.
+
+        :note: the group itself has to be stored.
+
+        :param group_pks: a list of group pks
+        :param operation: one of `GROUP_SET_OPERATIONS`. For `difference`, the nodes of the first group that are not
+            contained in any of the other groups are added.
+        """
+        if not self.is_stored:
+            raise ValueError('group has to be stored before nodes can be added')
+
+        validate_set_operation(operation, group_pks)
+
+        keyword = {'union': 'UNION', 'intersection': 'INTERSECT', 'difference': 'EXCEPT'}[operation]
+        select = 'SELECT dbnode_id FROM {table} WHERE dbgroup_id = %s'.format(table=_GROUP_NODES_TABLE)
+        statement = """
+            INSERT INTO {table} (dbgroup_id, dbnode_id)
+            SELECT %s, dbnode_id FROM ({nodes}) AS nodes
+            ON CONFLICT DO NOTHING
+            """.format(table=_GROUP_NODES_TABLE, nodes=' {} '.format(keyword).join([select] * len(group_pks)))
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(statement, [self.pk] + list(group_pks))
+
+
+# The name of the table of the many-to-many relation between groups and nodes
+_GROUP_NODES_TABLE = models.DbGroup.dbnodes.through._meta.db_table  # pylint: disable=protected-access
+
 
 class DjangoGroupCollection(BackendGroupCollection):
     """The Django Group collection"""
@@ -294,5 +376,34 @@ class DjangoGroupCollection(BackendGroupCollection):
 
         return retlist
 
+    def iter_node_pks(self, group_pks, operation='union', batch_size=None):  # pylint: disable=unused-argument
+        """Return an iterator over the pks of the nodes resulting from a set operation between the given groups.
+
+        The set operation is computed by the database and only the resulting pks are transferred.
+
+        :param group_pks: a list of group pks
+        :param operation: one of `GROUP_SET_OPERATIONS`. For `difference`, the nodes of the first group that are not
+            contained in any of the other groups are returned.
+        :param batch_size: the number of rows fetched from the database at a time
+        :return: an iterator of integers
+        """
+        validate_set_operation(operation, group_pks)
+
+        querysets = [
+            models.DbGroup.dbnodes.through.objects.filter(dbgroup_id=pk).values_list('dbnode_id', flat=True)
+            for pk in group_pks
+        ]
+        first, others = querysets[0], querysets[1:]
+
+        if operation == 'union':
+            queryset = first.union(*others)
+        elif operation == 'intersection':
+            queryset = first.intersection(*others)
+        else:
+            queryset = first.difference(*others)
+
+        # The batch size is determined by Django's server side cursor that is used by `iterator`
+        return queryset.order_by('dbnode_id').iterator()
+
     def delete(self, id):  # pylint: disable=redefined-builtin
         models.DbGroup.objects.filter(id=id).delete()
@@ -177,6 +177,8 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
         :raises AttributeError: if the attribute does not exist and no default is specified
         """
         try:
+            if not self._dbmodel.is_field_loaded('attributes'):
+                return self._get_stored_item('attributes', key)
             return self._dbmodel.attributes[key]
         except KeyError as exception:
             raise AttributeError('attribute `{}` does not exist'.format(exception))
@@ -322,6 +324,8 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
         :raises AttributeError: if the extra does not exist and no default is specified
         """
         try:
+            if not self._dbmodel.is_field_loaded('extras'):
+                return self._get_stored_item('extras', key)
             return self._dbmodel.extras[key]
         except KeyError as exception:
             raise AttributeError('extra `{}` does not exist'.format(exception))
@@ -436,6 +440,29 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
         for key in self._dbmodel.extras:
             yield key
 
+    def _get_stored_item(self, field, key):
+        """Return the value of a key of the given JSONB field of the stored node, fetching only that value.
+
+        :param field: the name of the JSONB field, either `attributes` or `extras`
+        :param key: the key
+        :return: the value of the key
+        :raises KeyError: if the key does not exist
+        """
+        from django.db import connection
+
+        # The field name is not a parameter of the query, so make sure it can only be one of the JSONB fields
+        if field not in ('attributes', 'extras'):
+            raise ValueError('invalid field `{}`'.format(field))
+
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT {0} ? %s, {0} -> %s FROM db_dbnode WHERE id = %s'.format(field), [key, key, self.id])
+            result = cursor.fetchone()
+
+        if result is None or not result[0]:
+            raise KeyError(key)
+
+        return result[1]
+
     def _flush_if_stored(self):
         if self._dbmodel.is_saved():
             self._dbmodel.save()
@@ -296,7 +296,13 @@ class DjangoQueryBuilder(BackendQueryBuilder):
         if column is None:
             column = self.get_column(column_name, alias)
 
-        database_entity = column[tuple(attr_key)]
+        # A single key is accessed with the `->` operator instead of a path, such that the expression matches the one of
+        # the expression indexes on the JSONB values of keys of the attributes
+        if len(attr_key) == 1:
+            database_entity = column[attr_key[0]]
+        else:
+            database_entity = column[tuple(attr_key)]
+
         if operator == '==':
             type_filter, casted_entity = cast_according_to_type(database_entity, value)
             expr = case([(type_filter, casted_entity == value)], else_=False)
@@ -348,6 +354,11 @@ class DjangoQueryBuilder(BackendQueryBuilder):
                 else_=False)
         else:
             raise InputValidationError("Unknown operator {} for filters in JSON field".format(operator))
+
+        index_expr = self.get_filter_expr_from_jsonb_value(operator, value, database_entity)
+        if index_expr is not None:
+            expr = and_(index_expr, expr)
+
         return expr
 
     def get_projectable_attribute(self, alias, column_name, attrpath, cast=None, **kwargs):  # pylint: disable=redefined-outer-name
@@ -449,6 +460,13 @@ class DjangoQueryBuilder(BackendQueryBuilder):
                         for colindex, rowitem in enumerate(resultrow)
                     ]
 
+    def iterrecords(self, query, batch_size):
+        from django.db import transaction
+
+        with transaction.atomic():
+            for row in query.yield_per(batch_size):
+                yield self.get_record(row)
+
     def iterdict(self, query, batch_size, tag_to_projected_properties_dict, tag_to_alias_map):
         from django.db import transaction
 
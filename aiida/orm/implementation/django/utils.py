@@ -79,6 +79,20 @@ class ModelWrapper(object):
         """
         return self._model.pk is not None
 
+    def is_field_loaded(self, field):
+        """Return whether the value of the field is loaded, such that getting it does not query the database.
+
+        The mutable fields of a saved model are refreshed every time they are accessed, so only the immutable fields
+        that were not deferred are loaded.
+
+        :param field: the name of the model field
+        :return: boolean, True if the value of the field is available on the model instance, False otherwise
+        """
+        if not self.is_saved():
+            return True
+
+        return not self._is_mutable_model_field(field) and field not in self._model.get_deferred_fields()
+
     def save(self):
         """Store the model instance.
 
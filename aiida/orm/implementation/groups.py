@@ -20,7 +20,28 @@ from aiida.common import exceptions
 from . import backends
 from .nodes import BackendNode
 
-__all__ = ('BackendGroup', 'BackendGroupCollection')
+__all__ = ('BackendGroup', 'BackendGroupCollection', 'GROUP_SET_OPERATIONS')
+
+# The set operations that can be computed between the node sets of a number of groups
+GROUP_SET_OPERATIONS = ('union', 'intersection', 'difference')
+
+# The number of node pks that is passed to the database in a single statement by the bulk membership operations
+GROUP_NODES_CHUNK_SIZE = 10000
+
+
+def validate_set_operation(operation, group_pks):
+    """Validate the arguments of a set operation between the node sets of groups.
+
+    :param operation: one of `GROUP_SET_OPERATIONS`
+    :param group_pks: a list of group pks
+    :raises ValueError: if the operation is not supported or no groups are specified
+    """
+    if operation not in GROUP_SET_OPERATIONS:
+        raise ValueError('invalid set operation `{}`, valid ones are: {}'.format(
+            operation, ', '.join(GROUP_SET_OPERATIONS)))
+
+    if not group_pks:
+        raise ValueError('at least one group has to be specified')
 
 
 @six.add_metaclass(abc.ABCMeta)
@@ -188,6 +209,47 @@ class BackendGroup(backends.BackendEntity):
         if any([not isinstance(node, BackendNode) for node in nodes]):
             raise TypeError('nodes have to be of type {}'.format(BackendNode))
 
+    @abc.abstractmethod
+    def add_nodes_by_pks(self, pks):
+        """Add the nodes with the given pks to the group with set-based statements, without loading the nodes.
+
+        Pks of nodes that are already in the group are ignored, as are pks that do not correspond to existing nodes.
+
+        :note: the group itself has to be stored.
+
+        :param pks: an iterable of node pks
+        """
+
+    @abc.abstractmethod
+    def remove_nodes_by_pks(self, pks):
+        """Remove the nodes with the given pks from the group with set-based statements, without loading the nodes.
+
+        :note: the group itself has to be stored.
+
+        :param pks: an iterable of node pks
+        """
+
+    @abc.abstractmethod
+    def iter_node_pks(self, batch_size=None):
+        """Return an iterator over the pks of the nodes in the group, ordered by pk, without loading the nodes.
+
+        :param batch_size: the number of rows fetched from the database at a time
+        :return: an iterator of integers
+        """
+
+    @abc.abstractmethod
+    def add_nodes_from_groups(self, group_pks, operation='union'):
+        """Add the nodes resulting from a set operation between the node sets of the given groups to this group.
+
+        The set operation and the insertion are performed by the database with a single `INSERT ... SELECT`.
+
+        :note: the group itself has to be stored.
+
+        :param group_pks: a list of group pks
+        :param operation: one of `GROUP_SET_OPERATIONS`. For `difference`, the nodes of the first group that are not
+            contained in any of the other groups are added.
+        """
+
     def __repr__(self):
         return '<{}: {}>'.format(self.__class__.__name__, str(self))
 
@@ -269,6 +331,19 @@ class BackendGroupCollection(backends.BackendCollection[BackendGroup]):
             raise exceptions.NotExistent("No group bound matching criteria '{}'".format(filters))
         return results[0]
 
+    @abc.abstractmethod
+    def iter_node_pks(self, group_pks, operation='union', batch_size=None):
+        """Return an iterator over the pks of the nodes resulting from a set operation between the given groups.
+
+        The set operation is computed by the database and only the resulting pks are transferred.
+
+        :param group_pks: a list of group pks
+        :param operation: one of `GROUP_SET_OPERATIONS`. For `difference`, the nodes of the first group that are not
+            contained in any of the other groups are returned.
+        :param batch_size: the number of rows fetched from the database at a time
+        :return: an iterator of integers
+        """
+
     @abc.abstractmethod
     def delete(self, id):  # pylint: disable=redefined-builtin, invalid-name
         """
@@ -12,6 +12,10 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 import abc
+import decimal
+import math
+import uuid
+
 import six
 
 from aiida.common import exceptions
@@ -215,6 +219,61 @@ class BackendQueryBuilder(object):
             raise InputValidationError('Unknown operator {} for filters on columns'.format(operator))
         return expr
 
+    @classmethod
+    def get_filter_expr_from_jsonb_value(cls, operator, value, database_entity):
+        """
+        Return an expression that compares the JSONB value of a key with the given value, if possible.
+
+        The expressions returned by `get_filter_expr_from_attributes` compare the value of a key only after checking its
+        JSONB type, which guards the cast of the value, but also prevents the database from using an index. The
+        expression returned here compares the JSONB value itself, which never raises, and which can therefore use an
+        expression index on the JSONB value of the key, such as the ones defined for the attributes of process nodes.
+        It matches all the rows matched by the typed comparison, so the two can be combined with a logical AND without
+        changing the result, also when negated.
+
+        :param operator: The operator provided by the user ('==',  '>', ...)
+        :param value: The value to compare with
+        :param database_entity: the JSONB value of the key, e.g. `attributes['process_state']`
+        :returns: An instance of sqlalchemy.sql.elements.BinaryExpression, or None if the comparison is not supported
+        """
+        # Remove when https://github.com/PyCQA/pylint/issues/1931 is fixed
+        # pylint: disable=no-name-in-module,import-error
+        from sqlalchemy import cast, literal
+        from sqlalchemy.dialects.postgresql import JSONB
+        from aiida.common import json
+
+        def is_number(value):
+            # Infinite and NaN values cannot be represented in JSON
+            if isinstance(value, float):
+                return not math.isinf(value) and not math.isnan(value)
+            return isinstance(value, six.integer_types) and not isinstance(value, bool)
+
+        def is_scalar(value):
+            return isinstance(value, six.string_types + (bool,)) or is_number(value)
+
+        def to_jsonb(value):
+            # The serialized value is bound as a string, since binding it as JSONB would serialize it a second time
+            return cast(literal(json.dumps(value)), JSONB)
+
+        if operator == '==' and is_scalar(value):
+            return database_entity == to_jsonb(value)
+
+        if operator == 'in' and value and all(is_scalar(element) for element in value):
+            return database_entity.in_([to_jsonb(element) for element in value])
+
+        # Since JSONB values of different types are ordered by type, a range is only implied for numbers
+        if is_number(value):
+            if operator == '>':
+                return database_entity > to_jsonb(value)
+            if operator == '<':
+                return database_entity < to_jsonb(value)
+            if operator in ('>=', '=>'):
+                return database_entity >= to_jsonb(value)
+            if operator in ('<=', '=<'):
+                return database_entity <= to_jsonb(value)
+
+        return None
+
     @abc.abstractmethod
     def get_projectable_attribute(self, alias, column_name, attrpath, cast=None, **kwargs):
         pass
@@ -267,6 +326,35 @@ class BackendQueryBuilder(object):
         :returns: An iterator over all the results of a list of dictionaries.
         """
 
+    @abc.abstractmethod
+    def iterrecords(self, query, batch_size):
+        """
+        :returns: An iterator over all the results as tuples of the projected values, which are not converted.
+        """
+
+    @staticmethod
+    def get_record(row):
+        """
+        Convert a row of projected column values returned by the query into a record.
+
+        Only the values whose type is specific to the database driver are converted: UUIDs into strings and decimals,
+        which are returned for aggregates like the `sum` of integers, into an integer or float. In particular, the
+        values of JSONB columns are returned as loaded by the driver, without being copied or cleaned.
+
+        :param row: a row of the query result
+        :returns: a tuple of the values of the row
+        """
+        record = []
+
+        for value in row:
+            if isinstance(value, uuid.UUID):
+                value = six.text_type(value)
+            elif isinstance(value, decimal.Decimal):
+                value = int(value) if value == value.to_integral_value() else float(value)
+            record.append(value)
+
+        return tuple(record)
+
     @abc.abstractmethod
     def get_column_names(self, alias):
         """
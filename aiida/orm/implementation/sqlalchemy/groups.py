@@ -22,7 +22,9 @@ from aiida.backends.sqlalchemy.models.group import DbGroup, table_groups_nodes
 from aiida.backends.sqlalchemy.models.node import DbNode
 from aiida.common.exceptions import UniquenessError
 from aiida.common.lang import type_check
+from aiida.common.utils import grouper
 from aiida.orm.implementation.groups import BackendGroup, BackendGroupCollection
+from aiida.orm.implementation.groups import GROUP_NODES_CHUNK_SIZE, validate_set_operation
 from . import entities
 from . import users
 from . import utils
@@ -249,11 +251,6 @@ class SqlaGroup(entities.SqlaModelEntity[DbGroup], BackendGroup):  # pylint: dis
 
         super(SqlaGroup, self).remove_nodes(nodes)
 
-        # Get dbnodes here ONCE, otherwise each call to dbnodes will re-read the current value in the database
-        dbnodes = self._dbmodel.dbnodes
-
-        list_nodes = []
-
         for node in nodes:
             if not isinstance(node, SqlaNode):
                 raise TypeError('invalid type {}, has to be {}'.format(type(node), SqlaNode))
@@ -261,14 +258,115 @@ class SqlaGroup(entities.SqlaModelEntity[DbGroup], BackendGroup):  # pylint: dis
             if node.id is None:
                 raise ValueError('At least one of the provided nodes is unstored, stopping...')
 
-            # If we don't check first, SqlA might issue a DELETE statement for an unexisting key, resulting in an error
-            if node.dbmodel in dbnodes:
-                list_nodes.append(node.dbmodel)
+        self.remove_nodes_by_pks([node.id for node in nodes])
+
+    def add_nodes_by_pks(self, pks):
+        """Add the nodes with the given pks to the group with set-based statements, without loading the nodes.
+
+        Pks of nodes that are already in the group are ignored, as are pks that do not correspond to existing nodes.
+
+        :note: the group itself has to be stored.
+
+        :param pks: an iterable of node pks
+        """
+        from sqlalchemy import literal, select  # pylint: disable=import-error, no-name-in-module
+        from sqlalchemy.dialects.postgresql import insert  # pylint: disable=import-error, no-name-in-module
+
+        if not self.is_stored:
+            raise ValueError('group has to be stored before nodes can be added')
+
+        session = sa.get_scoped_session()
+
+        for chunk in grouper(GROUP_NODES_CHUNK_SIZE, pks):
+            nodes = select([literal(self.pk), DbNode.id]).where(DbNode.id.in_(chunk))
+            statement = insert(table_groups_nodes).from_select(['dbgroup_id', 'dbnode_id'], nodes)
+            session.execute(statement.on_conflict_do_nothing(index_elements=['dbgroup_id', 'dbnode_id']))
+
+        session.commit()
+
+    def remove_nodes_by_pks(self, pks):
+        """Remove the nodes with the given pks from the group with set-based statements, without loading the nodes.
+
+        :note: the group itself has to be stored.
+
+        :param pks: an iterable of node pks
+        """
+        if not self.is_stored:
+            raise ValueError('group has to be stored before nodes can be removed')
+
+        session = sa.get_scoped_session()
+
+        for chunk in grouper(GROUP_NODES_CHUNK_SIZE, pks):
+            statement = table_groups_nodes.delete().where(
+                (table_groups_nodes.c.dbgroup_id == self.pk) & (table_groups_nodes.c.dbnode_id.in_(chunk)))
+            session.execute(statement)
+
+        session.commit()
+
+    def iter_node_pks(self, batch_size=None):
+        """Return an iterator over the pks of the nodes in the group, ordered by pk, without loading the nodes.
+
+        :param batch_size: the number of rows fetched from the database at a time
+        :return: an iterator of integers
+        """
+        session = sa.get_scoped_session()
+        query = session.query(table_groups_nodes.c.dbnode_id).filter(
+            table_groups_nodes.c.dbgroup_id == self.pk).order_by(table_groups_nodes.c.dbnode_id)
+
+        for (pk,) in query.yield_per(batch_size or GROUP_NODES_CHUNK_SIZE):
+            yield pk
+
+    def add_nodes_from_groups(self, group_pks, operation='union'):
+        """Add the nodes resulting from a set operation between the node sets of the given groups to this group.
+
+        The set operation and the insertion are performed by the database with a single `INSERT ... SELECT`.
+
+        :note: the group itself has to be stored.
+
+        :param group_pks: a list of group pks
+        :param operation: one of `GROUP_SET_OPERATIONS`. For `difference`, the nodes of the first group that are not
+            contained in any of the other groups are added.
+        """
+        from sqlalchemy import literal, select  # pylint: disable=import-error, no-name-in-module
+        from sqlalchemy.dialects.postgresql import insert  # pylint: disable=import-error, no-name-in-module
+
+        if not self.is_stored:
+            raise ValueError('group has to be stored before nodes can be added')
+
+        session = sa.get_scoped_session()
+        subquery = _get_set_operation_statement(group_pks, operation).alias('nodes')
+        nodes = select([literal(self.pk), subquery.c.dbnode_id])
+        statement = insert(table_groups_nodes).from_select(['dbgroup_id', 'dbnode_id'], nodes)
+        session.execute(statement.on_conflict_do_nothing(index_elements=['dbgroup_id', 'dbnode_id']))
+        session.commit()
 
-        for node in list_nodes:
-            dbnodes.remove(node)
 
-        sa.get_scoped_session().commit()
+def _get_set_operation_statement(group_pks, operation):
+    """Return the compound select statement of the node pks resulting from the set operation between the groups.
+
+    :param group_pks: a list of group pks
+    :param operation: one of `GROUP_SET_OPERATIONS`
+    :return: a selectable with the single column `dbnode_id`
+    """
+    from sqlalchemy import select, union, intersect, except_  # pylint: disable=import-error, no-name-in-module
+
+    validate_set_operation(operation, group_pks)
+
+    selects = [
+        select([table_groups_nodes.c.dbnode_id]).where(table_groups_nodes.c.dbgroup_id == pk) for pk in group_pks
+    ]
+
+    if len(selects) == 1:
+        return selects[0]
+
+    if operation == 'union':
+        return union(*selects)
+
+    if operation == 'intersection':
+        return intersect(*selects)
+
+    # Chained `EXCEPT` clauses are evaluated left to right, which yields the nodes of the first group not in any other
+    return except_(*selects)
 
 
 class SqlaGroupCollection(BackendGroupCollection):
@@ -347,6 +445,24 @@ class SqlaGroupCollection(BackendGroupCollection):
 
         return [SqlaGroup.from_dbmodel(group, self._backend) for group in groups]
 
+    def iter_node_pks(self, group_pks, operation='union', batch_size=None):
+        """Return an iterator over the pks of the nodes resulting from a set operation between the given groups.
+
+        The set operation is computed by the database and only the resulting pks are transferred.
+
+        :param group_pks: a list of group pks
+        :param operation: one of `GROUP_SET_OPERATIONS`. For `difference`, the nodes of the first group that are not
+            contained in any of the other groups are returned.
+        :param batch_size: the number of rows fetched from the database at a time
+        :return: an iterator of integers
+        """
+        session = sa.get_scoped_session()
+        subquery = _get_set_operation_statement(group_pks, operation).alias('nodes')
+        query = session.query(subquery.c.dbnode_id).order_by(subquery.c.dbnode_id)
+
+        for (pk,) in query.yield_per(batch_size or GROUP_NODES_CHUNK_SIZE):
+            yield pk
+
     def delete(self, id):  # pylint: disable=redefined-builtin
         session = sa.get_scoped_session()
 
@@ -179,6 +179,8 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
         :raises AttributeError: if the attribute does not exist and no default is specified
         """
         try:
+            if not self._dbmodel.is_field_loaded('attributes'):
+                return self._get_stored_item('attributes', key)
             return self._dbmodel.attributes[key]
         except KeyError as exception:
             raise AttributeError('attribute `{}` does not exist'.format(exception))
@@ -327,6 +329,8 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
         :raises AttributeError: if the extra does not exist and no default is specified
         """
         try:
+            if not self._dbmodel.is_field_loaded('extras'):
+                return self._get_stored_item('extras', key)
             return self._dbmodel.extras[key]
         except KeyError as exception:
             raise AttributeError('extra `{}` does not exist'.format(exception))
@@ -442,6 +446,23 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
         for key in self._dbmodel.extras.keys():
             yield key
 
+    def _get_stored_item(self, field, key):
+        """Return the value of a key of the given JSONB field of the stored node, fetching only that value.
+
+        :param field: the name of the JSONB field, either `attributes` or `extras`
+        :param key: the key
+        :return: the value of the key
+        :raises KeyError: if the key does not exist
+        """
+        column = getattr(models.DbNode, field)
+        session = get_scoped_session()
+        result = session.query(column.has_key(key), column[key]).filter(models.DbNode.id == self.id).first()
+
+        if result is None or not result[0]:
+            raise KeyError(key)
+
+        return result[1]
+
     def _flag_field(self, field):
         from aiida.backends.sqlalchemy.utils import flag_modified
         flag_modified(self._dbmodel, field)
@@ -311,7 +311,13 @@ class SqlaQueryBuilder(BackendQueryBuilder):
         if column is None:
             column = self.get_column(column_name, alias)
 
-        database_entity = column[tuple(attr_key)]
+        # A single key is accessed with the `->` operator instead of a path, such that the expression matches the one of
+        # the expression indexes on the JSONB values of keys of the attributes
+        if len(attr_key) == 1:
+            database_entity = column[attr_key[0]]
+        else:
+            database_entity = column[tuple(attr_key)]
+
         if operator == '==':
             type_filter, casted_entity = cast_according_to_type(database_entity, value)
             expr = case([(type_filter, casted_entity == value)], else_=False)
@@ -363,6 +369,11 @@ class SqlaQueryBuilder(BackendQueryBuilder):
                 else_=False)
         else:
             raise InputValidationError("Unknown operator {} for filters in JSON field".format(operator))
+
+        index_expr = self.get_filter_expr_from_jsonb_value(operator, value, database_entity)
+        if index_expr is not None:
+            expr = and_(index_expr, expr)
+
         return expr
 
     def get_projectable_attribute(self, alias, column_name, attrpath, cast=None, **kwargs):
@@ -476,6 +487,14 @@ class SqlaQueryBuilder(BackendQueryBuilder):
             self.get_session().rollback()
             raise
 
+    def iterrecords(self, query, batch_size):
+        try:
+            for row in query.yield_per(batch_size):
+                yield self.get_record(row)
+        except Exception:
+            self.get_session().rollback()
+            raise
+
     def iterdict(self, query, batch_size, tag_to_projected_properties_dict, tag_to_alias_map):
 
         def get_table_name(aliased_class):
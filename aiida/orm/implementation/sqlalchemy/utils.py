@@ -89,6 +89,23 @@ class ModelWrapper(object):
         """
         return self._model.id is not None
 
+    def is_field_loaded(self, field):
+        """Return whether the value of the field is loaded, such that getting it does not query the database.
+
+        Outside of a transaction, the mutable fields of a saved model are refreshed every time they are accessed. Within
+        a transaction, only the fields that were deferred or expired are loaded from the database.
+
+        :param field: the name of the model field
+        :return: boolean, True if the value of the field is available on the model instance, False otherwise
+        """
+        if not self.is_saved():
+            return True
+
+        if self._is_mutable_model_field(field) and not self._in_transaction():
+            return False
+
+        return field not in inspect(self._model).unloaded
+
     def save(self):
         """Store the model instance.
 
@@ -2461,29 +2461,19 @@ def export_tree(what, folder, allowed_licenses=None, forbidden_licenses=None,
               .format(sum(len(model_data) for model_data in export_data.values()),
                       len(all_nodes_pk)))
 
-    ## ATTRIBUTES
+    ## ATTRIBUTES AND EXTRAS
     if not silent:
-        print("STORING NODE ATTRIBUTES...")
+        print("STORING NODE ATTRIBUTES AND EXTRAS...")
     node_attributes = {}
-
-    # A second QueryBuilder query to get the attributes. See if this can be optimized
-    if len(all_nodes_pk) > 0:
-        all_nodes_query = QueryBuilder()
-        all_nodes_query.append(Node, filters={"id": {"in": all_nodes_pk}}, project=["*"])
-        for res in all_nodes_query.iterall():
-            node_attributes[str(res[0].pk)] = res[0].attributes
-
-    ## EXTRAS
-    if not silent:
-        print("STORING NODE EXTRAS...")
     node_extras = {}
 
-    # A second QueryBuilder query to get the extras. See if this can be optimized
+    # Project the columns as plain records, such that no nodes are constructed and the dictionaries are not copied
     if len(all_nodes_pk) > 0:
         all_nodes_query = QueryBuilder()
-        all_nodes_query.append(Node, filters={"id": {"in": all_nodes_pk}}, project=["*"])
-        for res in all_nodes_query.iterall():
-            node_extras[str(res[0].pk)] = res[0].extras
+        all_nodes_query.append(Node, filters={"id": {"in": all_nodes_pk}}, project=["id", "attributes", "extras"])
+        for pk, attributes, extras in all_nodes_query.iterrecords():
+            node_attributes[str(pk)] = attributes
+            node_extras[str(pk)] = extras
 
     if not silent:
         print("STORING NODE LINKS...")
@@ -23,6 +23,7 @@ from aiida.common.hashing import make_hash, _HASH_EXTRA_KEY
 from aiida.common.lang import classproperty, type_check
 from aiida.common.links import LinkType
 from aiida.manage.manager import get_manager
+from aiida.orm.utils.identity import get_identity_map
 from aiida.orm.utils.links import LinkManager, LinkTriple
 from aiida.orm.utils.repository import Repository
 from aiida.orm.utils.node import AbstractNodeMeta, validate_attribute_extra_key
@@ -100,6 +101,7 @@ class Node(Entity):
 
     # These are to be initialized in the `initialization` method
     _incoming_cache = None
+    _prefetched_links = None
     _repository = None
 
     @classmethod
@@ -151,6 +153,9 @@ class Node(Entity):
         # A cache of incoming links represented as a list of LinkTriples instances
         self._incoming_cache = list()
 
+        # The stored links that were prefetched for each link direction, see `prefetch_links`
+        self._prefetched_links = dict()
+
         # Calls the initialisation from the RepositoryMixin
         self._repository = Repository(uuid=self.uuid, is_stored=self.is_stored, base_path=self._repository_base_path)
 
@@ -765,6 +770,8 @@ class Node(Entity):
 
         if self.is_stored and source.is_stored:
             self.backend_entity.add_incoming(source.backend_entity, link_type, link_label)
+            self._prefetched_links.pop('incoming', None)
+            source._prefetched_links.pop('outgoing', None)  # pylint: disable=protected-access
         else:
             self._add_incoming_cache(source, link_type, link_label)
 
@@ -846,6 +853,11 @@ class Node(Entity):
         if link_type and not all([isinstance(t, LinkType) for t in link_type]):
             raise TypeError('link_type should be a LinkType or tuple of LinkType: got {}'.format(link_type))
 
+        link_triples = self._get_prefetched_link_triples(node_class, link_type, link_label_filter, link_direction)
+
+        if link_triples is not None:
+            return link_triples
+
         node_class = node_class or Node
         node_filters = {'id': {'==': self.id}}
         edge_filters = {}
@@ -876,6 +888,45 @@ class Node(Entity):
 
         return [LinkTriple(entry[0], LinkType(entry[1]), entry[2]) for entry in builder.all()]
 
+    def prefetch_links(self, link_direction='outgoing', link_type=()):
+        """Load the stored links in the given direction with a single query and keep them on this node.
+
+        Subsequent calls to `get_incoming` or `get_outgoing` for a subset of the prefetched link types, including those
+        made by the `inputs` and `outputs` managers, no longer query the database. Combined with an identity map, see
+        :py:mod:`aiida.orm.utils.identity`, the neighbors are the same instances as those loaded elsewhere.
+
+        :param link_direction: `incoming` or `outgoing` to prefetch the incoming or outgoing links, respectively
+        :param link_type: a `LinkType` or tuple of `LinkType` to prefetch, if empty all link types are prefetched
+        :return: self
+        """
+        from aiida.orm.utils.links import prefetch_links
+        prefetch_links([self], link_direction, link_type)
+        return self
+
+    def _get_prefetched_link_triples(self, node_class, link_type, link_label_filter, link_direction):
+        """Return the stored link triples that match the given filters from the prefetched links.
+
+        :param node_class: if specified, a class or tuple of classes of which the linked nodes should be instances
+        :param link_type: tuple of `LinkType`, if empty then links of all types are returned
+        :param link_label_filter: if specified, a pattern for the link labels as for the `like` operator
+        :param link_direction: `incoming` or `outgoing`
+        :return: list of `LinkTriple` or None if the requested links have not been prefetched
+        """
+        try:
+            prefetched_link_types, link_triples = self._prefetched_links[link_direction]
+        except KeyError:
+            return None
+
+        if prefetched_link_types and (not link_type or not prefetched_link_types.issuperset(link_type)):
+            return None
+
+        return [
+            link_triple for link_triple in link_triples
+            if (not link_type or link_triple.link_type in link_type) and
+            (node_class is None or isinstance(link_triple.node, node_class)) and
+            (not link_label_filter or sql_string_match(string=link_triple.link_label, pattern=link_label_filter))
+        ]
+
     def get_incoming(self, node_class=None, link_type=(), link_label_filter=None):
         """Return a list of link triples that are (directly) incoming into this node.
 
@@ -990,19 +1041,15 @@ class Node(Entity):
             else:
                 self._store(with_transaction=with_transaction, clean=True)
 
-            # Set up autogrouping used by verdi run
-            from aiida.orm.autogroup import current_autogroup, Autogroup, VERDIAUTOGROUP_TYPE
-            from aiida.orm import Group
+            # Set up autogrouping used by verdi run: the membership is buffered and written in bulk by the autogroup
+            from aiida.orm.autogroup import current_autogroup, Autogroup
 
             if current_autogroup is not None:
                 if not isinstance(current_autogroup, Autogroup):
                     raise exceptions.ValidationError('`current_autogroup` is not of type `Autogroup`')
 
                 if current_autogroup.is_to_be_grouped(self):
-                    group_label = current_autogroup.get_group_name()
-                    if group_label is not None:
-                        group = Group.objects.get_or_create(label=group_label, type_string=VERDIAUTOGROUP_TYPE)[0]
-                        group.add_nodes(self)
+                    current_autogroup.add_node(self)
 
         return self
 
@@ -1025,6 +1072,14 @@ class Node(Entity):
             self._repository.restore()
             raise
 
+        for link_triple in links:
+            link_triple.node._prefetched_links.pop('outgoing', None)  # pylint: disable=protected-access
+
+        identity_map = get_identity_map()
+
+        if identity_map is not None:
+            identity_map.add(self)
+
         self._incoming_cache = list()
         self._backend_entity.set_extra(_HASH_EXTRA_KEY, self.get_hash())
 
@@ -93,6 +93,14 @@ class CalcJobNode(CalculationNode):
             cls.SCHEUDLER_LAST_JOB_INFO_KEY,
         )
 
+    @classproperty
+    def _bufferable_attributes(cls):  # pylint: disable=no-self-argument
+        return super(CalcJobNode, cls)._bufferable_attributes + (
+            cls.SCHEDULER_STATE_KEY,
+            cls.SCHEDULER_LAST_CHECK_TIME_KEY,
+            cls.SCHEUDLER_LAST_JOB_INFO_KEY,
+        )
+
     @classproperty
     def _hash_ignored_attributes(cls):  # pylint: disable=no-self-argument
         return super(CalcJobNode, cls)._hash_ignored_attributes + (
@@ -12,19 +12,24 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
+import copy
 import enum
 import six
 
 from plumpy import ProcessState
 
+from aiida.common import exceptions
+from aiida.common.lang import classproperty, override
 from aiida.common.links import LinkType
-from aiida.common.lang import classproperty
 from aiida.orm.utils.mixins import Sealable
 
 from ..node import Node
 
 __all__ = ('ProcessNode',)
 
+# Marker in the attribute buffer for an attribute that is to be deleted
+_DELETED = object()
+
 
 class ProcessNode(Sealable, Node):
     """
@@ -39,6 +44,7 @@ class ProcessNode(Sealable, Node):
     # pylint: disable=too-many-public-methods,abstract-method
 
     CHECKPOINT_KEY = 'checkpoints'
+    CHECKPOINT_CONTEXT_KEY = 'checkpoint_context'
     EXCEPTION_KEY = 'exception'
     EXIT_MESSAGE_KEY = 'exit_message'
     EXIT_STATUS_KEY = 'exit_status'
@@ -68,6 +74,7 @@ class ProcessNode(Sealable, Node):
         return super(ProcessNode, cls)._updatable_attributes + (
             cls.PROCESS_PAUSED_KEY,
             cls.CHECKPOINT_KEY,
+            cls.CHECKPOINT_CONTEXT_KEY,
             cls.EXCEPTION_KEY,
             cls.EXIT_MESSAGE_KEY,
             cls.EXIT_STATUS_KEY,
@@ -76,6 +83,157 @@ class ProcessNode(Sealable, Node):
             cls.PROCESS_STATUS_KEY,
         )
 
+    @classproperty
+    def _bufferable_attributes(cls):
+        """Return the attributes whose updates are held back in memory while the attribute buffer is enabled."""
+        # pylint: disable=no-self-argument
+        return (
+            cls.PROCESS_STATE_KEY,
+            cls.PROCESS_STATUS_KEY,
+        )
+
+    _attribute_buffer = None
+    _attribute_buffer_callback = None
+
+    def enable_attribute_buffer(self, callback=None):
+        """Hold back the updates of the bufferable attributes in memory until the buffer is flushed.
+
+        The process state and status of a running process are updated many times during its lifetime and writing each
+        update separately costs a database statement every time. While the buffer is enabled, these updates are only
+        written when :meth:`flush_attribute_buffer` is called, or together with the next update of any other attribute,
+        which is written immediately as before. Reading an attribute through :meth:`get_attribute` takes the buffer
+        into account.
+
+        :param callback: optional callable that is called without arguments when the buffer goes from empty to
+            containing pending updates, which can be used to schedule a flush after a maximum interval
+        :raise aiida.common.ModificationNotAllowed: if the node is not stored
+        """
+        if not self.is_stored:
+            raise exceptions.ModificationNotAllowed('the attribute buffer can only be enabled for stored nodes')
+
+        if self._attribute_buffer is None:
+            self._attribute_buffer = {}
+
+        self._attribute_buffer_callback = callback
+
+    def disable_attribute_buffer(self):
+        """Flush the pending attribute updates and write any further update immediately."""
+        self.flush_attribute_buffer()
+        self._attribute_buffer = None
+        self._attribute_buffer_callback = None
+
+    @property
+    def is_attribute_buffer_pending(self):
+        """Return whether there are buffered attribute updates that have not yet been written to the database.
+
+        :return: boolean
+        """
+        return bool(self._attribute_buffer)
+
+    def flush_attribute_buffer(self):
+        """Write all the pending attribute updates to the database."""
+        if not self._attribute_buffer:
+            return
+
+        buffered, self._attribute_buffer = self._attribute_buffer, {}
+
+        attributes = {key: value for key, value in buffered.items() if value is not _DELETED}
+        deleted = [key for key, value in buffered.items() if value is _DELETED]
+
+        if attributes:
+            self.backend_entity.set_attribute_many(attributes)
+
+        if deleted:
+            existing = set(self.backend_entity.attributes_keys())
+            deleted = [key for key in deleted if key in existing]
+            if deleted:
+                self.backend_entity.delete_attribute_many(deleted)
+
+    def _buffer_attribute(self, key, value):
+        """Add an attribute update to the buffer.
+
+        :param key: name of the attribute
+        :param value: value of the attribute or the `_DELETED` marker
+        """
+        if self.is_sealed:
+            raise exceptions.ModificationNotAllowed('attributes of a sealed node are immutable')
+
+        notify = not self._attribute_buffer
+        self._attribute_buffer[key] = value
+
+        if notify and self._attribute_buffer_callback is not None:
+            self._attribute_buffer_callback()
+
+    @override
+    def get_attribute(self, key, *args, **kwargs):
+        """Return the value of an attribute, taking pending updates in the attribute buffer into account.
+
+        :param key: name of the attribute
+        :param default: return this value instead of raising if the attribute does not exist
+        :return: the value of the attribute
+        :raises AttributeError: if the attribute does not exist and no default is specified
+        """
+        if self._attribute_buffer and key in self._attribute_buffer:
+            value = self._attribute_buffer[key]
+
+            if value is not _DELETED:
+                return copy.deepcopy(value)
+
+            if args or 'default' in kwargs:
+                return args[0] if args else kwargs['default']
+
+            raise AttributeError('attribute `{}` does not exist'.format(key))
+
+        return super(ProcessNode, self).get_attribute(key, *args, **kwargs)
+
+    @override
+    def set_attribute(self, key, value):
+        """Set an attribute to the given value.
+
+        If the attribute buffer is enabled, updates of bufferable attributes are held back, while any other update is
+        written immediately together with all pending updates.
+
+        :param key: name of the attribute
+        :param value: value of the attribute
+        """
+        if self._attribute_buffer is None:
+            return super(ProcessNode, self).set_attribute(key, value)
+
+        if key not in self._updatable_attributes:
+            raise exceptions.ModificationNotAllowed('`{}` is not an updatable attribute'.format(key))
+
+        self._buffer_attribute(key, value)
+
+        if key not in self._bufferable_attributes:
+            self.flush_attribute_buffer()
+
+    @override
+    def delete_attribute(self, key):
+        """Delete an attribute.
+
+        If the attribute buffer is enabled, deletions of bufferable attributes are held back, while any other deletion
+        is executed immediately after all pending updates are written.
+
+        :param key: name of the attribute
+        :raises AttributeError: if the attribute does not exist
+        """
+        if self._attribute_buffer is None:
+            return super(ProcessNode, self).delete_attribute(key)
+
+        if key not in self._bufferable_attributes:
+            self.flush_attribute_buffer()
+            return super(ProcessNode, self).delete_attribute(key)
+
+        # This raises `AttributeError` if the attribute does not exist or already has a pending deletion
+        self.get_attribute(key)
+        self._buffer_attribute(key, _DELETED)
+
+    @override
+    def seal(self):
+        """Seal the node, writing any pending attribute updates first."""
+        self.flush_attribute_buffer()
+        super(ProcessNode, self).seal()
+
     @property
     def logger(self):
         """
@@ -368,22 +526,48 @@ class ProcessNode(Sealable, Node):
         """
         return self.get_attribute(self.CHECKPOINT_KEY, None)
 
-    def set_checkpoint(self, checkpoint):
+    @property
+    def checkpoint_context(self):
+        """
+        Return the serialized entries of the context that are stored separately from the checkpoint bundle
+
+        :returns: dictionary of the serialized context entries if it exists, None otherwise
+        """
+        return self.get_attribute(self.CHECKPOINT_CONTEXT_KEY, None)
+
+    def set_checkpoint(self, checkpoint, context=None):
         """
         Set the checkpoint bundle set for the process
 
-        :param state: string representation of the stepper state info
+        If the serialized entries of the context are given, they are written together with the checkpoint bundle.
+
+        :param checkpoint: string representation of the stepper state info
+        :param context: optional dictionary of the serialized context entries
         """
-        return self.set_attribute(self.CHECKPOINT_KEY, checkpoint)
+        if context is None:
+            return self.set_attribute(self.CHECKPOINT_KEY, checkpoint)
+
+        attributes = {self.CHECKPOINT_KEY: checkpoint, self.CHECKPOINT_CONTEXT_KEY: context}
+
+        if self._attribute_buffer is None:
+            if self.is_sealed:
+                raise exceptions.ModificationNotAllowed('attributes of a sealed node are immutable')
+            return self.backend_entity.set_attribute_many(attributes)
+
+        for key, value in attributes.items():
+            self._buffer_attribute(key, value)
+
+        return self.flush_attribute_buffer()
 
     def delete_checkpoint(self):
         """
-        Delete the checkpoint bundle set for the process
+        Delete the checkpoint bundle set for the process, as well as the context entries that are stored separately
         """
-        try:
-            self.delete_attribute(self.CHECKPOINT_KEY)
-        except AttributeError:
-            pass
+        for key in (self.CHECKPOINT_KEY, self.CHECKPOINT_CONTEXT_KEY):
+            try:
+                self.delete_attribute(key)
+            except AttributeError:
+                pass
 
     @property
     def paused(self):
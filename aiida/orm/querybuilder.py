@@ -25,12 +25,13 @@ from __future__ import print_function
 # Checking for correct input with the inspect module
 from inspect import isclass as inspect_isclass
 import copy
+import decimal
 import logging
 import six
 from six.moves import range, zip
-from sqlalchemy import and_, or_, not_, func as sa_func, select, join
-from sqlalchemy.types import Integer
-from sqlalchemy.orm import aliased
+from sqlalchemy import and_, or_, not_, func as sa_func, inspect as sa_inspect, select, join
+from sqlalchemy.types import Float, Integer
+from sqlalchemy.orm import aliased, Load
 from sqlalchemy.sql.expression import cast
 from sqlalchemy.dialects.postgresql import array
 
@@ -285,7 +286,10 @@ class QueryBuilder(object):
     # This tag defines how edges are tagged (labeled) by the QueryBuilder default
     # namely tag of first entity + _EDGE_TAG_DELIM + tag of second entity
     _EDGE_TAG_DELIM = '--'
-    _VALID_PROJECTION_KEYS = ('func', 'cast')
+    _VALID_PROJECTION_KEYS = ('func', 'cast', 'defer')
+    # Columns of nodes that are not loaded when projecting the entity, unless specified otherwise with `defer`
+    _DEFAULT_DEFERRED_NODE_COLUMNS = ('attributes', 'extras')
+    _VALID_PROJECTION_FUNCTIONS = ('count', 'sum', 'avg', 'min', 'max', 'array_agg')
 
     def __init__(self, backend=None, **kwargs):
         """
@@ -316,6 +320,9 @@ class QueryBuilder(object):
         :param order_by:
             How to order the results. As the 2 above, can be set also at later stage,
             check :func:`QueryBuilder.order_by` for more information.
+        :param group_by:
+            How to group the results to compute aggregates per group, can be set also at later stage,
+            check :func:`QueryBuilder.group_by` for more information.
 
         """
         backend = backend or get_manager().get_backend()
@@ -418,10 +425,16 @@ class QueryBuilder(object):
         if order_spec:
             self.order_by(order_spec)
 
+        # The user can also specify columns to group by, to compute aggregates per group.
+        self._group_by = []
+        group_spec = kwargs.pop('group_by', None)
+        if group_spec:
+            self.group_by(group_spec)
+
         # I've gone through all the keywords, popping each item
         # If kwargs is not empty, there is a problem:
         if kwargs:
-            valid_keys = ('path', 'filters', 'project', 'limit', 'offset', 'order_by')
+            valid_keys = ('path', 'filters', 'project', 'limit', 'offset', 'order_by', 'group_by')
             raise InputValidationError("Received additional keywords: {}"
                                        "\nwhich I cannot process"
                                        "\nValid keywords are: {}"
@@ -959,6 +972,70 @@ class QueryBuilder(object):
             self._order_by.append(_order_spec)
         return self
 
+    def group_by(self, group_by):
+        """
+        Set the entities to group by, such that aggregate functions in the projections are computed per group
+
+        :param group_by:
+            A dictionary, or list of dictionaries, where keys are valid tags of entities and values are the list of
+            columns or attributes to group by. An item in that list is either a string or a dictionary with the key
+            `cast`, to cast an attribute before grouping on it.
+
+        Projections of an entity that is grouped by have to be either one of the grouping items, with the same cast, or
+        an aggregate, i.e. projected with a `func` out of `count`, `sum`, `avg`, `min`, `max` and `array_agg`. Except
+        for `count` and `array_agg`, aggregates of attributes require a cast to the type on which they operate.
+
+        Usage::
+
+            # Number of processes and their maximum exit status per process label
+            qb = QueryBuilder()
+            qb.append(ProcessNode, tag='process', project=[
+                'attributes.process_label', {'id': {'func': 'count'}}, {'attributes.exit_status': {'func': 'max'}}])
+            qb.group_by({'process': ['attributes.process_label']})
+
+            # Minimum and average of a float attribute per value of another attribute
+            qb = QueryBuilder()
+            qb.append(Dict, tag='dict', project=[
+                {'attributes.formula': {'cast': 't'}},
+                {'attributes.energy': {'func': 'min', 'cast': 'f'}},
+            ])
+            qb.group_by({'dict': [{'attributes.formula': {'cast': 't'}}]})
+        """
+        self._group_by = []
+        allowed_keys = ('cast',)
+
+        if not isinstance(group_by, (list, tuple)):
+            group_by = [group_by]
+
+        for group_spec in group_by:
+            if not isinstance(group_spec, dict):
+                raise InputValidationError('Invalid input for group_by statement: {}, '
+                                           'expected a dictionary of tags and columns to group by'.format(group_spec))
+            _group_spec = {}
+            for tagspec, items_to_group_by in group_spec.items():
+                if not isinstance(items_to_group_by, (tuple, list)):
+                    items_to_group_by = [items_to_group_by]
+                tag = self._get_tag_from_specification(tagspec)
+                _group_spec[tag] = []
+                for item_to_group_by in items_to_group_by:
+                    if isinstance(item_to_group_by, six.string_types):
+                        item_to_group_by = {item_to_group_by: {}}
+                    elif not isinstance(item_to_group_by, dict):
+                        raise InputValidationError('Cannot deal with input to group_by {} of type {}'.format(
+                            item_to_group_by, type(item_to_group_by)))
+                    for entityname, groupspec in item_to_group_by.items():
+                        if not isinstance(groupspec, dict):
+                            raise InputValidationError('Expected a dictionary for the group_by specification of {}, '
+                                                       'got {}'.format(entityname, groupspec))
+                        for key in groupspec.keys():
+                            if key not in allowed_keys:
+                                raise InputValidationError('The allowed keys for a group_by specification are {}, '
+                                                           '{} is not valid'.format(', '.join(allowed_keys), key))
+                    _group_spec[tag].append(item_to_group_by)
+
+            self._group_by.append(_group_spec)
+        return self
+
     def add_filter(self, tagspec, filter_spec):
         """
         Adding a filter to my filters.
@@ -1080,6 +1157,16 @@ class QueryBuilder(object):
             print type(qb.first()[0])
             # >>> aiida.orm.nodes.data.structure.StructureData
 
+        When projecting the ORM instance of a node, its `attributes` and `extras` are not loaded with the query, but
+        only when they are first accessed. This avoids loading large attributes of nodes when only, for example, their
+        labels are needed. The columns that are deferred can be specified with the `defer` key, where an empty list
+        loads all columns eagerly::
+
+            qb = QueryBuilder()
+            qb.append(StructureData, tag='struc')
+            # Will project the ORM instance and load its attributes with the query
+            qb.add_projection('struc', {'*': {'defer': ['extras']}})
+
         The double star ``**`` projects all possible projections of this entity:
 
             QueryBuilder().append(StructureData,tag='s', project='**').limit(1).dict()[0]['s'].keys()
@@ -1113,7 +1200,13 @@ class QueryBuilder(object):
                 for key, val in spec.items():
                     if key not in self._VALID_PROJECTION_KEYS:
                         raise InputValidationError("{} is not a valid key {}".format(key, self._VALID_PROJECTION_KEYS))
-                    if not isinstance(val, six.string_types):
+                    if key == 'defer':
+                        if p != '*':
+                            raise InputValidationError("columns can only be deferred when projecting '*'")
+                        if not isinstance(val, (list, tuple)) or not all(
+                                isinstance(column, six.string_types) for column in val):
+                            raise InputValidationError("{} has to be a list of column names".format(val))
+                    elif not isinstance(val, six.string_types):
                         raise InputValidationError("{} has to be a string".format(val))
             _projections.append(_thisprojection)
         if self._debug:
@@ -1127,7 +1220,7 @@ class QueryBuilder(object):
             entity = self._impl.get_column(column_name, alias)
         return entity
 
-    def _add_to_projections(self, alias, projectable_entity_name, cast=None, func=None):
+    def _add_to_projections(self, alias, projectable_entity_name, cast=None, func=None, defer=None):
         """
         :param alias: A instance of *sqlalchemy.orm.util.AliasedClass*, alias for an ormclass
         :type alias: :class:`sqlalchemy.orm.util.AliasedClass`
@@ -1135,6 +1228,8 @@ class QueryBuilder(object):
             User specification of what to project.
             Appends to query's entities what the user wants to project
             (have returned by the query)
+        :param defer: the columns that are not loaded when projecting the entity, if None the default deferred columns
+            of the entity are used
 
         """
         column_name = projectable_entity_name.split('.')[0]
@@ -1147,16 +1242,23 @@ class QueryBuilder(object):
                                            "will not work!\n"
                                            "I suggest you apply functions on a column, e.g. ('id')\n")
             self._query = self._query.add_entity(alias)
+
+            if defer is None:
+                is_node = sa_inspect(alias).mapper.class_ is self._impl.Node
+                defer = self._DEFAULT_DEFERRED_NODE_COLUMNS if is_node else ()
+
+            for column_name in defer:
+                # Raises if the column does not exist, before SqlAlchemy raises a less informative exception
+                self._impl.get_column(column_name, alias)
+                self._query = self._query.options(Load(alias).defer(column_name))
         else:
             entity_to_project = self._get_projectable_entity(alias, column_name, attr_key, cast=cast)
             if func is None:
                 pass
-            elif func == 'max':
-                entity_to_project = sa_func.max(entity_to_project)
-            elif func == 'min':
-                entity_to_project = sa_func.max(entity_to_project)
-            elif func == 'count':
-                entity_to_project = sa_func.count(entity_to_project)
+            elif func == 'avg':
+                entity_to_project = sa_func.avg(entity_to_project, type_=Float)
+            elif func in self._VALID_PROJECTION_FUNCTIONS:
+                entity_to_project = getattr(sa_func, func)(entity_to_project)
             else:
                 raise InputValidationError("\nInvalid function specification {}".format(func))
             self._query = self._query.add_columns(entity_to_project)
@@ -1774,6 +1876,7 @@ class QueryBuilder(object):
             'filters': self._filters,
             'project': self._projections,
             'order_by': self._order_by,
+            'group_by': self._group_by,
             'limit': self._limit,
             'offset': self._offset,
         })
@@ -1890,6 +1993,17 @@ class QueryBuilder(object):
                 if edge_tag is not None:
                     self._build_projections(edge_tag)
 
+        # GROUP BY #############################
+        for group_spec in self._group_by:
+            for tag, entities in group_spec.items():
+                alias = self.tag_to_alias_map[tag]
+                for entitydict in entities:
+                    for entitytag, entityspec in entitydict.items():
+                        column_name = entitytag.split('.')[0]
+                        attrpath = entitytag.split('.')[1:]
+                        entity = self._get_projectable_entity(alias, column_name, attrpath, **entityspec)
+                        self._query = self._query.group_by(entity)
+
         # ORDER ################################
         for order_spec in self._order_by:
             for tag, entities in order_spec.items():
@@ -2059,11 +2173,15 @@ class QueryBuilder(object):
     def get_aiida_entity_res(value):
         """Convert a projected query result to front end class if it is an instance of a `BackendEntity`.
 
-        Values that are not an `BackendEntity` instance will be returned unaltered
+        Values that are not an `BackendEntity` instance will be returned unaltered, except for decimals, which are
+        returned for aggregates like the `sum` of integers and are converted to an integer or float.
 
         :param value: a projected query result to convert
         :return: the converted value
         """
+        if isinstance(value, decimal.Decimal):
+            return int(value) if value == value.to_integral_value() else float(value)
+
         try:
             return convert.get_orm_entity(value)
         except TypeError:
@@ -2199,6 +2317,55 @@ class QueryBuilder(object):
 
             yield item
 
+    def iterrecords(self, batch_size=100):
+        """
+        Same as :meth:`.records`, but returns a generator.
+        Be aware that this is only safe if no commit will take place during this
+        transaction. You might also want to read the SQLAlchemy documentation on
+        http://docs.sqlalchemy.org/en/latest/orm/query.html#sqlalchemy.orm.query.Query.yield_per
+
+
+        :param int batch_size:
+            The size of the batches to ask the backend to batch results in subcollections.
+            You can optimize the speed of the query by tuning this parameter.
+
+        :returns: a generator of tuples
+        """
+        query = self.get_query()
+
+        if '*' in self._attrkeys_as_in_sql_result.values():
+            raise InputValidationError('records can only be returned for projected columns and attributes, not for '
+                                       'entities projected with `*`')
+
+        for record in self._impl.iterrecords(query, batch_size):
+            yield record
+
+    def records(self, batch_size=None):
+        """
+        Executes the full query and returns the projected values as plain records.
+
+        Contrary to :meth:`.all`, no entities are constructed and the values are returned as they are loaded from the
+        database, except for UUIDs and decimals that are converted to strings and numbers. In particular, the
+        dictionaries of projected `attributes` or `extras` are neither copied nor cleaned. This makes it the fastest way
+        to retrieve large numbers of column values, but it can therefore not be used when projecting entire entities
+        with `*`::
+
+            qb = QueryBuilder()
+            qb.append(Node, project=['id', 'attributes'])
+            for pk, attributes in qb.records():
+                ...
+
+        :param int batch_size:
+            The size of the batches to ask the backend to batch results in subcollections.
+            You can optimize the speed of the query by tuning this parameter.
+            Leave the default (*None*) if speed is not critical or if you don't know
+            what you're doing!
+
+        :returns: a list of tuples of all projected values.
+        :raises InputValidationError: if an entity is projected with `*`
+        """
+        return list(self.iterrecords(batch_size=batch_size))
+
     def all(self, batch_size=None):
         """
         Executes the full query with the order of the rows as returned by the backend.
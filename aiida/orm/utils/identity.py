@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Identity map that makes sure that each stored node is represented by a single instance within a session.
+
+By default, every query that returns a node constructs a new instance, even if the same node was loaded before. Within
+the `identity_map` context manager, the stored nodes that are loaded or stored are registered by their pk and loading
+the same node again returns the registered instance, including the links that were prefetched for it. Since the
+registered instances are not refreshed, the identity map should only be used for sessions in which the same nodes are
+not modified concurrently by other interpreters, for example while parsing the outputs of a calculation.
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import contextlib
+import threading
+
+__all__ = ('IdentityMap', 'identity_map', 'get_identity_map')
+
+_LOCAL = threading.local()
+
+
+class IdentityMap(object):  # pylint: disable=useless-object-inheritance
+    """Mapping of the pk of stored nodes onto the node instance that represents them."""
+
+    def __init__(self):
+        self._nodes = {}
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, pk):
+        return pk in self._nodes
+
+    def get(self, pk):
+        """Return the registered instance for the given pk.
+
+        :param pk: the pk of the node
+        :return: the node instance or None if no instance is registered for the pk
+        """
+        return self._nodes.get(pk, None)
+
+    def add(self, node):
+        """Register the given stored node, unless an instance is already registered for its pk.
+
+        :param node: a stored node
+        :return: the registered instance for the pk of the node
+        """
+        return self._nodes.setdefault(node.pk, node)
+
+    def discard(self, pk):
+        """Remove the instance registered for the given pk, if any.
+
+        :param pk: the pk of the node
+        """
+        self._nodes.pop(pk, None)
+
+    def clear(self):
+        """Remove all registered instances."""
+        self._nodes.clear()
+
+
+def get_identity_map():
+    """Return the identity map that is active in the current thread.
+
+    :return: the active `IdentityMap` or None if no identity map is active
+    """
+    return getattr(_LOCAL, 'identity_map', None)
+
+
+@contextlib.contextmanager
+def identity_map():
+    """Context manager that activates an identity map for the current thread.
+
+    Nested use of the context manager reuses the identity map of the outermost context.
+
+    :return: the active `IdentityMap`
+    """
+    current = get_identity_map()
+
+    if current is not None:
+        yield current
+        return
+
+    _LOCAL.identity_map = IdentityMap()
+
+    try:
+        yield _LOCAL.identity_map
+    finally:
+        _LOCAL.identity_map = None
@@ -17,7 +17,7 @@ from collections import namedtuple, OrderedDict, Mapping
 from aiida.common import exceptions
 from aiida.common.lang import type_check
 
-__all__ = ('LinkPair', 'LinkTriple', 'LinkManager', 'validate_link')
+__all__ = ('LinkPair', 'LinkTriple', 'LinkManager', 'validate_link', 'prefetch_links')
 
 LinkPair = namedtuple('LinkPair', ['link_type', 'link_label'])
 LinkTriple = namedtuple('LinkTriple', ['node', 'link_type', 'link_label'])
@@ -157,6 +157,57 @@ def validate_link(source, target, link_type, link_label):
             target.uuid, link_type, link_label, source.uuid))
 
 
+def prefetch_links(nodes, link_direction='outgoing', link_type=()):
+    """Load the links in the given direction of all the given nodes with a single query and keep them on the nodes.
+
+    Subsequent calls to `get_incoming` or `get_outgoing` of the nodes, as well as the `inputs` and `outputs` managers
+    of process nodes, are then answered from memory, as long as the requested link types are a subset of the
+    prefetched ones. The prefetched links of a node are discarded when a link in that direction is added to it.
+
+    :param nodes: an iterable of nodes, unstored nodes are ignored since they do not have stored links
+    :param link_direction: `incoming` or `outgoing` to prefetch the incoming or outgoing links, respectively
+    :param link_type: a `LinkType` or tuple of `LinkType` to prefetch, if empty the links of all types are prefetched
+    :raise ValueError: if the link direction is invalid
+    :raise TypeError: if the link type is not a `LinkType` or tuple of `LinkType`
+    """
+    # pylint: disable=protected-access
+    from aiida.common.links import LinkType
+    from aiida.orm import Node, QueryBuilder
+
+    if link_direction not in ('incoming', 'outgoing'):
+        raise ValueError('link_direction should be `incoming` or `outgoing`, got: {}'.format(link_direction))
+
+    if not isinstance(link_type, tuple):
+        link_type = (link_type,)
+
+    if link_type and not all([isinstance(entry, LinkType) for entry in link_type]):
+        raise TypeError('link_type should be a LinkType or tuple of LinkType: got {}'.format(link_type))
+
+    nodes = {node.pk: node for node in nodes if node.is_stored}
+
+    if not nodes:
+        return
+
+    link_triples = {pk: [] for pk in nodes}
+    edge_filters = {}
+
+    if link_type:
+        edge_filters['type'] = {'in': [entry.value for entry in link_type]}
+
+    relationship = 'with_incoming' if link_direction == 'outgoing' else 'with_outgoing'
+
+    builder = QueryBuilder()
+    builder.append(Node, filters={'id': {'in': list(nodes)}}, project=['id'], tag='main')
+    builder.append(Node, project=['*'], edge_project=['type', 'label'], edge_filters=edge_filters,
+                   **{relationship: 'main'})
+
+    for pk, neighbor, neighbor_link_type, link_label in builder.iterall():
+        link_triples[pk].append(LinkTriple(neighbor, LinkType(neighbor_link_type), link_label))
+
+    for pk, node in nodes.items():
+        node._prefetched_links[link_direction] = (frozenset(link_type), link_triples[pk])
+
+
 class LinkManager(object):  # pylint: disable=useless-object-inheritance
     """
     Class to convert a list of LinkTriple tuples into an iterator.
@@ -175,6 +226,7 @@ class LinkManager(object):  # pylint: disable=useless-object-inheritance
     def __init__(self, link_triples):
         """Initialise the collection."""
         self.link_triples = link_triples
+        self._nodes_by_label = None
 
     def __iter__(self):
         """Return an iterator of LinkTriple instances.
@@ -260,22 +312,26 @@ class LinkManager(object):  # pylint: disable=useless-object-inheritance
     def get_node_by_label(self, label):
         """Return the node from list for given label.
 
+        The nodes are indexed by their link label the first time this is called, such that looking up many labels in
+        the same collection does not scan the link triples each time.
+
         :return: node that corresponds to the given label
         :raises aiida.common.NotExistent: if the label is not present among the link_triples
         """
-        matching_entry = None
-        for entry in self.link_triples:
-            if entry.link_label == label:
-                if matching_entry is None:
-                    matching_entry = entry.node
-                else:
-                    raise exceptions.MultipleObjectsError(
-                        'more than one neighbor with the label {} found'.format(label))
-
-        if matching_entry is None:
+        if self._nodes_by_label is None:
+            self._nodes_by_label = {}
+            for entry in self.link_triples:
+                self._nodes_by_label.setdefault(entry.link_label, []).append(entry.node)
+
+        try:
+            matching_entries = self._nodes_by_label[label]
+        except KeyError:
             raise exceptions.NotExistent('no neighbor with the label {} found'.format(label))
 
-        return matching_entry
+        if len(matching_entries) > 1:
+            raise exceptions.MultipleObjectsError('more than one neighbor with the label {} found'.format(label))
+
+        return matching_entries[0]
 
     def nested(self, sort=True):
         """Construct (nested) dictionary of matched nodes that mirrors the original nesting of link namespaces.
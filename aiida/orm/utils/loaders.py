@@ -14,6 +14,7 @@ from __future__ import absolute_import
 
 from abc import ABCMeta
 from enum import Enum
+import string
 
 import six
 
@@ -125,21 +126,32 @@ class OrmEntityLoader(object):
 
         uuid = identifier.replace('-', '')
 
-        if query_with_dashes:
-            for dash_pos in [20, 16, 12, 8]:
-                if len(uuid) > dash_pos:
-                    uuid = '{}-{}'.format(uuid[:dash_pos], uuid[dash_pos:])
-
         builder = QueryBuilder()
         builder.append(cls=classes, tag='entity', project=['*'])
 
         # If a UUID can be constructed from the identifier, it is a full UUID and the query can use an equality operator
         try:
-            UUID(uuid)
+            builder.add_filter('entity', {'uuid': str(UUID(uuid))})
         except ValueError:
-            builder.add_filter('entity', {'uuid': {'like': '{}%'.format(uuid)}})
+            pass
         else:
-            builder.add_filter('entity', {'uuid': uuid})
+            return builder
+
+        # A partial UUID is matched with a range of UUIDs, which unlike matching the UUID as text with a `like`
+        # operator, can use the index on the UUID column. This works because UUIDs are ordered by their bytes.
+        if uuid and all(char in string.hexdigits for char in uuid) and len(uuid) < 32:
+            prefix = uuid.lower()
+            lower = str(UUID(prefix.ljust(32, '0')))
+            upper = str(UUID(prefix.ljust(32, 'f')))
+            builder.add_filter('entity', {'uuid': {'>=': lower, '<=': upper}})
+            return builder
+
+        if query_with_dashes:
+            for dash_pos in [20, 16, 12, 8]:
+                if len(uuid) > dash_pos:
+                    uuid = '{}-{}'.format(uuid[:dash_pos], uuid[dash_pos:])
+
+        builder.add_filter('entity', {'uuid': {'like': '{}%'.format(uuid)}})
 
         return builder
 
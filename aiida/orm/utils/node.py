@@ -31,6 +31,9 @@ from aiida.common.utils import strip_prefix  # pylint: disable=wrong-import-posi
 # therefore is not allowed in individual attribute or extra keys.
 FIELD_SEPARATOR = '.'
 
+# Node classes by type string, see `load_node_class`
+NODE_CLASS_CACHE = {}
+
 __all__ = ('load_node_class', 'get_type_string_from_class', 'get_query_type_from_type_string', 'AbstractNodeMeta',
            'validate_attribute_extra_key', 'clean_value')
 
@@ -39,6 +42,27 @@ def load_node_class(type_string):
     """
     Return the `Node` sub class that corresponds to the given type string.
 
+    The class is resolved once per type string and cached, since this is called for every node that is loaded from
+    the database. The cache is cleared by :py:func:`aiida.plugins.entry_point.reset_entry_point_cache`.
+
+    :param type_string: the `type` string of the node
+    :return: a sub class of `Node`
+    """
+    try:
+        return NODE_CLASS_CACHE[type_string]
+    except KeyError:
+        pass
+
+    node_class = _resolve_node_class(type_string)
+    NODE_CLASS_CACHE[type_string] = node_class
+
+    return node_class
+
+
+def _resolve_node_class(type_string):
+    """
+    Resolve the `Node` sub class that corresponds to the given type string.
+
     :param type_string: the `type` string of the node
     :return: a sub class of `Node`
     """
@@ -13,19 +13,26 @@ Serialisation functions for AiiDA types
 WARNING: Changing the representation of things here may break people's current saved e.g. things like
 checkpoints and messages in the RabbitMQ queue so do so with caution.  It is fine to add representers
 for new types though.
+
+Besides the yaml representation, there is a versioned compact representation based on JSON, that is used for the
+checkpoints of processes. Nodes are referenced by their pk, such that all of them can be loaded with a single query, and
+any value that JSON cannot represent is embedded as its yaml representation. The `deserialize` function accepts both.
 """
 from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
 from functools import partial
+import re
+
+import six
 import yaml
 
 from plumpy import Bundle
 from plumpy.utils import AttributesFrozendict
 
 from aiida import orm
-from aiida.common import AttributeDict
+from aiida.common import AttributeDict, json
 
 _NODE_TAG = '!aiida_node'
 _GROUP_TAG = '!aiida_group'
@@ -34,6 +41,35 @@ _ATTRIBUTE_DICT_TAG = '!aiida_attributedict'
 _PLUMPY_ATTRIBUTES_FROZENDICT_TAG = '!plumpy:attributes_frozendict'
 _PLUMPY_BUNDLE = '!plumpy:bundle'
 
+# Matches the uuids of all the nodes in a serialized string, such that they can be loaded with a single query
+_NODE_UUID_REGEX = re.compile(r'{}\s+[\'"]?([0-9a-f]{{8}}-(?:[0-9a-f]{{4}}-){{3}}[0-9a-f]{{12}})'.format(_NODE_TAG))
+
+# The version of the compact format, to be incremented for every change of the representation that is not backwards
+# compatible. The version is written on the first line of the serialized string, after the prefix.
+COMPACT_FORMAT_VERSION = 1
+_COMPACT_PREFIX = u'aiida-compact:'
+
+# The tags of the values that are not represented as themselves in the compact format. A tagged value is represented as
+# a dictionary with the tag as its only key.
+_COMPACT_NODE_TAG = '!node'
+_COMPACT_GROUP_TAG = '!group'
+_COMPACT_COMPUTER_TAG = '!computer'
+_COMPACT_TUPLE_TAG = '!tuple'
+_COMPACT_DICT_TAG = '!dict'
+_COMPACT_YAML_TAG = '!yaml'
+_COMPACT_MAPPING_TAGS = {
+    AttributeDict: '!attributedict',
+    AttributesFrozendict: '!attributes_frozendict',
+    Bundle: '!bundle',
+}
+
+# The types whose instances are represented as themselves in the compact format, instances of sub classes are not
+_COMPACT_SCALAR_TYPES = (type(None), bool, float, str, six.text_type) + six.integer_types
+
+# Use the LibYAML bindings if they are available, which are considerably faster than the pure python implementation
+_BaseDumper = getattr(yaml, 'CDumper', yaml.Dumper)  # pylint: disable=invalid-name
+_BaseLoader = getattr(yaml, 'CLoader', yaml.Loader)  # pylint: disable=invalid-name
+
 
 def represent_node(dumper, node):
     """Represent a node in yaml.
@@ -57,7 +93,12 @@ def node_constructor(loader, node):
     :rtype: :class:`aiida.orm.nodes.node.Node`
     """
     yaml_node = loader.construct_scalar(node)
-    return orm.load_node(uuid=yaml_node)
+    nodes = getattr(loader, 'nodes', None) or {}
+
+    try:
+        return nodes[yaml_node]
+    except KeyError:
+        return orm.load_node(uuid=yaml_node)
 
 
 def represent_group(dumper, group):
@@ -163,7 +204,7 @@ def bundle_constructor(loader, bundle):
     return bundle
 
 
-class AiiDADumper(yaml.Dumper):
+class AiiDADumper(_BaseDumper):
     """Custom AiiDA yaml dumper.
 
     Needed so that we don't have to encode each type in the AiiDA graph hierarchy separately using a custom representer.
@@ -180,8 +221,14 @@ class AiiDADumper(yaml.Dumper):
         return super(AiiDADumper, self).represent_data(data)
 
 
-class AiiDALoader(yaml.Loader):
-    """AiiDA specific yaml loader"""
+class AiiDALoader(_BaseLoader):
+    """AiiDA specific yaml loader.
+
+    The `nodes` attribute can be set to a dictionary of preloaded nodes, keyed on their uuid, that will be used by the
+    node constructor instead of loading each node separately.
+    """
+
+    nodes = None
 
 
 yaml.add_representer(Bundle, represent_bundle, Dumper=AiiDADumper)
@@ -215,10 +262,240 @@ def serialize(data, encoding=None):
     return serialized
 
 
+def serialize_compact(data):
+    """Serialize the given data structure into the compact representation.
+
+    Nodes, groups and computers are represented by their pk and values that cannot be represented in JSON, for example
+    sets or instances of custom classes, are embedded as their yaml representation.
+
+    :param data: the general data to serialize
+    :return: string representation of the serialized data structure
+    :raises ValueError: if the data contains an unstored node, group or computer
+    """
+    encoded = json.dumps(_encode_compact(data), separators=(',', ':'))
+    return u'{}{}\n{}'.format(_COMPACT_PREFIX, COMPACT_FORMAT_VERSION, encoded)
+
+
 def deserialize(serialized):
+    """Deserialize a string that represents a serialized data structure.
+
+    :param serialized: a string in the compact representation or a yaml serialized string representation
+    :return: the deserialized data structure
+    """
+    return deserialize_many([serialized])[0]
+
+
+def deserialize_many(serialized):
+    """Deserialize a list of strings that represent serialized data structures.
+
+    The nodes that are referenced by all the strings in the compact representation are loaded with a single query.
+
+    :param serialized: a list of strings in the compact representation or yaml serialized string representations
+    :return: list of the deserialized data structures
+    :raises ValueError: if a string in the compact representation has an unsupported version
+    """
+    decoded = [_parse_compact(string) for string in serialized]
+
+    pks = set()
+    for encoded in decoded:
+        if encoded is not _NOT_COMPACT:
+            _collect_compact_pks(encoded, pks)
+
+    nodes = _load_nodes_by_pk(pks)
+
+    return [
+        _deserialize_yaml(string) if encoded is _NOT_COMPACT else _decode_compact(encoded, nodes)
+        for string, encoded in zip(serialized, decoded)
+    ]
+
+
+def _deserialize_yaml(serialized):
     """Deserialize a yaml dump that represents a serialized data structure.
 
     :param serialized: a yaml serialized string representation
     :return: the deserialized data structure
     """
-    return yaml.load(serialized, Loader=AiiDALoader)
+    loader = AiiDALoader(serialized)
+    loader.nodes = _load_nodes(serialized)
+
+    try:
+        return loader.get_single_data()
+    finally:
+        loader.dispose()
+
+
+def _load_nodes(serialized):
+    """Load all the nodes that are referenced in a serialized string with a single query.
+
+    Checkpoints of workchains can reference many nodes, for example those stored in the context, and loading each of
+    them separately while constructing the data structure would cost a query per node.
+
+    :param serialized: a yaml serialized string representation
+    :return: dictionary of nodes keyed on their uuid
+    """
+    if not isinstance(serialized, six.string_types):
+        return {}
+
+    uuids = set(_NODE_UUID_REGEX.findall(serialized))
+
+    if not uuids:
+        return {}
+
+    builder = orm.QueryBuilder().append(orm.Node, filters={'uuid': {'in': list(uuids)}}, project=['uuid', '*'])
+
+    return {str(uuid): node for uuid, node in builder.iterall()}
+
+
+def _load_nodes_by_pk(pks):
+    """Load the nodes with the given pks with a single query.
+
+    :param pks: set of node pks
+    :return: dictionary of nodes keyed on their pk
+    """
+    if not pks:
+        return {}
+
+    builder = orm.QueryBuilder().append(orm.Node, filters={'id': {'in': list(pks)}}, project=['id', '*'])
+
+    return {pk: node for pk, node in builder.iterall()}
+
+
+# Returned by `_parse_compact` for strings that are not in the compact representation
+_NOT_COMPACT = object()
+
+
+def _parse_compact(serialized):
+    """Parse the JSON of a string in the compact representation.
+
+    :param serialized: a string in the compact representation or a yaml serialized string representation
+    :return: the encoded data structure, or `_NOT_COMPACT` if the string is not in the compact representation
+    :raises ValueError: if the version of the compact representation is not supported
+    """
+    if not isinstance(serialized, six.string_types) or not serialized.startswith(_COMPACT_PREFIX):
+        return _NOT_COMPACT
+
+    header, _, encoded = serialized.partition('\n')
+
+    try:
+        version = int(header[len(_COMPACT_PREFIX):])
+    except ValueError:
+        raise ValueError('invalid header of the compact representation: {}'.format(header))
+
+    if version > COMPACT_FORMAT_VERSION:
+        raise ValueError('the compact representation has version {} but only versions up to {} are supported'.format(
+            version, COMPACT_FORMAT_VERSION))
+
+    return json.loads(encoded)
+
+
+def _encode_compact(data):
+    """Return the JSON serializable representation of the given data structure in the compact format.
+
+    :param data: the general data to encode
+    :return: the encoded data structure
+    """
+    # pylint: disable=too-many-return-statements,unidiomatic-typecheck
+    data_type = type(data)
+
+    if data_type in _COMPACT_SCALAR_TYPES:
+        return data
+
+    if data_type is list:
+        return [_encode_compact(item) for item in data]
+
+    if data_type is tuple:
+        return {_COMPACT_TUPLE_TAG: [_encode_compact(item) for item in data]}
+
+    if isinstance(data, (orm.Node, orm.Group, orm.Computer)):
+        if not data.is_stored:
+            raise ValueError('{} cannot be represented because it is not stored'.format(data))
+        if isinstance(data, orm.Node):
+            return {_COMPACT_NODE_TAG: data.pk}
+        if isinstance(data, orm.Group):
+            return {_COMPACT_GROUP_TAG: data.pk}
+        return {_COMPACT_COMPUTER_TAG: data.pk}
+
+    if (data_type is dict or data_type in _COMPACT_MAPPING_TAGS) and all(
+            isinstance(key, six.string_types) for key in data):
+        mapping = {key: _encode_compact(value) for key, value in data.items()}
+
+        if data_type in _COMPACT_MAPPING_TAGS:
+            return {_COMPACT_MAPPING_TAGS[data_type]: mapping}
+
+        # A dictionary with a single key starting with an exclamation mark would be mistaken for a tagged value
+        if len(mapping) == 1 and next(iter(mapping)).startswith('!'):
+            return {_COMPACT_DICT_TAG: mapping}
+
+        return mapping
+
+    return {_COMPACT_YAML_TAG: serialize(data)}
+
+
+def _collect_compact_pks(encoded, pks):
+    """Add the pks of the nodes referenced in an encoded data structure in the compact format to the given set.
+
+    :param encoded: the encoded data structure
+    :param pks: set of node pks
+    """
+    if isinstance(encoded, list):
+        for item in encoded:
+            _collect_compact_pks(item, pks)
+    elif isinstance(encoded, dict):
+        if len(encoded) == 1 and _COMPACT_NODE_TAG in encoded:
+            pks.add(encoded[_COMPACT_NODE_TAG])
+        elif not (len(encoded) == 1 and _COMPACT_YAML_TAG in encoded):
+            for value in encoded.values():
+                _collect_compact_pks(value, pks)
+
+
+def _decode_compact(encoded, nodes):
+    """Reconstruct the data structure from its encoded representation in the compact format.
+
+    :param encoded: the encoded data structure
+    :param nodes: dictionary of preloaded nodes keyed on their pk
+    :return: the decoded data structure
+    :raises ValueError: if the encoded data structure contains an unknown tag
+    """
+    # pylint: disable=too-many-return-statements
+    if isinstance(encoded, list):
+        return [_decode_compact(item, nodes) for item in encoded]
+
+    if not isinstance(encoded, dict):
+        return encoded
+
+    if len(encoded) != 1 or not next(iter(encoded)).startswith('!'):
+        return {key: _decode_compact(value, nodes) for key, value in encoded.items()}
+
+    tag, value = next(iter(encoded.items()))
+
+    if tag == _COMPACT_NODE_TAG:
+        try:
+            return nodes[value]
+        except KeyError:
+            return orm.load_node(pk=value)
+
+    if tag == _COMPACT_GROUP_TAG:
+        return orm.load_group(pk=value)
+
+    if tag == _COMPACT_COMPUTER_TAG:
+        return orm.load_computer(pk=value)
+
+    if tag == _COMPACT_TUPLE_TAG:
+        return tuple(_decode_compact(item, nodes) for item in value)
+
+    if tag == _COMPACT_YAML_TAG:
+        return _deserialize_yaml(value)
+
+    if tag == _COMPACT_DICT_TAG:
+        return {key: _decode_compact(item, nodes) for key, item in value.items()}
+
+    for mapping_type, mapping_tag in _COMPACT_MAPPING_TAGS.items():
+        if tag == mapping_tag:
+            mapping = {key: _decode_compact(item, nodes) for key, item in value.items()}
+            if mapping_type is Bundle:
+                bundle = Bundle.__new__(Bundle)
+                bundle.update(mapping)
+                return bundle
+            return mapping_type(mapping)
+
+    raise ValueError('unknown tag in the compact representation: {}'.format(tag))
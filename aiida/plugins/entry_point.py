@@ -11,6 +11,7 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
+import collections
 import enum
 import six
 import traceback
@@ -31,6 +32,12 @@ __all__ = ('load_entry_point', 'load_entry_point_from_string')
 ENTRY_POINT_GROUP_PREFIX = 'aiida.'
 ENTRY_POINT_STRING_SEPARATOR = ':'
 
+# Index of the entry points of each group by name, see `get_entry_point_group_index`
+_ENTRY_POINT_INDEX = {}
+
+# Objects loaded from entry points by group and name, see `load_entry_point`
+_LOADED_ENTRY_POINTS = {}
+
 
 class EntryPointFormat(enum.Enum):
     """
@@ -175,6 +182,11 @@ def load_entry_point(group, name):
     :raises aiida.common.MultipleEntryPointError: entry point could not be uniquely resolved
     :raises aiida.common.LoadingEntryPointError: entry point could not be loaded
     """
+    try:
+        return _LOADED_ENTRY_POINTS[(group, name)]
+    except KeyError:
+        pass
+
     entry_point = get_entry_point(group, name)
 
     try:
@@ -182,6 +194,8 @@ def load_entry_point(group, name):
     except ImportError:
         raise LoadingEntryPointError("Failed to load entry point '{}':\n{}".format(name, traceback.format_exc()))
 
+    _LOADED_ENTRY_POINTS[(group, name)] = loaded_entry_point
+
     return loaded_entry_point
 
 
@@ -217,7 +231,46 @@ def get_entry_points(group):
     :param group: the entry point group
     :return: a list of entry points
     """
-    return [ep for ep in ENTRYPOINT_MANAGER.iter_entry_points(group=group)]
+    return [ep for entry_points in get_entry_point_group_index(group).values() for ep in entry_points]
+
+
+def get_entry_point_group_index(group):
+    """
+    Return the index of the entry points within a specific group by name
+
+    The index is built once per interpreter, since iterating over the entry points of the entry point manager is slow.
+    If plugins are installed or removed while the interpreter is running, call `reset_entry_point_cache` to rebuild it.
+
+    :param group: the entry point group
+    :return: an ordered dictionary with the list of entry points registered under each name
+    """
+    try:
+        return _ENTRY_POINT_INDEX[group]
+    except KeyError:
+        pass
+
+    index = collections.OrderedDict()
+
+    for entry_point in ENTRYPOINT_MANAGER.iter_entry_points(group=group):
+        index.setdefault(entry_point.name, []).append(entry_point)
+
+    _ENTRY_POINT_INDEX[group] = index
+
+    return index
+
+
+def reset_entry_point_cache():
+    """
+    Clear the index of the entry points and the cache of the classes that were resolved from them
+
+    The index and the caches are rebuilt on demand, such that plugins that were installed or removed since they were
+    built are taken into account.
+    """
+    from aiida.orm.utils.node import NODE_CLASS_CACHE
+
+    _ENTRY_POINT_INDEX.clear()
+    _LOADED_ENTRY_POINTS.clear()
+    NODE_CLASS_CACHE.clear()
 
 
 def get_entry_point(group, name):
@@ -230,7 +283,7 @@ def get_entry_point(group, name):
     :raises aiida.common.MissingEntryPointError: entry point was not registered
     :raises aiida.common.MultipleEntryPointError: entry point could not be uniquely resolved
     """
-    entry_points = [ep for ep in get_entry_points(group) if ep.name == name]
+    entry_points = get_entry_point_group_index(group).get(name, [])
 
     if not entry_points:
         raise MissingEntryPointError("Entry point '{}' not found in group '{}'".format(name, group))
@@ -89,14 +89,19 @@ class AiidaApi(Api):
         resource classes.
 
         :param kwargs: parameters to be passed to the resources for
-          configuration and PREFIX
+          configuration and PREFIX, and the optional RESPONSE_CACHE_CONFIG
+          to enable the cache of the responses
         """
 
+        from aiida.restapi.common.cache import ResponseCache
         from aiida.restapi.resources import Calculation, Computer, User, Code, Data, \
             Group, Node, StructureData, KpointsData, BandsData, UpfData, CifData, ServerInfo
 
         self.app = app
 
+        # The cache is shared by all resources and disabled unless enabled in the configuration
+        kwargs['RESPONSE_CACHE'] = ResponseCache.from_config(kwargs.get('RESPONSE_CACHE_CONFIG', None))
+
         super(AiidaApi, self).__init__(app=app, prefix=kwargs['PREFIX'], catch_all_404s=True)
 
         self.add_resource(
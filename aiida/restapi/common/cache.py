@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""
+Cache of the responses and result counts of the REST API.
+
+Cached entries are keyed by the normalized request, or query, and a marker of the state of the database, which is the
+largest node pk by default. Since the provenance graph only grows, new nodes and the links created when storing them
+change the marker and make all cached entries stale at once. Other changes, like the modification of extras or the
+deletion of nodes, do not change the marker and are only reflected once the cached entries expire after their time to
+live.
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import functools
+
+from six.moves.urllib.parse import parse_qsl  # pylint: disable=import-error
+
+from aiida.common.datastructures import LRUCache
+from aiida.common.hashing import make_hash
+
+
+def get_database_marker():
+    """
+    Return a marker of the state of the database, which changes when nodes are stored.
+
+    :return: the largest pk of the nodes in the database
+    """
+    from aiida import orm
+
+    builder = orm.QueryBuilder()
+    builder.append(orm.Node, project=[{'id': {'func': 'max'}}])
+
+    return builder.first()[0]
+
+
+class ResponseCache(object):  # pylint: disable=useless-object-inheritance
+    """
+    Size bounded cache of the responses and result counts of the REST API, whose entries expire after a time to live.
+
+    The storage and the marker of the database state are pluggable: the storage can be any object that implements the
+    `get`, `set` and `clear` methods of :class:`aiida.common.datastructures.LRUCache`, for example to share the cache
+    between the processes of a WSGI server, and the marker any function without arguments that returns a hashable value.
+    """
+
+    def __init__(self, maxsize=1000, ttl=60, storage=None, marker=get_database_marker):
+        """
+        :param maxsize: the maximum number of cached entries, ignored if a storage is given
+        :param ttl: the number of seconds after which a cached entry expires, ignored if a storage is given
+        :param storage: optional storage for the entries, by default an in-memory `LRUCache`
+        :param marker: function that returns a marker of the state of the database
+        """
+        self._storage = storage if storage is not None else LRUCache(maxsize, ttl)
+        self._marker = marker
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Construct a cache from the `RESPONSE_CACHE_CONFIG` of the REST API configuration.
+
+        :param config: dictionary with the keys `ENABLED`, `MAXSIZE` and `TTL`
+        :return: a `ResponseCache` or None if the cache is not enabled
+        """
+        if not config or not config.get('ENABLED', False):
+            return None
+
+        return cls(maxsize=config.get('MAXSIZE', 1000), ttl=config.get('TTL', 60))
+
+    def get(self, key):
+        """
+        Return the cached value for the key.
+
+        :param key: a key returned by `get_response_key` or `get_count_key`
+        :return: the cached value or None if there is no valid entry
+        """
+        return self._storage.get(key, None)
+
+    def set(self, key, value):
+        """
+        Cache a value for the key.
+
+        :param key: a key returned by `get_response_key` or `get_count_key`
+        :param value: the value to cache
+        """
+        self._storage.set(key, value)
+
+    def clear(self):
+        """Remove all cached entries."""
+        self._storage.clear()
+
+    def get_response_key(self, request):
+        """
+        Return the key of the response to a request.
+
+        The query string is normalized by sorting its parameters, such that requests that only differ in the order of
+        their parameters share their cached response.
+
+        :param request: the Flask request
+        :return: a hashable key
+        """
+        query_string = request.query_string.decode('utf-8')
+        parameters = tuple(sorted(parse_qsl(query_string, keep_blank_values=True)))
+
+        return ('response', request.url_root, request.path.rstrip('/'), parameters, self._marker())
+
+    def get_count_key(self, queryhelp):
+        """
+        Return the key of the result count of a query.
+
+        :param queryhelp: the JSON compatible queryhelp of the query
+        :return: a hashable key
+        """
+        return ('count', make_hash(queryhelp), self._marker())
+
+
+def cache_response(method):
+    """
+    Decorator for the `get` method of a resource that caches its successful JSON responses in its `cache` attribute.
+
+    Cached responses carry an ETag, such that conditional requests with an `If-None-Match` header that matches it are
+    answered with a `304 Not Modified` response without a body. If the resource has no cache, the method is unaltered.
+    """
+
+    @functools.wraps(method)
+    def wrapper(resource, *args, **kwargs):
+        """Return the cached response, calling the method to create it if it is not cached."""
+        from flask import current_app, request
+
+        cache = resource.cache
+
+        if cache is None:
+            return method(resource, *args, **kwargs)
+
+        key = cache.get_response_key(request)
+        cached = cache.get(key)
+
+        if cached is None:
+            response = method(resource, *args, **kwargs)
+
+            if response.status_code != 200 or response.mimetype != 'application/json':
+                return response
+
+            response.add_etag()
+            cached = (response.get_data(), list(response.headers.items()))
+            cache.set(key, cached)
+
+        data, headers = cached
+        response = current_app.response_class(data, status=200, headers=headers)
+
+        return response.make_conditional(request)
+
+    return wrapper
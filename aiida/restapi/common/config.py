@@ -60,6 +60,21 @@ CACHING_TIMEOUTS = { #Caching TIMEOUTS (in seconds)
     'groups': 10,
     'codes': 10,
 }
+"""
+Cache of the responses and result counts of the REST API
+
+ENABLED: True/False. enables the cache. It is disabled by default, since only
+stored nodes invalidate the cache immediately: other changes, like updates of
+the state of running processes, of extras or deletions, are only served once
+the cached entries expire.
+MAXSIZE: maximum number of cached responses and counts
+TTL: number of seconds after which a cached entry expires.
+"""
+RESPONSE_CACHE_CONFIG = {
+    'ENABLED': False,
+    'MAXSIZE': 1000,
+    'TTL': 60,
+}
 
 # IO tree
 MAX_TREE_DEPTH = 5
@@ -501,6 +501,8 @@ class Utils(object):  # pylint: disable=useless-object-inheritance
         ## Create void variables
         filters = {}
         orderby = []
+        groupby = []
+        aggregates = []
         limit = None
         offset = None
         perpage = None
@@ -513,9 +515,11 @@ class Utils(object):  # pylint: disable=useless-object-inheritance
         filename = None
         rtype = None
 
-        # io tree limit parameters
+        # io tree limit and cursor parameters
         tree_in_limit = None
         tree_out_limit = None
+        tree_in_cursor = None
+        tree_out_cursor = None
 
         ## Count how many time a key has been used for the filters and check if
         # reserved keyword
@@ -546,6 +550,10 @@ class Utils(object):  # pylint: disable=useless-object-inheritance
             raise RestInputValidationError("You cannot specify perpage more than once")
         if 'orderby' in field_counts.keys() and field_counts['orderby'] > 1:
             raise RestInputValidationError("You cannot specify orderby more than once")
+        if 'groupby' in field_counts.keys() and field_counts['groupby'] > 1:
+            raise RestInputValidationError("You cannot specify groupby more than once")
+        if 'aggregate' in field_counts.keys() and field_counts['aggregate'] > 1:
+            raise RestInputValidationError("You cannot specify aggregate more than once")
         if 'alist' in field_counts.keys() and field_counts['alist'] > 1:
             raise RestInputValidationError("You cannot specify alist more than once")
         if 'nalist' in field_counts.keys() and field_counts['nalist'] > 1:
@@ -566,6 +574,10 @@ class Utils(object):  # pylint: disable=useless-object-inheritance
             raise RestInputValidationError("You cannot specify in_limit more than once")
         if 'out_limit' in field_counts.keys() and field_counts['out_limit'] > 1:
             raise RestInputValidationError("You cannot specify out_limit more than once")
+        if 'in_cursor' in field_counts.keys() and field_counts['in_cursor'] > 1:
+            raise RestInputValidationError("You cannot specify in_cursor more than once")
+        if 'out_cursor' in field_counts.keys() and field_counts['out_cursor'] > 1:
+            raise RestInputValidationError("You cannot specify out_cursor more than once")
 
         ## Extract results
         for field in field_list:
@@ -618,6 +630,24 @@ class Utils(object):  # pylint: disable=useless-object-inheritance
                 else:
                     raise RestInputValidationError("only assignment operator '=' is permitted after 'orderby'")
 
+            elif field[0] == 'groupby':
+                if field[1] == '=':
+                    if isinstance(field[2], list):
+                        groupby.extend(field[2])
+                    else:
+                        groupby.extend([field[2]])
+                else:
+                    raise RestInputValidationError("only assignment operator '=' is permitted after 'groupby'")
+
+            elif field[0] == 'aggregate':
+                if field[1] == '=':
+                    if isinstance(field[2], list):
+                        aggregates.extend(field[2])
+                    else:
+                        aggregates.extend([field[2]])
+                else:
+                    raise RestInputValidationError("only assignment operator '=' is permitted after 'aggregate'")
+
             elif field[0] == 'format':
                 if field[1] == '=':
                     downloadformat = field[2]
@@ -654,6 +684,18 @@ class Utils(object):  # pylint: disable=useless-object-inheritance
                 else:
                     raise RestInputValidationError("only assignment operator '=' is permitted after 'out_limit'")
 
+            elif field[0] == 'in_cursor':
+                if field[1] == '=':
+                    tree_in_cursor = field[2]
+                else:
+                    raise RestInputValidationError("only assignment operator '=' is permitted after 'in_cursor'")
+
+            elif field[0] == 'out_cursor':
+                if field[1] == '=':
+                    tree_out_cursor = field[2]
+                else:
+                    raise RestInputValidationError("only assignment operator '=' is permitted after 'out_cursor'")
+
             else:
 
                 ## Construct the filter entry.
@@ -681,13 +723,13 @@ class Utils(object):  # pylint: disable=useless-object-inheritance
         #     limit = self.limit_default
 
         return (limit, offset, perpage, orderby, filters, alist, nalist, elist, nelist, downloadformat, visformat,
-                filename, rtype, tree_in_limit, tree_out_limit)
+                filename, rtype, tree_in_limit, tree_out_limit, tree_in_cursor, tree_out_cursor, groupby, aggregates)
 
     def parse_query_string(self, query_string):
         # pylint: disable=too-many-locals
         """
         Function that parse the querystring, extracting infos for limit, offset,
-        ordering, filters, attribute and extra projections.
+        ordering, grouping, filters, attribute and extra projections.
         :param query_string (as obtained from request.query_string)
         :return: parsed values for the querykeys
         """
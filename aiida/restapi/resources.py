@@ -17,6 +17,7 @@ from six.moves.urllib.parse import unquote  # pylint: disable=import-error
 from flask import request, make_response
 from flask_restful import Resource
 
+from aiida.restapi.common.cache import cache_response
 from aiida.restapi.common.utils import Utils
 
 
@@ -85,18 +86,18 @@ class ServerInfo(Resource):
 
 
 class BaseResource(Resource):
-    # pylint: disable=fixme
     """
     Each derived class will instantiate a different type of translator.
     This is the only difference in the classes.
     """
 
-    ## TODO add the caching support. I cache total count, results, and possibly
-
     def __init__(self, **kwargs):
 
         self.trans = None
 
+        # Optional cache of the responses
+        self.cache = kwargs.get('RESPONSE_CACHE', None)
+
         # Flag to tell the path parser whether to expect a pk or a uuid pattern
         self.parse_pk_uuid = None
 
@@ -106,6 +107,7 @@ class BaseResource(Resource):
         self.utils = Utils(**self.utils_confs)
         self.method_decorators = {'get': kwargs.get('get_decorators', [])}
 
+    @cache_response
     def get(self, id=None, page=None):  # pylint: disable=redefined-builtin,invalid-name,unused-argument
         # pylint: disable=too-many-locals
         """
@@ -126,7 +128,8 @@ class BaseResource(Resource):
 
         # pylint: disable=unused-variable
         (limit, offset, perpage, orderby, filters, _alist, _nalist, _elist, _nelist, _downloadformat, _visformat,
-         _filename, _rtype, tree_in_limit, tree_out_limit) = self.utils.parse_query_string(query_string)
+         _filename, _rtype, _tree_in_limit, _tree_out_limit, _tree_in_cursor, _tree_out_cursor, groupby,
+         aggregates) = self.utils.parse_query_string(query_string)
 
         ## Validate request
         self.utils.validate_request(
@@ -147,7 +150,8 @@ class BaseResource(Resource):
 
         else:
             ## Set the query, and initialize qb object
-            self.trans.set_query(filters=filters, orders=orderby, node_id=node_id)
+            self.trans.set_query(
+                filters=filters, orders=orderby, node_id=node_id, groupby=groupby, aggregates=aggregates)
 
             ## Count results
             total_count = self.trans.get_total_count()
@@ -196,14 +200,18 @@ class Node(Resource):
         # Parse a uuid pattern in the URL path (not a pk)
         self.parse_pk_uuid = 'uuid'
 
+        # Optional cache of the responses
+        self.cache = kwargs.get('RESPONSE_CACHE', None)
+
         # Configure utils
         utils_conf_keys = ('PREFIX', 'PERPAGE_DEFAULT', 'LIMIT_DEFAULT')
         self.utils_confs = {k: kwargs[k] for k in utils_conf_keys if k in kwargs}
         self.utils = Utils(**self.utils_confs)
         self.method_decorators = {'get': kwargs.get('get_decorators', [])}
 
+    @cache_response
     def get(self, id=None, page=None):  # pylint: disable=redefined-builtin,invalid-name,unused-argument
-        # pylint: disable=too-many-locals,too-many-statements,too-many-branches,fixme
+        # pylint: disable=too-many-locals,too-many-statements,too-many-branches
         """
         Get method for the Node resource.
 
@@ -222,7 +230,8 @@ class Node(Resource):
         (resource_type, page, node_id, query_type) = self.utils.parse_path(path, parse_pk_uuid=self.parse_pk_uuid)
 
         (limit, offset, perpage, orderby, filters, alist, nalist, elist, nelist, downloadformat, visformat, filename,
-         rtype, tree_in_limit, tree_out_limit) = self.utils.parse_query_string(query_string)
+         rtype, tree_in_limit, tree_out_limit, tree_in_cursor, tree_out_cursor, groupby,
+         aggregates) = self.utils.parse_query_string(query_string)
 
         ## Validate request
         self.utils.validate_request(
@@ -245,7 +254,8 @@ class Node(Resource):
         ## Treat the statistics
         elif query_type == "statistics":
             (limit, offset, perpage, orderby, filters, alist, nalist, elist, nelist, downloadformat, visformat,
-             filename, rtype, tree_in_limit, tree_out_limit) = self.utils.parse_query_string(query_string)
+             filename, rtype, tree_in_limit, tree_out_limit, tree_in_cursor, tree_out_cursor, groupby,
+             aggregates) = self.utils.parse_query_string(query_string)
             headers = self.utils.build_headers(url=request.url, total_count=0)
             if filters:
                 usr = filters["user"]["=="]
@@ -253,11 +263,9 @@ class Node(Resource):
                 usr = None
             results = self.trans.get_statistics(usr)
 
-        # TODO improve the performance of tree endpoint by getting the data from database faster
-        # TODO add pagination for this endpoint (add default max limit)
         elif query_type == "tree":
             headers = self.utils.build_headers(url=request.url, total_count=0)
-            results = self.trans.get_io_tree(node_id, tree_in_limit, tree_out_limit)
+            results = self.trans.get_io_tree(node_id, tree_in_limit, tree_out_limit, tree_in_cursor, tree_out_cursor)
         else:
             ## Initialize the translator
             self.trans.set_query(
@@ -272,7 +280,9 @@ class Node(Resource):
                 downloadformat=downloadformat,
                 visformat=visformat,
                 filename=filename,
-                rtype=rtype)
+                rtype=rtype,
+                groupby=groupby,
+                aggregates=aggregates)
 
             ## Count results
             total_count = self.trans.get_total_count()
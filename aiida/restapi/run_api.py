@@ -83,7 +83,11 @@ def run_api(flask_app, flask_api, **kwargs):
         app.wsgi_app = ProfilerMiddleware(app.wsgi_app, restrictions=[30])
 
     # Instantiate an Api by associating its app
-    api_kwargs = dict(PREFIX=confs.PREFIX, PERPAGE_DEFAULT=confs.PERPAGE_DEFAULT, LIMIT_DEFAULT=confs.LIMIT_DEFAULT)
+    api_kwargs = dict(
+        PREFIX=confs.PREFIX,
+        PERPAGE_DEFAULT=confs.PERPAGE_DEFAULT,
+        LIMIT_DEFAULT=confs.LIMIT_DEFAULT,
+        RESPONSE_CACHE_CONFIG=getattr(confs, 'RESPONSE_CACHE_CONFIG', None))
     api = flask_api(app, **api_kwargs)
 
     # Check if the app has to be hooked-up or just returned
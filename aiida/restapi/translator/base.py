@@ -52,6 +52,9 @@ class BaseTranslator(object):
     _is_id_query = None
     _total_count = None
 
+    # The aggregate functions that can be projected for each group of a grouped query
+    _aggregate_functions = ('count', 'sum', 'avg', 'min', 'max')
+
     def __init__(self, Class=None, **kwargs):
         """
         Initialise the parameters.
@@ -101,8 +104,14 @@ class BaseTranslator(object):
         self.qbobj = QueryBuilder()
 
         self.limit_default = kwargs['LIMIT_DEFAULT']
+
+        # Optional cache of the result counts
+        self._cache = kwargs.get('RESPONSE_CACHE', None)
         self.schema = None
 
+        # Names of the projected columns and aggregates of a grouped query, None if the query is not grouped
+        self._grouping_labels = None
+
     def __repr__(self):
         """
         This function is required for the caching system to be able to compare
@@ -184,23 +193,21 @@ class BaseTranslator(object):
         """
         Count the number of rows returned by the query and set total_count
         """
-        if self._is_qb_initialized:
-            self._total_count = self.qbobj.count()
-        else:
+        if not self._is_qb_initialized:
             raise InvalidOperation("query builder object has not been initialized.")
 
-            # def caching_method(self):
-            #     """
-            #     class method for caching. It is a wrapper of the
-            # flask_cache memoize
-            #     method. To be used as a decorator
-            #     :return: the flask_cache memoize method with the timeout kwarg
-            #     corrispondent to the class
-            #     """
-            #     return cache.memoize()
-            #
+        if self._cache is None:
+            self._total_count = self.qbobj.count()
+            return
+
+        key = self._cache.get_count_key(self.qbobj.get_json_compatible_queryhelp())
+        total_count = self._cache.get(key)
 
-            #    @cache.memoize(timeout=CACHING_TIMEOUTS[self.__label__])
+        if total_count is None:
+            total_count = self.qbobj.count()
+            self._cache.set(key, total_count)
+
+        self._total_count = total_count
 
     def get_total_count(self):
         """
@@ -330,6 +337,47 @@ class BaseTranslator(object):
         for tag, columns in orders.items():
             self._query_help['order_by'][tag] = def_order(columns)
 
+    def set_grouping(self, groupby=None, aggregates=None):
+        """
+        Add the group_by clause in query_help and project the grouped columns followed by the aggregates, such that
+        the query returns one row per group. If no aggregate is given, the number of entities in each group is counted.
+
+        :param groupby: list of the names of the columns to group by
+        :param aggregates: list of the aggregates to project, either ``count`` for the number of entities or
+            ``<function>_<column>``, e.g. ``max_ctime``, where function is one of ``_aggregate_functions``
+        """
+        if groupby is None:
+            groupby = []
+
+        if not aggregates:
+            aggregates = ['count']
+
+        projections = []
+        for column in groupby:
+            if not isinstance(column, six.string_types) or column[0] in '+-':
+                raise RestInputValidationError("groupby has to be a list of column names, got '{}'".format(column))
+            projections.append(PK_DBSYNONYM if column == 'pk' else column)
+
+        group_by = list(projections)
+
+        for aggregate in aggregates:
+            if not isinstance(aggregate, six.string_types):
+                raise RestInputValidationError("aggregate has to be a list of names, got '{}'".format(aggregate))
+            if aggregate == 'count':
+                function, column = 'count', PK_DBSYNONYM
+            else:
+                function, _, column = aggregate.partition('_')
+            if function not in self._aggregate_functions or not column:
+                raise RestInputValidationError("invalid aggregate '{}', use 'count' or '<function>_<column>' with "
+                                               "function one of {}".format(aggregate, self._aggregate_functions))
+            projections.append({PK_DBSYNONYM if column == 'pk' else column: {'func': function}})
+
+        self._query_help["project"][self._result_type] = projections
+        if group_by:
+            self._query_help["group_by"] = {self._result_type: group_by}
+
+        self._grouping_labels = list(groupby) + list(aggregates)
+
     def set_query(self,
                   filters=None,
                   orders=None,
@@ -343,7 +391,9 @@ class BaseTranslator(object):
                   downloadformat=None,
                   visformat=None,
                   filename=None,
-                  rtype=None):
+                  rtype=None,
+                  groupby=None,
+                  aggregates=None):
         # pylint: disable=too-many-arguments,unused-argument
         """
         Adds filters, default projections, order specs to the query_help,
@@ -364,6 +414,9 @@ class BaseTranslator(object):
             cif, kpoints. E.g. jsmol, chemdoodle
         :param filename: name of the file to return its content
         :param rtype: return type of the file
+        :param groupby: list of the columns to group the results by. The projections are replaced by the grouped
+            columns and the aggregates
+        :param aggregates: list of the aggregates to project for each group, see :meth:`set_grouping`
         """
 
         tagged_filters = {}
@@ -389,8 +442,12 @@ class BaseTranslator(object):
         ## Add filters
         self.set_filters(tagged_filters)
 
-        ## Add projections
-        if projections is None:
+        ## Add projections, or the grouping and the aggregates that replace them
+        if groupby or aggregates:
+            if node_id is not None and self._result_type == self.__label__:
+                raise RestInputValidationError("groupby and aggregate cannot be applied to a specific id")
+            self.set_grouping(groupby, aggregates)
+        elif projections is None:
             self.set_default_projections()
         else:
             tagged_projections = {self._result_type: projections}
@@ -465,7 +522,12 @@ class BaseTranslator(object):
             raise InvalidOperation("query builder object has not been initialized.")
 
         results = []
-        if self._total_count > 0:
+        if self._total_count > 0 and self._grouping_labels is not None:
+            # The rows of a grouped query are returned as lists, since `dict` keys the projections by column name and
+            # several aggregates can be computed on the same column
+            for row in self.qbobj.iterall():
+                results.append(dict(zip(self._grouping_labels, row)))
+        elif self._total_count > 0:
             for res in self.qbobj.dict():
                 tmp = res[label]
                 if self._default_user_projections:
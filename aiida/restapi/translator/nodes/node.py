@@ -14,7 +14,7 @@ from __future__ import print_function
 from __future__ import absolute_import
 from aiida.common.exceptions import InputValidationError, ValidationError, \
     InvalidOperation
-from aiida.restapi.common.exceptions import RestValidationError
+from aiida.restapi.common.exceptions import RestValidationError, RestInputValidationError
 from aiida.restapi.translator.base import BaseTranslator
 from aiida.manage.manager import get_manager
 from aiida import orm
@@ -51,6 +51,9 @@ class NodeTranslator(BaseTranslator):
     _filename = None
     _rtype = None
 
+    # Columns of the nodes projected to display them in tree format
+    _tree_node_projections = ['id', 'uuid', 'node_type', 'label', 'description']
+
     def __init__(self, Class=None, **kwargs):
         """
         Initialise the parameters.
@@ -198,7 +201,9 @@ class NodeTranslator(BaseTranslator):
                   downloadformat=None,
                   visformat=None,
                   filename=None,
-                  rtype=None):
+                  rtype=None,
+                  groupby=None,
+                  aggregates=None):
         """
         Adds filters, default projections, order specs to the query_help,
         and initializes the qb object
@@ -218,6 +223,8 @@ class NodeTranslator(BaseTranslator):
             cif, kpoints. E.g. jsmol, chemdoodle
         :param filename: name of the file to return its content
         :param rtype: return type of the file
+        :param groupby: list of the columns to group the results by
+        :param aggregates: list of the aggregates to project for each group
         """
 
         ## Check the compatibility of query_type and id
@@ -251,7 +258,13 @@ class NodeTranslator(BaseTranslator):
         if self._result_type is not self.__label__:
             projections = self._default_projections
 
-        super(NodeTranslator, self).set_query(filters=filters, orders=orders, projections=projections, node_id=node_id)
+        super(NodeTranslator, self).set_query(
+            filters=filters,
+            orders=orders,
+            projections=projections,
+            node_id=node_id,
+            groupby=groupby,
+            aggregates=aggregates)
 
     def _get_content(self):
         """
@@ -270,61 +283,28 @@ class NodeTranslator(BaseTranslator):
         if self._total_count == 0:
             return {}
 
-        # otherwise ...
-        node = self.qbobj.first()[1]
-
         # content/attributes
         if self._content_type == "attributes":
-            # Get all attrs if nalist and alist are both None
-            if self._alist is None and self._nalist is None:
-                data = {self._content_type: node.attributes}
-            # Get all attrs except those contained in nalist
-            elif self._alist is None and self._nalist is not None:
-                attrs = {}
-                for key in node.attributes.keys():
-                    if key not in self._nalist:
-                        attrs[key] = node.get_attribute(key)
-                data = {self._content_type: attrs}
-            # Get all attrs contained in alist
-            elif self._alist is not None and self._nalist is None:
-                attrs = {}
-                for key in node.attributes.keys():
-                    if key in self._alist:
-                        attrs[key] = node.get_attribute(key)
-                data = {self._content_type: attrs}
-            else:
+            if self._alist is not None and self._nalist is not None:
                 raise RestValidationError("you cannot specify both alist and nalist")
-        # content/extras
-        elif self._content_type == "extras":
-
-            # Get all extras if nelist and elist are both None
-            if self._elist is None and self._nelist is None:
-                data = {self._content_type: node.extras}
-
-            # Get all extras except those contained in nelist
-            elif self._elist is None and self._nelist is not None:
-                extras = {}
-                for key in node.extras.keys():
-                    if key not in self._nelist:
-                        extras[key] = node.get_extra(key)
-                data = {self._content_type: extras}
-
-            # Get all extras contained in elist
-            elif self._elist is not None and self._nelist is None:
-                extras = {}
-                for key in node.extras.keys():
-                    if key in self._elist:
-                        extras[key] = node.get_extra(key)
-                data = {self._content_type: extras}
+            data = {self._content_type: self._get_projected_dictionary('attributes', self._alist, self._nalist)}
+            return data
 
-            else:
+        # content/extras
+        if self._content_type == "extras":
+            if self._elist is not None and self._nelist is not None:
                 raise RestValidationError("you cannot specify both elist and nelist")
+            data = {self._content_type: self._get_projected_dictionary('extras', self._elist, self._nelist)}
+            return data
+
+        # otherwise ...
+        node = self.qbobj.first()[1]
 
         # Data needed for visualization appropriately serialized (this
         # actually works only for data derived classes)
         # TODO refactor the code so to have this option only in data and
         # derived classes
-        elif self._content_type == 'visualization':
+        if self._content_type == 'visualization':
             # In this we do not return a dictionary but just an object and
             # the dictionary format is set by get_visualization_data
             data = {self._content_type: self.get_visualization_data(node, self._visformat)}
@@ -349,6 +329,30 @@ class NodeTranslator(BaseTranslator):
 
         return data
 
+    def _get_projected_dictionary(self, column, include=None, exclude=None):
+        """
+        Return the dictionary stored in the given column of the node, i.e. its attributes or extras.
+
+        The dictionary is projected as a record, such that the node is not constructed and the dictionary is not
+        copied, which is significantly faster for nodes with large attributes.
+
+        :param column: the name of the column, either `attributes` or `extras`
+        :param include: optional list of keys, if specified only these keys are returned
+        :param exclude: optional list of keys, if specified these keys are not returned
+        :return: the dictionary
+        """
+        builder = orm.QueryBuilder()
+        builder.append(orm.Node, filters=self._id_filter, project=[column])
+        dictionary = builder.records()[0][0] or {}
+
+        if include is not None:
+            return {key: value for key, value in dictionary.items() if key in include}
+
+        if exclude is not None:
+            return {key: value for key, value in dictionary.items() if key not in exclude}
+
+        return dictionary
+
     def _get_subclasses(self, parent=None, parent_class=None, recursive=True):
         """
         Import all submodules of the package containing the present class.
@@ -542,200 +546,207 @@ class NodeTranslator(BaseTranslator):
         qmanager = self._backend.query_manager
         return qmanager.get_creation_statistics(user_pk=user_pk)
 
-    def get_io_tree(self, uuid_pattern, tree_in_limit, tree_out_limit):
-        # pylint: disable=too-many-statements,too-many-locals
+    def get_io_tree(self, uuid_pattern, tree_in_limit=None, tree_out_limit=None, tree_in_cursor=None,
+                    tree_out_cursor=None):
         """
         json data to display nodes in tree format
+
+        The links in each direction are retrieved with a single query that projects the columns of the linked nodes
+        and is ordered by the pk of the links. At most `tree_in_limit` incoming and `tree_out_limit` outgoing links are
+        returned, by default and at most LIMIT_DEFAULT. If there are more links, `next_in_cursor` and `next_out_cursor`
+        are the pk of the last link that was returned, which can be passed as cursor to get the following links.
+
         :param uuid_pattern: main node uuid
+        :param tree_in_limit: maximum number of incoming links to return
+        :param tree_out_limit: maximum number of outgoing links to return
+        :param tree_in_cursor: only return the incoming links with a larger pk
+        :param tree_out_cursor: only return the outgoing links with a larger pk
         :return: json data to display node tree
         """
         from aiida.orm.querybuilder import QueryBuilder
         from aiida.orm import Node
 
-        def get_node_shape(ntype):
-            """
-            Get tree node shape depending on node type
-            :param ntype: node type
-            :return: shape of the node displayed in tree
-            """
-
-            node_type = ntype.split(".")[0]
-            if node_type == "process":
-                shape = "square"
-            elif ntype.split(".")[1] == "code":
-                shape = "triangle"
-            else:
-                # default and data node shape
-                shape = "dot"
-
-            return shape
-
-        def get_node_description(node):
-            """
-            Get the description of the node.
-            CalcJobNodes migrated from AiiDA < 1.0.0 do not have a valid CalcJobState,
-            in this case the function returns as description the type of the node (CalcJobNode)
-            :param node: node object
-            :return: description of the node
-            """
-            try:
-                description = node.get_description()
-            except ValueError:
-                description = node.node_type.split('.')[-2]
-            return description
+        tree_in_limit = self._get_tree_limit(tree_in_limit, 'in_limit')
+        tree_out_limit = self._get_tree_limit(tree_out_limit, 'out_limit')
 
         # Check whether uuid_pattern identifies a unique node
         self._check_id_validity(uuid_pattern)
 
         qb_obj = QueryBuilder()
-        qb_obj.append(Node, tag="main", project=["*"], filters=self._id_filter)
+        qb_obj.append(Node, tag="main", project=self._tree_node_projections, filters=self._id_filter)
+        main_node = qb_obj.dict()[0]['main']
 
-        nodes = []
+        nodes = [self._get_tree_node(main_node, 0, "main_node")]
         edges = []
-        node_count = 0
-
-        if qb_obj.count() > 0:
-            main_node = qb_obj.first()[0]
-            pk = main_node.pk
-            uuid = main_node.uuid
-            nodetype = main_node.node_type
-            nodelabel = main_node.label
-            display_type = nodetype.split('.')[-2]
-            description = get_node_description(main_node)
-
-            nodes.append({
-                "id": node_count,
-                "nodeid": pk,
-                "nodeuuid": uuid,
-                "nodetype": nodetype,
-                "nodelabel": nodelabel,
-                "displaytype": display_type,
-                "group": "main_node",
-                "description": description,
-                "shape": get_node_shape(nodetype)
-            })
-        node_count += 1
 
-        # get all inputs
-        qb_obj = QueryBuilder()
-        qb_obj.append(Node, tag="main", project=['*'], filters=self._id_filter)
-        qb_obj.append(Node, tag="in", project=['*'], edge_project=['label', 'type'], with_outgoing='main')
-        if tree_in_limit is not None:
-            qb_obj.limit(tree_in_limit)
-
-        input_node_pks = {}
-        sent_no_of_incomings = qb_obj.count()
-
-        if sent_no_of_incomings > 0:
-            for node_input in qb_obj.iterdict():
-                node = node_input['in']['*']
-                pk = node.pk
-                linklabel = node_input['main--in']['label']
-                linktype = node_input['main--in']['type']
-
-                # add node if it is not present
-                if pk not in input_node_pks.keys():
-                    input_node_pks[pk] = node_count
-                    uuid = node.uuid
-                    nodetype = node.node_type
-                    nodelabel = node.label
-                    display_type = nodetype.split('.')[-2]
-                    description = get_node_description(node)
-
-                    nodes.append({
-                        "id": node_count,
-                        "nodeid": pk,
-                        "nodeuuid": uuid,
-                        "nodetype": nodetype,
-                        "nodelabel": nodelabel,
-                        "displaytype": display_type,
-                        "group": "inputs",
-                        "description": description,
-                        "linklabel": linklabel,
+        incomings, next_in_cursor = self._get_tree_links('in', tree_in_limit, tree_in_cursor)
+        outgoings, next_out_cursor = self._get_tree_links('out', tree_out_limit, tree_out_cursor)
+
+        # Nodes linked multiple times are only added once, with the label and type of their first link
+        for group, links in (("inputs", incomings), ("outputs", outgoings)):
+            node_ids = {}
+
+            for node, link in links:
+                linktype = link['type']
+
+                if node['id'] not in node_ids:
+                    node_ids[node['id']] = len(nodes)
+                    nodes.append(self._get_tree_node(node, len(nodes), group, link))
+
+                if group == "inputs":
+                    edges.append({
+                        "from": node_ids[node['id']],
+                        "to": 0,
+                        "arrows": "to",
+                        "color": {
+                            "inherit": 'from'
+                        },
                         "linktype": linktype,
-                        "shape": get_node_shape(nodetype)
                     })
-                    node_count += 1
-
-                from_edge = input_node_pks[pk]
-                edges.append({
-                    "from": from_edge,
-                    "to": 0,
-                    "arrows": "to",
-                    "color": {
-                        "inherit": 'from'
-                    },
-                    "linktype": linktype,
-                })
-
-        # get all outputs
-        qb_obj = QueryBuilder()
-        qb_obj.append(Node, tag="main", project=['*'], filters=self._id_filter)
-        qb_obj.append(Node, tag="out", project=['*'], edge_project=['label', 'type'], with_incoming='main')
-        if tree_out_limit is not None:
-            qb_obj.limit(tree_out_limit)
-
-        output_node_pks = {}
-        sent_no_of_outgoings = qb_obj.count()
-
-        if sent_no_of_outgoings > 0:
-            for output in qb_obj.iterdict():
-                node = output['out']['*']
-                pk = node.pk
-                linklabel = output['main--out']['label']
-                linktype = output['main--out']['type']
-
-                # add node if it is not present
-                if pk not in output_node_pks.keys():
-                    output_node_pks[pk] = node_count
-                    uuid = node.uuid
-                    nodetype = node.node_type
-                    nodelabel = node.label
-                    display_type = nodetype.split('.')[-2]
-                    description = get_node_description(node)
-
-                    nodes.append({
-                        "id": node_count,
-                        "nodeid": pk,
-                        "nodeuuid": uuid,
-                        "nodetype": nodetype,
-                        "nodelabel": nodelabel,
-                        "displaytype": display_type,
-                        "group": "outputs",
-                        "description": description,
-                        "linklabel": linklabel,
-                        "linktype": linktype,
-                        "shape": get_node_shape(nodetype)
+                else:
+                    edges.append({
+                        "from": 0,
+                        "to": node_ids[node['id']],
+                        "arrows": "to",
+                        "color": {
+                            "inherit": 'to'
+                        },
+                        "linktype": linktype
                     })
-                    node_count += 1
-
-                to_edge = output_node_pks[pk]
-                edges.append({
-                    "from": 0,
-                    "to": to_edge,
-                    "arrows": "to",
-                    "color": {
-                        "inherit": 'to'
-                    },
-                    "linktype": linktype
-                })
-
-        # count total no of nodes
-        builder = QueryBuilder()
-        builder.append(Node, tag="main", project=['id'], filters=self._id_filter)
-        builder.append(Node, tag="in", project=['id'], with_outgoing='main')
-        total_no_of_incomings = builder.count()
-
-        builder = QueryBuilder()
-        builder.append(Node, tag="main", project=['id'], filters=self._id_filter)
-        builder.append(Node, tag="out", project=['id'], with_incoming='main')
-        total_no_of_outgoings = builder.count()
+
+        incoming_link_counts = self._get_tree_link_counts('in')
+        outgoing_link_counts = self._get_tree_link_counts('out')
 
         return {
             "nodes": nodes,
             "edges": edges,
-            "total_no_of_incomings": total_no_of_incomings,
-            "total_no_of_outgoings": total_no_of_outgoings,
-            "sent_no_of_incomings": sent_no_of_incomings,
-            "sent_no_of_outgoings": sent_no_of_outgoings
+            "total_no_of_incomings": sum(count['count'] for count in incoming_link_counts),
+            "total_no_of_outgoings": sum(count['count'] for count in outgoing_link_counts),
+            "sent_no_of_incomings": len(incomings),
+            "sent_no_of_outgoings": len(outgoings),
+            "next_in_cursor": next_in_cursor,
+            "next_out_cursor": next_out_cursor,
+            "incoming_link_counts": incoming_link_counts,
+            "outgoing_link_counts": outgoing_link_counts
         }
+
+    def _get_tree_limit(self, limit, name):
+        """
+        Validate the limit of the number of links in one direction of the tree
+
+        :param limit: the requested limit or None
+        :param name: the name of the limit in the query string
+        :return: the requested limit or LIMIT_DEFAULT if it is None
+        """
+        if limit is None:
+            return self.limit_default
+
+        if not isinstance(limit, int) or limit < 1:
+            raise RestInputValidationError("{} has to be a positive integer".format(name))
+
+        if limit > self.limit_default:
+            raise RestInputValidationError("{} cannot be larger than {}".format(name, self.limit_default))
+
+        return limit
+
+    @staticmethod
+    def _get_tree_node(node, node_id, group, link=None):
+        """
+        Get the representation of a node in the tree from its projected columns
+
+        :param node: dictionary of the projected columns of the node
+        :param node_id: the id of the node in the tree
+        :param group: the group of the node in the tree, i.e. main_node, inputs or outputs
+        :param link: dictionary of the label and type of the link to the main node, if any
+        :return: dictionary describing the node
+        """
+        nodetype = node['node_type']
+
+        # Shape of the node displayed in the tree depending on the node type
+        if nodetype.split(".")[0] == "process":
+            shape = "square"
+        elif nodetype.split(".")[1] == "code":
+            shape = "triangle"
+        else:
+            shape = "dot"
+
+        tree_node = {
+            "id": node_id,
+            "nodeid": node['id'],
+            "nodeuuid": node['uuid'],
+            "nodetype": nodetype,
+            "nodelabel": node['label'],
+            "displaytype": nodetype.split('.')[-2],
+            "group": group,
+            "description": node['description'],
+            "shape": shape
+        }
+
+        if link is not None:
+            tree_node["linklabel"] = link['label']
+            tree_node["linktype"] = link['type']
+
+        return tree_node
+
+    def _get_tree_links(self, direction, limit, cursor=None):
+        """
+        Get one page of the links of the main node in one direction, ordered by the pk of the links
+
+        :param direction: 'in' for the incoming and 'out' for the outgoing links
+        :param limit: the maximum number of links
+        :param cursor: only return links with a larger pk
+        :return: tuple of the list of pairs of dictionaries with the projected columns of the linked node and of the
+            link, and the pk of the last link that is returned if there are more links or None otherwise
+        """
+        from aiida.orm.querybuilder import QueryBuilder
+        from aiida.orm import Node
+
+        edge_tag = 'main--{}'.format(direction)
+        joining = {'in': {'with_outgoing': 'main'}, 'out': {'with_incoming': 'main'}}[direction]
+        edge_filters = {'id': {'>': cursor}} if cursor is not None else None
+
+        qb_obj = QueryBuilder()
+        qb_obj.append(Node, tag="main", filters=self._id_filter)
+        qb_obj.append(
+            Node,
+            tag=direction,
+            project=self._tree_node_projections,
+            edge_project=['id', 'label', 'type'],
+            edge_filters=edge_filters,
+            **joining)
+        qb_obj.order_by({edge_tag: ['id']})
+
+        # Retrieve one more link than requested to know whether there are more links
+        qb_obj.limit(limit + 1)
+        links = [(result[direction], result[edge_tag]) for result in qb_obj.dict()]
+
+        if len(links) > limit:
+            links = links[:limit]
+            return links, links[-1][1]['id']
+
+        return links, None
+
+    def _get_tree_link_counts(self, direction):
+        """
+        Count the links of the main node in one direction per link type and label
+
+        :param direction: 'in' for the incoming and 'out' for the outgoing links
+        :return: list of dictionaries with the link type, the link label and the number of links
+        """
+        from aiida.orm.querybuilder import QueryBuilder
+        from aiida.orm import Node
+
+        edge_tag = 'main--{}'.format(direction)
+        joining = {'in': {'with_outgoing': 'main'}, 'out': {'with_incoming': 'main'}}[direction]
+
+        qb_obj = QueryBuilder()
+        qb_obj.append(Node, tag="main", filters=self._id_filter)
+        qb_obj.append(Node, tag=direction, edge_project=['type', 'label', {'id': {'func': 'count'}}], **joining)
+        qb_obj.group_by({edge_tag: ['type', 'label']})
+        qb_obj.order_by({edge_tag: ['type', 'label']})
+
+        return [{
+            "linktype": linktype,
+            "linklabel": linklabel,
+            "count": count
+        } for linktype, linklabel, count in qb_obj.all()]
@@ -452,6 +452,19 @@ class SlurmScheduler(aiida.schedulers.Scheduler):
         raise SchedulerError("Error during submission, could not retrieve the jobID from "
                              "sbatch output; see log for more info.")
 
+    def _filter_joblist_output(self, stdout, job_ids):
+        """
+        Return the lines of the squeue output of the given jobs.
+
+        The job id is the first field of each line, so the lines of the other
+        jobs are dropped without parsing them.
+
+        :param str stdout: the output of the squeue command
+        :param set job_ids: the ids of the jobs of interest
+        :return: the output restricted to the given jobs
+        """
+        return '\n'.join(line for line in stdout.splitlines() if line.split(_FIELD_SEPARATOR, 1)[0] in job_ids)
+
     def _parse_joblist_output(self, retval, stdout, stderr):
         """
         Parse the queue output string, as returned by executing the
@@ -494,13 +507,15 @@ class SlurmScheduler(aiida.schedulers.Scheduler):
         # the last field), I don't split the title.
         # This assumes that _field_separator never
         # appears in any previous field.
-        jobdata_raw = [l.split(_FIELD_SEPARATOR, num_fields) for l in stdout.splitlines() if _FIELD_SEPARATOR in l]
+        # The lines are split lazily, one at a time while parsing them
+        jobdata_raw = (l.split(_FIELD_SEPARATOR, num_fields) for l in stdout.splitlines() if _FIELD_SEPARATOR in l)
+        field_names = [field[1] for field in self.fields]
 
         # Create dictionary and parse specific fields
         job_list = []
         for job in jobdata_raw:
 
-            thisjob_dict = {k[1]: v for k, v in zip(self.fields, job)}
+            thisjob_dict = dict(zip(field_names, job))
 
             this_job = JobInfo()
             try:
@@ -551,7 +566,7 @@ class SlurmScheduler(aiida.schedulers.Scheduler):
                 # Also print a warning
                 self.logger.warning("Wrong line length in squeue output!"
                                     "Skipping optional fields. Line: '{}'"
-                                    "".format(jobdata_raw))
+                                    "".format(job))
                 # I append this job before continuing
                 job_list.append(this_job)
                 continue
@@ -11,6 +11,7 @@
 from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
+import logging
 import unittest
 from aiida.schedulers.plugins.direct import DirectScheduler
 from aiida.schedulers import SchedulerError
@@ -89,5 +90,37 @@ class TestParserGetJobList(unittest.TestCase):
         self.assertIn("11383", job_ids)
 
 
+class TestSubmitBatch(unittest.TestCase):
+    """Tests for the submission of multiple scripts with a single remote command."""
+
+    def test_get_submit_batch_command(self):
+        scheduler = DirectScheduler()
+        command = scheduler._get_submit_batch_command([('/scratch/job_a', 'aiida.sh'), ('/scratch/job_b', 'aiida.sh')])
+
+        self.assertEqual(command.count('bash -e'), 2)
+        self.assertIn("cd '/scratch/job_a'", command)
+        self.assertIn("cd '/scratch/job_b'", command)
+        self.assertEqual(command.count(scheduler._submit_batch_separator), 4)
+
+    def test_parse_submit_batch_output(self):
+        """Test parsing the recorded output of a batch of three submissions of which the second one failed."""
+        scheduler = DirectScheduler()
+        separator = scheduler._submit_batch_separator
+
+        stdout = '21712\n{sep} 0\n{sep} 1\n21716\n{sep} 0\n'.format(sep=separator)
+        error = 'bash: line 1: cd: /scratch/job_b: No such file or directory'
+        stderr = '{sep}\n{error}\n{sep}\n{sep}\n'.format(sep=separator, error=error)
+
+        logging.disable(logging.ERROR)
+        try:
+            job_ids = scheduler._parse_submit_batch_output(0, stdout, stderr, 3)
+        finally:
+            logging.disable(logging.NOTSET)
+
+        self.assertEqual(job_ids[0], '21712')
+        self.assertIsInstance(job_ids[1], SchedulerError)
+        self.assertEqual(job_ids[2], '21716')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -190,5 +190,37 @@ class TestParserBkill(unittest.TestCase):
         self.assertTrue(scheduler._parse_kill_output(retval, stdout, stderr))
 
 
+class TestSubmitBatch(unittest.TestCase):
+    """Tests for the submission of multiple scripts with a single remote command."""
+
+    def test_get_submit_batch_command(self):
+        scheduler = LsfScheduler()
+        command = scheduler._get_submit_batch_command([('/scratch/job_a', 'aiida.sh'), ('/scratch/job_b', 'aiida.sh')])
+
+        self.assertEqual(command.count('bsub'), 2)
+        self.assertIn("cd '/scratch/job_a'", command)
+        self.assertIn("cd '/scratch/job_b'", command)
+        self.assertEqual(command.count(scheduler._submit_batch_separator), 4)
+
+    def test_parse_submit_batch_output(self):
+        """Test parsing the recorded output of a batch of three submissions of which the second one failed."""
+        scheduler = LsfScheduler()
+        separator = scheduler._submit_batch_separator
+
+        stdout = 'Job <764254593> is submitted to queue <test>.\n{sep} 0\n{sep} 1\nJob <764254595> is submitted to queue <test>.\n{sep} 0\n'.format(sep=separator)
+        error = 'Bad resource requirement syntax. Job not submitted.'
+        stderr = '{sep}\n{error}\n{sep}\n{sep}\n'.format(sep=separator, error=error)
+
+        logging.disable(logging.ERROR)
+        try:
+            job_ids = scheduler._parse_submit_batch_output(0, stdout, stderr, 3)
+        finally:
+            logging.disable(logging.NOTSET)
+
+        self.assertEqual(job_ids[0], '764254593')
+        self.assertIsInstance(job_ids[1], SchedulerError)
+        self.assertEqual(job_ids[2], '764254595')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -11,8 +11,10 @@
 from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
+import logging
 import unittest
 import uuid
+from aiida.schedulers import SchedulerError
 from aiida.schedulers.plugins.pbspro import *
 from aiida.schedulers.datastructures import JobState
 
@@ -1070,3 +1072,35 @@ class TestSubmitScript(unittest.TestCase):
         with self.assertRaises(ValueError):
             job_tmpl.job_resource = scheduler.create_job_resource(
                 num_machines=1, num_mpiprocs_per_machine=1, num_cores_per_machine=24, num_cores_per_mpiproc=23)
+
+
+class TestSubmitBatch(unittest.TestCase):
+    """Tests for the submission of multiple scripts with a single remote command."""
+
+    def test_get_submit_batch_command(self):
+        scheduler = PbsproScheduler()
+        command = scheduler._get_submit_batch_command([('/scratch/job_a', 'aiida.sh'), ('/scratch/job_b', 'aiida.sh')])
+
+        self.assertEqual(command.count('qsub'), 2)
+        self.assertIn("cd '/scratch/job_a'", command)
+        self.assertIn("cd '/scratch/job_b'", command)
+        self.assertEqual(command.count(scheduler._submit_batch_separator), 4)
+
+    def test_parse_submit_batch_output(self):
+        """Test parsing the recorded output of a batch of three submissions of which the second one failed."""
+        scheduler = PbsproScheduler()
+        separator = scheduler._submit_batch_separator
+
+        stdout = '68350.mycluster\n{sep} 0\n{sep} 1\n68352.mycluster\n{sep} 0\n'.format(sep=separator)
+        error = 'qsub: Unknown queue'
+        stderr = '{sep}\n{error}\n{sep}\n{sep}\n'.format(sep=separator, error=error)
+
+        logging.disable(logging.ERROR)
+        try:
+            job_ids = scheduler._parse_submit_batch_output(0, stdout, stderr, 3)
+        finally:
+            logging.disable(logging.NOTSET)
+
+        self.assertEqual(job_ids[0], '68350.mycluster')
+        self.assertIsInstance(job_ids[1], SchedulerError)
+        self.assertEqual(job_ids[2], '68352.mycluster')
@@ -348,3 +348,35 @@ class TestCommand(unittest.TestCase):
         # the seconds since epoch, as suggested on stackoverflow:
         # http://stackoverflow.com/questions/1697815
         return datetime.datetime.fromtimestamp(time.mktime(time_struct))
+
+
+class TestSubmitBatch(unittest.TestCase):
+    """Tests for the submission of multiple scripts with a single remote command."""
+
+    def test_get_submit_batch_command(self):
+        scheduler = SgeScheduler()
+        command = scheduler._get_submit_batch_command([('/scratch/job_a', 'aiida.sh'), ('/scratch/job_b', 'aiida.sh')])
+
+        self.assertEqual(command.count('qsub'), 2)
+        self.assertIn("cd '/scratch/job_a'", command)
+        self.assertIn("cd '/scratch/job_b'", command)
+        self.assertEqual(command.count(scheduler._submit_batch_separator), 4)
+
+    def test_parse_submit_batch_output(self):
+        """Test parsing the recorded output of a batch of three submissions of which the second one failed."""
+        scheduler = SgeScheduler()
+        separator = scheduler._submit_batch_separator
+
+        stdout = '1176936\n{sep} 0\n{sep} 1\n1176938\n{sep} 0\n'.format(sep=separator)
+        error = 'Unable to run job: job rejected: the requested parallel environment "mpi" does not exist.'
+        stderr = '{sep}\n{error}\n{sep}\n{sep}\n'.format(sep=separator, error=error)
+
+        logging.disable(logging.ERROR)
+        try:
+            job_ids = scheduler._parse_submit_batch_output(0, stdout, stderr, 3)
+        finally:
+            logging.disable(logging.NOTSET)
+
+        self.assertEqual(job_ids[0], '1176936')
+        self.assertIsInstance(job_ids[1], SchedulerError)
+        self.assertEqual(job_ids[2], '1176938')
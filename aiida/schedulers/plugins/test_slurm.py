@@ -15,6 +15,7 @@ import unittest
 import logging
 import uuid
 import datetime
+import mock
 
 from aiida.schedulers.plugins.slurm import *
 
@@ -320,5 +321,112 @@ class TestSubmitScript(unittest.TestCase):
                 num_machines=1, num_mpiprocs_per_machine=1, num_cores_per_machine=24, num_cores_per_mpiproc=23)
 
 
+class TestSubmitBatch(unittest.TestCase):
+    """Tests for the submission of multiple scripts with a single remote command."""
+
+    def test_get_submit_batch_command(self):
+        scheduler = SlurmScheduler()
+        command = scheduler._get_submit_batch_command([('/scratch/job_a', 'aiida.sh'), ('/scratch/job_b', 'aiida.sh')])
+
+        self.assertEqual(command.count('sbatch'), 2)
+        self.assertIn("cd '/scratch/job_a'", command)
+        self.assertIn("cd '/scratch/job_b'", command)
+        self.assertEqual(command.count(scheduler._submit_batch_separator), 4)
+
+    def test_parse_submit_batch_output(self):
+        """Test parsing the recorded output of a batch of three submissions of which the second one failed."""
+        scheduler = SlurmScheduler()
+        separator = scheduler._submit_batch_separator
+
+        stdout = 'Submitted batch job 1201\n{sep} 0\n{sep} 1\nSubmitted batch job 1203\n{sep} 0\n'.format(sep=separator)
+        error = 'sbatch: error: Batch job submission failed: Invalid account or account/partition combination specified'
+        stderr = '{sep}\n{error}\n{sep}\n{sep}\n'.format(sep=separator, error=error)
+
+        logging.disable(logging.ERROR)
+        try:
+            job_ids = scheduler._parse_submit_batch_output(0, stdout, stderr, 3)
+        finally:
+            logging.disable(logging.NOTSET)
+
+        self.assertEqual(job_ids[0], '1201')
+        self.assertIsInstance(job_ids[1], SchedulerError)
+        self.assertEqual(job_ids[2], '1203')
+
+    def test_parse_submit_batch_output_truncated(self):
+        """Test that submissions without output, e.g. because the connection dropped, are returned as errors."""
+        scheduler = SlurmScheduler()
+        stdout = 'Submitted batch job 1201\n{} 0\n'.format(scheduler._submit_batch_separator)
+
+        job_ids = scheduler._parse_submit_batch_output(255, stdout, '', 3)
+
+        self.assertEqual(job_ids[0], '1201')
+        self.assertIsInstance(job_ids[1], SchedulerError)
+        self.assertIsInstance(job_ids[2], SchedulerError)
+
+
+class TestGetJobs(unittest.TestCase):
+    """Tests for the retrieval of the job list in chunks."""
+
+    def test_get_jobs_chunked(self):
+        """Test that a long list of jobs is queried with multiple commands with a bounded number of job ids."""
+
+        class DummyTransport(object):  # pylint: disable=useless-object-inheritance
+            """Transport that records the executed commands and returns the recorded squeue output."""
+
+            def __init__(self):
+                self.commands = []
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, exc_type, exc_value, traceback):
+                pass
+
+            def exec_command_wait(self, command):
+                self.commands.append(command)
+                return 0, TEXT_SQUEUE_TO_TEST, ''
+
+        transport = DummyTransport()
+        scheduler = SlurmScheduler()
+        scheduler.set_transport(transport)
+        scheduler._joblist_chunk_size = 3
+
+        jobs = [str(job_id) for job_id in range(7)]
+        job_list = scheduler.get_jobs(jobs=jobs)
+
+        self.assertEqual(len(transport.commands), 3)
+        self.assertIn('--jobs=0,1,2', transport.commands[0])
+        self.assertIn('--jobs=6', transport.commands[2])
+        self.assertEqual(len(job_list), 3 * 7)
+
+    def test_get_jobs_filtered(self):
+        """Test that only the lines of the requested jobs are parsed when querying by user."""
+        scheduler = SlurmScheduler()
+
+        stdout = scheduler._filter_joblist_output(TEXT_SQUEUE_TO_TEST, {'863100', '863553', '1'})
+        self.assertEqual([line.split('^^^')[0] for line in stdout.splitlines()], ['863100', '863553'])
+
+        class DummyTransport(object):  # pylint: disable=useless-object-inheritance
+            """Transport that returns the recorded squeue output."""
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, exc_type, exc_value, traceback):
+                pass
+
+            @staticmethod
+            def exec_command_wait(command):  # pylint: disable=unused-argument
+                return 0, TEXT_SQUEUE_TO_TEST, ''
+
+        scheduler.set_transport(DummyTransport())
+
+        with mock.patch.object(scheduler, '_parse_joblist_output', wraps=scheduler._parse_joblist_output) as parse:
+            job_dict = scheduler.get_jobs(user='user5', as_dict=True, filter_jobs=['863553', 863100])
+
+        self.assertEqual(set(job_dict.keys()), {'863100', '863553'})
+        self.assertEqual(len(parse.call_args[0][1].splitlines()), 2)
+
+
 if __name__ == '__main__':
     unittest.main()
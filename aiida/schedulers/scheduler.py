@@ -50,6 +50,12 @@ class Scheduler(object):
     # The class to be used for the job resource.
     _job_resource_class = None
 
+    # Maximum number of job ids that are passed to a single joblist command, to keep the command line bounded
+    _joblist_chunk_size = 500
+
+    # Marker printed after each submission of a batch, to split the combined output in the output of each submission
+    _submit_batch_separator = '__AIIDA_SUBMIT_BATCH_SEPARATOR__'
+
     def __init__(self):
         self._transport = None
 
@@ -328,7 +334,23 @@ stderr:
         """
         raise NotImplementedError
 
-    def get_jobs(self, jobs=None, user=None, as_dict=False):
+    def _filter_joblist_output(self, stdout, job_ids):
+        """
+        Return the output of the joblist command restricted to the given jobs.
+
+        Plugins whose output can cheaply be restricted to the lines of given
+        jobs can implement this, such that the lines of the other jobs are
+        never parsed. The default implementation returns the output unchanged;
+        `get_jobs` drops the parsed jobs that were not requested in any case.
+
+        :param str stdout: the output of the joblist command
+        :param set job_ids: the ids of the jobs of interest
+        :return: the output restricted to the given jobs
+        """
+        # pylint: disable=no-self-use,unused-argument
+        return stdout
+
+    def get_jobs(self, jobs=None, user=None, as_dict=False, filter_jobs=None):
         """
         Get the list of jobs and return it.
 
@@ -339,14 +361,41 @@ stderr:
         :param list as_dict: if False (default), a list of JobInfo objects is
              returned. If True, a dictionary is returned, having as key the
              job_id and as value the JobInfo object.
+        :param list filter_jobs: if specified, only the jobs with these ids are
+             returned, which is useful when querying the jobs of a user of
+             which only a few are of interest.
 
         Note: typically, only either jobs or user can be specified. See also
         comments in _get_joblist_command.
+
+        If more than `_joblist_chunk_size` jobs are specified, the jobs are
+        queried in chunks with one command each, such that the length of the
+        command line remains bounded.
         """
+        from aiida.common.utils import grouper
+
+        if jobs and not isinstance(jobs, six.string_types) and len(jobs) > self._joblist_chunk_size:
+            chunks = [list(chunk) for chunk in grouper(self._joblist_chunk_size, jobs)]
+        else:
+            chunks = [jobs]
+
+        if filter_jobs is not None:
+            filter_jobs = set(str(job_id) for job_id in filter_jobs)
+
+        joblist = []
+
         with self.transport:
-            retval, stdout, stderr = self.transport.exec_command_wait(self._get_joblist_command(jobs=jobs, user=user))
+            for chunk in chunks:
+                retval, stdout, stderr = self.transport.exec_command_wait(
+                    self._get_joblist_command(jobs=chunk, user=user))
+
+                if filter_jobs is None:
+                    joblist.extend(self._parse_joblist_output(retval, stdout, stderr))
+                else:
+                    stdout = self._filter_joblist_output(stdout, filter_jobs)
+                    joblist.extend(job for job in self._parse_joblist_output(retval, stdout, stderr)
+                                   if job.job_id in filter_jobs)
 
-        joblist = self._parse_joblist_output(retval, stdout, stderr)
         if as_dict:
             jobdict = {job.job_id: job for job in joblist}
             if None in jobdict:
@@ -406,6 +455,112 @@ stderr:
             self._get_submit_command(escape_for_bash(submit_script)))
         return self._parse_submit_output(retval, stdout, stderr)
 
+    def _get_submit_batch_command(self, submissions):
+        """
+        Return the string to execute to submit multiple scripts with a single command.
+
+        Each script is submitted in a subshell from within its working directory, with the submit command of the plugin,
+        after which the separator is printed to both stdout and stderr, followed on stdout by the exit status of the
+        submit command. This makes it possible to parse the output of each submission separately with the
+        `_parse_submit_output` method of the plugin.
+
+        Typically, this function does not need to be modified by the plugins.
+
+        :param submissions: a list of tuples `(working_directory, submit_script)` where the submit script is relative
+            to the working directory. The paths should not be escaped.
+        :return: the string to execute to submit all the scripts.
+        """
+        separator = self._submit_batch_separator
+        commands = []
+
+        for working_directory, submit_script in submissions:
+            submit_command = self._get_submit_command(escape_for_bash(submit_script))
+            commands.append('( cd {} || exit; {} ); echo "{} $?"; echo "{}" >&2'.format(
+                escape_for_bash(working_directory), submit_command, separator, separator))
+
+        return '; '.join(commands)
+
+    def _parse_submit_batch_output(self, retval, stdout, stderr, count):
+        """
+        Parse the output of the command returned by `_get_submit_batch_command`.
+
+        The output is split in the output of each submission, which is then parsed by `_parse_submit_output`. A failure
+        of one submission does not affect the others: the exception is returned in place of its job id.
+
+        Typically, this function does not need to be modified by the plugins.
+
+        :param retval: the exit status of the batch command
+        :param stdout: the combined stdout of all the submissions
+        :param stderr: the combined stderr of all the submissions
+        :param count: the number of submissions in the batch
+        :return: a list of length `count` with for each submission either the job id or a `SchedulerError`.
+        """
+        separator = self._submit_batch_separator
+        outputs = []
+        errors = [[]]
+        lines = []
+
+        for line in stdout.split('\n'):
+            if line.startswith(separator):
+                try:
+                    submit_retval = int(line[len(separator):].strip())
+                except ValueError:
+                    submit_retval = None
+                outputs.append((submit_retval, '\n'.join(lines)))
+                lines = []
+            else:
+                lines.append(line)
+
+        for line in stderr.split('\n'):
+            if line.strip() == separator:
+                errors.append([])
+            else:
+                errors[-1].append(line)
+
+        results = []
+
+        for index in range(count):
+            try:
+                submit_retval, submit_stdout = outputs[index]
+            except IndexError:
+                results.append(
+                    SchedulerError('Error during batch submission, no output for submission {} of {}, retval={}\n'
+                                   'stdout={}\nstderr={}'.format(index + 1, count, retval, stdout, stderr)))
+                continue
+
+            submit_stderr = '\n'.join(errors[index]) if index < len(errors) else ''
+
+            if submit_retval is None:
+                results.append(
+                    SchedulerError('Error during batch submission, could not parse the exit status of submission {} '
+                                   'of {}'.format(index + 1, count)))
+                continue
+
+            try:
+                results.append(self._parse_submit_output(submit_retval, submit_stdout, submit_stderr))
+            except SchedulerError as exception:
+                results.append(exception)
+
+        return results
+
+    def submit_from_scripts(self, submissions):
+        """
+        Submit multiple scripts, each from within its own working directory, executing a single remote command.
+
+        Return a list with, for each submission in the same order, either a string with the JobID in a valid format to
+        be used for querying, or the `SchedulerError` that was raised while parsing the output of that submission.
+
+        Typically, this function does not need to be modified by the plugins.
+
+        :param submissions: a list of tuples `(working_directory, submit_script)`
+        :return: list of job ids or exceptions
+        """
+        if not submissions:
+            return []
+
+        retval, stdout, stderr = self.transport.exec_command_wait(self._get_submit_batch_command(submissions))
+        return self._parse_submit_batch_output(retval, stdout, stderr, len(submissions))
+
     def kill(self, jobid):
         """
         Kill a remote job, and try to parse the output message of the scheduler